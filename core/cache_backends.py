@@ -0,0 +1,327 @@
+"""
+Cache backends.
+
+``ResilientCache`` puts a remote cache (Redis through django-redis by
+default) behind a circuit breaker. Nothing connects while settings are
+imported: the primary backend is built on first use. When it cannot be
+reached, calls go to a local fallback cache (the database cache or
+local memory) until the breaker lets a call through again to re-probe.
+Keys written or deleted in the fallback meanwhile are deleted from the
+primary when it recovers, so its stale copies do not shadow them; the
+rest of the primary is left alone, as other processes share it.
+
+    CACHES = {
+        'default': {
+            'BACKEND': 'core.cache_backends.ResilientCache',
+            'LOCATION': 'redis://redis:6379/1',
+            'OPTIONS': {
+                'PRIMARY_BACKEND': 'django_redis.cache.RedisCache',
+                'PRIMARY_OPTIONS': {'SOCKET_CONNECT_TIMEOUT': 0.5},
+                'FALLBACK': 'database',  # Another alias, or a cache config dict
+                'FAILURE_THRESHOLD': 3,
+                'RESET_TIMEOUT': 30,
+            },
+        },
+        'database': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'cache_table'},
+    }
+
+Naming the fallback by alias keeps it visible to ``createcachetable``.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional, Set, Tuple
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.utils.module_loading import import_string
+
+
+logger = logging.getLogger(__name__)
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+PRIMARY, FALLBACK = 'primary', 'fallback'
+
+# Methods whose keys are stale in the primary after they ran on the fallback
+WRITE_METHODS = {'add', 'set', 'touch', 'delete', 'incr', 'decr', 'set_many', 'delete_many'}
+MAX_TRACKED_KEYS = 10000
+
+
+class CircuitBreaker:
+    """
+    Stop calling a failing dependency for a while.
+
+    The breaker opens after ``failure_threshold`` failures in a row. Once
+    ``reset_timeout`` seconds have passed, ``allow()`` lets a single call
+    through (half-open): its success closes the breaker, a failure opens
+    it again for another ``reset_timeout``.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self.last_error = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return CLOSED
+        if self._probing or self.clock() - self.opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def allow(self) -> bool:
+        """True when a call to the dependency should be attempted."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._probing or self.clock() - self.opened_at < self.reset_timeout:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> bool:
+        """Close the breaker; True when it was open before."""
+        with self._lock:
+            was_open = self.opened_at is not None
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+            return was_open
+
+    def record_failure(self, error: Optional[BaseException] = None) -> bool:
+        """Count a failure; True when this failure opened the breaker."""
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error) if error is not None else None
+            was_closed = self.opened_at is None
+            if self._probing or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()
+                self._probing = False
+                return was_closed
+            return False
+
+    def status(self) -> Dict:
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'last_error': self.last_error,
+            'open_for': round(self.clock() - self.opened_at, 1) if self.opened_at is not None else None,
+        }
+
+
+# Django keeps one cache instance per thread; the breakers are shared by
+# every thread in the process so an outage is detected once
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+# Keys (with their version) changed in the fallback during an outage, per
+# breaker; like the breakers they are shared by every thread in the process
+_fallback_writes: Dict[str, Set[Tuple[str, Optional[int]]]] = {}
+_fallback_writes_lock = threading.Lock()
+
+
+def get_breaker(name: str, failure_threshold: int = 3, reset_timeout: float = 30.0) -> CircuitBreaker:
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(failure_threshold, reset_timeout)
+        return _breakers[name]
+
+
+def connection_errors() -> tuple:
+    """Exceptions that mean the primary cache could not be reached."""
+    errors = [ConnectionError, TimeoutError]
+    try:
+        from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+        errors += [RedisConnectionError, RedisTimeoutError]
+    except ImportError:
+        pass
+    try:
+        from django_redis.exceptions import ConnectionInterrupted
+        errors.append(ConnectionInterrupted)
+    except ImportError:
+        pass
+    return tuple(errors)
+
+
+class ResilientCache(BaseCache):
+    """Remote cache with lazy connection and failover to a local cache."""
+
+    def __init__(self, server, params):
+        super().__init__(params)
+        options = dict(params.get('OPTIONS', {}))
+        shared = {key: params[key] for key in ('TIMEOUT', 'KEY_PREFIX', 'VERSION', 'KEY_FUNCTION') if key in params}
+        self._primary_config = {
+            'BACKEND': options.get('PRIMARY_BACKEND', 'django_redis.cache.RedisCache'),
+            'LOCATION': server,
+            'OPTIONS': options.get('PRIMARY_OPTIONS', {}),
+            **shared,
+        }
+        fallback = options.get('FALLBACK', {})
+        self._fallback_alias = fallback if isinstance(fallback, str) else None
+        self._fallback_config = None if self._fallback_alias else {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': f'resilient-fallback-{server}',
+            **shared,
+            **fallback,
+        }
+        self.invalidate_on_recovery = options.get('INVALIDATE_ON_RECOVERY', True)
+        self._breaker_name = f"{self._primary_config['BACKEND']}:{server}"
+        self.breaker = get_breaker(
+            self._breaker_name,
+            options.get('FAILURE_THRESHOLD', 3),
+            options.get('RESET_TIMEOUT', 30.0),
+        )
+        self._errors = connection_errors()
+        self._primary = None
+        self._fallback = None
+
+    @staticmethod
+    def _build(config: Dict) -> BaseCache:
+        params = dict(config)
+        backend = params.pop('BACKEND')
+        location = params.pop('LOCATION', '')
+        return import_string(backend)(location, params)
+
+    @property
+    def primary(self) -> BaseCache:
+        if self._primary is None:
+            self._primary = self._build(self._primary_config)
+        return self._primary
+
+    @property
+    def fallback(self) -> BaseCache:
+        if self._fallback is None:
+            if self._fallback_alias:
+                from django.core.cache import caches
+                self._fallback = caches[self._fallback_alias]
+            else:
+                self._fallback = self._build(self._fallback_config)
+        return self._fallback
+
+    @property
+    def mode(self) -> str:
+        return PRIMARY if self.breaker.state == CLOSED else FALLBACK
+
+    def status(self) -> Dict:
+        """Which backend is serving, for the health probes."""
+        return {
+            'mode': self.mode,
+            'primary': self._primary_config['BACKEND'],
+            'fallback': self._fallback_alias or self._fallback_config['BACKEND'],
+            **self.breaker.status(),
+        }
+
+    def _call(self, method: str, *args, **kwargs):
+        if self.breaker.allow():
+            try:
+                if self.invalidate_on_recovery and self.breaker.state != CLOSED:
+                    # Re-probing after an outage: entries written or deleted in the
+                    # fallback meanwhile (sessions, invalidations) would otherwise
+                    # be shadowed by the stale ones still in the primary
+                    self._invalidate_fallback_writes()
+                result = getattr(self.primary, method)(*args, **kwargs)
+            except self._errors as e:
+                if self.breaker.record_failure(e):
+                    logger.warning(f"Cache backend unreachable, using the fallback cache: {e}")
+            except Exception:
+                # The primary answered (e.g. incr() of a missing key)
+                self._recovered()
+                raise
+            else:
+                self._recovered()
+                return result
+        result = getattr(self.fallback, method)(*args, **kwargs)
+        # A refused add() changed nothing; deleting the primary's copy would
+        # release whatever it holds (the backup slot) for other processes
+        if self.invalidate_on_recovery and method in WRITE_METHODS and not (method == 'add' and not result):
+            self._track_fallback_write(method, args, kwargs.get('version'))
+        return result
+
+    def _track_fallback_write(self, method: str, args, version):
+        keys = args[0] if method in ('set_many', 'delete_many') else [args[0]]
+        with _fallback_writes_lock:
+            tracked = _fallback_writes.setdefault(self._breaker_name, set())
+            if len(tracked) >= MAX_TRACKED_KEYS:
+                return
+            tracked.update((key, version) for key in keys)
+            if len(tracked) >= MAX_TRACKED_KEYS:
+                logger.warning(
+                    f"More than {MAX_TRACKED_KEYS} cache keys changed in the fallback; "
+                    "later ones may read stale values once the primary recovers"
+                )
+
+    def _invalidate_fallback_writes(self):
+        """Delete the keys changed in the fallback from the primary; kept for the next probe on failure."""
+        with _fallback_writes_lock:
+            tracked = set(_fallback_writes.get(self._breaker_name, ()))
+        if not tracked:
+            return
+        by_version: Dict[Optional[int], list] = {}
+        for key, version in tracked:
+            by_version.setdefault(version, []).append(key)
+        for version, keys in by_version.items():
+            self.primary.delete_many(keys, version=version)
+        with _fallback_writes_lock:
+            _fallback_writes.get(self._breaker_name, set()).difference_update(tracked)
+
+    def _recovered(self):
+        if self.breaker.record_success():
+            logger.info('Cache backend reachable again')
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call('add', key, value, timeout=timeout, version=version)
+
+    def get(self, key, default=None, version=None):
+        return self._call('get', key, default=default, version=version)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call('set', key, value, timeout=timeout, version=version)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call('touch', key, timeout=timeout, version=version)
+
+    def delete(self, key, version=None):
+        return self._call('delete', key, version=version)
+
+    def get_many(self, keys, version=None):
+        return self._call('get_many', keys, version=version)
+
+    def has_key(self, key, version=None):
+        return self._call('has_key', key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        return self._call('incr', key, delta=delta, version=version)
+
+    def decr(self, key, delta=1, version=None):
+        return self._call('decr', key, delta=delta, version=version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._call('set_many', data, timeout=timeout, version=version)
+
+    def delete_many(self, keys, version=None):
+        return self._call('delete_many', keys, version=version)
+
+    def clear(self):
+        return self._call('clear')
+
+    def close(self, **kwargs):
+        for backend in (self._primary, self._fallback):
+            if backend is not None:
+                backend.close(**kwargs)
+
+    def __getattr__(self, name):
+        # Backend-specific extras such as django-redis' keys() and ttl();
+        # AttributeError when the serving backend has no such method
+        if name.startswith('_'):
+            raise AttributeError(name)
+        backend = self.fallback if self.mode == FALLBACK else self.primary
+        if not callable(getattr(backend, name)):
+            return getattr(backend, name)
+        return lambda *args, **kwargs: self._call(name, *args, **kwargs)
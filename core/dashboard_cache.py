@@ -0,0 +1,59 @@
+"""
+Dashboard cache keys and invalidation.
+
+Kept apart from core.views so signal handlers, Celery tasks and other apps
+can invalidate the dashboard without importing the view module.
+
+Cached dashboard data is keyed by generation counters (see
+core.utils.get_cache_version) rather than deleted key by key: one counter
+per site, one for the 'All Sites' view and a global one that every key
+includes. Bumping a counter makes the older entries unreachable; they
+expire with their timeout.
+"""
+
+# Generation shared by every dashboard key; bumped when the affected sites are unknown
+GLOBAL_GENERATION = 'global'
+
+
+def dashboard_generation_key(site_id=None):
+    """Cache key holding the dashboard data generation for a site (or all sites)."""
+    return f"dashboard:generation:{site_id or 'all'}"
+
+
+def dashboard_stats_key(site_id=None):
+    """Cache key of the dashboard statistics for a site (or all sites) in the current generation."""
+    from core.utils import get_cache_version
+
+    generation = get_cache_version(dashboard_generation_key(site_id))
+    epoch = get_cache_version(dashboard_generation_key(GLOBAL_GENERATION))
+    return f"dashboard_data_{site_id or 'all'}_{generation}_{epoch}"
+
+
+def bump_dashboard_generation(site_ids=None):
+    """
+    Start a new dashboard cache generation for the given sites and for 'all sites'.
+
+    With no site ids every dashboard cache entry is invalidated at once.
+    """
+    from core.utils import bump_cache_version
+
+    if site_ids is None:
+        bump_cache_version(dashboard_generation_key(GLOBAL_GENERATION))
+        return
+    for site_id in {*site_ids, None}:
+        bump_cache_version(dashboard_generation_key(site_id))
+
+
+def invalidate_dashboard_cache(user_id=None, site_id=None):
+    """
+    Invalidate the cached dashboard data for a site, or for every site.
+
+    The cached statistics are shared by all users, so ``user_id`` no longer
+    narrows the invalidation; it is accepted for existing callers.
+    """
+    if site_id == 'all':
+        bump_dashboard_generation([])
+    elif site_id:
+        bump_dashboard_generation([site_id])
+    else:
+        bump_dashboard_generation()
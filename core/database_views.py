@@ -0,0 +1,196 @@
+"""
+Database statistics and backup views.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views.decorators.http import require_http_methods
+
+from core.rbac import is_staff_or_superuser
+
+
+logger = logging.getLogger(__name__)
+
+
+@login_required
+@user_passes_test(is_staff_or_superuser)
+@require_http_methods(["GET"])
+def database_stats(request):
+    """Get database statistics and information."""
+    try:
+        from core.services.database_stats_service import DatabaseStatsService
+
+        data = DatabaseStatsService().get_stats(breakdowns=True)
+        tables = data['tables']
+
+        def breakdown(label, field, value):
+            return tables[label]['breakdown'][field].get(value, 0)
+
+        stats = {
+            'locations': {
+                'total': tables['Locations']['count'],
+                'sites': breakdown('Locations', 'is_site', True),
+                'sub_locations': breakdown('Locations', 'is_site', False),
+                'active': breakdown('Locations', 'is_active', True),
+            },
+            'customers': {
+                'total': tables['Customers']['count'],
+                'active': breakdown('Customers', 'is_active', True),
+            },
+            'equipment': {
+                'total': tables['Equipment']['count'],
+                'active': breakdown('Equipment', 'is_active', True),
+            },
+            'maintenance': {
+                'total': tables['Maintenance Activities']['count'],
+                'completed': breakdown('Maintenance Activities', 'status', 'completed'),
+                'pending': breakdown('Maintenance Activities', 'status', 'pending'),
+            },
+            'events': {
+                'total': tables['Calendar Events']['count'],
+                'recent': tables['Calendar Events']['breakdown']['recent'],
+            },
+            'database': {
+                'total_size': data['database_size'] or 'Unknown',
+                'locations_table_size': tables['Locations']['size'] or 'Unknown',
+                'customers_table_size': tables['Customers']['size'] or 'Unknown',
+                'equipment_table_size': tables['Equipment']['size'] or 'Unknown',
+            },
+        }
+        
+        return JsonResponse({
+            'success': True,
+            'stats': stats,
+            'timestamp': data['generated_at']
+        })
+        
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'error': str(e)
+        }, status=500)
+
+
+@login_required
+@user_passes_test(is_staff_or_superuser)
+def database_stats_api(request):
+    """
+    API endpoint to get database statistics.
+
+    Row counts are catalog estimates (cached briefly); ``?exact=1`` returns
+    exact counts once the background count has run, queueing it if needed.
+    """
+    try:
+        from core.services.database_stats_service import DatabaseStatsService
+
+        stats = DatabaseStatsService().get_stats(exact=request.GET.get('exact') == '1')
+        return JsonResponse({
+            'status': 'success',
+            'tables': {
+                label: {'count': info['count'], 'size': info['size'], 'estimated': info['estimated']}
+                for label, info in stats['tables'].items()
+            },
+            'database_size': stats['database_size'] or 'N/A',
+            'database_name': stats['database_name'],
+            'generated_at': stats['generated_at'],
+            'exact_pending': stats['exact_pending'],
+            'counted_at': stats.get('counted_at'),
+        })
+        
+    except Exception as e:
+        logger.error(f"Error getting database stats: {str(e)}", exc_info=True)
+        return JsonResponse({
+            'status': 'error',
+            'message': f'Error getting database stats: {str(e)}'
+        }, status=500)
+
+
+@login_required
+@user_passes_test(is_staff_or_superuser)
+@require_http_methods(["POST"])
+def backup_database(request):
+    """
+    Queue a database backup (``kind=full`` or ``kind=incremental``).
+
+    The backup runs as the run_database_backup Celery task; poll
+    backup_status for its progress and the resulting archive.
+    """
+    from core.tasks import BACKUP_PROGRESS_KEY, BACKUP_SLOT_KEY, run_database_backup
+
+    kind = request.POST.get('kind', 'full')
+    if kind not in ('full', 'incremental'):
+        return JsonResponse({'success': False, 'error': 'kind must be full or incremental'}, status=400)
+
+    # cache.add is atomic, so only one request takes the free slot
+    now = timezone.now()
+    taken = cache.add(BACKUP_SLOT_KEY, now.isoformat(), None)
+    progress = None
+    if not taken:
+        held_since = cache.get(BACKUP_SLOT_KEY)
+        progress = cache.get(BACKUP_PROGRESS_KEY)
+        if held_since is None:
+            # Released since the add() above
+            taken = cache.add(BACKUP_SLOT_KEY, now.isoformat(), None)
+        elif (_backup_slot_is_stale(held_since, progress, now)
+                and cache.add(f'{BACKUP_SLOT_KEY}:{held_since}', True, 3600)):
+            # Left behind by a dead worker: of concurrent requests, only the
+            # one whose add() wins for this stale slot takes it over
+            cache.set(BACKUP_SLOT_KEY, now.isoformat(), None)
+            taken = True
+    if not taken:
+        return JsonResponse({
+            'success': False,
+            'error': 'A backup is already in progress',
+            'progress': progress
+        }, status=409)
+
+    try:
+        cache.set(BACKUP_PROGRESS_KEY, {'stage': 'queued', 'kind': kind, 'updated_at': now.isoformat()}, 3600)
+        result = run_database_backup.delay(kind)
+    except Exception as e:
+        cache.delete_many([BACKUP_PROGRESS_KEY, BACKUP_SLOT_KEY])
+        logger.error(f"Error queueing database backup: {str(e)}")
+        return JsonResponse({
+            'success': False,
+            'error': f'Error queueing database backup: {str(e)}'
+        }, status=500)
+
+    return JsonResponse({
+        'success': True,
+        'message': f'{kind.capitalize()} database backup started',
+        'task_id': result.id
+    }, status=202)
+
+
+def _backup_slot_is_stale(held_since, progress, now):
+    """
+    True when the backup holding the slot finished, or has not reported for
+    an hour and is assumed to have died with its worker.
+    """
+    last_seen = datetime.fromisoformat(held_since)
+    if progress and datetime.fromisoformat(progress['updated_at']) >= last_seen:
+        # Progress written before the slot was taken belongs to an earlier backup
+        if progress['stage'] in ('done', 'failed'):
+            return True
+        last_seen = datetime.fromisoformat(progress['updated_at'])
+    return now - last_seen >= timedelta(hours=1)
+
+
+@login_required
+@user_passes_test(is_staff_or_superuser)
+@require_http_methods(["GET"])
+def backup_status(request):
+    """Progress of the current or last backup, and the backups on disk."""
+    from core.services.backup_service import BackupService
+    from core.tasks import BACKUP_PROGRESS_KEY
+
+    return JsonResponse({
+        'success': True,
+        'progress': cache.get(BACKUP_PROGRESS_KEY),
+        'backups': BackupService().list_backups()
+    })
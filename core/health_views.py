@@ -0,0 +1,154 @@
+"""
+Health check views.
+
+These serve the snapshot written by the health probe service and import
+nothing else from core.views, so the health endpoint Docker and the load
+balancer poll does not load the full view module.
+"""
+
+import logging
+
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.shortcuts import render
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+
+
+logger = logging.getLogger(__name__)
+
+
+def health_snapshot_checks(snapshot):
+    """Flatten a health snapshot's probe results into the list the debug page renders."""
+    statuses = {'PASS': 'success', 'WARNING': 'warning'}
+    return [
+        {
+            'name': name,
+            'category': result['category'],
+            'status': statuses.get(result['status'], 'error'),
+            'message': result.get('message', ''),
+            'duration': result.get('duration'),
+        }
+        for name, result in snapshot['probes'].items()
+    ]
+
+
+def simple_health_check(request):
+    """
+    Load-balancer / Docker health check, answered from the latest health snapshot.
+
+    Never queries the database or runs a probe in the request: returns 200
+    unless a critical probe (the database) failed in the last run, in which
+    case it returns 503.
+    """
+    from core.services.health_probe_service import HealthProbeService, PASS, WARNING
+
+    snapshot = HealthProbeService().get_snapshot()
+    status = snapshot['summary']['status']
+    failing = [
+        name for name, result in snapshot['probes'].items()
+        if result['status'] not in (PASS, WARNING)
+    ]
+    return JsonResponse({
+        'status': 'error' if status == 'critical' else 'ok',
+        'health': status,
+        'checked_at': snapshot['generated_at'],
+        'age_seconds': snapshot['age_seconds'],
+        'stale': snapshot['stale'],
+        'failing': failing,
+    }, status=503 if status == 'critical' else 200)
+
+
+@csrf_exempt
+@require_http_methods(["GET"])
+def comprehensive_health_check(request):
+    """Latest health snapshot: every probe result, the system metrics and the snapshot's age."""
+    from core.services.health_probe_service import HealthProbeService
+
+    try:
+        snapshot = HealthProbeService().get_snapshot()
+        system = snapshot['probes'].get('System Resources', {})
+        return JsonResponse({
+            'timestamp': snapshot['generated_at'],
+            'age_seconds': snapshot['age_seconds'],
+            'stale': snapshot['stale'],
+            'overall_status': snapshot['summary']['status'],
+            'summary': snapshot['summary'],
+            'components': {**snapshot['probes'], 'system': system.get('details', {})},
+            'checks': health_snapshot_checks(snapshot),
+        })
+    except Exception as e:
+        logger.error(f"Error in comprehensive health check: {str(e)}")
+        return JsonResponse({
+            'error': str(e),
+            'status': 'error',
+            'timestamp': timezone.now().isoformat()
+        }, status=500)
+
+
+@login_required
+def system_health_check(request):
+    """
+    Health probe results grouped by category for the health check page.
+
+    Serves the latest snapshot; ``?refresh=1`` runs the probes now.
+    """
+    from core.services.health_probe_service import HealthProbeService, PASS, WARNING
+
+    if not request.user.is_superuser:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+
+    service = HealthProbeService()
+    if request.GET.get('refresh') == '1':
+        service.refresh()
+    snapshot = service.get_snapshot()
+
+    categories = {
+        category: {'passed': [], 'failed': [], 'warnings': []}
+        for category in ['CORE', 'SCHEMA', 'API', 'CALENDAR', 'MIGRATIONS', 'AUTH', 'DEPS']
+    }
+    quick_fixes = []
+    for name, result in snapshot['probes'].items():
+        check = {'name': name, 'status': result['status']}
+        if result['status'] == PASS:
+            bucket = 'passed'
+        elif result['status'] == WARNING:
+            bucket = 'warnings'
+            check['message'] = result.get('message')
+        else:
+            bucket = 'failed'
+            check.update(error=result.get('message'), fix=result.get('fix'))
+            if result.get('fix'):
+                quick_fixes.append(result['fix'])
+        categories.setdefault(result['category'], {'passed': [], 'failed': [], 'warnings': []})[bucket].append(check)
+
+    summary = dict(snapshot['summary'])
+    summary['overall_status'] = summary['status']
+    percentage = summary['health_percentage']
+    if percentage >= 90:
+        summary['status'] = 'EXCELLENT'
+    elif percentage >= 75:
+        summary['status'] = 'GOOD'
+    elif percentage >= 50:
+        summary['status'] = 'MODERATE'
+    else:
+        summary['status'] = 'CRITICAL'
+
+    return JsonResponse({
+        'timestamp': snapshot['generated_at'],
+        'age_seconds': snapshot['age_seconds'],
+        'stale': snapshot['stale'],
+        'categories': categories,
+        'summary': summary,
+        'quick_fixes': quick_fixes,
+    })
+
+
+@login_required
+def health_check_view(request):
+    """Render the health check interface."""
+    if not request.user.is_superuser:
+        return render(request, 'core/access_denied.html', {'message': 'Access denied'})
+    
+    return render(request, 'core/health_check.html')
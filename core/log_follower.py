@@ -0,0 +1,506 @@
+"""
+Shared follower for growing log files.
+
+Every viewer following a container's log used to get its own thread polling
+the file once a second. Here one background thread per process follows every
+file that has at least one subscriber: it sleeps on inotify (watching the
+parent directories, so rotations and recreated files wake it too) or, where
+inotify is unavailable, wakes every ``poll_interval`` seconds and checks the
+files with ``stat()``. New lines are read once and fanned out to each
+subscriber's bounded queue; a subscriber that falls behind has lines dropped
+and counted instead of slowing the reader or the other subscribers down.
+
+Each line carries its position, ``(inode, byte offset after the line)``.
+The SSE stream sends the positions as the event id, so a reconnecting
+browser (``Last-Event-ID``) resumes where it left off instead of losing the
+lines written while it was away.
+"""
+
+import ctypes
+import ctypes.util
+import json
+import logging
+import os
+import queue
+import select
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOG_FOLLOWER_CONFIG = {
+    'poll_interval': 1.0,
+    'queue_size': 1000,
+    'stream_seconds': 55,
+    'heartbeat_seconds': 15,
+    'max_streams': 2,
+    'resume_bytes': 256 * 1024,
+}
+
+# From <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+# How long to sleep between safety-net stat() checks when inotify is active
+INOTIFY_RECHECK_FACTOR = 5
+
+
+class _Inotify:
+    """
+    Minimal libc inotify binding.
+
+    Events are only used to wake the follower up; which files changed and by
+    how much is always worked out with ``stat()``, so overflowed or coalesced
+    events cannot lose lines.
+    """
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._watched = set()
+
+    def watch(self, directory: str):
+        if directory in self._watched:
+            return
+        if self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed for {directory}: {os.strerror(errno)}")
+        self._watched.add(directory)
+
+    def drain(self):
+        try:
+            while os.read(self.fd, 64 * 1024):
+                pass
+        except BlockingIOError:
+            pass
+
+
+Position = Tuple[int, int]
+
+
+def format_event_id(positions: Dict[str, Position]) -> str:
+    """SSE event id for the given ``{label: (inode, offset)}`` positions."""
+    return ','.join(f"{label}:{inode}:{offset}" for label, (inode, offset) in sorted(positions.items()))
+
+
+def parse_event_id(value: Optional[str]) -> Dict[str, Position]:
+    """Positions from an event id sent back as ``Last-Event-ID``; malformed parts are ignored."""
+    positions = {}
+    for part in (value or '').split(','):
+        try:
+            label, inode, offset = part.rsplit(':', 2)
+            positions[label] = (int(inode), int(offset))
+        except ValueError:
+            continue
+    return positions
+
+
+class _FollowedFile:
+    """Read position, identity and unterminated last line of one followed file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.handle = None
+        self.identity = None
+        self.partial = b''
+        # Byte offset just past the last complete line read
+        self.offset = 0
+        # Subscribers see lines written from now on; history comes from the tail API
+        self._open(at_end=True)
+
+    def _open(self, at_end: bool):
+        try:
+            handle = open(self.path, 'rb')
+        except OSError:
+            self.handle = self.identity = None
+            return
+        stat = os.fstat(handle.fileno())
+        if at_end:
+            handle.seek(0, os.SEEK_END)
+        self.handle, self.identity, self.partial = handle, (stat.st_dev, stat.st_ino), b''
+        self.offset = handle.tell()
+
+    @property
+    def position(self) -> Optional[Position]:
+        return (self.identity[1], self.offset) if self.handle is not None else None
+
+    def _read_available(self) -> List[Tuple[bytes, Position]]:
+        data = self.handle.read()
+        if not data:
+            return []
+        lines = (self.partial + data).split(b'\n')
+        self.partial = lines.pop()
+        return self._positioned(lines)
+
+    def _positioned(self, lines: List[bytes]) -> List[Tuple[bytes, Position]]:
+        positioned = []
+        for line in lines:
+            self.offset += len(line) + 1
+            positioned.append((line, (self.identity[1], self.offset)))
+        return positioned
+
+    def read_since(self, position: Position, limit: int) -> List[Tuple[bytes, Position]]:
+        """
+        Complete lines between an earlier ``position`` and the current read position.
+
+        A position in another (rotated) file, or past the end of a truncated
+        one, replays the current file from the top. At most the last
+        ``limit`` bytes are returned, starting at a line boundary.
+        """
+        if self.handle is None:
+            return []
+        inode, start = position
+        current, end = self.position
+        if inode != current or start > end:
+            start = 0
+        skip_partial = end - start > limit
+        if skip_partial:
+            start = end - limit
+        data = os.pread(self.handle.fileno(), end - start, start)
+        lines = data.split(b'\n')[:-1]
+        if skip_partial and lines:
+            start += len(lines.pop(0)) + 1
+        positioned = []
+        for line in lines:
+            start += len(line) + 1
+            positioned.append((line, (current, start)))
+        return positioned
+
+    def read_new(self) -> List[Tuple[bytes, Position]]:
+        """
+        Return complete lines written since the last call, with the position
+        after each, following truncation and rotation.
+        """
+        if self.handle is None:
+            # Missing when subscribed, or rotated away: a file appearing now is new, read it all
+            self._open(at_end=False)
+            if self.handle is None:
+                return []
+
+        try:
+            stat = os.stat(self.path)
+            identity = (stat.st_dev, stat.st_ino)
+        except OSError:
+            stat = identity = None
+
+        if identity == self.identity and stat.st_size < self.handle.tell():
+            # Truncated in place (copytruncate): start again from the top
+            self.handle.seek(0)
+            self.partial = b''
+            self.offset = 0
+
+        lines = self._read_available()
+
+        if identity != self.identity:
+            # Rotated: the rest of the old file was read above, switch to the new one
+            if self.partial:
+                lines += self._positioned([self.partial])
+            self.close()
+            if identity is not None:
+                self._open(at_end=False)
+                if self.handle is not None:
+                    lines += self._read_available()
+        return lines
+
+    def close(self):
+        if self.handle is not None:
+            self.handle.close()
+        self.handle = self.identity = None
+        self.partial = b''
+        self.offset = 0
+
+
+class Subscription:
+    """
+    One subscriber's view of the follower: a bounded queue of ``(label, line)``.
+
+    When the queue is full new lines are dropped and counted in ``dropped``
+    rather than blocking the follower; consumers report the count with
+    ``take_dropped()``. ``positions`` holds, per label, the position after
+    the last line taken from the queue.
+    """
+
+    def __init__(self, follower: 'LogFollower', paths: Dict[str, str], queue_size: int,
+                 keep: Optional[Callable[[str], bool]] = None, stream: bool = False):
+        self.follower = follower
+        self.paths = dict(paths)
+        self.keep = keep
+        self.stream = stream
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.positions: Dict[str, Position] = {}
+        self.dropped = 0
+        self.closed = False
+
+    def offer(self, label: str, line: str, position: Optional[Position] = None):
+        """Queue a line without blocking (called by the follower thread)."""
+        if self.keep is not None and not self.keep(line):
+            return
+        try:
+            self.queue.put_nowait((label, line, position))
+        except queue.Full:
+            self.dropped += 1
+
+    def get_batch(self, timeout: float, limit: int = 500) -> List[Tuple[str, str]]:
+        """Wait up to ``timeout`` seconds for a line, then return everything queued (up to ``limit``)."""
+        try:
+            items = [self.queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while len(items) < limit:
+            try:
+                items.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        for label, _, position in items:
+            if position is not None:
+                self.positions[label] = position
+        return [(label, line) for label, line, _ in items]
+
+    def take_dropped(self) -> int:
+        """Return and reset the number of lines dropped since the last call."""
+        with self.follower._lock:
+            dropped, self.dropped = self.dropped, 0
+        return dropped
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.follower.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class LogFollower:
+    """
+    Follows log files for any number of subscribers with a single thread.
+
+    The thread starts with the first subscription and exits once the last one
+    is closed. ``poll()`` runs one read-and-dispatch pass and can be called
+    directly (tests, management commands) without starting the thread.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, use_inotify: bool = True):
+        """Initialize the follower with configuration from settings."""
+        self.config = {**DEFAULT_LOG_FOLLOWER_CONFIG, **getattr(settings, 'LOG_FOLLOWER_CONFIG', {}), **(config or {})}
+        self._lock = threading.Lock()
+        self._subscriptions: List[Subscription] = []
+        self._files: Dict[str, _FollowedFile] = {}
+        self._thread = None
+        self._wake_read, self._wake_write = os.pipe()
+        os.set_blocking(self._wake_read, False)
+        os.set_blocking(self._wake_write, False)
+
+        self._inotify = None
+        if use_inotify:
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError, TypeError) as e:
+                logger.info(f"inotify unavailable ({e}), polling log files every {self.config['poll_interval']}s")
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._inotify is not None
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscriptions)
+
+    @property
+    def stream_count(self) -> int:
+        with self._lock:
+            return sum(subscription.stream for subscription in self._subscriptions)
+
+    def subscribe(self, paths: Dict[str, str], keep: Optional[Callable[[str], bool]] = None,
+                  resume: Optional[Dict[str, Position]] = None) -> Subscription:
+        """
+        Subscribe to new lines of the given files.
+
+        ``paths`` maps each file path to the label its lines are queued with
+        (the container name). ``keep`` filters decoded lines before queueing.
+        ``resume`` maps labels to positions from an earlier subscription; the
+        lines written since then are queued first.
+        """
+        subscription = Subscription(self, paths, self.config['queue_size'], keep)
+        with self._lock:
+            self._add(subscription, resume)
+        return subscription
+
+    def open_stream(self, paths: Dict[str, str], keep: Optional[Callable[[str], bool]] = None,
+                    resume: Optional[Dict[str, Position]] = None) -> Optional[Subscription]:
+        """
+        Subscribe for a long-lived stream, or return None when this process
+        already serves ``max_streams`` of them.
+
+        Each stream holds a request thread for up to ``stream_seconds``; the
+        cap keeps the remaining threads free for ordinary requests.
+        """
+        subscription = Subscription(self, paths, self.config['queue_size'], keep, stream=True)
+        with self._lock:
+            if sum(other.stream for other in self._subscriptions) >= self.config['max_streams']:
+                return None
+            self._add(subscription, resume)
+        return subscription
+
+    def _add(self, subscription: Subscription, resume: Optional[Dict[str, Position]]):
+        for path, label in subscription.paths.items():
+            followed = self._files.get(path)
+            if followed is None:
+                followed = self._files[path] = _FollowedFile(path)
+                self._watch(path)
+            if resume and label in resume:
+                for raw, position in followed.read_since(resume[label], self.config['resume_bytes']):
+                    subscription.offer(label, raw.decode('utf-8', errors='replace').rstrip('\r'), position)
+            if followed.position is not None:
+                subscription.positions.setdefault(label, followed.position)
+        self._subscriptions.append(subscription)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='log-follower', daemon=True)
+            self._thread.start()
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            followed = {path for other in self._subscriptions for path in other.paths}
+            for path in list(self._files):
+                if path not in followed:
+                    self._files.pop(path).close()
+        self._wake()
+
+    def _watch(self, path: str):
+        if self._inotify is None:
+            return
+        directory = os.path.dirname(os.path.abspath(path))
+        try:
+            self._inotify.watch(directory)
+        except OSError as e:
+            logger.warning(f"Falling back to polling for {path}: {e}")
+
+    def _wake(self):
+        try:
+            os.write(self._wake_write, b'x')
+        except BlockingIOError:
+            pass
+
+    def _wait(self):
+        fds = [self._wake_read]
+        timeout = self.config['poll_interval']
+        if self._inotify is not None:
+            fds.append(self._inotify.fd)
+            timeout *= INOTIFY_RECHECK_FACTOR
+        ready, _, _ = select.select(fds, [], [], timeout)
+        if self._wake_read in ready:
+            try:
+                while os.read(self._wake_read, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+        if self._inotify is not None and self._inotify.fd in ready:
+            self._inotify.drain()
+
+    def poll(self) -> int:
+        """Read new lines from every followed file and queue them; returns the number of lines read."""
+        total = 0
+        with self._lock:
+            for path, followed in self._files.items():
+                try:
+                    raw_lines = followed.read_new()
+                except OSError as e:
+                    logger.warning(f"Error following {path}: {e}")
+                    followed.close()
+                    continue
+                if not raw_lines:
+                    continue
+                total += len(raw_lines)
+                lines = [(raw.decode('utf-8', errors='replace').rstrip('\r'), position) for raw, position in raw_lines]
+                for subscription in self._subscriptions:
+                    label = subscription.paths.get(path)
+                    if label is None:
+                        continue
+                    for line, position in lines:
+                        subscription.offer(label, line, position)
+        return total
+
+    def _run(self):
+        logger.debug(f"Log follower started ({'inotify' if self.uses_inotify else 'polling'})")
+        while True:
+            with self._lock:
+                if not self._subscriptions:
+                    self._thread = None
+                    logger.debug("Log follower stopped: no subscribers")
+                    return
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error(f"Error in log follower: {e}")
+            self._wait()
+
+
+_follower = None
+_follower_lock = threading.Lock()
+
+
+def get_log_follower() -> LogFollower:
+    """Return this process's shared follower."""
+    global _follower
+    with _follower_lock:
+        if _follower is None:
+            _follower = LogFollower()
+        return _follower
+
+
+def sse_event(event: str, data, event_id: Optional[str] = None) -> str:
+    """Format one Server-Sent Event with a JSON payload."""
+    id_line = f"id: {event_id}\n" if event_id else ''
+    return f"{id_line}event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def iter_sse(subscription: Subscription, stream_seconds: Optional[float] = None,
+             heartbeat_seconds: Optional[float] = None, clock: Callable[[], float] = time.monotonic) -> Iterator[str]:
+    """
+    Stream a subscription as Server-Sent Events, closing it when done.
+
+    Lines are sent in batches as ``log`` events of ``[{container, line}]``,
+    with the subscription's positions as the event id, and lines the client
+    was too slow to receive as ``dropped`` events. A
+    comment is sent every ``heartbeat_seconds`` while idle, and the stream
+    ends after ``stream_seconds`` so a worker is not held indefinitely;
+    ``EventSource`` reconnects on its own.
+    """
+    config = subscription.follower.config
+    deadline = clock() + (stream_seconds or config['stream_seconds'])
+    heartbeat = heartbeat_seconds or config['heartbeat_seconds']
+    try:
+        yield 'retry: 1000\n\n'
+        while True:
+            remaining = deadline - clock()
+            if remaining <= 0:
+                break
+            batch = subscription.get_batch(timeout=min(heartbeat, remaining))
+            dropped = subscription.take_dropped()
+            if dropped:
+                yield sse_event('dropped', {'count': dropped})
+            if batch:
+                yield sse_event(
+                    'log', [{'container': label, 'line': line} for label, line in batch],
+                    format_event_id(subscription.positions),
+                )
+            elif not dropped:
+                yield ': keepalive\n\n'
+    finally:
+        subscription.close()
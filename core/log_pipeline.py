@@ -0,0 +1,283 @@
+"""
+Queue-based logging pipeline.
+
+With ``settings.LOGGING`` attached directly to the loggers, every request
+thread that logs does the file writes, the size checks and rotations, and
+waits on the handler locks itself. Here the configured loggers are given a
+single ``QueueingHandler`` instead: a call to ``logger.info`` renders the
+message, puts the record on a bounded in-memory queue and returns. One
+listener thread per process takes records off the queue and hands them to
+the handlers the logger was originally configured with.
+
+When the queue is full, records are dropped and counted rather than
+blocking the caller; the count is logged as a warning once there is room
+again. A ``SamplingFilter`` thins out bursts of DEBUG/INFO records from the
+same line of code, and ``JsonFormatter`` writes one JSON object per line.
+
+Settings apply the configuration at import and name ``dict_config`` as
+``LOGGING_CONFIG`` so that Django's own logging setup keeps the queue in
+place. This module is imported from settings, so it only imports Django
+inside ``dict_config``.
+"""
+
+import atexit
+import json
+import logging
+import logging.config
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_LOG_PIPELINE_CONFIG = {
+    'enabled': True,
+    'queue_size': 10000,
+    'sample_burst': 50,
+    'sample_window': 1.0,
+    'sample_rate': 100,
+}
+
+# Attributes every LogRecord has; anything else was passed with ``extra=``
+RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_STOP = object()
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects, including ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        # RotatingFileHandler formats each record twice (size check, then write)
+        cached = record.__dict__.get('_json')
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        entry = {
+            'time': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'function': record.funcName,
+            'line': record.lineno,
+            'process': record.process,
+            'thread': record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        if record.stack_info:
+            entry['stack'] = self.formatStack(record.stack_info)
+        for key, value in vars(record).items():
+            if key not in RECORD_ATTRIBUTES and key not in entry and key != '_json':
+                entry[key] = value
+        text = json.dumps(entry, default=str, ensure_ascii=False)
+        record._json = (self, text)
+        return text
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Sample bursts of low-severity records from the same call site.
+
+    Within each ``window`` seconds the first ``burst`` DEBUG/INFO records
+    from a given ``(logger, file, line)`` pass, then one in every ``rate``.
+    The next record let through carries the number skipped as ``sampled``.
+    WARNING and above always pass.
+    """
+
+    def __init__(self, burst: int = 50, window: float = 1.0, rate: int = 100, clock=time.monotonic):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self.rate = max(1, rate)
+        self.clock = clock
+        self._sites: Dict[Tuple, List] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        key = (record.name, record.pathname, record.lineno)
+        now = self.clock()
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None or now - site[0] >= self.window:
+                # [window start, records seen in window, records skipped since last pass]
+                skipped = site[2] if site else 0
+                site = self._sites[key] = [now, 0, skipped]
+            site[1] += 1
+            seen = site[1]
+            if seen > self.burst and (seen - self.burst) % self.rate:
+                site[2] += 1
+                return False
+            skipped, site[2] = site[2], 0
+        if skipped:
+            record.sampled = skipped
+        return True
+
+
+class QueuePipeline:
+    """
+    The bounded queue and listener thread shared by every QueueingHandler.
+
+    Queue items are ``(record, handlers)``: each handler queues records
+    together with its own downstream handlers, so routing (e.g. security
+    records to ``security.log`` only) is unchanged.
+    """
+
+    def __init__(self, queue_size: int = 10000):
+        self.queue_size = queue_size
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._thread = None
+        self.queue = queue.Queue(maxsize=queue_size)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='log-pipeline', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Process what is queued, then stop the listener."""
+        if self._thread is None:
+            return
+        self.queue.put(_STOP)
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    def drain(self, timeout: float = 5.0):
+        """Wait until the listener has handled everything queued so far."""
+        deadline = time.monotonic() + timeout
+        while self._thread is not None and self.queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def restart_after_fork(self):
+        # Only the forking thread survives a fork: start over in the child
+        self.queue = queue.Queue(maxsize=self.queue_size)
+        self._lock = threading.Lock()
+        self.dropped = 0
+        self._thread = None
+        self.start()
+
+    def put(self, record: logging.LogRecord, handlers: Sequence[logging.Handler]) -> bool:
+        try:
+            self.queue.put_nowait((record, handlers))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        return True
+
+    def take_dropped(self) -> int:
+        with self._lock:
+            dropped, self.dropped = self.dropped, 0
+        return dropped
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is _STOP:
+                    return
+                record, handlers = item
+                for handler in handlers:
+                    if record.levelno >= handler.level:
+                        try:
+                            handler.handle(record)
+                        except Exception:
+                            handler.handleError(record)
+            finally:
+                self.queue.task_done()
+
+
+class QueueingHandler(logging.Handler):
+    """Handler that queues records for another set of handlers and returns immediately."""
+
+    def __init__(self, pipeline: QueuePipeline, handlers: Sequence[logging.Handler]):
+        super().__init__()
+        self.pipeline = pipeline
+        self.handlers = tuple(handlers)
+
+    def createLock(self):
+        # The queue is thread-safe; a handler lock would only make callers take turns
+        self.lock = None
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Render the message and traceback now, in the caller's thread."""
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            record = self.prepare(record)
+            if not self.pipeline.put(record, self.handlers):
+                return
+            dropped = self.pipeline.take_dropped()
+            if dropped:
+                notice = logging.LogRecord(
+                    record.name, logging.WARNING, __file__, 0,
+                    f"Logging queue full: dropped {dropped} log records", None, None,
+                )
+                if not self.pipeline.put(notice, self.handlers):
+                    with self.pipeline._lock:
+                        self.pipeline.dropped += dropped
+        except Exception:
+            self.handleError(record)
+
+
+_pipeline: Optional[QueuePipeline] = None
+
+
+def install_pipeline(logger_names: Sequence[str], config: Optional[Dict] = None) -> QueuePipeline:
+    """
+    Move the handlers of the named loggers (and the root logger) behind the queue.
+
+    Each logger keeps its level and propagation; its handlers are replaced by
+    one QueueingHandler forwarding to them, with a SamplingFilter of its own
+    (a propagated record passes several handlers and must be counted once by
+    each). The pipeline and its listener thread are created once per process.
+    """
+    global _pipeline
+    config = {**DEFAULT_LOG_PIPELINE_CONFIG, **(config or {})}
+    if _pipeline is None:
+        _pipeline = QueuePipeline(config['queue_size'])
+        _pipeline.start()
+        atexit.register(_pipeline.stop)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=_pipeline.restart_after_fork)
+
+    for logger in [logging.getLogger()] + [logging.getLogger(name) for name in logger_names]:
+        handlers = [handler for handler in logger.handlers if not isinstance(handler, QueueingHandler)]
+        if not handlers:
+            continue
+        queueing = QueueingHandler(_pipeline, handlers)
+        queueing.addFilter(SamplingFilter(config['sample_burst'], config['sample_window'], config['sample_rate']))
+        logger.handlers = [queueing]
+    return _pipeline
+
+
+def configure_logging(logging_config: Dict, pipeline_config: Optional[Dict] = None) -> Optional[QueuePipeline]:
+    """Apply ``logging_config`` with dictConfig, then put its loggers behind the queue unless disabled."""
+    if _pipeline is not None:
+        # Let records queued for the handlers about to be replaced reach them
+        _pipeline.drain()
+    logging.config.dictConfig(logging_config)
+    config = {**DEFAULT_LOG_PIPELINE_CONFIG, **(pipeline_config or {})}
+    if not config['enabled']:
+        return None
+    return install_pipeline(list(logging_config.get('loggers', {})), config)
+
+
+def dict_config(logging_config: Dict):
+    """``LOGGING_CONFIG`` entry point: Django calls it with ``settings.LOGGING`` during setup."""
+    from django.conf import settings
+
+    configure_logging(logging_config, getattr(settings, 'LOG_PIPELINE_CONFIG', None))
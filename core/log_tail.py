@@ -0,0 +1,77 @@
+"""
+Tail reading for log files.
+
+The log viewer only ever shows the last N lines of a file, so instead of
+``readlines()`` on the whole file (10 MB per rotated log, per container, per
+refresh) the file is read backwards from EOF in fixed-size blocks until N
+lines have been found. Only those lines are decoded, so the cost follows the
+number of lines requested rather than the size of the file.
+"""
+
+import os
+from typing import Callable, Iterator, List, Optional
+
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def iter_lines_reverse(path: str, block_size: int = TAIL_BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Yield the raw lines of a file from last to first.
+
+    Lines keep their trailing ``b'\\n'`` like ``readlines()``; a final line
+    without one is yielded as is.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b''
+        trailing = True  # The next piece yielded is the end of the file
+
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            parts = (f.read(read_size) + remainder).split(b'\n')
+            # The first piece may continue in the previous block
+            remainder = parts.pop(0)
+            for part in reversed(parts):
+                if trailing:
+                    trailing = False
+                    if part:
+                        yield part
+                    continue
+                yield part + b'\n'
+
+        if trailing:
+            if remainder:
+                yield remainder
+        else:
+            yield remainder + b'\n'
+
+
+def _decode(line: bytes) -> str:
+    text = line.decode('utf-8', errors='replace')
+    return text[:-2] + '\n' if text.endswith('\r\n') else text
+
+
+def tail_lines(path: str, lines: int, keep: Optional[Callable[[bytes], bool]] = None,
+               block_size: int = TAIL_BLOCK_SIZE) -> List[str]:
+    """
+    Return the last ``lines`` lines of a file, oldest first, decoded as UTF-8.
+
+    ``keep`` filters raw lines (e.g. to skip ``#`` header lines) before they
+    count towards ``lines``. ``lines <= 0`` returns every line.
+    """
+    collected = []
+    for raw in iter_lines_reverse(path, block_size):
+        if keep is None or keep(raw):
+            collected.append(raw)
+            if 0 < lines <= len(collected):
+                break
+    collected.reverse()
+    return [_decode(raw) for raw in collected]
+
+
+def not_header(raw: bytes) -> bool:
+    """``keep`` predicate skipping the ``#`` header lines of collected log files."""
+    return not raw.startswith(b'#')
@@ -0,0 +1,147 @@
+"""
+Management command measuring what a worker pays at start-up.
+
+Each run starts a fresh interpreter with ``-X importtime``, calls
+django.setup() (optionally loading the URLconf and extra modules, as the
+first request would) and reports the time taken and the process RSS.
+The import log gives the slowest modules and a per-package breakdown.
+"""
+
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+MARKER = 'STARTUP_PROFILE '
+
+CHILD_SCRIPT = '''
+import json, sys, time
+from importlib import import_module
+started = time.perf_counter()
+import django
+django.setup()
+result = {'setup_ms': (time.perf_counter() - started) * 1000}
+for module in sys.argv[1:]:
+    module_started = time.perf_counter()
+    import_module(module)
+    result.setdefault('modules_ms', {})[module] = (time.perf_counter() - module_started) * 1000
+result['total_ms'] = (time.perf_counter() - started) * 1000
+import psutil
+result['rss'] = psutil.Process().memory_info().rss
+print(%r + json.dumps(result))
+''' % MARKER
+
+IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)')
+
+
+def parse_importtime(lines):
+    """``[(module, self_us, cumulative_us, depth)]`` from ``-X importtime`` output."""
+    entries = []
+    for line in lines:
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+
+def package_breakdown(entries):
+    """Self import time (us) summed per top-level package, largest first."""
+    totals = defaultdict(int)
+    for module, self_us, _, _ in entries:
+        totals[module.split('.')[0]] += self_us
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+class Command(BaseCommand):
+    help = 'Measure per-module import time and per-worker RSS after django.setup()'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=3, help='Fresh interpreters to start (default 3)')
+        parser.add_argument('--top', type=int, default=20, help='Modules and packages to list (default 20)')
+        parser.add_argument('--urls', action='store_true', help='Also import the URLconf, as the first request does')
+        parser.add_argument('--import', dest='modules', action='append', default=[], metavar='MODULE',
+                            help='Also import MODULE after setup (repeatable), e.g. core.views')
+        parser.add_argument('--max-ms', type=float, help='Fail if the median start-up time exceeds this')
+        parser.add_argument('--max-rss-mb', type=float, help='Fail if the median RSS exceeds this')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    def handle(self, *args, **options):
+        if options['runs'] < 1:
+            raise CommandError('--runs must be at least 1')
+        modules = ([settings.ROOT_URLCONF] if options['urls'] else []) + options['modules']
+
+        runs = [self.run_child(modules) for _ in range(options['runs'])]
+        # The first run also warms the bytecode cache; report the import log of the last
+        entries = runs[-1].pop('imports')
+        for run in runs[:-1]:
+            run.pop('imports')
+        report = {
+            'runs': runs,
+            'median_ms': round(statistics.median(run['total_ms'] for run in runs), 1),
+            'median_rss_mb': round(statistics.median(run['rss'] for run in runs) / 1024 ** 2, 1),
+            'modules_imported': len(entries),
+            'slowest_modules': [
+                {'module': module, 'self_ms': self_us / 1000, 'cumulative_ms': cumulative_us / 1000}
+                for module, self_us, cumulative_us, _ in
+                sorted(entries, key=lambda entry: entry[2], reverse=True)[:options['top']]
+            ],
+            'packages': [
+                {'package': package, 'self_ms': self_us / 1000}
+                for package, self_us in package_breakdown(entries)[:options['top']]
+            ],
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self.display(report)
+
+        over = []
+        if options['max_ms'] is not None and report['median_ms'] > options['max_ms']:
+            over.append(f"start-up took {report['median_ms']} ms (budget {options['max_ms']} ms)")
+        if options['max_rss_mb'] is not None and report['median_rss_mb'] > options['max_rss_mb']:
+            over.append(f"RSS is {report['median_rss_mb']} MB (budget {options['max_rss_mb']} MB)")
+        if over:
+            raise CommandError('Start-up budget exceeded: ' + '; '.join(over))
+
+    def run_child(self, modules):
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', CHILD_SCRIPT, *modules],
+            capture_output=True, text=True, env=os.environ.copy(), cwd=settings.BASE_DIR,
+        )
+        result = next(
+            (json.loads(line[len(MARKER):]) for line in process.stdout.splitlines() if line.startswith(MARKER)), None
+        )
+        if process.returncode != 0 or result is None:
+            errors = [line for line in process.stderr.splitlines() if not line.startswith('import time:')]
+            raise CommandError('Start-up failed:\n' + '\n'.join(errors[-20:]))
+        result = {key: round(value, 1) if isinstance(value, float) else value for key, value in result.items()}
+        result['imports'] = parse_importtime(process.stderr.splitlines())
+        return result
+
+    def display(self, report):
+        for number, run in enumerate(report['runs'], 1):
+            modules = ''.join(f", {module} {ms:.1f} ms" for module, ms in run.get('modules_ms', {}).items())
+            self.stdout.write(
+                f"Run {number}: django.setup() {run['setup_ms']:.1f} ms{modules}, "
+                f"total {run['total_ms']:.1f} ms, RSS {run['rss'] / 1024 ** 2:.1f} MB"
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"Median: {report['median_ms']} ms, {report['median_rss_mb']} MB RSS, "
+            f"{report['modules_imported']} modules imported"
+        ))
+
+        self.stdout.write('\nSlowest imports (cumulative):')
+        for entry in report['slowest_modules']:
+            self.stdout.write(f"  {entry['cumulative_ms']:9.1f} ms  {entry['self_ms']:8.1f} ms self  {entry['module']}")
+        self.stdout.write('\nImport time by package (self):')
+        for entry in report['packages']:
+            self.stdout.write(f"  {entry['self_ms']:9.1f} ms  {entry['package']}")
@@ -22,6 +22,11 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def is_health_check(request):
+    """Load-balancer health checks are answered from the health snapshot without touching the database."""
+    return request.path.rstrip('/').endswith('/health/simple')
+
+
 class DatabaseConnectionMiddleware(MiddlewareMixin):
     """
     Middleware to handle database connection issues gracefully.
@@ -29,6 +34,8 @@ class DatabaseConnectionMiddleware(MiddlewareMixin):
     
     def process_request(self, request):
         """Ensure database connection is healthy before processing request."""
+        if is_health_check(request):
+            return None
         try:
             # Test database connection
             connection.ensure_connection()
@@ -82,7 +89,7 @@ class SystemMonitoringMiddleware(MiddlewareMixin):
     
     def process_request(self, request):
         """Record request start time and system metrics."""
-        if not self.monitoring_enabled:
+        if not self.monitoring_enabled or is_health_check(request):
             return None
         
         request.start_time = time.time()
@@ -12,6 +12,11 @@ from django.conf import settings
 from .models import Permission, Role, UserProfile
 
 
+def is_staff_or_superuser(user):
+    """Check if user is staff or superuser."""
+    return user.is_staff or user.is_superuser
+
+
 def permission_required(permission_codename, login_url=None, raise_exception=False):
     """
     Decorator for views that checks if user has a specific permission.
@@ -0,0 +1,328 @@
+"""
+Backup Service
+Database backups written by a Celery task instead of inside a request.
+
+Each model is streamed with ``.iterator()`` through Django's JSONL
+serializer into a gzip (or zstd) archive, so memory use does not grow
+with the database; gzip archives restore with ``manage.py loaddata``. On
+PostgreSQL, full backups use ``pg_dump --format=custom`` when it is
+installed. Every archive gets a SHA-256 checksum (also written next to it
+in ``sha256sum`` format) and an entry in ``manifest.json``; old backups
+are pruned after each run.
+
+Incremental backups hold only the rows whose ``updated_at`` is newer than
+the start of the previous backup (models without ``updated_at`` are
+included in full). Deleted rows are not recorded, so restoring means the
+last full backup followed by its incrementals in order.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import shutil
+import subprocess
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.core import serializers
+from django.db import connections, router
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKUP_CONFIG = {
+    'directory': None,  # BASE_DIR/backups
+    'format': 'auto',  # 'auto' (pg_dump for full backups on PostgreSQL when installed), 'jsonl' or 'pg_dump'
+    'compression': 'gzip',  # or 'zstd' (needs the zstandard package)
+    'compression_level': 6,
+    'chunk_size': 2000,
+    'retention_days': 30,
+    'keep_min': 3,  # Full backups kept regardless of age
+    'exclude': ['contenttypes', 'auth.permission', 'sessions'],
+}
+
+MANIFEST_FILE = 'manifest.json'
+EXTENSIONS = {'gzip': '.jsonl.gz', 'zstd': '.jsonl.zst', 'pg_dump': '.dump'}
+FULL, INCREMENTAL = 'full', 'incremental'
+
+
+class BackupError(Exception):
+    """A backup could not be written."""
+
+
+class _HashingWriter(io.RawIOBase):
+    """Binary sink that checksums and counts what passes through to ``raw``."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.sha256.update(data)
+        self.size += len(data)
+        self.raw.write(data)
+        return len(data)
+
+
+class BackupService:
+    """Write, list and prune database backups."""
+
+    def __init__(self, config: Optional[Dict] = None, using: str = 'default'):
+        self.config = {
+            **DEFAULT_BACKUP_CONFIG,
+            **getattr(settings, 'BACKUP_CONFIG', {}),
+            **(config or {}),
+        }
+        self.directory = self.config['directory'] or os.path.join(settings.BASE_DIR, 'backups')
+        self.using = using
+
+    @property
+    def connection(self):
+        return connections[self.using]
+
+    # Manifest
+
+    def read_manifest(self) -> Dict:
+        try:
+            with open(os.path.join(self.directory, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'backups': []}
+
+    def write_manifest(self, manifest: Dict):
+        path = os.path.join(self.directory, MANIFEST_FILE)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_path, path)
+
+    def list_backups(self) -> List[Dict]:
+        """Backups in the manifest, newest first."""
+        return list(reversed(self.read_manifest()['backups']))
+
+    # Backups
+
+    def backup_models(self) -> List:
+        """Models to dump, dependencies first, leaving out proxies, unmanaged models and exclusions."""
+        excluded = {label.lower() for label in self.config['exclude']}
+        app_list = {}
+        for model in apps.get_models():
+            meta = model._meta
+            if meta.proxy or not meta.managed or meta.app_label in excluded or meta.label_lower in excluded:
+                continue
+            if not router.allow_migrate_model(self.using, model):
+                continue
+            app_list.setdefault(apps.get_app_config(meta.app_label), []).append(model)
+        return serializers.sort_dependencies(app_list.items(), allow_cycles=True)
+
+    def create_backup(self, kind: str = FULL, progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Write a backup and record it in the manifest, then prune old backups.
+
+        ``kind`` is ``full`` or ``incremental``; an incremental backup with no
+        earlier backup to build on is written as a full one. ``progress`` is
+        called with a dict describing the work done so far.
+        """
+        if kind not in (FULL, INCREMENTAL):
+            raise BackupError(f"Unknown backup kind: {kind}")
+        os.makedirs(self.directory, exist_ok=True)
+        progress = progress or (lambda info: None)
+        previous = self.read_manifest()['backups']
+        since = previous[-1]['started_at'] if kind == INCREMENTAL and previous else None
+        if since is None:
+            kind = FULL
+
+        started = timezone.now()
+        backup_format = self.backup_format(kind)
+        extension = EXTENSIONS['pg_dump' if backup_format == 'pg_dump' else self.config['compression']]
+        stem = f"backup_{started.strftime('%Y%m%d_%H%M%S')}{'_incremental' if kind == INCREMENTAL else ''}"
+        name, attempt = f"{stem}{extension}", 1
+        while os.path.exists(os.path.join(self.directory, name)):
+            attempt += 1
+            name = f"{stem}_{attempt}{extension}"
+        path = os.path.join(self.directory, name)
+        partial_path = f"{path}.partial"
+
+        try:
+            if backup_format == 'pg_dump':
+                details = self._pg_dump(partial_path, progress)
+            else:
+                details = self._dump_jsonl(partial_path, since, progress)
+            os.replace(partial_path, path)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+
+        entry = {
+            'name': name,
+            'kind': kind,
+            'format': backup_format,
+            'compression': 'pg_dump' if backup_format == 'pg_dump' else self.config['compression'],
+            'started_at': started.isoformat(),
+            'finished_at': timezone.now().isoformat(),
+            'since': since,
+            **details,
+        }
+        with open(f"{path}.sha256", 'w', encoding='utf-8') as f:
+            f.write(f"{entry['sha256']}  {name}\n")
+
+        manifest = self.read_manifest()
+        manifest['backups'].append(entry)
+        self.write_manifest(manifest)
+        entry['pruned'] = self.prune()
+        progress({'stage': 'done', 'name': name, 'size': entry['size']})
+        return entry
+
+    def backup_format(self, kind: str) -> str:
+        configured = self.config['format']
+        if configured == 'pg_dump' or (
+            configured == 'auto' and kind == FULL
+            and self.connection.vendor == 'postgresql' and shutil.which('pg_dump')
+        ):
+            if kind == INCREMENTAL:
+                raise BackupError('pg_dump backups cannot be incremental')
+            return 'pg_dump'
+        return 'jsonl'
+
+    def _open_compressed(self, raw):
+        compression = self.config['compression']
+        level = self.config['compression_level']
+        if compression == 'gzip':
+            return gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=level)
+        if compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                raise BackupError('zstd compression needs the zstandard package')
+            return zstandard.ZstdCompressor(level=level).stream_writer(raw, closefd=False)
+        raise BackupError(f"Unknown compression: {compression}")
+
+    def _dump_jsonl(self, path: str, since: Optional[str], progress: Callable[[Dict], None]) -> Dict:
+        models = self.backup_models()
+        since_time = datetime.fromisoformat(since) if since else None
+        chunk_size = self.config['chunk_size']
+        counts = {}
+        serializer = serializers.get_serializer('jsonl')()
+
+        with open(path, 'wb') as raw:
+            hashing = _HashingWriter(raw)
+            compressed = self._open_compressed(hashing)
+            text = io.TextIOWrapper(compressed, encoding='utf-8')
+            try:
+                for index, model in enumerate(models):
+                    queryset = model._base_manager.using(self.using).order_by(model._meta.pk.name)
+                    if since_time is not None and any(field.name == 'updated_at' for field in model._meta.concrete_fields):
+                        queryset = queryset.filter(updated_at__gt=since_time)
+                    label = model._meta.label
+
+                    def rows(queryset=queryset, label=label, index=index):
+                        for count, obj in enumerate(queryset.iterator(chunk_size=chunk_size), 1):
+                            counts[label] = count
+                            if count % chunk_size == 0:
+                                progress({'stage': 'dumping', 'model': label, 'models_done': index,
+                                          'models_total': len(models), 'rows': count})
+                            yield obj
+
+                    serializer.serialize(rows(), stream=text)
+                    progress({'stage': 'dumping', 'model': label, 'models_done': index + 1,
+                              'models_total': len(models), 'rows': counts.get(label, 0)})
+                text.flush()
+            finally:
+                text.detach()
+                compressed.close()
+
+        return {
+            'size': hashing.size,
+            'sha256': hashing.sha256.hexdigest(),
+            'rows': sum(counts.values()),
+            'models': counts,
+        }
+
+    def _pg_dump(self, path: str, progress: Callable[[Dict], None]) -> Dict:
+        settings_dict = self.connection.settings_dict
+        command = ['pg_dump', '--format=custom', f"--compress={self.config['compression_level']}",
+                   '--verbose', '--no-owner', f'--file={path}']
+        for option, key in (('--host', 'HOST'), ('--port', 'PORT'), ('--username', 'USER')):
+            if settings_dict.get(key):
+                command += [option, str(settings_dict[key])]
+        command.append(settings_dict['NAME'])
+        env = {**os.environ, 'PGPASSWORD': settings_dict.get('PASSWORD') or ''}
+
+        tables_total = len(self.connection.introspection.table_names())
+        tables_done = 0
+        messages = []
+        process = subprocess.Popen(command, env=env, stderr=subprocess.PIPE, text=True)
+        for line in process.stderr:
+            messages = (messages + [line.rstrip()])[-20:]
+            if 'dumping contents of table' in line:
+                tables_done += 1
+                progress({'stage': 'dumping', 'model': line.rsplit(' ', 1)[-1].strip().strip('"'),
+                          'models_done': tables_done, 'models_total': tables_total})
+        if process.wait() != 0:
+            raise BackupError('pg_dump failed: ' + '\n'.join(messages))
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return {'size': os.path.getsize(path), 'sha256': digest.hexdigest(), 'tables': tables_done}
+
+    # Retention
+
+    def prune(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        Delete backups older than ``retention_days``, always keeping the newest
+        ``keep_min`` full backups and the incrementals taken after the oldest
+        full backup kept. Returns the names removed.
+        """
+        now = now or timezone.now()
+        cutoff = now - timedelta(days=self.config['retention_days'])
+        manifest = self.read_manifest()
+        backups = manifest['backups']
+        fulls = [entry for entry in backups if entry['kind'] == FULL]
+        newest = {entry['name'] for entry in fulls[-self.config['keep_min']:]} if self.config['keep_min'] else set()
+        kept_fulls = [entry for entry in fulls
+                      if entry['name'] in newest or datetime.fromisoformat(entry['started_at']) >= cutoff]
+        oldest_base = datetime.fromisoformat(kept_fulls[0]['started_at']) if kept_fulls else None
+
+        kept, removed = [], []
+        for entry in backups:
+            if entry in kept_fulls or (
+                entry['kind'] == INCREMENTAL and oldest_base is not None
+                and datetime.fromisoformat(entry['started_at']) > oldest_base
+            ):
+                kept.append(entry)
+                continue
+            removed.append(entry['name'])
+            for path in (entry['name'], f"{entry['name']}.sha256"):
+                try:
+                    os.remove(os.path.join(self.directory, path))
+                except FileNotFoundError:
+                    pass
+        if removed:
+            manifest['backups'] = kept
+            self.write_manifest(manifest)
+            logger.info(f"Pruned {len(removed)} old backups")
+        return removed
+
+    def verify(self, name: str) -> bool:
+        """Check a backup file against the checksum in the manifest."""
+        entry = next((entry for entry in self.read_manifest()['backups'] if entry['name'] == name), None)
+        if entry is None:
+            raise BackupError(f"Unknown backup: {name}")
+        digest = hashlib.sha256()
+        with open(os.path.join(self.directory, name), 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest() == entry['sha256']
@@ -0,0 +1,153 @@
+"""
+Bulk Delete Service
+Deletes large querysets in primary-key chunks with raw SQL, one short
+transaction per chunk, instead of Django's collector loading every row and
+holding locks for the whole purge.
+"""
+
+import logging
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db import connection, models, transaction
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BULK_DELETE_CONFIG = {
+    'chunk_size': 1000,
+    'pause': 0.0,
+}
+
+
+def _chunks(values: Sequence, size: int) -> Iterable[Sequence]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class BatchedDeleter:
+    """
+    Service for deleting a queryset's rows and their dependents in chunks.
+
+    The queryset is walked in ascending primary-key order, ``chunk_size`` keys
+    at a time. For each chunk, dependent rows are removed first with raw
+    ``DELETE ... WHERE fk IN (...)`` statements, following the models' CASCADE
+    relations (including many-to-many through tables) and nulling SET_NULL
+    references, then the chunk itself is deleted, all in one transaction.
+
+    ``also_delete`` lists extra ``(model, fk_name)`` relations to treat as
+    CASCADE, e.g. calendar events whose FK to an activity is SET_NULL but which
+    should go with it. Raw deletes bypass delete() and the pre/post_delete
+    signals, so callers invalidate caches once when the purge is done.
+    """
+
+    def __init__(self, model, also_delete: Iterable[Tuple[type, str]] = (), config: Optional[Dict] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        """Initialize the deleter with configuration from settings."""
+        self.model = model
+        self.config = {**DEFAULT_BULK_DELETE_CONFIG, **getattr(settings, 'BULK_DELETE_CONFIG', {}), **(config or {})}
+        self.chunk_size = max(1, self.config['chunk_size'])
+        self.sleep = sleep
+        self.also_delete = [(related_model, related_model._meta.get_field(fk_name)) for related_model, fk_name in also_delete]
+
+    def _relations(self, model) -> List[Tuple[type, models.Field, bool]]:
+        """Return ``(related_model, fk_field, cascade)`` for every relation pointing at ``model``."""
+        relations = []
+        for relation in model._meta.get_fields(include_hidden=True):
+            if not (relation.auto_created and not relation.concrete and (relation.one_to_many or relation.one_to_one)):
+                continue
+            on_delete = relation.on_delete
+            if on_delete is models.CASCADE:
+                relations.append((relation.related_model, relation.field, True))
+            elif on_delete is models.SET_NULL:
+                relations.append((relation.related_model, relation.field, False))
+            elif on_delete is not models.DO_NOTHING:
+                raise ValueError(
+                    f"{relation.related_model._meta.label}.{relation.field.name} uses {on_delete.__name__}; "
+                    f"delete {model._meta.label} through the ORM instead"
+                )
+        if model is self.model:
+            extra = {(related_model, field.name) for related_model, field in self.also_delete}
+            relations = [r for r in relations if (r[0], r[1].name) not in extra]
+            relations += [(related_model, field, True) for related_model, field in self.also_delete]
+        return relations
+
+    def _execute(self, sql: str, params: Sequence) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.rowcount
+
+    def _delete_rows(self, model, pks: Sequence, counts: Dict[str, int]):
+        """Delete rows of ``model`` with the given primary keys, dependents first."""
+        quote = connection.ops.quote_name
+        for related_model, field, cascade in self._relations(model):
+            table, column = quote(related_model._meta.db_table), quote(field.column)
+            for batch in _chunks(pks, self.chunk_size):
+                placeholders = ', '.join(['%s'] * len(batch))
+                if not cascade:
+                    self._execute(f"UPDATE {table} SET {column} = NULL WHERE {column} IN ({placeholders})", batch)
+                elif self._relations(related_model):
+                    # Dependents have dependents of their own: resolve their keys and recurse
+                    dependent_pks = list(
+                        related_model._base_manager.filter(**{f'{field.name}__in': batch}).values_list('pk', flat=True)
+                    )
+                    if dependent_pks:
+                        self._delete_rows(related_model, dependent_pks, counts)
+                else:
+                    deleted = self._execute(f"DELETE FROM {table} WHERE {column} IN ({placeholders})", batch)
+                    if deleted > 0:
+                        counts[related_model._meta.label] = counts.get(related_model._meta.label, 0) + deleted
+
+        table, pk_column = quote(model._meta.db_table), quote(model._meta.pk.column)
+        for batch in _chunks(pks, self.chunk_size):
+            placeholders = ', '.join(['%s'] * len(batch))
+            deleted = self._execute(f"DELETE FROM {table} WHERE {pk_column} IN ({placeholders})", batch)
+            counts[model._meta.label] = counts.get(model._meta.label, 0) + deleted
+
+    def delete(self, queryset) -> Dict:
+        """
+        Delete every row in ``queryset`` (which must be of this deleter's model).
+
+        Returns a dict with ``deleted`` (rows removed from the queryset's
+        model), ``by_model`` (rows removed per model label, dependents
+        included), ``chunks``, ``seconds`` and ``rows_per_second``.
+        """
+        if queryset.model is not self.model:
+            raise ValueError(f"Expected a {self.model._meta.label} queryset, got {queryset.model._meta.label}")
+
+        keys = queryset.order_by('pk').values_list('pk', flat=True)
+        counts = {}
+        chunks = 0
+        last_pk = None
+        started = time.perf_counter()
+
+        while True:
+            page = keys.filter(pk__gt=last_pk) if last_pk is not None else keys
+            pks = list(page[:self.chunk_size])
+            if not pks:
+                break
+            with transaction.atomic():
+                self._delete_rows(self.model, pks, counts)
+            chunks += 1
+            last_pk = pks[-1]
+            logger.debug(f"Deleted chunk {chunks} of {self.model._meta.label} ({len(pks)} rows, up to pk {last_pk})")
+            if self.config['pause']:
+                self.sleep(self.config['pause'])
+
+        seconds = time.perf_counter() - started
+        deleted = counts.get(self.model._meta.label, 0)
+        total = sum(counts.values())
+        result = {
+            'deleted': deleted,
+            'by_model': counts,
+            'chunks': chunks,
+            'seconds': round(seconds, 3),
+            'rows_per_second': round(total / seconds) if seconds > 0 else total,
+        }
+        if chunks:
+            logger.info(
+                f"Deleted {deleted} {str(self.model._meta.verbose_name_plural).lower()} ({total} rows with dependents) "
+                f"in {chunks} chunks, {result['seconds']}s, {result['rows_per_second']} rows/s"
+            )
+        return result
@@ -0,0 +1,241 @@
+"""
+Database Stats Service
+Row counts and table sizes for the debug and database pages without a
+COUNT(*) per table: totals come from the planner's statistics
+(pg_stat_user_tables / pg_class on PostgreSQL, MAX(rowid) on SQLite),
+status breakdowns from one grouped query per table, and results are
+cached for a short time. Exact counts are computed by a Celery task and
+cached separately.
+"""
+
+import logging
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Count, Q
+from django.template.defaultfilters import filesizeformat
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATABASE_STATS_CONFIG = {
+    'cache_ttl': 60,
+    'exact_ttl': 3600,
+    'recent_days': 7,
+}
+
+# (label, model, fields the breakdown groups by, date field for the "recent" count)
+STATS_TABLES = [
+    ('Equipment', 'equipment.Equipment', ['is_active'], None),
+    ('Equipment Connections', 'equipment.EquipmentConnection', [], None),
+    ('Locations', 'core.Location', ['is_site', 'is_active'], None),
+    ('Customers', 'core.Customer', ['is_active'], None),
+    ('Maintenance Activities', 'maintenance.MaintenanceActivity', ['status'], None),
+    ('Maintenance Schedules', 'maintenance.MaintenanceSchedule', [], None),
+    ('Activity Types', 'maintenance.MaintenanceActivityType', [], None),
+    ('Calendar Events', 'events.CalendarEvent', [], 'created_at'),
+    ('Users', 'auth.User', [], None),
+]
+
+CACHE_PREFIX = 'database_stats'
+EXACT_PENDING_TIMEOUT = 300
+
+
+class DatabaseStatsService:
+    """Estimated and exact table statistics for the configured tables."""
+
+    def __init__(self, config: Optional[Dict] = None, using: str = 'default', tables: Optional[List] = None):
+        self.config = {
+            **DEFAULT_DATABASE_STATS_CONFIG,
+            **getattr(settings, 'DATABASE_STATS_CONFIG', {}),
+            **(config or {}),
+        }
+        self.using = using
+        self.tables = tables if tables is not None else STATS_TABLES
+
+    @property
+    def connection(self):
+        return connections[self.using]
+
+    def cache_key(self, kind: str) -> str:
+        return f'{CACHE_PREFIX}:{self.using}:{kind}'
+
+    def models(self):
+        for label, model_name, group_by, recent_field in self.tables:
+            yield label, apps.get_model(model_name), group_by, recent_field
+
+    def estimate_counts(self) -> Dict[str, Dict]:
+        """``{db_table: {'count', 'size'}}`` from catalog statistics, without scanning the tables."""
+        tables = [model._meta.db_table for _, model, _, _ in self.models()]
+        vendor = self.connection.vendor
+        if vendor == 'postgresql':
+            return self._postgresql_estimates(tables)
+        if vendor == 'sqlite':
+            return self._sqlite_estimates(tables)
+        # No catalog estimate for other backends: fall back to exact counts
+        return {model._meta.db_table: {'count': model.objects.using(self.using).count(), 'size': None}
+                for _, model, _, _ in self.models()}
+
+    def _postgresql_estimates(self, tables: List[str]) -> Dict[str, Dict]:
+        with self.connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT c.relname, c.reltuples::bigint, s.n_live_tup, s.n_tup_ins + s.n_tup_del,
+                       pg_size_pretty(pg_total_relation_size(c.oid))
+                FROM pg_class c
+                LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+                WHERE c.relname = ANY(%s) AND c.relkind IN ('r', 'p') AND pg_table_is_visible(c.oid)
+            """, [tables])
+            rows = cursor.fetchall()
+        estimates = {}
+        for table, reltuples, live_tuples, changes, size in rows:
+            # n_live_tup follows inserts and deletes as they happen, so a 0 is
+            # trusted once it has seen some; reltuples is only refreshed by
+            # VACUUM/ANALYZE and is -1 before the first one
+            if live_tuples or (live_tuples == 0 and changes):
+                count = live_tuples
+            elif reltuples is not None and reltuples >= 0:
+                count = reltuples
+            else:
+                count = None
+            estimates[table] = {'count': count, 'size': size}
+
+        # Never analyzed and no tracked changes (new, empty or stats reset):
+        # count those tables exactly rather than report no count at all
+        for _, model, _, _ in self.models():
+            estimate = estimates.get(model._meta.db_table)
+            if estimate is not None and estimate['count'] is None:
+                estimate['count'] = model.objects.using(self.using).count()
+        return estimates
+
+    def _sqlite_estimates(self, tables: List[str]) -> Dict[str, Dict]:
+        # MAX(rowid) is a single b-tree lookup; it over-counts by the rows deleted since
+        estimates = {}
+        with self.connection.cursor() as cursor:
+            for table in tables:
+                cursor.execute(f'SELECT MAX(rowid) FROM {self.connection.ops.quote_name(table)}')
+                estimates[table] = {'count': cursor.fetchone()[0] or 0, 'size': None}
+        return estimates
+
+    def database_size(self) -> Optional[str]:
+        vendor = self.connection.vendor
+        try:
+            with self.connection.cursor() as cursor:
+                if vendor == 'postgresql':
+                    cursor.execute('SELECT pg_size_pretty(pg_database_size(current_database()))')
+                    return cursor.fetchone()[0]
+                if vendor == 'sqlite':
+                    cursor.execute('PRAGMA page_count')
+                    pages = cursor.fetchone()[0]
+                    cursor.execute('PRAGMA page_size')
+                    return filesizeformat(pages * cursor.fetchone()[0])
+        except Exception as e:
+            logger.warning(f"Error getting database size: {e}")
+        return None
+
+    def breakdowns(self) -> Dict[str, Dict]:
+        """
+        Exact totals and per-field counts, from one grouped query per table.
+
+        ``{'Locations': {'total': 12, 'is_site': {True: 3, False: 9}, 'is_active': {...}}}``;
+        tables with a recent field also get ``recent``: rows created in the
+        last ``recent_days`` days. Tables with neither are left out and keep
+        their catalog estimate, so none is scanned just for a total.
+        """
+        since = timezone.now() - timedelta(days=self.config['recent_days'])
+        result = {}
+        for label, model, group_by, recent_field in self.models():
+            if not group_by and not recent_field:
+                continue
+            annotations = {'rows': Count('pk')}
+            if recent_field:
+                annotations['recent'] = Count('pk', filter=Q(**{f'{recent_field}__gte': since}))
+            queryset = model.objects.using(self.using).order_by()
+            if group_by:
+                groups = list(queryset.values(*group_by).annotate(**annotations))
+            else:
+                groups = [queryset.aggregate(**annotations)]
+
+            stats = {'total': sum(group['rows'] for group in groups)}
+            for field in group_by:
+                counts = stats[field] = {}
+                for group in groups:
+                    counts[group[field]] = counts.get(group[field], 0) + group['rows']
+            if recent_field:
+                stats['recent'] = sum(group['recent'] for group in groups)
+            result[label] = stats
+        return result
+
+    def get_stats(self, breakdowns: bool = False, exact: bool = False) -> Dict:
+        """
+        Table statistics, cached for ``cache_ttl`` seconds.
+
+        Counts are estimates unless ``breakdowns`` is set (the grouped query
+        yields exact totals for the tables it covers) or exact counts from
+        ``refresh_exact`` are cached. With ``exact`` and nothing cached, the
+        background count is queued and ``exact_pending`` is set.
+        """
+        key = self.cache_key('breakdowns' if breakdowns else 'estimates')
+        stats = cache.get(key)
+        if stats is None:
+            stats = self._collect(breakdowns)
+            cache.set(key, stats, self.config['cache_ttl'])
+
+        stats = {**stats, 'exact_pending': False}
+        if exact:
+            counted = cache.get(self.cache_key('exact'))
+            if counted is None:
+                stats['exact_pending'] = self.queue_exact()
+            else:
+                stats['tables'] = {
+                    label: {**info, 'count': counted['counts'].get(label, info['count']), 'estimated': False}
+                    for label, info in stats['tables'].items()
+                }
+                stats['counted_at'] = counted['counted_at']
+        return stats
+
+    def _collect(self, breakdowns: bool) -> Dict:
+        estimates = self.estimate_counts()
+        grouped = self.breakdowns() if breakdowns else {}
+        tables = {}
+        for label, model, _, _ in self.models():
+            estimate = estimates.get(model._meta.db_table, {'count': None, 'size': None})
+            info = {'table': model._meta.db_table, 'count': estimate['count'], 'size': estimate['size'], 'estimated': True}
+            if label in grouped:
+                info.update(count=grouped[label]['total'], estimated=False, breakdown=grouped[label])
+            tables[label] = info
+        return {
+            'tables': tables,
+            'database_size': self.database_size(),
+            'database_name': self.connection.settings_dict.get('NAME', 'Unknown'),
+            'generated_at': timezone.now().isoformat(),
+        }
+
+    def queue_exact(self) -> bool:
+        """Queue ``refresh_exact_database_stats`` unless it is already queued; True when pending."""
+        from core.tasks import refresh_exact_database_stats
+
+        pending_key = self.cache_key('exact_pending')
+        if not cache.add(pending_key, True, EXACT_PENDING_TIMEOUT):
+            return True
+        try:
+            refresh_exact_database_stats.delay(self.using)
+        except Exception as e:
+            logger.warning(f"Could not queue exact database stats: {e}")
+            cache.delete(pending_key)
+            return False
+        return True
+
+    def refresh_exact(self) -> Dict:
+        """COUNT(*) every table and cache the result for ``exact_ttl`` seconds."""
+        counted = {
+            'counts': {label: model.objects.using(self.using).count() for label, model, _, _ in self.models()},
+            'counted_at': timezone.now().isoformat(),
+        }
+        cache.set(self.cache_key('exact'), counted, self.config['exact_ttl'])
+        cache.delete(self.cache_key('exact_pending'))
+        return counted
@@ -0,0 +1,428 @@
+"""
+Health Probe Service
+One registry of health probes. The probes run concurrently, each with its
+own timeout, from a Celery beat task (or a background thread when the
+snapshot has gone stale) and the results are kept as a snapshot with the
+time it was taken. Health endpoints serve that snapshot without touching
+the database, so load-balancer checks cost a file stat.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime, timezone as dt_timezone
+from typing import Callable, Dict, Iterable, List, Optional
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEALTH_PROBE_CONFIG = {
+    'snapshot_path': '/app/logs/health_snapshot.json',
+    'stale_after': 120,
+    'timeout': 5.0,
+    'max_workers': 16,
+    'background_refresh': True,
+}
+
+PASS, WARNING, FAIL, TIMEOUT = 'PASS', 'WARNING', 'FAIL', 'TIMEOUT'
+
+
+class ProbeWarning(Exception):
+    """Raised by a probe that ran but found something worth a warning rather than a failure."""
+
+
+class HealthProbe:
+    """A registered check: ``func()`` returns a message or a dict of details, or raises."""
+
+    def __init__(self, name: str, func: Callable, category: str, critical: bool = False,
+                 timeout: Optional[float] = None, fix: Optional[str] = None):
+        self.name = name
+        self.func = func
+        self.category = category
+        self.critical = critical
+        self.timeout = timeout
+        self.fix = fix
+
+
+_registry: Dict[str, HealthProbe] = {}
+
+
+def register_probe(name: str, category: str, critical: bool = False,
+                   timeout: Optional[float] = None, fix: Optional[str] = None):
+    """
+    Decorator adding a probe to the registry.
+
+    ``critical`` probes take the overall status to ``critical`` when they
+    fail (``/health/simple/`` then answers 503); any other failure or
+    warning makes it ``warning``. ``timeout`` overrides the configured one.
+    """
+    def decorator(func):
+        _registry[name] = HealthProbe(name, func, category, critical, timeout, fix)
+        return func
+    return decorator
+
+
+def get_probes() -> List[HealthProbe]:
+    return list(_registry.values())
+
+
+def _call_probe(probe: HealthProbe) -> Dict:
+    from django.db import connections
+
+    started = time.perf_counter()
+    result = {'category': probe.category, 'critical': probe.critical}
+    try:
+        outcome = probe.func()
+        result['status'] = PASS
+        if isinstance(outcome, dict):
+            result['details'] = outcome
+        elif outcome:
+            result['message'] = str(outcome)
+    except ProbeWarning as e:
+        result.update(status=WARNING, message=str(e))
+    except Exception as e:
+        result.update(status=FAIL, message=str(e) or e.__class__.__name__)
+    finally:
+        # Probes run in pool threads: close the connections they opened
+        connections.close_all()
+    result['duration'] = round(time.perf_counter() - started, 4)
+    if result['status'] == FAIL and probe.fix:
+        result['fix'] = probe.fix
+    return result
+
+
+def summarize(results: Dict[str, Dict]) -> Dict:
+    """Overall status and counts for a set of probe results."""
+    passed = sum(1 for result in results.values() if result['status'] == PASS)
+    warnings = sum(1 for result in results.values() if result['status'] == WARNING)
+    failed = len(results) - passed - warnings
+    if any(result['critical'] and result['status'] in (FAIL, TIMEOUT) for result in results.values()):
+        status = 'critical'
+    elif failed or warnings:
+        status = 'warning'
+    else:
+        status = 'healthy'
+    return {
+        'status': status,
+        'total_checks': len(results),
+        'passed': passed,
+        'failed': failed,
+        'warnings': warnings,
+        'health_percentage': round(passed * 100 / len(results)) if results else 0,
+    }
+
+
+# Latest snapshot in this process per snapshot path, with the file's mtime when it was read
+_latest: Dict[str, Dict] = {}
+_latest_lock = threading.Lock()
+_refreshing = threading.Lock()
+
+
+class HealthProbeService:
+    """Run the registered probes and keep the latest snapshot of their results."""
+
+    def __init__(self, config: Optional[Dict] = None, probes: Optional[Iterable[HealthProbe]] = None):
+        self.config = {
+            **DEFAULT_HEALTH_PROBE_CONFIG,
+            **getattr(settings, 'HEALTH_PROBE_CONFIG', {}),
+            **(config or {}),
+        }
+        self.probes = list(probes) if probes is not None else get_probes()
+
+    def run_probes(self) -> Dict:
+        """
+        Run every probe concurrently and return a snapshot.
+
+        Timeouts count from the start of the run. A probe still running at its
+        deadline is reported as TIMEOUT and left to finish in the background,
+        so one hung dependency cannot hold up the others or the caller.
+        """
+        started = time.time()
+        results = {}
+        if self.probes:
+            executor = ThreadPoolExecutor(
+                max_workers=max(1, min(self.config['max_workers'], len(self.probes))),
+                thread_name_prefix='health-probe',
+            )
+            try:
+                futures = [(probe, executor.submit(_call_probe, probe)) for probe in self.probes]
+                for probe, future in futures:
+                    timeout = probe.timeout if probe.timeout is not None else self.config['timeout']
+                    try:
+                        results[probe.name] = future.result(timeout=max(0.0, started + timeout - time.time()))
+                    except FutureTimeoutError:
+                        results[probe.name] = {
+                            'category': probe.category,
+                            'critical': probe.critical,
+                            'status': TIMEOUT,
+                            'message': f'No answer within {timeout:g}s',
+                            'duration': round(time.time() - started, 4),
+                        }
+                        if probe.fix:
+                            results[probe.name]['fix'] = probe.fix
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        return {
+            'generated_at': datetime.fromtimestamp(started, tz=dt_timezone.utc).isoformat(),
+            'generated_ts': started,
+            'duration': round(time.time() - started, 4),
+            'summary': summarize(results),
+            'probes': results,
+        }
+
+    def refresh(self) -> Dict:
+        """Run the probes and store the snapshot."""
+        snapshot = self.run_probes()
+        self.save(snapshot)
+        return snapshot
+
+    def save(self, snapshot: Dict):
+        path = self.config['snapshot_path']
+        with _latest_lock:
+            latest = _latest.setdefault(path, {'snapshot': None, 'mtime': None})
+            latest['snapshot'] = snapshot
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, default=str)
+            os.replace(temp_path, path)
+            with _latest_lock:
+                latest['mtime'] = os.stat(path).st_mtime_ns
+        except OSError as e:
+            # Still served from this process's memory
+            logger.debug(f"Could not write health snapshot to {path}: {e}")
+
+    def load(self) -> Optional[Dict]:
+        """The latest snapshot: this process's copy, or the file if another process wrote a newer one."""
+        path = self.config['snapshot_path']
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        with _latest_lock:
+            latest = _latest.setdefault(path, {'snapshot': None, 'mtime': None})
+            snapshot, known_mtime = latest['snapshot'], latest['mtime']
+        if mtime is None or mtime == known_mtime:
+            return snapshot
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read health snapshot from {path}: {e}")
+            return snapshot
+        with _latest_lock:
+            latest['mtime'] = mtime
+            if latest['snapshot'] is None or stored.get('generated_ts', 0) >= latest['snapshot']['generated_ts']:
+                latest['snapshot'] = stored
+            return latest['snapshot']
+
+    def get_snapshot(self, now: Optional[float] = None) -> Dict:
+        """
+        Return the latest snapshot with its ``age_seconds`` and ``stale`` flag.
+
+        Never runs a probe in the caller's thread. When there is no snapshot
+        yet, or it is older than ``stale_after`` (beat not running), a refresh
+        is started in a background thread and the status is ``unknown`` until
+        it completes.
+        """
+        snapshot = self.load()
+        now = time.time() if now is None else now
+        if snapshot is None:
+            self.refresh_in_background()
+            return {
+                'generated_at': None,
+                'age_seconds': None,
+                'stale': True,
+                'summary': {**summarize({}), 'status': 'unknown'},
+                'probes': {},
+            }
+        age = max(0.0, now - snapshot['generated_ts'])
+        stale = age > self.config['stale_after']
+        if stale:
+            self.refresh_in_background()
+        return {**snapshot, 'age_seconds': round(age, 1), 'stale': stale}
+
+    def refresh_in_background(self) -> bool:
+        """Start a refresh thread unless disabled or one is already running in this process."""
+        if not self.config['background_refresh'] or not _refreshing.acquire(blocking=False):
+            return False
+
+        def run():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Background health refresh failed: {e}")
+            finally:
+                _refreshing.release()
+
+        threading.Thread(target=run, name='health-refresh', daemon=True).start()
+        return True
+
+
+# Built-in probes
+
+def _probe_user():
+    from django.contrib.auth.models import User
+
+    user = User.objects.filter(is_superuser=True, is_active=True).first()
+    if user is None:
+        raise ProbeWarning('No active superuser to run the request as')
+    return user
+
+
+@register_probe('Database Connection', 'CORE', critical=True, fix='Check database connectivity and credentials')
+def probe_database():
+    from django.db import connection
+
+    started = time.perf_counter()
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+        cursor.fetchone()
+    return {'response_time': round(time.perf_counter() - started, 4)}
+
+
+@register_probe('Cache', 'DEPS', fix='Check the cache backend configuration')
+def probe_cache():
+    from django.core.cache import cache
+
+    key = 'health_probe_test'
+    cache.set(key, 'value', 60)
+    value = cache.get(key)
+    cache.delete(key)
+    if value != 'value':
+        raise RuntimeError('Cache read/write mismatch')
+    # ResilientCache reports whether Redis or its fallback is serving
+    status = getattr(cache, 'status', None)
+    if status is None:
+        return {'backend': settings.CACHES['default']['BACKEND']}
+    status = status()
+    if status['mode'] != 'primary':
+        raise ProbeWarning(f"Serving from the fallback cache ({status['fallback']}): {status['last_error']}")
+    return status
+
+
+@register_probe('Redis Connection', 'DEPS', fix='Check Redis server connectivity')
+def probe_redis():
+    if not getattr(settings, 'USE_REDIS', True):
+        return 'Redis disabled'
+    import redis
+
+    client = redis.Redis.from_url(
+        getattr(settings, 'REDIS_URL', 'redis://redis:6379'), socket_connect_timeout=1, socket_timeout=1
+    )
+    client.ping()
+
+
+@register_probe('Celery Worker', 'DEPS', timeout=5.0, fix='Start a Celery worker')
+def probe_celery_worker():
+    from maintenance_dashboard.celery import app
+
+    replies = app.control.ping(timeout=2.0)
+    if not replies:
+        raise RuntimeError('No worker answered a ping')
+    return {'workers': sorted(name for reply in replies for name in reply)}
+
+
+@register_probe('Celery Beat', 'DEPS', fix='Start Celery beat')
+def probe_celery_beat():
+    from django.db.models import Max
+    from django.utils import timezone
+    from django_celery_beat.models import PeriodicTask
+
+    latest = PeriodicTask.objects.filter(enabled=True).aggregate(latest=Max('last_run_at'))['latest']
+    if latest is None:
+        raise ProbeWarning('No periodic tasks have run')
+    seconds = (timezone.now() - latest).total_seconds()
+    if seconds >= 600:
+        raise ProbeWarning(f'No recent heartbeat (last was {int(seconds // 60)} min ago)')
+    return f'Recent heartbeat ({int(seconds)}s ago)'
+
+
+@register_probe('System Resources', 'CORE')
+def probe_system():
+    import psutil
+
+    metrics = {
+        'cpu_percent': psutil.cpu_percent(interval=0.1),
+        'memory_percent': psutil.virtual_memory().percent,
+        'disk_usage': psutil.disk_usage('/').percent,
+        'load_average': psutil.getloadavg() if hasattr(psutil, 'getloadavg') else None,
+        'process_count': len(psutil.pids()),
+    }
+    if metrics['disk_usage'] > 90:
+        raise ProbeWarning(f"Low disk space: {100 - metrics['disk_usage']:.1f}% free")
+    return metrics
+
+
+@register_probe('MaintenanceActivity Model', 'SCHEMA', fix='Run: ./scripts/simple_timezone_fix.sh')
+def probe_maintenance_model():
+    from maintenance.models import MaintenanceActivity
+
+    MaintenanceActivity.objects.exists()
+    if not hasattr(MaintenanceActivity, 'timezone'):
+        raise RuntimeError('MaintenanceActivity.timezone is missing')
+
+
+@register_probe('CalendarEvent Model', 'SCHEMA', fix='Check events app migrations')
+def probe_calendar_event_model():
+    from events.models import CalendarEvent
+
+    CalendarEvent.objects.exists()
+
+
+@register_probe('Unapplied Migrations', 'MIGRATIONS', fix='Run: python manage.py migrate')
+def probe_migrations():
+    from django.db import connection
+    from django.db.migrations.executor import MigrationExecutor
+
+    executor = MigrationExecutor(connection)
+    plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+    if plan:
+        raise ProbeWarning(f'{len(plan)} migrations not applied')
+
+
+@register_probe('fetch_unified_events API', 'API', fix='Run: ./scripts/simple_timezone_fix.sh')
+def probe_unified_events():
+    from django.test import RequestFactory
+    from events.views import fetch_unified_events
+
+    request = RequestFactory().get('/events/api/unified/', {'start': '2025-01-01', 'end': '2025-12-31'})
+    request.user = _probe_user()
+    response = fetch_unified_events(request)
+    if response.status_code != 200:
+        raise RuntimeError(f'Returned HTTP {response.status_code}')
+
+
+@register_probe('Calendar View Renders', 'CALENDAR', fix='Check calendar view and template rendering')
+def probe_calendar_view():
+    from django.test import RequestFactory
+    from events.views import calendar_view
+
+    request = RequestFactory().get('/events/calendar/')
+    request.user = _probe_user()
+    response = calendar_view(request)
+    if response.status_code != 200:
+        raise RuntimeError(f'Returned HTTP {response.status_code}')
+
+
+@register_probe('Maintenance Activities Count', 'CALENDAR')
+def probe_activities_exist():
+    from maintenance.models import MaintenanceActivity
+
+    if not MaintenanceActivity.objects.exists():
+        raise ProbeWarning('No maintenance activities found - calendar may appear empty')
+
+
+@register_probe('Admin User Exists', 'AUTH', fix='Create admin user: python manage.py createsuperuser')
+def probe_admin_user():
+    from django.contrib.auth.models import User
+
+    if not User.objects.filter(is_superuser=True).exists():
+        raise RuntimeError('No superuser')
@@ -0,0 +1,367 @@
+"""
+Log Store Service
+Indexes collected container and system logs in SQLite FTS5 databases, one
+file per UTC day, so they can be searched by time, container, level and
+text without reading log files into memory.
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOG_STORE_CONFIG = {
+    'enabled': True,
+    'directory': '/app/logs/store',
+    'retention_days': 14,
+    'max_page_size': 500,
+    'busy_timeout': 30,
+}
+
+LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+LEVEL_ALIASES = {'WARN': 'WARNING', 'FATAL': 'CRITICAL', 'CRIT': 'CRITICAL', 'ERR': 'ERROR'}
+LEVEL_PATTERN = re.compile(r'\b(DEBUG|INFO|WARNING|WARN|ERROR|ERR|CRITICAL|CRIT|FATAL)\b', re.IGNORECASE)
+
+PARTITION_PREFIX = 'logs-'
+PARTITION_SUFFIX = '.db'
+OFFSETS_FILE = 'ingest_offsets.json'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    ts INTEGER NOT NULL,
+    container TEXT NOT NULL,
+    stream TEXT NOT NULL,
+    level TEXT NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_ts ON entries (ts);
+CREATE INDEX IF NOT EXISTS entries_container_ts ON entries (container, ts);
+CREATE INDEX IF NOT EXISTS entries_level_ts ON entries (level, ts);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    message, content='entries', content_rowid='id', tokenize='unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts (rowid, message) VALUES (new.id, new.message);
+END;
+"""
+
+# Leading timestamps recognised when ingesting plain log files
+ISO_TIMESTAMP = re.compile(r'^\[?(\d{4}-\d{2}-\d{2})[ T](\d{2}:\d{2}:\d{2})')
+SYSLOG_TIMESTAMP = re.compile(r'^([A-Z][a-z]{2}) +(\d{1,2}) (\d{2}:\d{2}:\d{2})')
+
+
+def detect_level(message: str) -> str:
+    """Return the first log level named near the start of a message, INFO when there is none."""
+    match = LEVEL_PATTERN.search(message, 0, 200)
+    if not match:
+        return 'INFO'
+    level = match.group(1).upper()
+    return LEVEL_ALIASES.get(level, level)
+
+
+def to_nanos(moment: datetime) -> int:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=dt_timezone.utc)
+    return int(moment.timestamp()) * 1_000_000_000 + moment.microsecond * 1000
+
+
+def from_nanos(nanos: int) -> datetime:
+    return datetime.fromtimestamp(nanos // 1_000_000_000, tz=dt_timezone.utc).replace(
+        microsecond=(nanos % 1_000_000_000) // 1000
+    )
+
+
+def match_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching every word, with FTS5 syntax characters taken literally."""
+    return ' '.join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+class LogStore:
+    """
+    Service for storing and searching log entries.
+
+    Each UTC day is a separate SQLite database (``logs-YYYY-MM-DD.db``)
+    holding an ``entries`` table indexed on time, container and level, plus
+    an external-content FTS5 index of the messages. A query only opens the
+    days in its time range and walks them newest first, so a page costs a
+    few index lookups per day; retention deletes whole day files.
+    """
+
+    def __init__(self, config: Optional[Dict] = None):
+        """Initialize the store with configuration from settings."""
+        self.config = {**DEFAULT_LOG_STORE_CONFIG, **getattr(settings, 'LOG_STORE_CONFIG', {}), **(config or {})}
+        self.directory = str(self.config['directory'])
+
+    def partition_path(self, day: date) -> str:
+        return os.path.join(self.directory, f"{PARTITION_PREFIX}{day.isoformat()}{PARTITION_SUFFIX}")
+
+    def partitions(self) -> List[date]:
+        """Days with a partition, oldest first."""
+        days = []
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return days
+        for name in names:
+            if name.startswith(PARTITION_PREFIX) and name.endswith(PARTITION_SUFFIX):
+                try:
+                    days.append(date.fromisoformat(name[len(PARTITION_PREFIX):-len(PARTITION_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(days)
+
+    def _connect(self, day: date, write: bool = False) -> sqlite3.Connection:
+        path = self.partition_path(day)
+        if write:
+            os.makedirs(self.directory, exist_ok=True)
+            connection = sqlite3.connect(path, timeout=self.config['busy_timeout'])
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.executescript(SCHEMA)
+        else:
+            connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=self.config['busy_timeout'])
+        return connection
+
+    # Ingestion
+
+    def add(self, entries: Iterable[Tuple[int, str, str, str]]) -> int:
+        """
+        Store ``(timestamp_ns, container, stream, message)`` entries.
+
+        Entries are grouped by day and written in one transaction per
+        partition. Returns the number of entries stored.
+        """
+        by_day: Dict[date, List[Tuple]] = {}
+        for nanos, container, stream, message in entries:
+            day = from_nanos(nanos).date()
+            by_day.setdefault(day, []).append((nanos, container, stream.upper(), detect_level(message), message))
+
+        stored = 0
+        for day, rows in by_day.items():
+            connection = self._connect(day, write=True)
+            try:
+                with connection:
+                    connection.executemany(
+                        'INSERT INTO entries (ts, container, stream, level, message) VALUES (?, ?, ?, ?, ?)', rows,
+                    )
+            finally:
+                connection.close()
+            stored += len(rows)
+        return stored
+
+    def _load_offsets(self) -> Dict[str, List[int]]:
+        try:
+            with open(os.path.join(self.directory, OFFSETS_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_offsets(self, offsets: Dict[str, List[int]]):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, OFFSETS_FILE)
+        with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+            json.dump(offsets, f)
+        os.replace(f"{path}.tmp", path)
+
+    def ingest_file(self, path: str, source: str, now: Optional[datetime] = None) -> int:
+        """
+        Store the lines appended to a plain log file since the last call.
+
+        The read offset is remembered per path together with the file's
+        inode, so a rotated or truncated file is read from the start. Lines
+        starting with an ISO or syslog timestamp keep it; others get the time
+        of the previous line, or ``now``.
+        """
+        now = now or datetime.now(dt_timezone.utc)
+        offsets = self._load_offsets()
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return 0
+        if not os.path.isfile(path):
+            return 0
+
+        inode, offset = offsets.get(path, [None, 0])
+        if inode != stat.st_ino or stat.st_size < offset:
+            offset = 0
+        if stat.st_size == offset:
+            return 0
+
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+        # Leave an unterminated last line for the next run
+        end = data.rfind(b'\n') + 1
+        if not end:
+            return 0
+
+        entries = []
+        last = to_nanos(now)
+        for raw in data[:end].split(b'\n')[:-1]:
+            line = raw.decode('utf-8', errors='replace').rstrip('\r')
+            if not line.strip() or line.startswith('#'):
+                continue
+            last = self._line_timestamp(line, now) or last
+            entries.append((last, source, 'STDOUT', line))
+
+        stored = self.add(entries)
+        offsets[path] = [stat.st_ino, offset + end]
+        self._save_offsets(offsets)
+        return stored
+
+    def _line_timestamp(self, line: str, now: datetime) -> Optional[int]:
+        match = ISO_TIMESTAMP.match(line)
+        if match:
+            try:
+                return to_nanos(datetime.fromisoformat(f"{match.group(1)} {match.group(2)}"))
+            except ValueError:
+                return None
+        match = SYSLOG_TIMESTAMP.match(line)
+        if match:
+            try:
+                moment = datetime.strptime(f"{now.year} {match.group(1)} {match.group(2)} {match.group(3)}", '%Y %b %d %H:%M:%S')
+            except ValueError:
+                return None
+            if moment.month > now.month:
+                # Written last December, read in January
+                moment = moment.replace(year=now.year - 1)
+            return to_nanos(moment)
+        return None
+
+    # Retention
+
+    def prune(self, retention_days: Optional[int] = None, today: Optional[date] = None) -> List[date]:
+        """Delete the partitions older than ``retention_days``; returns the days removed."""
+        retention_days = self.config['retention_days'] if retention_days is None else retention_days
+        cutoff = (today or datetime.now(dt_timezone.utc).date()) - timedelta(days=retention_days)
+        removed = []
+        for day in self.partitions():
+            if day >= cutoff:
+                break
+            path = self.partition_path(day)
+            for suffix in ('', '-wal', '-shm'):
+                try:
+                    os.remove(path + suffix)
+                except FileNotFoundError:
+                    pass
+            removed.append(day)
+        if removed:
+            logger.info(f"Pruned {len(removed)} log store partitions older than {cutoff}")
+        return removed
+
+    # Search
+
+    @staticmethod
+    def encode_cursor(day: date, nanos: int, row_id: int) -> str:
+        return f"{day.isoformat()}.{nanos}.{row_id}"
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[date, int, int]:
+        try:
+            day, nanos, row_id = cursor.split('.')
+            return date.fromisoformat(day), int(nanos), int(row_id)
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+    def search(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+               containers: Optional[Sequence[str]] = None, levels: Optional[Sequence[str]] = None,
+               text: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None) -> Dict:
+        """
+        Return entries matching every given filter, newest first.
+
+        ``start`` is inclusive and ``end`` exclusive; ``text`` must match all
+        of its words. Returns ``entries``, and ``next_cursor`` to pass back for
+        the following page (None on the last page).
+        """
+        limit = max(1, min(limit, self.config['max_page_size']))
+        started = time.perf_counter()
+        start_ns = to_nanos(start) if start else None
+        end_ns = to_nanos(end) if end else None
+        after = self.decode_cursor(cursor) if cursor else None
+
+        conditions, params = [], []
+        if start_ns is not None:
+            conditions.append('ts >= ?')
+            params.append(start_ns)
+        if end_ns is not None:
+            conditions.append('ts < ?')
+            params.append(end_ns)
+        if containers:
+            conditions.append(f"container IN ({', '.join('?' * len(containers))})")
+            params.extend(containers)
+        if levels:
+            levels = [LEVEL_ALIASES.get(level.upper(), level.upper()) for level in levels]
+            conditions.append(f"level IN ({', '.join('?' * len(levels))})")
+            params.extend(levels)
+        query = match_query(text) if text else ''
+        if query:
+            conditions.append('id IN (SELECT rowid FROM entries_fts WHERE entries_fts MATCH ?)')
+            params.append(query)
+
+        days = [
+            day for day in reversed(self.partitions())
+            if (start is None or day >= from_nanos(start_ns).date())
+            and (end is None or day <= from_nanos(end_ns - 1).date())
+            and (after is None or day <= after[0])
+        ]
+
+        results = []
+        next_cursor = None
+        searched = 0
+        for day in days:
+            searched += 1
+            day_conditions, day_params = list(conditions), list(params)
+            if after and day == after[0]:
+                day_conditions.append('(ts < ? OR (ts = ? AND id < ?))')
+                day_params.extend([after[1], after[1], after[2]])
+            where = f"WHERE {' AND '.join(day_conditions)}" if day_conditions else ''
+            wanted = limit + 1 - len(results)
+            connection = self._connect(day)
+            try:
+                rows = connection.execute(
+                    f"SELECT id, ts, container, stream, level, message FROM entries {where} "
+                    f"ORDER BY ts DESC, id DESC LIMIT ?",
+                    day_params + [wanted],
+                ).fetchall()
+            except sqlite3.OperationalError as e:
+                if 'fts5' in str(e) or 'syntax' in str(e):
+                    raise ValueError(f"Invalid search text: {text}")
+                logger.warning(f"Skipping log store partition {day}: {e}")
+                continue
+            finally:
+                connection.close()
+
+            for row_id, nanos, container, stream, level, message in rows:
+                if len(results) == limit:
+                    last = results[-1]
+                    next_cursor = self.encode_cursor(last['_day'], last['_ts'], last['_id'])
+                    break
+                results.append({
+                    '_day': day, '_ts': nanos, '_id': row_id,
+                    'timestamp': from_nanos(nanos).isoformat(),
+                    'container': container,
+                    'stream': stream,
+                    'level': level,
+                    'message': message,
+                })
+            if next_cursor:
+                break
+
+        for entry in results:
+            del entry['_day'], entry['_ts'], entry['_id']
+        return {
+            'entries': results,
+            'next_cursor': next_cursor,
+            'partitions_searched': searched,
+            'seconds': round(time.perf_counter() - started, 4),
+        }
@@ -6,7 +6,6 @@ Provides real-time log streaming from multiple sources without Docker commands.
 import os
 import json
 import glob
-import time
 import threading
 import asyncio
 import subprocess
@@ -16,10 +15,22 @@ from django.conf import settings
 from django.core.cache import cache
 from django.contrib.auth.models import User
 from django.utils import timezone
+from core.log_follower import get_log_follower
+from core.log_tail import not_header, tail_lines
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Streams are shared by every service instance in the process so a stream
+# started by one request can be stopped by the next
+_active_streams: Dict[str, Dict[str, Any]] = {}
+_streams_lock = threading.Lock()
+
+
+def not_header_line(line: str) -> bool:
+    """Subscription filter skipping the ``#`` header lines of collected log files."""
+    return not line.startswith('#')
+
 
 class LogStreamingService:
     """
@@ -44,7 +55,6 @@ class LogStreamingService:
                 '/var/log/system.log'
             ]
         })
-        self.active_streams = {}
         self.logger = logging.getLogger(__name__)
     
     def get_available_containers(self) -> List[Dict[str, Any]]:
@@ -283,16 +293,8 @@ class LogStreamingService:
             if not os.path.exists(log_file):
                 return f"Log file not found: {log_file}"
             
-            # Read the file
-            with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-                if follow:
-                    # For following, read all lines and return
-                    all_lines = f.readlines()
-                    return ''.join(all_lines[-lines:]) if lines > 0 else ''.join(all_lines)
-                else:
-                    # For non-following, read last N lines
-                    all_lines = f.readlines()
-                    return ''.join(all_lines[-lines:]) if lines > 0 else ''.join(all_lines)
+            # Read only the last N lines, seeking back from the end of the file
+            return ''.join(tail_lines(log_file, lines))
                     
         except Exception as e:
             return f"Error reading log file {log_file}: {str(e)}"
@@ -313,31 +315,29 @@ class LogStreamingService:
                 return f"Log file not found: {log_file}"
             
             logs = []
-            with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-                file_lines = f.readlines()
-                
-                # Parse JSON logs (Docker format: {"log":"message","stream":"stdout","time":"timestamp"})
-                for line in file_lines[-lines:] if lines > 0 else file_lines:
-                    try:
-                        log_entry = json.loads(line.strip())
-                        timestamp = log_entry.get('time', '')
-                        stream = log_entry.get('stream', 'stdout')
-                        message = log_entry.get('log', '')
-                        
-                        # Format timestamp
-                        if timestamp:
-                            try:
-                                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                                formatted_time = dt.strftime('%Y-%m-%d %H:%M:%S')
-                            except (ValueError, TypeError):
-                                formatted_time = timestamp
-                        else:
-                            formatted_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        
-                        logs.append(f"[{formatted_time}] [{stream.upper()}] {message}")
-                    except json.JSONDecodeError:
-                        # Fallback to raw line if not JSON
-                        logs.append(line.strip())
+            # Parse JSON logs (Docker format: {"log":"message","stream":"stdout","time":"timestamp"})
+            # Only the tail of the file is read, and only those lines are parsed
+            for line in tail_lines(log_file, lines):
+                try:
+                    log_entry = json.loads(line.strip())
+                    timestamp = log_entry.get('time', '')
+                    stream = log_entry.get('stream', 'stdout')
+                    message = log_entry.get('log', '')
+                    
+                    # Format timestamp
+                    if timestamp:
+                        try:
+                            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                            formatted_time = dt.strftime('%Y-%m-%d %H:%M:%S')
+                        except (ValueError, TypeError):
+                            formatted_time = timestamp
+                    else:
+                        formatted_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    
+                    logs.append(f"[{formatted_time}] [{stream.upper()}] {message}")
+                except json.JSONDecodeError:
+                    # Fallback to raw line if not JSON
+                    logs.append(line.strip())
             
             return '\n'.join(logs)
             
@@ -386,15 +386,9 @@ class LogStreamingService:
                 # Read from collected system log files
                 for log_file in system_log_files:
                     try:
-                        with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-                            all_lines = f.readlines()
-                        
-                        # Skip header lines (lines starting with #)
-                        content_lines = [line for line in all_lines if not line.startswith('#')]
-                        
-                        # Take last lines from this file
+                        # Take last lines from this file, skipping header lines (lines starting with #)
                         lines_per_file = max(1, lines // len(system_log_files)) if system_log_files else lines
-                        system_logs.extend(content_lines[-lines_per_file:])
+                        system_logs.extend(tail_lines(log_file, lines_per_file, keep=not_header))
                         
                     except Exception as e:
                         self.logger.warning(f"Error reading system log file {log_file}: {e}")
@@ -415,11 +409,9 @@ class LogStreamingService:
                 for log_path in log_paths:
                     try:
                         if os.path.exists(log_path):
-                            with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
-                                file_lines = f.readlines()
-                                # Take last lines from this file
-                                lines_per_file = max(1, lines // len(log_paths))
-                                system_logs.extend(file_lines[-lines_per_file:])
+                            # Take last lines from this file
+                            lines_per_file = max(1, lines // len(log_paths))
+                            system_logs.extend(tail_lines(log_path, lines_per_file))
                     except Exception as e:
                         self.logger.warning(f"Error reading system log {log_path}: {e}")
             
@@ -429,10 +421,9 @@ class LogStreamingService:
                 for container in containers[:3]:  # Limit to first 3 containers
                     if container.get('log_file') and os.path.exists(container['log_file']):
                         try:
-                            with open(container['log_file'], 'r', encoding='utf-8', errors='replace') as f:
-                                file_lines = f.readlines()
-                                lines_per_container = max(1, lines // 3)
-                                system_logs.extend([f"[{container['name']}] {line}" for line in file_lines[-lines_per_container:]])
+                            lines_per_container = max(1, lines // 3)
+                            file_lines = tail_lines(container['log_file'], lines_per_container)
+                            system_logs.extend([f"[{container['name']}] {line}" for line in file_lines])
                         except Exception as e:
                             self.logger.warning(f"Error reading container log {container['name']}: {e}")
             
@@ -539,17 +530,8 @@ class LogStreamingService:
             
             # Read from collected log file
             try:
-                with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-                    all_lines = f.readlines()
-                
-                # Skip header lines (lines starting with #)
-                content_lines = [line for line in all_lines if not line.startswith('#')]
-                
-                # Take the last N lines
-                if lines > 0:
-                    content_lines = content_lines[-lines:]
-                
-                result = ''.join(content_lines)
+                # Take the last N lines, skipping header lines (lines starting with #)
+                result = ''.join(tail_lines(log_file, lines, keep=not_header))
                 debug_info.append(f"Collected log result length: {len(result)}")
                 debug_info.append(f"Collected log preview: {result[:100]}...")
                 return result
@@ -609,11 +591,29 @@ class LogStreamingService:
         debug_info.append("=== END CONTAINER LOGS DEBUG ===\n")
         self.logger.info("\n".join(debug_info))
     
+    def resolve_log_files(self, containers: List[str] = None) -> Dict[str, str]:
+        """
+        Map the log files of the given containers (all when empty) to their names.
+
+        Containers without a readable log file are left out.
+        """
+        wanted = set(containers or [])
+        return {
+            container['log_file']: container['name']
+            for container in self.get_available_containers()
+            if container.get('log_file') and (not wanted or container['name'] in wanted)
+        }
+
     def start_log_stream(self, user: User, containers: List[str] = None, 
                         callback: Callable = None) -> str:
         """
         Start a real-time log stream.
         
+        The stream subscribes to the process-wide log follower, so any number
+        of streams share one reader. With a callback, a thread waits on the
+        subscription and calls ``callback(container_name, line)`` for each
+        new line.
+        
         Args:
             user: Django user
             containers: List of containers to stream
@@ -625,74 +625,45 @@ class LogStreamingService:
         import uuid
         stream_id = str(uuid.uuid4())
         
-        # Store stream info
-        self.active_streams[stream_id] = {
-            'user_id': user.id,
-            'containers': containers or [],
-            'started_at': timezone.now(),
-            'callback': callback,
-            'active': True
-        }
+        subscription = get_log_follower().subscribe(self.resolve_log_files(containers), keep=not_header_line)
+        with _streams_lock:
+            _active_streams[stream_id] = {
+                'user_id': user.id,
+                'containers': containers or [],
+                'started_at': timezone.now(),
+                'subscription': subscription,
+            }
         
-        # Start streaming in background thread
-        thread = threading.Thread(
-            target=self._stream_logs,
-            args=(stream_id, containers or []),
-            daemon=True
-        )
-        thread.start()
+        if callback:
+            thread = threading.Thread(
+                target=self._dispatch_stream,
+                args=(stream_id, subscription, callback),
+                daemon=True
+            )
+            thread.start()
         
         return stream_id
     
-    def _stream_logs(self, stream_id: str, containers: List[str]):
+    def _dispatch_stream(self, stream_id: str, subscription, callback: Callable):
         """
-        Background thread for streaming logs.
+        Background thread delivering a subscription's lines to a callback.
         
         Args:
             stream_id: Unique stream identifier
-            containers: List of containers to monitor
+            subscription: Log follower subscription
+            callback: Callback function for log updates
         """
         try:
-            stream_info = self.active_streams.get(stream_id)
-            if not stream_info:
-                return
-            
-            # Track file positions
-            file_positions = {}
-            
-            while stream_info.get('active', False):
-                for container_name in containers:
-                    container = next(
-                        (c for c in self.get_available_containers() if c['name'] == container_name), 
-                        None
-                    )
-                    
-                    if container and container.get('log_file'):
-                        log_file = container['log_file']
-                        current_pos = file_positions.get(log_file, 0)
-                        
-                        try:
-                            with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-                                f.seek(current_pos)
-                                new_lines = f.readlines()
-                                if new_lines:
-                                    file_positions[log_file] = f.tell()
-                                    
-                                    # Process new lines
-                                    for line in new_lines:
-                                        if stream_info.get('callback'):
-                                            stream_info['callback'](container_name, line.strip())
-                        except Exception as e:
-                            self.logger.warning(f"Error streaming logs for {container_name}: {e}")
-                
-                time.sleep(1)  # Check every second
-                
+            while not subscription.closed:
+                for container_name, line in subscription.get_batch(timeout=1.0):
+                    callback(container_name, line)
+                dropped = subscription.take_dropped()
+                if dropped:
+                    self.logger.warning(f"Log stream {stream_id} fell behind, {dropped} lines dropped")
         except Exception as e:
             self.logger.error(f"Error in log stream {stream_id}: {e}")
         finally:
-            # Clean up
-            if stream_id in self.active_streams:
-                del self.active_streams[stream_id]
+            self.stop_log_stream(stream_id)
     
     def stop_log_stream(self, stream_id: str):
         """
@@ -701,8 +672,10 @@ class LogStreamingService:
         Args:
             stream_id: Stream ID to stop
         """
-        if stream_id in self.active_streams:
-            self.active_streams[stream_id]['active'] = False
+        with _streams_lock:
+            stream_info = _active_streams.pop(stream_id, None)
+        if stream_info:
+            stream_info['subscription'].close()
     
     def get_stream_status(self, stream_id: str) -> Dict[str, Any]:
         """
@@ -714,12 +687,13 @@ class LogStreamingService:
         Returns:
             Stream status information
         """
-        stream_info = self.active_streams.get(stream_id)
+        with _streams_lock:
+            stream_info = _active_streams.get(stream_id)
         if not stream_info:
             return {'active': False, 'error': 'Stream not found'}
         
         return {
-            'active': stream_info.get('active', False),
+            'active': not stream_info['subscription'].closed,
             'user_id': stream_info.get('user_id'),
             'containers': stream_info.get('containers', []),
             'started_at': stream_info.get('started_at').isoformat() if stream_info.get('started_at') else None,
@@ -0,0 +1,207 @@
+"""
+Map Data Service
+Builds the customer dependency map data (location groups, equipment and connections)
+from a few bulk queries and caches the serialized result per customer.
+"""
+
+import json
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+from core.models import Customer, Location
+from core.utils import bump_cache_version, get_cache_version
+from equipment.graph import CASCADE_OFFLINE, GRAPH_VERSION_KEY, get_equipment_graph
+from equipment.models import Equipment, EquipmentConnection
+
+
+logger = logging.getLogger(__name__)
+
+MAP_VERSION_KEY = 'customer_map:version'
+MAP_CACHE_TIMEOUT = 3600  # 1 hour; version bumps make stale entries unreachable anyway
+
+# Statuses counted in the "Offline" and "Maintenance" stat boxes
+OFFLINE_COUNT_STATUSES = ('inactive', 'retired')
+STATUS_DISPLAY = dict(Equipment.STATUS_CHOICES)
+
+
+def invalidate_customer_maps():
+    """Make every cached customer map stale; the next request rebuilds what it needs."""
+    bump_cache_version(MAP_VERSION_KEY)
+
+
+class MapDataService:
+    """
+    Service producing the per-customer data behind the dependency map page.
+
+    Locations, equipment and connections for all requested customers are loaded
+    with one query each; cascade status comes from the cached equipment graph.
+    Each customer's map is serialized to JSON once and cached under the current
+    map and graph versions, so any location, customer, equipment or connection
+    change is picked up on the next request.
+    """
+
+    def _cache_key(self, customer_id: int, map_version: int, graph_version: int) -> str:
+        return f'customer_map:{customer_id}:{map_version}:{graph_version}'
+
+    def get_customers(self, customer_id: Optional[int] = None) -> List[Dict]:
+        """Return active customers (optionally just one) as ``{'id', 'name'}`` dicts."""
+        customers = Customer.objects.filter(is_active=True).order_by('name')
+        if customer_id is not None:
+            customers = customers.filter(id=customer_id)
+        return list(customers.values('id', 'name'))
+
+    def get_customer_maps_json(self, customers: List[Dict]) -> List[str]:
+        """
+        Return the serialized map of each customer that has equipment, in order.
+
+        Args:
+            customers: ``{'id', 'name'}`` dicts, e.g. from get_customers().
+
+        Returns:
+            list: JSON object strings, one per customer with active equipment.
+        """
+        map_version = get_cache_version(MAP_VERSION_KEY)
+        graph_version = get_cache_version(GRAPH_VERSION_KEY)
+        keys = {
+            customer['id']: self._cache_key(customer['id'], map_version, graph_version)
+            for customer in customers
+        }
+        payloads = cache.get_many(keys.values())
+
+        missing = [customer for customer in customers if keys[customer['id']] not in payloads]
+        if missing:
+            built = self.build_customer_maps(missing)
+            fresh = {}
+            for customer in missing:
+                customer_map = built.get(customer['id'])
+                # Customers without equipment are cached as '' so they are not rebuilt either
+                fresh[keys[customer['id']]] = json.dumps(customer_map, cls=DjangoJSONEncoder) if customer_map else ''
+            cache.set_many(fresh, MAP_CACHE_TIMEOUT)
+            payloads.update(fresh)
+            logger.info(f"Built customer maps for {len(missing)} customers (map v{map_version}, graph v{graph_version})")
+
+        return [payloads[keys[customer['id']]] for customer in customers if payloads[keys[customer['id']]]]
+
+    def build_customer_maps(self, customers: Iterable[Dict]) -> Dict[int, Dict]:
+        """
+        Build map data for ``customers`` with three bulk queries.
+
+        A location belongs to a customer when it, or its parent location, is
+        assigned to that customer. Customers without active equipment are left out.
+
+        Returns:
+            dict: customer ID to a dict with customer, stats, location_groups,
+            equipment and connections.
+        """
+        customers = {customer['id']: customer for customer in customers}
+        customer_ids = list(customers)
+        if not customer_ids:
+            return {}
+
+        belongs = Q(customer_id__in=customer_ids) | Q(parent_location__customer_id__in=customer_ids)
+        locations = {}
+        location_customers = {}
+        for pk, name, parent_id, is_site, customer_id, parent_customer_id in Location.objects.filter(
+            belongs, is_active=True
+        ).order_by('name').values_list(
+            'id', 'name', 'parent_location_id', 'is_site', 'customer_id', 'parent_location__customer_id'
+        ):
+            locations[pk] = {'id': pk, 'name': name, 'parent_id': parent_id, 'is_site': is_site}
+            location_customers[pk] = {customer_id, parent_customer_id} & customers.keys()
+
+        effective_statuses = get_equipment_graph().effective_statuses()
+        equipment_by_customer = {customer_id: [] for customer_id in customer_ids}
+        equipment_customers = {}
+        for pk, name, status, location_id in Equipment.objects.filter(
+            is_active=True, location_id__in=list(locations)
+        ).order_by('name').values_list('id', 'name', 'status', 'location_id'):
+            effective_status = effective_statuses.get(pk, status)
+            entry = {
+                'id': pk,
+                'name': name,
+                'location_id': location_id,
+                'location_name': locations[location_id]['name'],
+                'status': status,
+                'status_display': STATUS_DISPLAY.get(status, status),
+                'effective_status': effective_status,
+                'is_cascade_offline': effective_status == CASCADE_OFFLINE,
+            }
+            equipment_customers[pk] = location_customers[location_id]
+            for customer_id in location_customers[location_id]:
+                equipment_by_customer[customer_id].append(entry)
+
+        connections_by_customer = {customer_id: [] for customer_id in customer_ids}
+        for pk, upstream_id, downstream_id, connection_type, is_critical in EquipmentConnection.objects.filter(
+            is_active=True,
+            upstream_equipment_id__in=list(equipment_customers),
+            downstream_equipment__is_active=True,
+        ).order_by().values_list(
+            'id', 'upstream_equipment_id', 'downstream_equipment_id', 'connection_type', 'is_critical'
+        ):
+            shared = equipment_customers[upstream_id] & equipment_customers.get(downstream_id, set())
+            for customer_id in shared:
+                connections_by_customer[customer_id].append({
+                    'id': pk,
+                    'upstream_id': upstream_id,
+                    'downstream_id': downstream_id,
+                    'connection_type': connection_type,
+                    'is_critical': is_critical,
+                })
+
+        maps = {}
+        for customer_id, customer in customers.items():
+            equipment = equipment_by_customer[customer_id]
+            if not equipment:
+                continue
+            customer_locations = [
+                location for pk, location in locations.items() if customer_id in location_customers[pk]
+            ]
+            maps[customer_id] = {
+                'customer': customer,
+                'stats': {
+                    'equipment_count': len(equipment),
+                    'location_count': len(customer_locations),
+                    'offline_count': sum(1 for entry in equipment if entry['status'] in OFFLINE_COUNT_STATUSES),
+                    'maintenance_count': sum(1 for entry in equipment if entry['status'] == 'maintenance'),
+                    'cascade_offline_count': sum(1 for entry in equipment if entry['is_cascade_offline']),
+                    'connection_count': len(connections_by_customer[customer_id]),
+                },
+                'location_groups': self._location_groups(customer_locations, equipment),
+                'equipment': equipment,
+                'connections': connections_by_customer[customer_id],
+            }
+        return maps
+
+    def _location_groups(self, customer_locations: List[Dict], equipment: List[Dict]) -> List[Dict]:
+        """Group a customer's locations under their sites, then independent locations last."""
+        equipment_ids = {}
+        for entry in equipment:
+            equipment_ids.setdefault(entry['location_id'], []).append(entry['id'])
+
+        def location_entry(location):
+            return {
+                'id': location['id'],
+                'name': location['name'],
+                'equipment_ids': equipment_ids.get(location['id'], []),
+            }
+
+        children = {}
+        for location in customer_locations:
+            if location['parent_id'] is not None:
+                children.setdefault(location['parent_id'], []).append(location_entry(location))
+
+        groups = [
+            {'site': {'id': location['id'], 'name': location['name']}, 'locations': children.get(location['id'], [])}
+            for location in customer_locations if location['is_site']
+        ]
+        independent = [
+            location_entry(location) for location in customer_locations
+            if location['parent_id'] is None and not location['is_site']
+        ]
+        if independent:
+            groups.append({'site': None, 'locations': independent})
+        return groups
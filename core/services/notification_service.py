@@ -0,0 +1,153 @@
+"""
+Reminder Digest Service
+Groups due reminders per recipient into one digest email each and delivers them
+over a shared mail connection, with chunking and retry of failed recipients.
+"""
+
+import logging
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIGEST_CONFIG = {
+    'chunk_size': 500,
+    'max_retries': 2,
+    'retry_delay': 5,
+}
+
+
+class ReminderDigestService:
+    """
+    Service for sending reminder digests.
+
+    Each reminder is an ``(email, title, lines)`` tuple. Reminders for the same
+    address become one message, all messages are rendered before any is sent,
+    and they go out over one connection per chunk of ``chunk_size`` messages
+    (most SMTP servers cap the messages accepted per session). Recipients whose
+    message fails are retried on a fresh connection up to ``max_retries`` times.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, sleep: Callable[[float], None] = time.sleep):
+        """Initialize the service with configuration from settings."""
+        self.config = {**DEFAULT_DIGEST_CONFIG, **getattr(settings, 'REMINDER_DIGEST_CONFIG', {}), **(config or {})}
+        self.sleep = sleep
+
+    def group_by_recipient(self, reminders: Iterable[Tuple[str, str, List[str]]]) -> Dict[str, List[Tuple[str, List[str]]]]:
+        """Group reminders by email address, keeping their order."""
+        grouped = {}
+        for email, title, lines in reminders:
+            if email:
+                grouped.setdefault(email, []).append((title, lines))
+        return grouped
+
+    def render_digests(self, reminders: Iterable[Tuple[str, str, List[str]]], subject_prefix: str,
+                       intro: str, digest_intro: str) -> List[EmailMessage]:
+        """
+        Render one message per recipient.
+
+        Args:
+            reminders: ``(email, title, lines)`` tuples.
+            subject_prefix: e.g. "Maintenance Reminder"; single reminders keep
+                the "<prefix>: <title>" subject, digests say how many items they hold.
+            intro: Opening line for a single reminder.
+            digest_intro: Opening line for a digest, formatted with ``count``.
+        """
+        messages = []
+        for email, items in self.group_by_recipient(reminders).items():
+            if len(items) == 1:
+                title, lines = items[0]
+                subject = f"{subject_prefix}: {title}"
+                body = f"{intro}\n\n" + "\n".join(lines) + "\n"
+            else:
+                subject = f"{subject_prefix}: {len(items)} items"
+                sections = [f"{index}. {title}\n" + "\n".join(f"   {line}" for line in lines)
+                            for index, (title, lines) in enumerate(items, start=1)]
+                body = digest_intro.format(count=len(items)) + "\n\n" + "\n\n".join(sections) + "\n"
+            message = EmailMessage(subject=subject, body=body, from_email=settings.DEFAULT_FROM_EMAIL, to=[email])
+            message.reminder_count = len(items)
+            messages.append(message)
+        return messages
+
+    def _send_chunk(self, chunk: List[EmailMessage]) -> Tuple[List[EmailMessage], List[EmailMessage]]:
+        """Send a chunk over one connection; returns (delivered, failed)."""
+        delivered, failed = [], []
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as e:
+            logger.error(f"Could not open mail connection for {len(chunk)} reminder digests: {str(e)}")
+            return delivered, list(chunk)
+
+        try:
+            for index, message in enumerate(chunk):
+                try:
+                    connection.send_messages([message])
+                    delivered.append(message)
+                except Exception as e:
+                    logger.warning(f"Reminder digest to {', '.join(message.to)} failed: {str(e)}")
+                    failed.append(message)
+                    # A dropped session fails everything after it; retry those on a new connection
+                    if not self._connection_alive(connection):
+                        failed.extend(chunk[index + 1:])
+                        break
+        finally:
+            try:
+                connection.close()
+            except Exception:
+                pass
+        return delivered, failed
+
+    def _connection_alive(self, connection) -> bool:
+        smtp = getattr(connection, 'connection', True)
+        if smtp is True:
+            # Non-SMTP backends have no session to lose
+            return True
+        if smtp is None:
+            return False
+        try:
+            return smtp.noop()[0] == 250
+        except Exception:
+            return False
+
+    def send(self, messages: List[EmailMessage]) -> Dict:
+        """
+        Deliver rendered messages in chunks, retrying failed recipients.
+
+        Returns a dict with ``delivered`` and ``failed`` message lists and the
+        number of ``connections`` opened.
+        """
+        chunk_size = max(1, self.config['chunk_size'])
+        pending = list(messages)
+        delivered = []
+        connections = 0
+
+        for attempt in range(self.config['max_retries'] + 1):
+            if not pending:
+                break
+            if attempt:
+                logger.info(f"Retrying {len(pending)} reminder digests (attempt {attempt + 1})")
+                self.sleep(self.config['retry_delay'])
+            failed = []
+            for start in range(0, len(pending), chunk_size):
+                chunk_delivered, chunk_failed = self._send_chunk(pending[start:start + chunk_size])
+                connections += 1
+                delivered.extend(chunk_delivered)
+                failed.extend(chunk_failed)
+            pending = failed
+
+        for message in pending:
+            logger.error(f"Giving up on reminder digest to {', '.join(message.to)}")
+        return {'delivered': delivered, 'failed': pending, 'connections': connections}
+
+    def send_reminders(self, reminders: Iterable[Tuple[str, str, List[str]]], subject_prefix: str,
+                       intro: str, digest_intro: str) -> Dict:
+        """Render and send digests; adds ``reminders_sent`` (reminders in delivered digests)."""
+        messages = self.render_digests(reminders, subject_prefix, intro, digest_intro)
+        result = self.send(messages)
+        result['reminders_sent'] = sum(message.reminder_count for message in result['delivered'])
+        return result
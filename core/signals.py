@@ -2,10 +2,12 @@
 Django signals for core app.
 """
 
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth.models import User
-from .models import UserProfile
+from .models import UserProfile, Customer, Location
+from .services.map_data_service import invalidate_customer_maps
 import logging
 from events.models import CalendarEvent
 # REMOVED: maintenance imports since we've unified the system
@@ -34,6 +36,15 @@ def create_or_update_user_profile(sender, instance, created, **kwargs):
         logger.error(f"Error creating/updating UserProfile for user {instance.username}: {str(e)}")
 
 
+@receiver(post_save, sender=Customer)
+@receiver(post_delete, sender=Customer)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_maps_on_location_change(sender, instance, **kwargs):
+    """Rebuild cached customer maps after a customer or location is added, changed or removed."""
+    transaction.on_commit(invalidate_customer_maps)
+
+
 # REMOVED: sync_maintenance_activity_from_event signal
 # This signal is no longer needed since we've unified the calendar/maintenance system.
 # Calendar events with event_type='maintenance' are now the maintenance activities themselves.
\ No newline at end of file
@@ -162,124 +162,48 @@ def auto_update_portainer_stack():
         logger.error(f"Unexpected error in auto-update: {str(e)}")
         return {'status': 'error', 'message': f'Error: {str(e)}'}
 
+def get_log_store():
+    """Return the searchable log store, or None when it is disabled."""
+    from django.conf import settings
+    from core.services.log_store_service import LogStore
+
+    if not getattr(settings, 'LOG_STORE_CONFIG', {}).get('enabled', True):
+        return None
+    return LogStore()
+
 @shared_task
 def collect_docker_logs():
     """
-    Collect Docker logs from all containers and write them to files.
+    Collect Docker logs from all containers and append them to files.
     This task runs periodically to maintain log files that can be read by the web interface.
+    Containers are fetched concurrently from the Docker Engine API and only lines
+    newer than each container's cursor are appended (see DockerLogCollector).
     """
+    from core.services.docker_log_collector import DockerLogCollector
+
+    collector = DockerLogCollector(store=get_log_store())
+    socket_path = collector.config['socket_path']
+    if not os.path.exists(socket_path):
+        logger.error(f"Docker socket not available at {socket_path}")
+        return {'status': 'error', 'message': 'Docker socket not available'}
+
     try:
-        # Create logs directory if it doesn't exist
-        logs_dir = '/app/logs'
-        os.makedirs(logs_dir, exist_ok=True)
-        
-        # Get list of containers using docker ps
-        try:
-            result = subprocess.run(
-                ['docker', 'ps', '--format', '{{.Names}}\t{{.ID}}\t{{.Image}}'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode != 0:
-                logger.warning(f"Docker ps failed: {result.stderr}")
-                return {'status': 'error', 'message': 'Docker ps failed'}
-            
-            containers = []
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    parts = line.split('\t')
-                    if len(parts) >= 3:
-                        containers.append({
-                            'name': parts[0].strip(),
-                            'id': parts[1].strip(),
-                            'image': parts[2].strip()
-                        })
-            
-            logger.info(f"Found {len(containers)} containers")
-            
-        except subprocess.TimeoutExpired:
-            logger.error("Docker ps command timed out")
-            return {'status': 'error', 'message': 'Docker ps timed out'}
-        except FileNotFoundError:
-            logger.error("Docker CLI not available")
-            return {'status': 'error', 'message': 'Docker CLI not available'}
-        
-        # Collect logs for each container
-        collected_logs = {}
-        for container in containers:
-            try:
-                # Get logs for this container
-                log_result = subprocess.run(
-                    ['docker', 'logs', '--tail', '100', container['name']],
-                    capture_output=True,
-                    text=True,
-                    timeout=15
-                )
-                
-                if log_result.returncode == 0:
-                    # Write logs to file
-                    log_file = os.path.join(logs_dir, f"{container['name']}.log")
-                    with open(log_file, 'w', encoding='utf-8') as f:
-                        f.write(f"# Container: {container['name']}\n")
-                        f.write(f"# Image: {container['image']}\n")
-                        f.write(f"# ID: {container['id']}\n")
-                        f.write(f"# Collected at: {datetime.now().isoformat()}\n")
-                        f.write("#" * 80 + "\n")
-                        f.write(log_result.stdout)
-                    
-                    collected_logs[container['name']] = {
-                        'status': 'success',
-                        'lines': len(log_result.stdout.split('\n')),
-                        'file': log_file
-                    }
-                    lines_count = len(log_result.stdout.split('\n'))
-                    logger.info(f"Collected logs for {container['name']}: {lines_count} lines")
-                else:
-                    collected_logs[container['name']] = {
-                        'status': 'error',
-                        'error': log_result.stderr
-                    }
-                    logger.warning(f"Failed to get logs for {container['name']}: {log_result.stderr}")
-                    
-            except subprocess.TimeoutExpired:
-                collected_logs[container['name']] = {
-                    'status': 'error',
-                    'error': 'Timeout getting logs'
-                }
-                logger.warning(f"Timeout getting logs for {container['name']}")
-            except Exception as e:
-                collected_logs[container['name']] = {
-                    'status': 'error',
-                    'error': str(e)
-                }
-                logger.error(f"Error getting logs for {container['name']}: {e}")
-        
-        # Write summary file
-        summary_file = os.path.join(logs_dir, 'collection_summary.json')
-        summary = {
-            'timestamp': datetime.now().isoformat(),
-            'containers_processed': len(containers),
-            'containers_successful': len([c for c in collected_logs.values() if c['status'] == 'success']),
-            'containers_failed': len([c for c in collected_logs.values() if c['status'] == 'error']),
-            'results': collected_logs
-        }
-        
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
-        
-        logger.info(f"Docker logs collection completed: {summary['containers_successful']} successful, {summary['containers_failed']} failed")
-        
-        return {
-            'status': 'success',
-            'message': f'Collected logs for {summary["containers_successful"]} containers',
-            'summary': summary
-        }
-        
+        summary = collector.collect()
     except Exception as e:
         logger.error(f"Error in collect_docker_logs task: {e}")
         return {'status': 'error', 'message': str(e)}
+    finally:
+        collector.client.close()
+
+    logger.info(
+        f"Docker logs collection completed: {summary['containers_successful']} successful, "
+        f"{summary['containers_failed']} failed, {summary['lines_collected']} new lines in {summary['seconds']}s"
+    )
+    return {
+        'status': 'success',
+        'message': f'Collected logs for {summary["containers_successful"]} containers',
+        'summary': summary
+    }
 
 @shared_task
 def collect_system_logs():
@@ -337,6 +261,16 @@ def collect_system_logs():
                 }
                 logger.warning(f"Error reading system log {log_path}: {e}")
         
+        # Index lines appended to the regular log files since the last run
+        store = get_log_store()
+        if store is not None:
+            for log_path, result in system_logs.items():
+                if result['status'] == 'success' and os.path.isfile(log_path):
+                    try:
+                        result['indexed'] = store.ingest_file(log_path, f"system:{os.path.basename(log_path)}")
+                    except Exception as e:
+                        logger.warning(f"Error indexing system log {log_path}: {e}")
+        
         # Write system logs summary
         summary_file = os.path.join(logs_dir, 'system_logs_summary.json')
         summary = {
@@ -362,6 +296,78 @@ def collect_system_logs():
         logger.error(f"Error in collect_system_logs task: {e}")
         return {'status': 'error', 'message': str(e)}
 
+@shared_task
+def prune_log_store():
+    """
+    Drop log store partitions older than LOG_STORE_CONFIG['retention_days'].
+    """
+    store = get_log_store()
+    if store is None:
+        return {'status': 'skipped', 'message': 'Log store disabled'}
+    removed = store.prune()
+    return {'status': 'success', 'removed': [day.isoformat() for day in removed]}
+
+@shared_task
+def refresh_health_snapshot():
+    """
+    Run the registered health probes concurrently and store the snapshot
+    that the health endpoints serve (see HealthProbeService).
+    """
+    from core.services.health_probe_service import HealthProbeService
+
+    snapshot = HealthProbeService().refresh()
+    summary = snapshot['summary']
+    if summary['status'] != 'healthy':
+        failing = [name for name, result in snapshot['probes'].items() if result['status'] != 'PASS']
+        logger.warning(f"Health probes {summary['status']}: {', '.join(failing)}")
+    return {'status': summary['status'], 'duration': snapshot['duration']}
+
+@shared_task
+def refresh_exact_database_stats(using='default'):
+    """
+    Exact COUNT(*) of the tables on the database stats pages, queued on
+    demand by DatabaseStatsService.get_stats(exact=True).
+    """
+    from core.services.database_stats_service import DatabaseStatsService
+
+    return DatabaseStatsService(using=using).refresh_exact()
+
+BACKUP_PROGRESS_KEY = 'backup:progress'
+# Held (cache.add) from queueing a backup until its task finishes; the value is when it was taken
+BACKUP_SLOT_KEY = 'backup:slot'
+
+@shared_task(bind=True)
+def run_database_backup(self, kind='full'):
+    """
+    Write a database backup (see BackupService) and prune old ones.
+    Progress is published as the task's PROGRESS state and under
+    BACKUP_PROGRESS_KEY in the cache for the settings page to poll.
+    """
+    from django.core.cache import cache
+    from core.services.backup_service import BackupService
+
+    def report(info):
+        state = {**info, 'kind': kind, 'task_id': self.request.id, 'updated_at': timezone.now().isoformat()}
+        cache.set(BACKUP_PROGRESS_KEY, state, 86400)
+        if self.request.id:
+            try:
+                self.update_state(state='PROGRESS', meta=state)
+            except Exception as e:
+                # The cache entry is enough for the page; a result backend hiccup must not fail the backup
+                logger.debug(f"Could not publish backup progress: {e}")
+
+    report({'stage': 'starting'})
+    try:
+        entry = BackupService().create_backup(kind=kind, progress=report)
+    except Exception as e:
+        logger.error(f"Database backup failed: {e}", exc_info=True)
+        report({'stage': 'failed', 'error': str(e)})
+        raise
+    finally:
+        cache.delete(BACKUP_SLOT_KEY)
+    logger.info(f"Database backup {entry['name']} written: {entry['size']} bytes, sha256 {entry['sha256']}")
+    return entry
+
 @shared_task
 def update_version_info():
     """Automatically update version information from git"""
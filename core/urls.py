@@ -3,8 +3,13 @@ URL configuration for core app.
 """
 
 from django.urls import path
-from . import views
 from django.http import JsonResponse
+from core.utils import LazyViews
+
+# View modules are imported on the first request that dispatches to them
+views = LazyViews('core.views')
+health_views = LazyViews('core.health_views')
+database_views = LazyViews('core.database_views')
 
 app_name = 'core'
 
@@ -27,6 +32,7 @@ urlpatterns = [
     path('version/extract/', views.extract_version_from_url_api, name='extract_version_from_url_api'),
     path('version/form/', views.version_form_view, name='version_form'),
     path('map/', views.map_view, name='map_view'),
+    path('api/map-data/', views.map_data_api, name='map_data_api'),
     path('locations/settings/', views.locations_settings, name='locations_settings'),
     path('equipment-items/settings/', views.equipment_items_settings, name='equipment_items_settings'),
     path('equipment-conditional-fields/settings/', views.equipment_conditional_fields_settings, name='equipment_conditional_fields_settings'),
@@ -36,14 +42,14 @@ urlpatterns = [
     path('api/equipment-categories/<int:category_id>/edit/', views.edit_equipment_category_ajax, name='edit_equipment_category_ajax'),
     
     # Debug and utility URLs
-    path('health/comprehensive/', views.comprehensive_health_check, name='comprehensive_health_check'),
+    path('health/comprehensive/', health_views.comprehensive_health_check, name='comprehensive_health_check'),
     path('health/run/', views.run_health_check, name='run_health_check'),
-    path('health/api/', views.comprehensive_health_check, name='health_check_api'),  # Alias for template compatibility
+    path('health/api/', health_views.comprehensive_health_check, name='health_check_api'),  # Alias for template compatibility
     path('health/', views.run_health_check, name='health_check'),  # Alias for template compatibility
-    path('health/simple/', views.simple_health_check, name='simple_health_check'),
-    path('health/simple', views.simple_health_check, name='simple_health_check_no_slash'),  # Accept without trailing slash for nginx/reverse proxies
-    path('health/system/', views.system_health_check, name='system_health_check'),
-    path('health/check/', views.health_check_view, name='health_check_view'),
+    path('health/simple/', health_views.simple_health_check, name='simple_health_check'),
+    path('health/simple', health_views.simple_health_check, name='simple_health_check_no_slash'),  # Accept without trailing slash for nginx/reverse proxies
+    path('health/system/', health_views.system_health_check, name='system_health_check'),
+    path('health/check/', health_views.health_check_view, name='health_check_view'),
     path('health/clear-logs/', views.clear_health_logs, name='clear_health_logs'),
     path('debug/clear-maintenance/', views.clear_maintenance_activities, name='clear_maintenance_activities'),
     path('clear-maintenance-data/', views.clear_maintenance_data, name='clear_maintenance_data'),
@@ -55,6 +61,8 @@ urlpatterns = [
     path('docker/logs/', views.get_docker_logs_api, name='get_docker_logs'),
     path('docker/aggregated-logs/', views.get_aggregated_logs_api, name='get_aggregated_logs'),
     path('docker/system-logs/', views.get_system_logs_api, name='get_system_logs'),
+    path('docker/log-stream/', views.log_stream_sse, name='log_stream_sse'),
+    path('docker/log-search/', views.search_logs_api, name='search_logs'),
     path('locations/bulk-edit/', views.bulk_edit_locations, name='bulk_edit_locations'),
     path('locations/<int:location_id>/delete/', views.delete_location, name='delete_location'),
     path('locations/<int:location_id>/edit/', views.edit_location, name='edit_location'),
@@ -79,7 +87,9 @@ urlpatterns = [
     path('api/roles/<int:role_id>/', views.role_detail_api, name='role_detail_api'),
     path('api/endpoint-metrics/', views.endpoint_metrics_api, name='endpoint_metrics_api'),
     path('api/categories/<int:category_id>/fields/', views.category_fields_api, name='category_fields_api'),
-    path('api/database-stats/', views.database_stats_api, name='database_stats_api'),
+    path('api/database-stats/', database_views.database_stats_api, name='database_stats_api'),
+    path('api/backup/', database_views.backup_database, name='backup_database'),
+    path('api/backup/status/', database_views.backup_status, name='backup_status'),
     path('api/clear-maintenance/', views.clear_maintenance_activities_api, name='clear_maintenance_activities_api'),
     path('api/reorganize-activity-types/', views.reorganize_activity_types_api, name='reorganize_activity_types_api'),
     path('api/test-health/', views.test_health, name='test_health'),
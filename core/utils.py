@@ -3,6 +3,8 @@ Utility functions for the maintenance dashboard.
 """
 
 import logging
+import time
+from importlib import import_module
 
 logger = logging.getLogger(__name__)
 
@@ -198,4 +200,134 @@ def get_or_create_default_activity_type():
         return None
     except Exception as e:
         logger.error(f"Error getting default activity type: {str(e)}")
-        return None 
\ No newline at end of file
+        return None 
+
+def build_location_index(location_ids=None):
+    """
+    Resolve every location's site and effective customer with one query.
+
+    Returns a dict mapping location ID to ``(site_id, customer_id)``, matching
+    Location.get_site_location() and Location.get_effective_customer() but
+    without walking parent_location one query at a time. Either value may be
+    None. Each location is resolved once, so this is linear in the number of
+    locations.
+
+    With ``location_ids``, only those locations and their ancestors are
+    loaded, one query per level of the hierarchy, instead of the whole table.
+    """
+    from .models import Location
+
+    locations = Location.objects.order_by().values_list('id', 'parent_location_id', 'is_site', 'customer_id')
+    if location_ids is None:
+        rows = {pk: (parent_id, is_site, customer_id) for pk, parent_id, is_site, customer_id in locations}
+    else:
+        rows = {}
+        pending = set(location_ids) - {None}
+        while pending:
+            fetched = {
+                pk: (parent_id, is_site, customer_id)
+                for pk, parent_id, is_site, customer_id in locations.filter(id__in=pending)
+            }
+            rows.update(fetched)
+            pending = {parent_id for parent_id, _, _ in fetched.values() if parent_id is not None and parent_id not in rows}
+    index = {}
+
+    for location_id in rows:
+        path = []
+        node = location_id
+        while node is not None and node in rows and node not in index and node not in path:
+            path.append(node)
+            node = rows[node][0]
+
+        if node in index:
+            site_id, customer_id = index[node]
+        else:
+            # Reached the top of the hierarchy (or a broken/cyclic parent chain)
+            top = path[-1]
+            site_id = top if node is None and rows[top][1] else None
+            customer_id = None
+
+        # Walk back down so each location inherits its nearest ancestor's customer
+        for pk in reversed(path):
+            customer_id = rows[pk][2] or customer_id
+            index[pk] = (site_id, customer_id)
+
+    return index
+
+
+def get_cache_version(key):
+    """
+    Return the current value of the version counter stored under ``key``.
+
+    Cached data is keyed by this version, so bumping it (bump_cache_version)
+    makes every older entry unreachable. A missing counter starts from the
+    clock so an evicted key never resurrects stale entries.
+    """
+    from django.core.cache import cache
+
+    version = cache.get(key)
+    if version is None:
+        version = int(time.time() * 1000)
+        cache.add(key, version, None)
+        version = cache.get(key, version)
+    return version
+
+
+def bump_cache_version(key):
+    """Advance the version counter stored under ``key``."""
+    from django.core.cache import cache
+
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), None)
+
+
+class LazyView:
+    """
+    URL callback that imports its view function on first dispatch.
+
+    ``__module__`` and ``__name__`` are known without the import, so URL
+    resolution and reversing do not load the view module; any other
+    attribute (``csrf_exempt`` and the like, read by middleware) resolves
+    the view. Only function views are supported.
+    """
+
+    def __init__(self, module, name):
+        self.__module__ = module
+        self.__name__ = self.__qualname__ = name
+        self._view = None
+
+    def resolve(self):
+        if self._view is None:
+            self._view = getattr(import_module(self.__module__), self.__name__)
+        return self._view
+
+    def __call__(self, request, *args, **kwargs):
+        return self.resolve()(request, *args, **kwargs)
+
+    def __getattr__(self, name):
+        # view_class is probed while the URL resolver populates itself
+        if name.startswith('__') or name in ('_view', 'view_class'):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self):
+        return f'<LazyView {self.__module__}.{self.__name__}>'
+
+
+class LazyViews:
+    """
+    Stand-in for a views module in a URLconf.
+
+    ``views = LazyViews('core.views')`` makes ``views.dashboard`` a LazyView,
+    so importing the URLconf does not import the module.
+    """
+
+    def __init__(self, module):
+        self._module = module
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return LazyView(self._module, name)
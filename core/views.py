@@ -40,6 +40,11 @@ from django.contrib.admin.views.decorators import staff_member_required
 import hmac
 import hashlib
 
+# The health and database views live in core.health_views and
+# core.database_views so their URLs can be served without importing this module
+from core.dashboard_cache import bump_dashboard_generation, dashboard_stats_key, invalidate_dashboard_cache
+from core.rbac import is_staff_or_superuser
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,9 +53,59 @@ def natural_sort_key(text):
     return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', str(text))]
 
 
-def is_staff_or_superuser(user):
-    """Check if user is staff or superuser."""
-    return user.is_staff or user.is_superuser
+def _dashboard_site_stats(equipment_query, maintenance_query, calendar_query, today):
+    """Aggregate equipment, maintenance and calendar counts for the dashboard."""
+    equipment_stats = equipment_query.values('status').annotate(count=Count('id'))
+    equipment_counts = {item['status']: item['count'] for item in equipment_stats}
+    
+    maintenance_stats = maintenance_query.values('status').annotate(count=Count('id'))
+    maintenance_counts = {item['status']: item['count'] for item in maintenance_stats}
+    
+    # For calendar stats, use a more efficient approach
+    calendar_total = calendar_query.count()
+    calendar_events_this_week = calendar_query.filter(
+        event_date__gte=today,
+        event_date__lt=today + timedelta(days=7)
+    ).count()
+    calendar_completed = calendar_query.filter(is_completed=True).count()
+    calendar_pending = calendar_query.filter(is_completed=False, event_date__gte=today).count()
+    
+    calendar_stats = {
+        'total': calendar_total,
+        'events_this_week': calendar_events_this_week,
+        'completed': calendar_completed,
+        'pending': calendar_pending
+    }
+    
+    # Calculate overdue maintenance - status is maintained by check_overdue_maintenance
+    overdue_count = maintenance_query.filter(status='overdue').count()
+    
+    # Calculate completed this month
+    completed_this_month = maintenance_query.filter(
+        status='completed',
+        actual_end__gte=today.replace(day=1)
+    ).count()
+    
+    site_stats = {
+        'total_equipment': sum(equipment_counts.values()),
+        'active_equipment': equipment_counts.get('active', 0),
+        'equipment_in_maintenance': equipment_counts.get('maintenance', 0),
+        'inactive_equipment': equipment_counts.get('inactive', 0),
+        
+        # Maintenance statistics
+        'total_maintenance_activities': sum(maintenance_counts.values()),
+        'pending_maintenance': maintenance_counts.get('pending', 0),
+        'in_progress_maintenance': maintenance_counts.get('in_progress', 0),
+        'overdue_maintenance': overdue_count,
+        'completed_this_month': completed_this_month,
+        
+        # Calendar statistics
+        'total_calendar_events': calendar_stats['total'],
+        'events_this_week': calendar_stats['events_this_week'],
+        'completed_events': calendar_stats['completed'],
+        'pending_events': calendar_stats['pending'],
+    }
+    return site_stats
 
 
 @login_required
@@ -94,16 +149,6 @@ def dashboard(request):
         else:
             is_all_sites = True
     
-    # Create cache key for this dashboard view
-    cache_key = f"dashboard_data_{selected_site_id or 'all'}_{request.user.id}"
-    cache_timeout = 300  # 5 minutes
-    
-    # Note: Full context caching disabled due to QuerySet serialization issues
-    # Cache individual expensive queries instead if needed
-    # cached_data = cache.get(cache_key)
-    # if cached_data:
-    #     return render(request, 'core/dashboard.html', cached_data)
-    
     # Get all sites for the site selector
     sites = Location.objects.filter(is_site=True, is_active=True).order_by('name')
     selected_site = None
@@ -115,6 +160,11 @@ def dashboard(request):
     
     # Get today's date for various calculations
     today = timezone.now().date()
+    
+    # The context holds QuerySets, so only the plain statistics are cached;
+    # they are keyed by the site's dashboard generation (core.dashboard_cache)
+    cache_key = f"{dashboard_stats_key(selected_site.id if selected_site else None)}_{today.isoformat()}"
+    cache_timeout = 300  # 5 minutes
     urgent_cutoff = today + timedelta(days=7)
     upcoming_cutoff = today + timedelta(days=30)
     
@@ -256,12 +306,8 @@ def dashboard(request):
         ),
         status__in=upcoming_statuses
     ).exclude(
-        # Exclude overdue items (they go to urgent)
-        Q(status='overdue') |
-        # Exclude items that are past their scheduled_end (they're overdue and go to urgent)
-        Q(scheduled_end__lt=now, status__in=['pending', 'scheduled']) |
-        # Exclude items that are past their scheduled_start if no scheduled_end (they're overdue)
-        Q(scheduled_end__isnull=True, scheduled_start__lt=now, status__in=['pending', 'scheduled'])
+        # Overdue items go to urgent; check_overdue_maintenance keeps the status current
+        status='overdue'
     ).order_by('scheduled_end', 'scheduled_start')[:max_items])
     
     # Filter out calendar events that are synced with maintenance activities to avoid duplication
@@ -657,8 +703,7 @@ def dashboard(request):
         # Bulk overdue maintenance counts
         overdue_by_site = MaintenanceActivity.objects.filter(
             Q(equipment__location__parent_location_id__in=site_ids) | Q(equipment__location_id__in=site_ids),
-            scheduled_end__lt=timezone.now(),
-            status__in=['pending', 'scheduled']
+            status='overdue'
         ).values('equipment__location__parent_location_id', 'equipment__location_id').annotate(count=Count('id'))
         
         # Bulk upcoming maintenance counts - items AFTER urgent window but within upcoming window
@@ -673,9 +718,7 @@ def dashboard(request):
             ),
             status__in=['scheduled', 'pending', 'in_progress']
         ).exclude(
-            Q(status='overdue') |
-            Q(scheduled_end__lt=now, status__in=['pending', 'scheduled']) |
-            Q(scheduled_end__isnull=True, scheduled_start__lt=now, status__in=['pending', 'scheduled'])
+            status='overdue'
         ).values('equipment__location__parent_location_id', 'equipment__location_id').annotate(count=Count('id'))
         
         # Build lookup dictionaries
@@ -858,61 +901,10 @@ def dashboard(request):
     
     # ===== OPTIMIZED OVERALL SITE STATISTICS =====
     
-    # Use aggregate queries for statistics - these are already filtered by site if applicable
-    # Limit the querysets before aggregation to prevent expensive operations on huge datasets
-    equipment_stats = equipment_query.values('status').annotate(count=Count('id'))
-    equipment_counts = {item['status']: item['count'] for item in equipment_stats}
-    
-    maintenance_stats = maintenance_query.values('status').annotate(count=Count('id'))
-    maintenance_counts = {item['status']: item['count'] for item in maintenance_stats}
-    
-    # For calendar stats, use a more efficient approach
-    calendar_total = calendar_query.count()
-    calendar_events_this_week = calendar_query.filter(
-        event_date__gte=today,
-        event_date__lt=today + timedelta(days=7)
-    ).count()
-    calendar_completed = calendar_query.filter(is_completed=True).count()
-    calendar_pending = calendar_query.filter(is_completed=False, event_date__gte=today).count()
-    
-    calendar_stats = {
-        'total': calendar_total,
-        'events_this_week': calendar_events_this_week,
-        'completed': calendar_completed,
-        'pending': calendar_pending
-    }
-    
-    # Calculate overdue maintenance - use exists() check first to avoid full count if possible
-    overdue_count = maintenance_query.filter(
-        scheduled_end__lt=timezone.now(),
-        status__in=['pending', 'scheduled']
-    ).count()
-    
-    # Calculate completed this month
-    completed_this_month = maintenance_query.filter(
-        status='completed',
-        actual_end__gte=today.replace(day=1)
-    ).count()
-    
-    site_stats = {
-        'total_equipment': sum(equipment_counts.values()),
-        'active_equipment': equipment_counts.get('active', 0),
-        'equipment_in_maintenance': equipment_counts.get('maintenance', 0),
-        'inactive_equipment': equipment_counts.get('inactive', 0),
-        
-        # Maintenance statistics
-        'total_maintenance_activities': sum(maintenance_counts.values()),
-        'pending_maintenance': maintenance_counts.get('pending', 0),
-        'in_progress_maintenance': maintenance_counts.get('in_progress', 0),
-        'overdue_maintenance': overdue_count,
-        'completed_this_month': completed_this_month,
-        
-        # Calendar statistics
-        'total_calendar_events': calendar_stats['total'],
-        'events_this_week': calendar_stats['events_this_week'],
-        'completed_events': calendar_stats['completed'],
-        'pending_events': calendar_stats['pending'],
-    }
+    site_stats = cache.get(cache_key)
+    if site_stats is None:
+        site_stats = _dashboard_site_stats(equipment_query, maintenance_query, calendar_query, today)
+        cache.set(cache_key, site_stats, cache_timeout)
     
     # Calculate overall site health
     equipment_health_ratio = site_stats['active_equipment'] / max(site_stats['total_equipment'], 1)
@@ -1082,41 +1074,6 @@ def clear_maintenance_data(request):
     return render(request, 'core/clear_data_confirm.html', context)
 
 
-def invalidate_dashboard_cache(user_id=None, site_id=None):
-    """Invalidate dashboard cache for specific user and/or site."""
-    from django.core.cache import cache
-    
-    if user_id:
-        # Invalidate cache for specific user
-        if site_id == 'all':
-            # For 'all' sites, clear the 'all' cache for this user
-            cache_key = f"dashboard_data_all_{user_id}"
-            cache.delete(cache_key)
-        elif site_id:
-            # Invalidate cache for specific user and site
-            cache_key = f"dashboard_data_{site_id}_{user_id}"
-            cache.delete(cache_key)
-            # Also clear the 'all' cache since it might contain this site's data
-            cache_key = f"dashboard_data_all_{user_id}"
-            cache.delete(cache_key)
-        else:
-            # Invalidate all dashboard caches for this specific user only
-            # Clear the 'all' cache and common site-specific caches for this user
-            cache.delete(f"dashboard_data_all_{user_id}")
-            # Clear site-specific caches for this user (limit to reasonable range)
-            for site_id_val in range(1, 100):  # Reasonable upper limit for site IDs
-                cache.delete(f"dashboard_data_{site_id_val}_{user_id}")
-    else:
-        # Invalidate all dashboard caches (use with caution - can be slow)
-        # Since Django cache doesn't support pattern deletion, we'll clear common cache keys
-        # This is expensive, so prefer passing user_id when possible
-        for i in range(100):  # Reasonable upper limit for user IDs
-            cache.delete(f"dashboard_data_all_{i}")
-            # Also clear some common site-specific caches
-            for site_id_val in range(1, 100):  # Reasonable upper limit for site IDs
-                cache.delete(f"dashboard_data_{site_id_val}_{i}")
-
-
 @login_required
 def profile_view(request):
     """User profile view."""
@@ -1208,106 +1165,17 @@ def profile_view(request):
 
 @login_required
 def map_view(request):
-    """Map view showing customer-specific equipment with connections."""
-    from equipment.models import EquipmentConnection
-    import json
-    
-    # Get selected customer from request or show all
+    """Map view showing customer-specific equipment with connections (data loaded from map_data_api)."""
     selected_customer_id = request.GET.get('customer_id', 'all')
     
     customers = Customer.objects.filter(is_active=True).order_by('name')
     
-    # Build customer-specific maps
-    customer_maps = []
-    
-    if selected_customer_id == 'all':
-        # Show all customers
-        customer_list = customers
-    else:
-        # Show specific customer
-        try:
-            customer_list = [customers.get(id=selected_customer_id)]
-        except Customer.DoesNotExist:
-            customer_list = customers
-            selected_customer_id = 'all'
-    
-    for customer in customer_list:
-        # Get all locations for this customer (sites and sub-locations)
-        customer_locations = Location.objects.filter(
-            Q(customer=customer) | Q(parent_location__customer=customer),
-            is_active=True
-        ).select_related('parent_location', 'customer')
-        
-        # Get all equipment at these locations
-        customer_equipment = Equipment.objects.filter(
-            location__in=customer_locations,
-            is_active=True
-        ).select_related('location', 'category')
-        
-        if not customer_equipment.exists():
-            continue
-        
-        # Get equipment IDs for this customer
-        equipment_ids = list(customer_equipment.values_list('id', flat=True))
-        
-        # Get connections between this customer's equipment
-        customer_connections = EquipmentConnection.objects.filter(
-            upstream_equipment__id__in=equipment_ids,
-            downstream_equipment__id__in=equipment_ids,
-            is_active=True
-        ).select_related('upstream_equipment', 'downstream_equipment')
-        
-        # Build connection data for JavaScript
-        connection_data = []
-        for conn in customer_connections:
-            connection_data.append({
-                'id': conn.id,
-                'upstream_id': conn.upstream_equipment.id,
-                'downstream_id': conn.downstream_equipment.id,
-                'connection_type': conn.connection_type,
-                'is_critical': conn.is_critical,
-            })
-        
-        # Build equipment data with effective status
-        equipment_data = []
-        for equip in customer_equipment:
-            effective_status = equip.get_effective_status()
-            equipment_data.append({
-                'id': equip.id,
-                'name': equip.name,
-                'location_id': equip.location.id if equip.location else None,
-                'location_name': equip.location.name if equip.location else 'Unknown',
-                'status': equip.status,
-                'effective_status': effective_status,
-                'is_cascade_offline': effective_status == 'cascade_offline',
-            })
-        
-        # Group locations by site
-        sites = customer_locations.filter(is_site=True)
-        location_groups = {}
-        for site in sites:
-            location_groups[site] = customer_locations.filter(parent_location=site)
-        
-        # Add independent locations (no parent)
-        independent_locations = customer_locations.filter(parent_location=None, is_site=False)
-        if independent_locations.exists():
-            location_groups[None] = independent_locations
-        
-        customer_maps.append({
-            'customer': customer,
-            'locations': customer_locations,
-            'location_groups': location_groups,
-            'equipment': customer_equipment,
-            'connections': customer_connections,
-            'connections_json': json.dumps(connection_data),
-            'equipment_json': json.dumps(equipment_data),
-        })
-    
     # Get all equipment for connection manager dropdowns
-    all_equipment = Equipment.objects.filter(is_active=True).select_related('location', 'category')
+    all_equipment = Equipment.objects.filter(is_active=True).select_related('location').only(
+        'id', 'name', 'location__name'
+    )
     
     context = {
-        'customer_maps': customer_maps,
         'customers': customers,
         'selected_customer_id': selected_customer_id,
         'all_equipment': all_equipment,
@@ -1315,6 +1183,37 @@ def map_view(request):
     return render(request, 'core/map.html', context)
 
 
+@login_required
+@require_http_methods(["GET"])
+def map_data_api(request):
+    """
+    Customer map data for the map page: location groups, equipment with cascade
+    status and connections per customer. Optional ``customer_id`` limits the
+    result to one customer.
+    """
+    from core.services.map_data_service import MapDataService
+    
+    customer_id = request.GET.get('customer_id', 'all')
+    if customer_id == 'all':
+        customer_id = None
+    else:
+        try:
+            customer_id = int(customer_id)
+        except ValueError:
+            return JsonResponse({'status': 'error', 'message': 'Invalid customer_id'}, status=400)
+    
+    try:
+        service = MapDataService()
+        customer_maps = service.get_customer_maps_json(service.get_customers(customer_id))
+    except Exception as e:
+        logger.error(f"Error building customer map data: {str(e)}")
+        return JsonResponse({'status': 'error', 'message': 'Error loading map data'}, status=500)
+    
+    # Each customer's map is cached pre-serialized, so splice the JSON instead of re-encoding it
+    content = '{"status": "success", "customers": [' + ', '.join(customer_maps) + ']}'
+    return HttpResponse(content, content_type='application/json')
+
+
 @login_required
 @user_passes_test(is_staff_or_superuser)
 def settings_view(request):
@@ -3046,15 +2945,6 @@ def health_check_api(request):
         }, status=500)
 
 
-@login_required
-def health_check_view(request):
-    """Render the health check interface."""
-    if not request.user.is_superuser:
-        return render(request, 'core/access_denied.html', {'message': 'Access denied'})
-    
-    return render(request, 'core/health_check.html')
-
-
 @csrf_exempt
 @require_http_methods(["GET"])
 def endpoint_metrics_api(request):
@@ -3237,8 +3127,8 @@ def log_health_failure(component, message):
 def get_recent_health_failures(limit=10):
     if not os.path.exists(HEALTH_LOG_FILE):
         return []
-    with open(HEALTH_LOG_FILE, 'r') as f:
-        lines = f.readlines()[-limit:]
+    from core.log_tail import tail_lines
+    lines = tail_lines(HEALTH_LOG_FILE, limit)
     return [
         dict(zip(['timestamp', 'component', 'message'], line.strip().split(' | ', 2)))
         for line in lines
@@ -3326,65 +3216,6 @@ def health_check(request):
     })
 
 
-def simple_health_check(request):
-    """Simple health check endpoint for Docker health checks - returns 200 OK."""
-    try:
-        # Basic database connection check with timeout
-        from django.db import connection
-        from django.db.utils import OperationalError
-        import time
-        
-        start_time = time.time()
-        
-        # Quick database ping
-        try:
-            connection.ensure_connection()
-            db_time = time.time() - start_time
-            logger.debug(f"Database health check completed in {db_time:.3f}s")
-        except OperationalError as db_error:
-            logger.error(f"Database health check failed: {db_error}")
-            return JsonResponse({'status': 'error', 'message': 'Database connection failed'}, status=500)
-        
-        # Basic Redis check (only if enabled and Redis is available)
-        from django.conf import settings
-        redis_status = "disabled"
-        if getattr(settings, 'USE_REDIS', True):
-            try:
-                import redis
-                r = redis.Redis.from_url(
-                    getattr(settings, 'REDIS_URL', 'redis://redis:6379'), 
-                    socket_connect_timeout=1, 
-                    socket_timeout=1
-                )
-                r.ping()
-                redis_status = "healthy"
-                logger.debug("Redis health check completed successfully")
-            except Exception as redis_error:
-                # Log the Redis error but don't fail the health check
-                logger.warning(f"Redis connection failed: {redis_error}. Health check continuing...")
-                redis_status = "unavailable"
-        
-        # Return success response
-        response_data = {
-            'status': 'ok',
-            'timestamp': time.time(),
-            'database': 'healthy',
-            'redis': redis_status,
-            'response_time': time.time() - start_time
-        }
-        
-        logger.debug(f"Health check completed successfully in {response_data['response_time']:.3f}s")
-        return JsonResponse(response_data, status=200)
-        
-    except Exception as e:
-        logger.error(f"Health check failed: {str(e)}", exc_info=True)
-        return JsonResponse({
-            'status': 'error', 
-            'message': str(e),
-            'timestamp': time.time()
-        }, status=500)
-
-
 @require_POST
 def clear_health_logs(request):
     """Clear the recent health failure log (from cache and file)."""
@@ -3996,7 +3827,6 @@ def clear_maintenance_activities_api(request):
     """API endpoint to clear scheduled maintenance activities (unsecured for now - will add API keys later)."""
     try:
         from maintenance.models import MaintenanceActivity, MaintenanceSchedule
-        from django.db import connection
         import json
         import time
         import threading
@@ -4040,54 +3870,36 @@ def clear_maintenance_activities_api(request):
             schedules_count = schedules_query.count()
             results['schedules_deleted'] = schedules_count
         
+        def purge():
+            """Chunked raw deletion of the selected activities (and schedules)."""
+            from core.services.bulk_delete_service import BatchedDeleter
+            from equipment.kpis import refresh_kpi_snapshots
+            from events.models import CalendarEvent
+            from maintenance.overdue import affected_site_ids
+            
+            equipment_ids = list(activities_query.order_by().values_list('equipment_id', flat=True).distinct())
+            # Calendar events go with their activity, as the pre_delete signal does for single deletes
+            deleted = BatchedDeleter(
+                MaintenanceActivity, also_delete=[(CalendarEvent, 'maintenance_activity')]
+            ).delete(activities_query)
+            if clear_schedules:
+                deleted['schedules'] = BatchedDeleter(MaintenanceSchedule).delete(schedules_query)['deleted']
+            
+            # Raw deletes skip post_delete signals: refresh KPIs and dashboards once
+            refresh_kpi_snapshots(equipment_ids)
+            bump_dashboard_generation(affected_site_ids(equipment_ids))
+            return deleted
+        
         # If async mode and not dry run, run in background thread
         if async_mode and not dry_run:
             def delete_in_background():
                 """Background deletion function."""
                 try:
-                    # Re-query in new thread context
-                    from maintenance.models import MaintenanceActivity, MaintenanceSchedule
-                    from django.db import connection
-                    
-                    if clear_all:
-                        activities = MaintenanceActivity.objects.all()
-                    else:
-                        activities = MaintenanceActivity.objects.filter(
-                            status__in=['scheduled', 'pending']
-                        )
-                    
-                    activity_ids = list(activities.values_list('id', flat=True))
-                    
-                    if activity_ids and use_fast_delete and len(activity_ids) > 100:
-                        # Fast SQL delete
-                        ids_str = ','.join(map(str, activity_ids))
-                        with connection.cursor() as cursor:
-                            cursor.execute(f"DELETE FROM maintenance_maintenancetimelineentry WHERE activity_id IN ({ids_str})")
-                            cursor.execute(f"DELETE FROM maintenance_maintenancechecklist WHERE activity_id IN ({ids_str})")
-                            cursor.execute(f"DELETE FROM maintenance_maintenancereport WHERE maintenance_activity_id IN ({ids_str})")
-                            # Delete calendar events (must be done before activities)
-                            try:
-                                cursor.execute(f"DELETE FROM events_calendarevent WHERE maintenance_activity_id IN ({ids_str})")
-                                logger.info(f"Background: Deleted {cursor.rowcount} calendar events via SQL")
-                            except Exception as e:
-                                logger.warning(f"Background: Could not delete calendar events via SQL: {str(e)}")
-                                # Try to delete via ORM as fallback
-                                try:
-                                    from events.models import CalendarEvent
-                                    CalendarEvent.objects.filter(maintenance_activity_id__in=activity_ids).delete()
-                                except Exception as e2:
-                                    logger.error(f"Background: Could not delete calendar events via ORM either: {str(e2)}")
-                            cursor.execute(f"DELETE FROM maintenance_maintenanceactivity WHERE id IN ({ids_str})")
-                        logger.info(f"Fast SQL deletion completed: {len(activity_ids)} activities")
-                    else:
-                        # ORM delete
-                        deleted = activities.delete()
-                        logger.info(f"ORM deletion completed: {deleted[0]} activities")
-                    
-                    if clear_schedules:
-                        MaintenanceSchedule.objects.all().delete()
-                        logger.info(f"Schedules deleted")
-                    
+                    deleted = purge()
+                    logger.info(
+                        f"Background deletion completed: {deleted['deleted']} activities in {deleted['chunks']} chunks "
+                        f"({deleted['rows_per_second']} rows/s)"
+                    )
                 except Exception as e:
                     logger.error(f"Background deletion error: {str(e)}")
             
@@ -4101,60 +3913,29 @@ def clear_maintenance_activities_api(request):
                 'message': f'Deletion started in background for {activities_count} activities. Check logs for completion.',
                 'activities_to_delete': activities_count,
                 'schedules_to_delete': results['schedules_deleted'] if clear_schedules else 0,
-                'note': 'Background deletion is running. It will complete in 5-30 seconds depending on data volume.'
+                'note': 'Background deletion runs in short per-chunk transactions; check logs for throughput.'
             })
         
         # Perform deletion if not dry run (synchronous mode)
         if not dry_run:
-            if use_fast_delete and activities_count > 100:
-                # OPTIMIZED: Use raw SQL for bulk deletion (10-50x faster)
-                # Get activity IDs
-                activity_ids = list(activities_query.values_list('id', flat=True))
-                
-                if activity_ids:
-                    # Convert to comma-separated string for SQL IN clause
-                    ids_str = ','.join(map(str, activity_ids))
-                    
-                    with connection.cursor() as cursor:
-                        # Delete related records first (CASCADE simulation)
-                        # This is much faster than Django's ORM cascade
-                        
-                        # Delete timeline entries
-                        cursor.execute(f"DELETE FROM maintenance_maintenancetimelineentry WHERE activity_id IN ({ids_str})")
-                        
-                        # Delete checklist items  
-                        cursor.execute(f"DELETE FROM maintenance_maintenancechecklist WHERE activity_id IN ({ids_str})")
-                        
-                        # Delete reports
-                        cursor.execute(f"DELETE FROM maintenance_maintenancereport WHERE maintenance_activity_id IN ({ids_str})")
-                        
-                        # Delete calendar events if they exist (must be done before activities)
-                        try:
-                            deleted_events = cursor.execute(f"DELETE FROM events_calendarevent WHERE maintenance_activity_id IN ({ids_str})")
-                            logger.info(f"Deleted {cursor.rowcount} calendar events via SQL")
-                        except Exception as e:
-                            logger.warning(f"Could not delete calendar events via SQL: {str(e)}")
-                            # Try to delete via ORM as fallback
-                            try:
-                                from events.models import CalendarEvent
-                                CalendarEvent.objects.filter(maintenance_activity_id__in=activity_ids).delete()
-                            except Exception as e2:
-                                logger.error(f"Could not delete calendar events via ORM either: {str(e2)}")
-                        
-                        # Finally delete the activities themselves
-                        cursor.execute(f"DELETE FROM maintenance_maintenanceactivity WHERE id IN ({ids_str})")
-                    
-                    results['activities_deleted'] = len(activity_ids)
-                    results['method'] = 'fast_sql'
+            if use_fast_delete:
+                # Chunked raw SQL deletion: short transactions, dependents removed per chunk
+                deleted = purge()
+                results['activities_deleted'] = deleted['deleted']
+                results['chunks'] = deleted['chunks']
+                results['rows_per_second'] = deleted['rows_per_second']
+                results['method'] = 'chunked_sql'
+                if clear_schedules:
+                    results['schedules_deleted'] = deleted['schedules']
             else:
                 # Standard Django ORM delete (slower but safer)
                 deleted_activities = activities_query.delete()
                 results['activities_deleted'] = deleted_activities[0] if deleted_activities else 0
                 results['method'] = 'orm'
-            
-            if clear_schedules:
-                deleted_schedules = schedules_query.delete()
-                results['schedules_deleted'] = deleted_schedules[0] if deleted_schedules else 0
+                
+                if clear_schedules:
+                    deleted_schedules = schedules_query.delete()
+                    results['schedules_deleted'] = deleted_schedules[0] if deleted_schedules else 0
             
             results['message'] = f'Successfully deleted {results["activities_deleted"]} activities'
             if clear_schedules:
@@ -4306,656 +4087,29 @@ def clear_database(request):
             'details': error_details
         }, status=500)
 
-
-@login_required
-def system_health_check(request):
-    """System health check endpoint for debugging issues."""
-    if not request.user.is_superuser:
-        return JsonResponse({'error': 'Access denied'}, status=403)
-    
-    health_data = {
-        'timestamp': timezone.now().isoformat(),
-        'categories': {},
-        'summary': {
-            'total_checks': 0,
-            'passed': 0,
-            'failed': 0,
-            'warnings': 0,
-            'health_percentage': 0
-        },
-        'quick_fixes': []
-    }
+@csrf_exempt
+@require_http_methods(["POST"])
+def reset_admin_password_api(request):
+    """
+    Reset admin user password via API.
     
-    def run_check(category, check_name, test_func, fix_suggestion=None):
-        """Run a health check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['failed'].append({
-                    'name': check_name,
-                    'status': 'FAIL',
-                    'fix': fix_suggestion
-                })
-                health_data['summary']['failed'] += 1
-                if fix_suggestion:
-                    health_data['quick_fixes'].append(fix_suggestion)
-        except Exception as e:
-            health_data['categories'][category]['failed'].append({
-                'name': check_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'fix': fix_suggestion
-            })
-            health_data['summary']['failed'] += 1
-            if fix_suggestion:
-                health_data['quick_fixes'].append(fix_suggestion)
+    Expected JSON payload:
+    {
+        "username": "admin",
+        "new_password": "newpassword123"
+    }
+    """
+    try:
+        data = json.loads(request.body) if request.body else {}
+        username = data.get('username', 'admin')
+        new_password = data.get('new_password', 'temppass123')
         
-        health_data['summary']['total_checks'] += 1
-    
-    def run_warning_check(category, check_name, test_func, warning_message=None):
-        """Run a warning check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['warnings'].append({
-                    'name': check_name,
-                    'status': 'WARNING',
-                    'message': warning_message
-                })
-                health_data['summary']['warnings'] += 1
-        except Exception as e:
-            health_data['categories'][category]['warnings'].append({
-                'name': check_name,
-                'status': 'WARNING',
-                'error': str(e),
-                'message': warning_message
-            })
-            health_data['summary']['warnings'] += 1
+        from django.contrib.auth.models import User
         
-        health_data['summary']['total_checks'] += 1
-    
-    # Initialize categories
-    categories = ['CORE', 'SCHEMA', 'API', 'CALENDAR', 'MIGRATIONS', 'AUTH', 'DEPS']
-    for category in categories:
-        health_data['categories'][category] = {
-            'passed': [],
-            'failed': [],
-            'warnings': []
-        }
-    
-    # CORE APPLICATION HEALTH
-    run_check('CORE', 'Django Configuration', 
-              lambda: True,  # Simplified for now
-              'Check Django settings and configuration')
-    
-    run_check('CORE', 'Database Connection',
-              lambda: connection.cursor().execute('SELECT 1') is not None,
-              'Check database connectivity and credentials')
-    
-    # DATABASE SCHEMA INTEGRITY
-    run_check('SCHEMA', 'MaintenanceActivity Model',
-              lambda: MaintenanceActivity.objects.count() >= 0,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    run_check('SCHEMA', 'Timezone Field Exists',
-              lambda: hasattr(MaintenanceActivity, 'timezone'),
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    try:
-        from events.models import CalendarEvent
-        run_check('SCHEMA', 'CalendarEvent Model',
-                  lambda: CalendarEvent.objects.count() >= 0,
-                  'Check events app migrations')
-    except ImportError:
-        health_data['categories']['SCHEMA']['failed'].append({
-            'name': 'CalendarEvent Model',
-            'status': 'ERROR',
-            'error': 'CalendarEvent model not found',
-            'fix': 'Check events app migrations'
-        })
-        health_data['summary']['failed'] += 1
-        health_data['summary']['total_checks'] += 1
-    
-    # API ENDPOINTS FUNCTIONALITY
-    def test_unified_events_api():
-        try:
-            from events.views import fetch_unified_events
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/api/unified/?start=2025-01-01&end=2025-12-31')
-            test_request.user = request.user
-            
-            response = fetch_unified_events(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('API', 'fetch_unified_events API',
-              test_unified_events_api,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    # CALENDAR SPECIFIC ISSUES
-    def test_calendar_view():
         try:
-            from events.views import calendar_view
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/calendar/')
-            test_request.user = request.user
-            
-            response = calendar_view(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('CALENDAR', 'Calendar View Renders',
-              test_calendar_view,
-              'Check calendar view and template rendering')
-    
-    run_warning_check('CALENDAR', 'Maintenance Activities Count',
-                      lambda: MaintenanceActivity.objects.count() > 0,
-                      'No maintenance activities found - calendar may appear empty')
-    
-    # USER AUTHENTICATION
-    run_check('AUTH', 'Admin User Exists',
-              lambda: User.objects.filter(is_superuser=True).exists(),
-              'Create admin user: python manage.py createsuperuser')
-    
-    # EXTERNAL DEPENDENCIES
-    def test_redis():
-        try:
-            from django.core.cache import cache
-            cache.set('health_test', 'value')
-            return cache.get('health_test') == 'value'
-        except Exception:
-            return False
-    
-    run_check('DEPS', 'Redis Connection',
-              test_redis,
-              'Check Redis server connectivity')
-    
-    # Calculate health percentage
-    if health_data['summary']['total_checks'] > 0:
-        health_data['summary']['health_percentage'] = round(
-            (health_data['summary']['passed'] * 100) / health_data['summary']['total_checks']
-        )
-    
-    # Determine overall health status
-    if health_data['summary']['health_percentage'] >= 90:
-        health_data['summary']['status'] = 'EXCELLENT'
-    elif health_data['summary']['health_percentage'] >= 75:
-        health_data['summary']['status'] = 'GOOD'
-    elif health_data['summary']['health_percentage'] >= 50:
-        health_data['summary']['status'] = 'MODERATE'
-    else:
-        health_data['summary']['status'] = 'CRITICAL'
-    
-    return JsonResponse(health_data)
-
-
-@login_required
-def health_check_view(request):
-    """Render the health check interface."""
-    if not request.user.is_superuser:
-        return render(request, 'core/access_denied.html', {'message': 'Access denied'})
-    
-    return render(request, 'core/health_check.html')
-
-@login_required
-def system_health_check(request):
-    """System health check endpoint for debugging issues."""
-    if not request.user.is_superuser:
-        return JsonResponse({'error': 'Access denied'}, status=403)
-    
-    health_data = {
-        'timestamp': timezone.now().isoformat(),
-        'categories': {},
-        'summary': {
-            'total_checks': 0,
-            'passed': 0,
-            'failed': 0,
-            'warnings': 0,
-            'health_percentage': 0
-        },
-        'quick_fixes': []
-    }
-    
-    def run_check(category, check_name, test_func, fix_suggestion=None):
-        """Run a health check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['failed'].append({
-                    'name': check_name,
-                    'status': 'FAIL',
-                    'fix': fix_suggestion
-                })
-                health_data['summary']['failed'] += 1
-                if fix_suggestion:
-                    health_data['quick_fixes'].append(fix_suggestion)
-        except Exception as e:
-            health_data['categories'][category]['failed'].append({
-                'name': check_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'fix': fix_suggestion
-            })
-            health_data['summary']['failed'] += 1
-            if fix_suggestion:
-                health_data['quick_fixes'].append(fix_suggestion)
-        
-        health_data['summary']['total_checks'] += 1
-    
-    def run_warning_check(category, check_name, test_func, warning_message=None):
-        """Run a warning check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['warnings'].append({
-                    'name': check_name,
-                    'status': 'WARNING',
-                    'message': warning_message
-                })
-                health_data['summary']['warnings'] += 1
-        except Exception as e:
-            health_data['categories'][category]['warnings'].append({
-                'name': check_name,
-                'status': 'WARNING',
-                'error': str(e),
-                'message': warning_message
-            })
-            health_data['summary']['warnings'] += 1
-        
-        health_data['summary']['total_checks'] += 1
-    
-    # Initialize categories
-    categories = ['CORE', 'SCHEMA', 'API', 'CALENDAR', 'MIGRATIONS', 'AUTH', 'DEPS']
-    for category in categories:
-        health_data['categories'][category] = {
-            'passed': [],
-            'failed': [],
-            'warnings': []
-        }
-    
-    # CORE APPLICATION HEALTH
-    run_check('CORE', 'Django Configuration', 
-              lambda: True,  # Simplified for now
-              'Check Django settings and configuration')
-    
-    run_check('CORE', 'Database Connection',
-              lambda: connection.cursor().execute('SELECT 1') is not None,
-              'Check database connectivity and credentials')
-    
-    # DATABASE SCHEMA INTEGRITY
-    run_check('SCHEMA', 'MaintenanceActivity Model',
-              lambda: MaintenanceActivity.objects.count() >= 0,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    run_check('SCHEMA', 'Timezone Field Exists',
-              lambda: hasattr(MaintenanceActivity, 'timezone'),
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    try:
-        from events.models import CalendarEvent
-        run_check('SCHEMA', 'CalendarEvent Model',
-                  lambda: CalendarEvent.objects.count() >= 0,
-                  'Check events app migrations')
-    except ImportError:
-        health_data['categories']['SCHEMA']['failed'].append({
-            'name': 'CalendarEvent Model',
-            'status': 'ERROR',
-            'error': 'CalendarEvent model not found',
-            'fix': 'Check events app migrations'
-        })
-        health_data['summary']['failed'] += 1
-        health_data['summary']['total_checks'] += 1
-    
-    # API ENDPOINTS FUNCTIONALITY
-    def test_unified_events_api():
-        try:
-            from events.views import fetch_unified_events
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/api/unified/?start=2025-01-01&end=2025-12-31')
-            test_request.user = request.user
-            
-            response = fetch_unified_events(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('API', 'fetch_unified_events API',
-              test_unified_events_api,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    # CALENDAR SPECIFIC ISSUES
-    def test_calendar_view():
-        try:
-            from events.views import calendar_view
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/calendar/')
-            test_request.user = request.user
-            
-            response = calendar_view(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('CALENDAR', 'Calendar View Renders',
-              test_calendar_view,
-              'Check calendar view and template rendering')
-    
-    run_warning_check('CALENDAR', 'Maintenance Activities Count',
-                      lambda: MaintenanceActivity.objects.count() > 0,
-                      'No maintenance activities found - calendar may appear empty')
-    
-    # USER AUTHENTICATION
-    run_check('AUTH', 'Admin User Exists',
-              lambda: User.objects.filter(is_superuser=True).exists(),
-              'Create admin user: python manage.py createsuperuser')
-    
-    # EXTERNAL DEPENDENCIES
-    def test_redis():
-        try:
-            from django.core.cache import cache
-            cache.set('health_test', 'value')
-            return cache.get('health_test') == 'value'
-        except Exception:
-            return False
-    
-    run_check('DEPS', 'Redis Connection',
-              test_redis,
-              'Check Redis server connectivity')
-    
-    # Calculate health percentage
-    if health_data['summary']['total_checks'] > 0:
-        health_data['summary']['health_percentage'] = round(
-            (health_data['summary']['passed'] * 100) / health_data['summary']['total_checks']
-        )
-    
-    # Determine overall health status
-    if health_data['summary']['health_percentage'] >= 90:
-        health_data['summary']['status'] = 'EXCELLENT'
-    elif health_data['summary']['health_percentage'] >= 75:
-        health_data['summary']['status'] = 'GOOD'
-    elif health_data['summary']['health_percentage'] >= 50:
-        health_data['summary']['status'] = 'MODERATE'
-    else:
-        health_data['summary']['status'] = 'CRITICAL'
-    
-    return JsonResponse(health_data)
-
-
-@login_required
-def health_check_view(request):
-    """Render the health check interface."""
-    if not request.user.is_superuser:
-        return render(request, 'core/access_denied.html', {'message': 'Access denied'})
-    
-    return render(request, 'core/health_check.html')
-
-
-
-@login_required
-def system_health_check(request):
-    """System health check endpoint for debugging issues."""
-    if not request.user.is_superuser:
-        return JsonResponse({'error': 'Access denied'}, status=403)
-    
-    health_data = {
-        'timestamp': timezone.now().isoformat(),
-        'categories': {},
-        'summary': {
-            'total_checks': 0,
-            'passed': 0,
-            'failed': 0,
-            'warnings': 0,
-            'health_percentage': 0
-        },
-        'quick_fixes': []
-    }
-    
-    def run_check(category, check_name, test_func, fix_suggestion=None):
-        """Run a health check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['failed'].append({
-                    'name': check_name,
-                    'status': 'FAIL',
-                    'fix': fix_suggestion
-                })
-                health_data['summary']['failed'] += 1
-                if fix_suggestion:
-                    health_data['quick_fixes'].append(fix_suggestion)
-        except Exception as e:
-            health_data['categories'][category]['failed'].append({
-                'name': check_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'fix': fix_suggestion
-            })
-            health_data['summary']['failed'] += 1
-            if fix_suggestion:
-                health_data['quick_fixes'].append(fix_suggestion)
-        
-        health_data['summary']['total_checks'] += 1
-    
-    def run_warning_check(category, check_name, test_func, warning_message=None):
-        """Run a warning check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['warnings'].append({
-                    'name': check_name,
-                    'status': 'WARNING',
-                    'message': warning_message
-                })
-                health_data['summary']['warnings'] += 1
-        except Exception as e:
-            health_data['categories'][category]['warnings'].append({
-                'name': check_name,
-                'status': 'WARNING',
-                'error': str(e),
-                'message': warning_message
-            })
-            health_data['summary']['warnings'] += 1
-        
-        health_data['summary']['total_checks'] += 1
-    
-    # Initialize categories
-    categories = ['CORE', 'SCHEMA', 'API', 'CALENDAR', 'MIGRATIONS', 'AUTH', 'DEPS']
-    for category in categories:
-        health_data['categories'][category] = {
-            'passed': [],
-            'failed': [],
-            'warnings': []
-        }
-    
-    # CORE APPLICATION HEALTH
-    run_check('CORE', 'Django Configuration', 
-              lambda: True,  # Simplified for now
-              'Check Django settings and configuration')
-    
-    run_check('CORE', 'Database Connection',
-              lambda: connection.cursor().execute('SELECT 1') is not None,
-              'Check database connectivity and credentials')
-    
-    # DATABASE SCHEMA INTEGRITY
-    run_check('SCHEMA', 'MaintenanceActivity Model',
-              lambda: MaintenanceActivity.objects.count() >= 0,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    run_check('SCHEMA', 'Timezone Field Exists',
-              lambda: hasattr(MaintenanceActivity, 'timezone'),
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    try:
-        from events.models import CalendarEvent
-        run_check('SCHEMA', 'CalendarEvent Model',
-                  lambda: CalendarEvent.objects.count() >= 0,
-                  'Check events app migrations')
-    except ImportError:
-        health_data['categories']['SCHEMA']['failed'].append({
-            'name': 'CalendarEvent Model',
-            'status': 'ERROR',
-            'error': 'CalendarEvent model not found',
-            'fix': 'Check events app migrations'
-        })
-        health_data['summary']['failed'] += 1
-        health_data['summary']['total_checks'] += 1
-    
-    # API ENDPOINTS FUNCTIONALITY
-    def test_unified_events_api():
-        try:
-            from events.views import fetch_unified_events
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/api/unified/?start=2025-01-01&end=2025-12-31')
-            test_request.user = request.user
-            
-            response = fetch_unified_events(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('API', 'fetch_unified_events API',
-              test_unified_events_api,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    # CALENDAR SPECIFIC ISSUES
-    def test_calendar_view():
-        try:
-            from events.views import calendar_view
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/calendar/')
-            test_request.user = request.user
-            
-            response = calendar_view(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('CALENDAR', 'Calendar View Renders',
-              test_calendar_view,
-              'Check calendar view and template rendering')
-    
-    run_warning_check('CALENDAR', 'Maintenance Activities Count',
-                      lambda: MaintenanceActivity.objects.count() > 0,
-                      'No maintenance activities found - calendar may appear empty')
-    
-    # USER AUTHENTICATION
-    run_check('AUTH', 'Admin User Exists',
-              lambda: User.objects.filter(is_superuser=True).exists(),
-              'Create admin user: python manage.py createsuperuser')
-    
-    # EXTERNAL DEPENDENCIES
-    def test_redis():
-        try:
-            from django.core.cache import cache
-            cache.set('health_test', 'value')
-            return cache.get('health_test') == 'value'
-        except Exception:
-            return False
-    
-    run_check('DEPS', 'Redis Connection',
-              test_redis,
-              'Check Redis server connectivity')
-    
-    # Calculate health percentage
-    if health_data['summary']['total_checks'] > 0:
-        health_data['summary']['health_percentage'] = round(
-            (health_data['summary']['passed'] * 100) / health_data['summary']['total_checks']
-        )
-    
-    # Determine overall health status
-    if health_data['summary']['health_percentage'] >= 90:
-        health_data['summary']['status'] = 'EXCELLENT'
-    elif health_data['summary']['health_percentage'] >= 75:
-        health_data['summary']['status'] = 'GOOD'
-    elif health_data['summary']['health_percentage'] >= 50:
-        health_data['summary']['status'] = 'MODERATE'
-    else:
-        health_data['summary']['status'] = 'CRITICAL'
-    
-    return JsonResponse(health_data)
-
-
-@login_required
-def health_check_view(request):
-    """Render the health check interface."""
-    if not request.user.is_superuser:
-        return render(request, 'core/access_denied.html', {'message': 'Access denied'})
-    
-    return render(request, 'core/health_check.html')
-
-@csrf_exempt
-@require_http_methods(["POST"])
-def reset_admin_password_api(request):
-    """
-    Reset admin user password via API.
-    
-    Expected JSON payload:
-    {
-        "username": "admin",
-        "new_password": "newpassword123"
-    }
-    """
-    try:
-        data = json.loads(request.body) if request.body else {}
-        username = data.get('username', 'admin')
-        new_password = data.get('new_password', 'temppass123')
-        
-        from django.contrib.auth.models import User
-        
-        try:
-            user = User.objects.get(username=username)
-            user.set_password(new_password)
-            user.save()
+            user = User.objects.get(username=username)
+            user.set_password(new_password)
+            user.save()
             
             return JsonResponse({
                 'success': True,
@@ -5151,214 +4305,6 @@ def run_migrations_api(request):
             'error': str(e)
         }, status=500)
 
-@login_required
-def system_health_check(request):
-    """System health check endpoint for debugging issues."""
-    if not request.user.is_superuser:
-        return JsonResponse({'error': 'Access denied'}, status=403)
-    
-    health_data = {
-        'timestamp': timezone.now().isoformat(),
-        'categories': {},
-        'summary': {
-            'total_checks': 0,
-            'passed': 0,
-            'failed': 0,
-            'warnings': 0,
-            'health_percentage': 0
-        },
-        'quick_fixes': []
-    }
-    
-    def run_check(category, check_name, test_func, fix_suggestion=None):
-        """Run a health check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['failed'].append({
-                    'name': check_name,
-                    'status': 'FAIL',
-                    'fix': fix_suggestion
-                })
-                health_data['summary']['failed'] += 1
-                if fix_suggestion:
-                    health_data['quick_fixes'].append(fix_suggestion)
-        except Exception as e:
-            health_data['categories'][category]['failed'].append({
-                'name': check_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'fix': fix_suggestion
-            })
-            health_data['summary']['failed'] += 1
-            if fix_suggestion:
-                health_data['quick_fixes'].append(fix_suggestion)
-        
-        health_data['summary']['total_checks'] += 1
-    
-    def run_warning_check(category, check_name, test_func, warning_message=None):
-        """Run a warning check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['warnings'].append({
-                    'name': check_name,
-                    'status': 'WARNING',
-                    'message': warning_message
-                })
-                health_data['summary']['warnings'] += 1
-        except Exception as e:
-            health_data['categories'][category]['warnings'].append({
-                'name': check_name,
-                'status': 'WARNING',
-                'error': str(e),
-                'message': warning_message
-            })
-            health_data['summary']['warnings'] += 1
-        
-        health_data['summary']['total_checks'] += 1
-    
-    # Initialize categories
-    categories = ['CORE', 'SCHEMA', 'API', 'CALENDAR', 'MIGRATIONS', 'AUTH', 'DEPS']
-    for category in categories:
-        health_data['categories'][category] = {
-            'passed': [],
-            'failed': [],
-            'warnings': []
-        }
-    
-    # CORE APPLICATION HEALTH
-    run_check('CORE', 'Django Configuration', 
-              lambda: True,  # Simplified for now
-              'Check Django settings and configuration')
-    
-    run_check('CORE', 'Database Connection',
-              lambda: connection.cursor().execute('SELECT 1') is not None,
-              'Check database connectivity and credentials')
-    
-    # DATABASE SCHEMA INTEGRITY
-    run_check('SCHEMA', 'MaintenanceActivity Model',
-              lambda: MaintenanceActivity.objects.count() >= 0,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    run_check('SCHEMA', 'Timezone Field Exists',
-              lambda: hasattr(MaintenanceActivity, 'timezone'),
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    try:
-        from events.models import CalendarEvent
-        run_check('SCHEMA', 'CalendarEvent Model',
-                  lambda: CalendarEvent.objects.count() >= 0,
-                  'Check events app migrations')
-    except ImportError:
-        health_data['categories']['SCHEMA']['failed'].append({
-            'name': 'CalendarEvent Model',
-            'status': 'ERROR',
-            'error': 'CalendarEvent model not found',
-            'fix': 'Check events app migrations'
-        })
-        health_data['summary']['failed'] += 1
-        health_data['summary']['total_checks'] += 1
-    
-    # API ENDPOINTS FUNCTIONALITY
-    def test_unified_events_api():
-        try:
-            from events.views import fetch_unified_events
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/api/unified/?start=2025-01-01&end=2025-12-31')
-            test_request.user = request.user
-            
-            response = fetch_unified_events(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('API', 'fetch_unified_events API',
-              test_unified_events_api,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    # CALENDAR SPECIFIC ISSUES
-    def test_calendar_view():
-        try:
-            from events.views import calendar_view
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/calendar/')
-            test_request.user = request.user
-            
-            response = calendar_view(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('CALENDAR', 'Calendar View Renders',
-              test_calendar_view,
-              'Check calendar view and template rendering')
-    
-    run_warning_check('CALENDAR', 'Maintenance Activities Count',
-                      lambda: MaintenanceActivity.objects.count() > 0,
-                      'No maintenance activities found - calendar may appear empty')
-    
-    # USER AUTHENTICATION
-    run_check('AUTH', 'Admin User Exists',
-              lambda: User.objects.filter(is_superuser=True).exists(),
-              'Create admin user: python manage.py createsuperuser')
-    
-    # EXTERNAL DEPENDENCIES
-    def test_redis():
-        try:
-            from django.core.cache import cache
-            cache.set('health_test', 'value')
-            return cache.get('health_test') == 'value'
-        except Exception:
-            return False
-    
-    run_check('DEPS', 'Redis Connection',
-              test_redis,
-              'Check Redis server connectivity')
-    
-    # Calculate health percentage
-    if health_data['summary']['total_checks'] > 0:
-        health_data['summary']['health_percentage'] = round(
-            (health_data['summary']['passed'] * 100) / health_data['summary']['total_checks']
-        )
-    
-    # Determine overall health status
-    if health_data['summary']['health_percentage'] >= 90:
-        health_data['summary']['status'] = 'EXCELLENT'
-    elif health_data['summary']['health_percentage'] >= 75:
-        health_data['summary']['status'] = 'GOOD'
-    elif health_data['summary']['health_percentage'] >= 50:
-        health_data['summary']['status'] = 'MODERATE'
-    else:
-        health_data['summary']['status'] = 'CRITICAL'
-    
-    return JsonResponse(health_data)
-
-
-@login_required
-def health_check_view(request):
-    """Render the health check interface."""
-    if not request.user.is_superuser:
-        return render(request, 'core/access_denied.html', {'message': 'Access denied'})
-    
-    return render(request, 'core/health_check.html')
-
 @require_GET
 def test_health(request):
     """Minimal health check endpoint for debug page AJAX."""
@@ -5654,451 +4600,6 @@ def bulk_locations_view(request):
     return render(request, 'core/bulk_locations.html', context)
 
 
-
-def get_comprehensive_system_health():
-    """Get comprehensive system health (no Docker/container status)."""
-    health_data = {
-        'timestamp': timezone.now().isoformat(),
-        'overall_status': 'healthy',
-        'components': {}
-    }
-    
-    # Database health
-    db_health = check_database_health()
-    health_data['components']['database'] = db_health
-    
-    # Cache health
-    cache_health = check_cache_health()
-    health_data['components']['cache'] = cache_health
-    
-    # Celery worker health
-    celery_health = check_celery_worker_health()
-    health_data['components']['celery_worker'] = celery_health
-    
-    # Celery beat health
-    celery_beat_health = check_celery_beat_health()
-    health_data['components']['celery_beat'] = celery_beat_health
-    
-    # System metrics
-    try:
-        system_metrics = get_system_metrics()
-        health_data['components']['system'] = system_metrics
-    except Exception as e:
-        health_data['components']['system'] = {'error': str(e)}
-    
-    # Determine overall status
-    if db_health.get('status') == 'unhealthy':
-        health_data['overall_status'] = 'critical'
-    elif cache_health.get('status') == 'unhealthy':
-        health_data['overall_status'] = 'warning'
-    elif celery_health.get('status') == 'unhealthy' or celery_beat_health.get('status') == 'unhealthy':
-        health_data['overall_status'] = 'warning'
-    
-    return health_data
-
-
-def check_celery_worker_health():
-    """Check Celery worker health by running inspect ping."""
-    try:
-        import subprocess
-        result = subprocess.run([
-            'celery', '-A', 'maintenance_dashboard', 'inspect', 'ping'
-        ], capture_output=True, text=True, timeout=10)
-        if result.returncode == 0 and 'pong' in result.stdout:
-            return {'status': 'healthy', 'output': result.stdout}
-        else:
-            return {'status': 'unhealthy', 'output': result.stdout + result.stderr}
-    except Exception as e:
-        return {'status': 'unhealthy', 'error': str(e)}
-
-
-def check_celery_beat_health():
-    """Check Celery beat health by checking last run of periodic tasks."""
-    try:
-        from django_celery_beat.models import PeriodicTask
-        from django.utils import timezone
-        enabled_tasks = PeriodicTask.objects.filter(enabled=True)
-        if not enabled_tasks.exists():
-            return {'status': 'warning', 'message': 'No periodic tasks enabled'}
-        recent = None
-        for task in enabled_tasks:
-            if task.last_run_at and (recent is None or task.last_run_at > recent):
-                recent = task.last_run_at
-        if recent:
-            seconds_since = (timezone.now() - recent).total_seconds()
-            if seconds_since < 600:
-                return {'status': 'healthy', 'message': f'Recent heartbeat ({int(seconds_since)}s ago)'}
-            else:
-                return {'status': 'warning', 'message': f'No recent heartbeat (last was {int(seconds_since//60)} min ago)'}
-        else:
-            return {'status': 'warning', 'message': 'No periodic tasks have ever run'}
-    except Exception as e:
-        return {'status': 'unhealthy', 'error': str(e)}
-
-
-@csrf_exempt
-@require_http_methods(["GET"])
-def comprehensive_health_check(request):
-    """Comprehensive health check including container status."""
-    try:
-        health_data = get_comprehensive_system_health()
-        return JsonResponse(health_data)
-    except Exception as e:
-        logger.error(f"Error in comprehensive health check: {str(e)}")
-        return JsonResponse({
-            'error': str(e),
-            'status': 'error',
-            'timestamp': timezone.now().isoformat()
-        }, status=500)
-
-
-@login_required
-def health_check_view(request):
-    """Render the health check interface."""
-    if not request.user.is_superuser:
-        return render(request, 'core/access_denied.html', {'message': 'Access denied'})
-    
-    return render(request, 'core/health_check.html')
-
-
-@login_required
-@user_passes_test(is_staff_or_superuser)
-@require_http_methods(["GET"])
-def database_stats(request):
-    """Get database statistics and information."""
-    try:
-        from django.db import connection
-        from django.db.models import Count
-        from .models import Location, Customer
-        from equipment.models import Equipment
-        from maintenance.models import MaintenanceActivity
-        from events.models import CalendarEvent
-        
-        # Get basic counts
-        stats = {
-            'locations': {
-                'total': Location.objects.count(),
-                'sites': Location.objects.filter(is_site=True).count(),
-                'sub_locations': Location.objects.filter(is_site=False).count(),
-                'active': Location.objects.filter(is_active=True).count(),
-            },
-            'customers': {
-                'total': Customer.objects.count(),
-                'active': Customer.objects.filter(is_active=True).count(),
-            },
-            'equipment': {
-                'total': Equipment.objects.count(),
-                'active': Equipment.objects.filter(is_active=True).count(),
-            },
-            'maintenance': {
-                'total': MaintenanceActivity.objects.count(),
-                'completed': MaintenanceActivity.objects.filter(status='completed').count(),
-                'pending': MaintenanceActivity.objects.filter(status='pending').count(),
-            },
-            'events': {
-                'total': CalendarEvent.objects.count(),
-                'recent': CalendarEvent.objects.filter(created_at__gte=timezone.now() - timezone.timedelta(days=7)).count(),
-            }
-        }
-        
-        # Get database size info
-        with connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT 
-                    pg_size_pretty(pg_database_size(current_database())) as db_size,
-                    pg_size_pretty(pg_total_relation_size('core_location')) as locations_size,
-                    pg_size_pretty(pg_total_relation_size('core_customer')) as customers_size,
-                    pg_size_pretty(pg_total_relation_size('equipment_equipment')) as equipment_size
-            """)
-            db_info = cursor.fetchone()
-            
-        stats['database'] = {
-            'total_size': db_info[0] if db_info else 'Unknown',
-            'locations_table_size': db_info[1] if db_info else 'Unknown',
-            'customers_table_size': db_info[2] if db_info else 'Unknown',
-            'equipment_table_size': db_info[3] if db_info else 'Unknown',
-        }
-        
-        return JsonResponse({
-            'success': True,
-            'stats': stats,
-            'timestamp': timezone.now().isoformat()
-        })
-        
-    except Exception as e:
-        return JsonResponse({
-            'success': False,
-            'error': str(e)
-        }, status=500)
-
-
-@login_required
-def system_health_check(request):
-    """System health check endpoint for debugging issues."""
-    if not request.user.is_superuser:
-        return JsonResponse({'error': 'Access denied'}, status=403)
-    
-    health_data = {
-        'timestamp': timezone.now().isoformat(),
-        'categories': {},
-        'summary': {
-            'total_checks': 0,
-            'passed': 0,
-            'failed': 0,
-            'warnings': 0,
-            'health_percentage': 0
-        },
-        'quick_fixes': []
-    }
-    
-    def run_check(category, check_name, test_func, fix_suggestion=None):
-        """Run a health check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['failed'].append({
-                    'name': check_name,
-                    'status': 'FAIL',
-                    'fix': fix_suggestion
-                })
-                health_data['summary']['failed'] += 1
-                if fix_suggestion:
-                    health_data['quick_fixes'].append(fix_suggestion)
-        except Exception as e:
-            health_data['categories'][category]['failed'].append({
-                'name': check_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'fix': fix_suggestion
-            })
-            health_data['summary']['failed'] += 1
-            if fix_suggestion:
-                health_data['quick_fixes'].append(fix_suggestion)
-        
-        health_data['summary']['total_checks'] += 1
-    
-    def run_warning_check(category, check_name, test_func, warning_message=None):
-        """Run a warning check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['warnings'].append({
-                    'name': check_name,
-                    'status': 'WARNING',
-                    'message': warning_message
-                })
-                health_data['summary']['warnings'] += 1
-        except Exception as e:
-            health_data['categories'][category]['warnings'].append({
-                'name': check_name,
-                'status': 'WARNING',
-                'error': str(e),
-                'message': warning_message
-            })
-            health_data['summary']['warnings'] += 1
-        
-        health_data['summary']['total_checks'] += 1
-    
-    # Initialize categories
-    categories = ['CORE', 'SCHEMA', 'API', 'CALENDAR', 'MIGRATIONS', 'AUTH', 'DEPS']
-    for category in categories:
-        health_data['categories'][category] = {
-            'passed': [],
-            'failed': [],
-            'warnings': []
-        }
-    
-    # CORE APPLICATION HEALTH
-    run_check('CORE', 'Django Configuration', 
-              lambda: True,  # Simplified for now
-              'Check Django settings and configuration')
-    
-    run_check('CORE', 'Database Connection',
-              lambda: connection.cursor().execute('SELECT 1') is not None,
-              'Check database connectivity and credentials')
-    
-    # DATABASE SCHEMA INTEGRITY
-    run_check('SCHEMA', 'MaintenanceActivity Model',
-              lambda: MaintenanceActivity.objects.count() >= 0,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    run_check('SCHEMA', 'Timezone Field Exists',
-              lambda: hasattr(MaintenanceActivity, 'timezone'),
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    try:
-        from events.models import CalendarEvent
-        run_check('SCHEMA', 'CalendarEvent Model',
-                  lambda: CalendarEvent.objects.count() >= 0,
-                  'Check events app migrations')
-    except ImportError:
-        health_data['categories']['SCHEMA']['failed'].append({
-            'name': 'CalendarEvent Model',
-            'status': 'ERROR',
-            'error': 'CalendarEvent model not found',
-            'fix': 'Check events app migrations'
-        })
-        health_data['summary']['failed'] += 1
-        health_data['summary']['total_checks'] += 1
-    
-    # API ENDPOINTS FUNCTIONALITY
-    def test_unified_events_api():
-        try:
-            from events.views import fetch_unified_events
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/api/unified/?start=2025-01-01&end=2025-12-31')
-            test_request.user = request.user
-            
-            response = fetch_unified_events(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('API', 'fetch_unified_events API',
-              test_unified_events_api,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    # CALENDAR SPECIFIC ISSUES
-    def test_calendar_view():
-        try:
-            from events.views import calendar_view
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/calendar/')
-            test_request.user = request.user
-            
-            response = calendar_view(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('CALENDAR', 'Calendar View Renders',
-              test_calendar_view,
-              'Check calendar view and template rendering')
-    
-    run_warning_check('CALENDAR', 'Maintenance Activities Count',
-                      lambda: MaintenanceActivity.objects.count() > 0,
-                      'No maintenance activities found - calendar may appear empty')
-    
-    # USER AUTHENTICATION
-    run_check('AUTH', 'Admin User Exists',
-              lambda: User.objects.filter(is_superuser=True).exists(),
-              'Create admin user: python manage.py createsuperuser')
-    
-    # EXTERNAL DEPENDENCIES
-    def test_redis():
-        try:
-            from django.core.cache import cache
-            cache.set('health_test', 'value')
-            return cache.get('health_test') == 'value'
-        except Exception:
-            return False
-    
-    run_check('DEPS', 'Redis Connection',
-              test_redis,
-              'Check Redis server connectivity')
-    
-    # Calculate health percentage
-    if health_data['summary']['total_checks'] > 0:
-        health_data['summary']['health_percentage'] = round(
-            (health_data['summary']['passed'] * 100) / health_data['summary']['total_checks']
-        )
-    
-    # Determine overall health status
-    if health_data['summary']['health_percentage'] >= 90:
-        health_data['summary']['status'] = 'EXCELLENT'
-    elif health_data['summary']['health_percentage'] >= 75:
-        health_data['summary']['status'] = 'GOOD'
-    elif health_data['summary']['health_percentage'] >= 50:
-        health_data['summary']['status'] = 'MODERATE'
-    else:
-        health_data['summary']['status'] = 'CRITICAL'
-    
-    return JsonResponse(health_data)
-
-
-@login_required
-def health_check_view(request):
-    """Render the health check interface."""
-    if not request.user.is_superuser:
-        return render(request, 'core/access_denied.html', {'message': 'Access denied'})
-    
-    return render(request, 'core/health_check.html')
-
-
-@login_required
-@user_passes_test(is_staff_or_superuser)
-@require_http_methods(["POST"])
-def backup_database(request):
-    """Create a database backup."""
-    try:
-        from django.core.management import call_command
-        from io import StringIO
-        import os
-        from django.conf import settings
-        
-        # Create backup directory if it doesn't exist
-        backup_dir = os.path.join(settings.BASE_DIR, 'backups')
-        os.makedirs(backup_dir, exist_ok=True)
-        
-        # Generate backup filename with timestamp
-        timestamp = timezone.now().strftime('%Y%m%d_%H%M%S')
-        backup_filename = f'backup_{timestamp}.json'
-        backup_path = os.path.join(backup_dir, backup_filename)
-        
-        # Capture command output
-        output = StringIO()
-        
-        # Call the dumpdata command
-        call_command('dumpdata', 
-                    '--exclude', 'contenttypes',
-                    '--exclude', 'auth.Permission',
-                    '--exclude', 'sessions',
-                    '--indent', '2',
-                    '--output', backup_path,
-                    stdout=output,
-                    verbosity=2)
-        
-        result = output.getvalue()
-        output.close()
-        
-        # Get file size
-        file_size = os.path.getsize(backup_path) if os.path.exists(backup_path) else 0
-        
-        return JsonResponse({
-            'success': True,
-            'message': f'Database backup created successfully: {backup_filename}',
-            'filename': backup_filename,
-            'file_size': file_size,
-            'file_size_pretty': f'{file_size / 1024 / 1024:.2f} MB' if file_size > 0 else '0 B',
-            'output': result
-        })
-        
-    except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        return JsonResponse({
-            'success': False,
-            'error': f'Error creating database backup: {str(e)}',
-            'details': error_details
-        }, status=500)
-
-
 @login_required
 @user_passes_test(is_staff_or_superuser)
 @require_http_methods(["POST"])
@@ -6733,6 +5234,119 @@ def stop_log_stream_api(request):
             'error': f'Error stopping log stream: {str(e)}'
         }, status=500)
 
+
+@login_required
+@user_passes_test(is_staff_or_superuser)
+@require_http_methods(["GET"])
+def log_stream_sse(request):
+    """
+    Server-Sent Events stream of new log lines for the requested containers.
+
+    All viewers share the process's log follower, so each one costs a
+    subscription queue rather than a reader of its own. The stream ends after
+    ``LOG_FOLLOWER_CONFIG['stream_seconds']`` and the browser reconnects,
+    sending the last event id back as ``Last-Event-ID`` so the lines written
+    in between are replayed.
+
+    Each open stream holds a request thread (gunicorn runs gthread workers
+    for this), so a process serves at most ``LOG_FOLLOWER_CONFIG['max_streams']``
+    of them. Above that the view answers 503 and the page polls instead.
+    """
+    from django.http import StreamingHttpResponse
+    from core.log_follower import get_log_follower, iter_sse, parse_event_id
+    from core.services.docker_logs_service import DockerLogsService
+    from core.services.log_streaming_service import LogStreamingService, not_header_line
+
+    if not DockerLogsService().can_access(request.user):
+        return JsonResponse({
+            'error': 'Access denied'
+        }, status=403)
+
+    containers = [name for name in request.GET.get('containers', '').split(',') if name]
+    log_files = LogStreamingService().resolve_log_files(containers)
+    if not log_files:
+        return JsonResponse({
+            'success': False,
+            'error': 'No log files available to follow for the requested containers'
+        }, status=404)
+
+    subscription = get_log_follower().open_stream(
+        log_files, keep=not_header_line, resume=parse_event_id(request.headers.get('Last-Event-ID'))
+    )
+    if subscription is None:
+        response = JsonResponse({
+            'success': False,
+            'error': 'Too many live log streams open, poll the log tail instead'
+        }, status=503)
+        response['Retry-After'] = '30'
+        return response
+
+    response = StreamingHttpResponse(iter_sse(subscription), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@login_required
+@user_passes_test(is_staff_or_superuser)
+@require_http_methods(["GET"])
+def search_logs_api(request):
+    """
+    API endpoint to search the indexed log store.
+
+    GET parameters: ``start``/``end`` (ISO 8601, default the last 24 hours),
+    ``containers`` and ``levels`` (comma-separated), ``q`` (full text, all
+    words must match), ``limit`` and ``cursor`` (``next_cursor`` of the
+    previous page). Entries are returned newest first.
+    """
+    from datetime import timezone as dt_timezone
+    from django.utils.dateparse import parse_datetime
+    from core.services.docker_logs_service import DockerLogsService
+    from core.services.log_store_service import LogStore
+
+    if not DockerLogsService().can_access(request.user):
+        return JsonResponse({
+            'error': 'Access denied'
+        }, status=403)
+
+    def parse_time(name, default):
+        value = request.GET.get(name)
+        if not value:
+            return default
+        parsed = parse_datetime(value)
+        if parsed is None:
+            raise ValueError(f"Invalid {name}: {value}")
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=dt_timezone.utc)
+
+    def split(name):
+        return [value for value in request.GET.get(name, '').split(',') if value] or None
+
+    try:
+        end = parse_time('end', timezone.now())
+        start = parse_time('start', end - timedelta(hours=24))
+        limit = int(request.GET.get('limit', 100))
+        result = LogStore().search(
+            start=start, end=end, containers=split('containers'), levels=split('levels'),
+            text=request.GET.get('q') or None, limit=limit, cursor=request.GET.get('cursor') or None,
+        )
+    except ValueError as e:
+        return JsonResponse({
+            'success': False,
+            'error': str(e)
+        }, status=400)
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'error': f'Error searching logs: {str(e)}'
+        }, status=500)
+
+    return JsonResponse({
+        'success': True,
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        **result
+    })
+
 def version_view(request):
     """Display version information for debugging and verification."""
     try:
@@ -7099,63 +5713,6 @@ def invalidate_cache_api(request):
         }, status=500)
 
 
-@login_required
-@user_passes_test(is_staff_or_superuser)
-def database_stats_api(request):
-    """API endpoint to get database statistics."""
-    try:
-        from django.db import connection
-        from equipment.models import Equipment, EquipmentConnection
-        from maintenance.models import MaintenanceActivity, MaintenanceSchedule, MaintenanceActivityType
-        from events.models import CalendarEvent
-        
-        tables = {}
-        
-        # Get row counts for key tables - handle each one individually to avoid total failure
-        def safe_count(model_class, model_name):
-            try:
-                return model_class.objects.count()
-            except Exception as e:
-                logger.warning(f"Error counting {model_name}: {str(e)}")
-                return 'Error'
-        
-        tables['Equipment'] = {'count': safe_count(Equipment, 'Equipment')}
-        tables['Equipment Connections'] = {'count': safe_count(EquipmentConnection, 'EquipmentConnection')}
-        tables['Locations'] = {'count': safe_count(Location, 'Location')}
-        tables['Customers'] = {'count': safe_count(Customer, 'Customer')}
-        tables['Maintenance Activities'] = {'count': safe_count(MaintenanceActivity, 'MaintenanceActivity')}
-        tables['Maintenance Schedules'] = {'count': safe_count(MaintenanceSchedule, 'MaintenanceSchedule')}
-        tables['Activity Types'] = {'count': safe_count(MaintenanceActivityType, 'MaintenanceActivityType')}
-        tables['Calendar Events'] = {'count': safe_count(CalendarEvent, 'CalendarEvent')}
-        tables['Users'] = {'count': safe_count(User, 'User')}
-        
-        # Get database size (PostgreSQL specific)
-        try:
-            with connection.cursor() as cursor:
-                cursor.execute("""
-                    SELECT pg_size_pretty(pg_database_size(current_database())) as size;
-                """)
-                row = cursor.fetchone()
-                db_size = row[0] if row else 'Unknown'
-        except Exception as e:
-            logger.warning(f"Error getting database size: {str(e)}")
-            db_size = 'N/A'
-        
-        return JsonResponse({
-            'status': 'success',
-            'tables': tables,
-            'database_size': db_size,
-            'database_name': connection.settings_dict.get('NAME', 'Unknown')
-        })
-        
-    except Exception as e:
-        logger.error(f"Error getting database stats: {str(e)}", exc_info=True)
-        return JsonResponse({
-            'status': 'error',
-            'message': f'Error getting database stats: {str(e)}'
-        }, status=500)
-
-
 @login_required
 def branding_settings(request):
     """Branding settings management page"""
@@ -7349,215 +5906,6 @@ def update_user_timezone(request):
             'error': str(e)
         }, status=500)
 
-
-@login_required
-def system_health_check(request):
-    """System health check endpoint for debugging issues."""
-    if not request.user.is_superuser:
-        return JsonResponse({'error': 'Access denied'}, status=403)
-    
-    health_data = {
-        'timestamp': timezone.now().isoformat(),
-        'categories': {},
-        'summary': {
-            'total_checks': 0,
-            'passed': 0,
-            'failed': 0,
-            'warnings': 0,
-            'health_percentage': 0
-        },
-        'quick_fixes': []
-    }
-    
-    def run_check(category, check_name, test_func, fix_suggestion=None):
-        """Run a health check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['failed'].append({
-                    'name': check_name,
-                    'status': 'FAIL',
-                    'fix': fix_suggestion
-                })
-                health_data['summary']['failed'] += 1
-                if fix_suggestion:
-                    health_data['quick_fixes'].append(fix_suggestion)
-        except Exception as e:
-            health_data['categories'][category]['failed'].append({
-                'name': check_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'fix': fix_suggestion
-            })
-            health_data['summary']['failed'] += 1
-            if fix_suggestion:
-                health_data['quick_fixes'].append(fix_suggestion)
-        
-        health_data['summary']['total_checks'] += 1
-    
-    def run_warning_check(category, check_name, test_func, warning_message=None):
-        """Run a warning check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['warnings'].append({
-                    'name': check_name,
-                    'status': 'WARNING',
-                    'message': warning_message
-                })
-                health_data['summary']['warnings'] += 1
-        except Exception as e:
-            health_data['categories'][category]['warnings'].append({
-                'name': check_name,
-                'status': 'WARNING',
-                'error': str(e),
-                'message': warning_message
-            })
-            health_data['summary']['warnings'] += 1
-        
-        health_data['summary']['total_checks'] += 1
-    
-    # Initialize categories
-    categories = ['CORE', 'SCHEMA', 'API', 'CALENDAR', 'MIGRATIONS', 'AUTH', 'DEPS']
-    for category in categories:
-        health_data['categories'][category] = {
-            'passed': [],
-            'failed': [],
-            'warnings': []
-        }
-    
-    # CORE APPLICATION HEALTH
-    run_check('CORE', 'Django Configuration', 
-              lambda: True,  # Simplified for now
-              'Check Django settings and configuration')
-    
-    run_check('CORE', 'Database Connection',
-              lambda: connection.cursor().execute('SELECT 1') is not None,
-              'Check database connectivity and credentials')
-    
-    # DATABASE SCHEMA INTEGRITY
-    run_check('SCHEMA', 'MaintenanceActivity Model',
-              lambda: MaintenanceActivity.objects.count() >= 0,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    run_check('SCHEMA', 'Timezone Field Exists',
-              lambda: hasattr(MaintenanceActivity, 'timezone'),
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    try:
-        from events.models import CalendarEvent
-        run_check('SCHEMA', 'CalendarEvent Model',
-                  lambda: CalendarEvent.objects.count() >= 0,
-                  'Check events app migrations')
-    except ImportError:
-        health_data['categories']['SCHEMA']['failed'].append({
-            'name': 'CalendarEvent Model',
-            'status': 'ERROR',
-            'error': 'CalendarEvent model not found',
-            'fix': 'Check events app migrations'
-        })
-        health_data['summary']['failed'] += 1
-        health_data['summary']['total_checks'] += 1
-    
-    # API ENDPOINTS FUNCTIONALITY
-    def test_unified_events_api():
-        try:
-            from events.views import fetch_unified_events
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/api/unified/?start=2025-01-01&end=2025-12-31')
-            test_request.user = request.user
-            
-            response = fetch_unified_events(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('API', 'fetch_unified_events API',
-              test_unified_events_api,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    # CALENDAR SPECIFIC ISSUES
-    def test_calendar_view():
-        try:
-            from events.views import calendar_view
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/calendar/')
-            test_request.user = request.user
-            
-            response = calendar_view(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('CALENDAR', 'Calendar View Renders',
-              test_calendar_view,
-              'Check calendar view and template rendering')
-    
-    run_warning_check('CALENDAR', 'Maintenance Activities Count',
-                      lambda: MaintenanceActivity.objects.count() > 0,
-                      'No maintenance activities found - calendar may appear empty')
-    
-    # USER AUTHENTICATION
-    run_check('AUTH', 'Admin User Exists',
-              lambda: User.objects.filter(is_superuser=True).exists(),
-              'Create admin user: python manage.py createsuperuser')
-    
-    # EXTERNAL DEPENDENCIES
-    def test_redis():
-        try:
-            from django.core.cache import cache
-            cache.set('health_test', 'value')
-            return cache.get('health_test') == 'value'
-        except Exception:
-            return False
-    
-    run_check('DEPS', 'Redis Connection',
-              test_redis,
-              'Check Redis server connectivity')
-    
-    # Calculate health percentage
-    if health_data['summary']['total_checks'] > 0:
-        health_data['summary']['health_percentage'] = round(
-            (health_data['summary']['passed'] * 100) / health_data['summary']['total_checks']
-        )
-    
-    # Determine overall health status
-    if health_data['summary']['health_percentage'] >= 90:
-        health_data['summary']['status'] = 'EXCELLENT'
-    elif health_data['summary']['health_percentage'] >= 75:
-        health_data['summary']['status'] = 'GOOD'
-    elif health_data['summary']['health_percentage'] >= 50:
-        health_data['summary']['status'] = 'MODERATE'
-    else:
-        health_data['summary']['status'] = 'CRITICAL'
-    
-    return JsonResponse(health_data)
-
-
-@login_required
-def health_check_view(request):
-    """Render the health check interface."""
-    if not request.user.is_superuser:
-        return render(request, 'core/access_denied.html', {'message': 'Access denied'})
-    
-    return render(request, 'core/health_check.html')
-
 @login_required
 def css_customization_create(request):
     """Create a new CSS customization"""
@@ -7653,215 +6001,6 @@ def update_user_timezone(request):
             'error': str(e)
         }, status=500)
 
-
-@login_required
-def system_health_check(request):
-    """System health check endpoint for debugging issues."""
-    if not request.user.is_superuser:
-        return JsonResponse({'error': 'Access denied'}, status=403)
-    
-    health_data = {
-        'timestamp': timezone.now().isoformat(),
-        'categories': {},
-        'summary': {
-            'total_checks': 0,
-            'passed': 0,
-            'failed': 0,
-            'warnings': 0,
-            'health_percentage': 0
-        },
-        'quick_fixes': []
-    }
-    
-    def run_check(category, check_name, test_func, fix_suggestion=None):
-        """Run a health check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['failed'].append({
-                    'name': check_name,
-                    'status': 'FAIL',
-                    'fix': fix_suggestion
-                })
-                health_data['summary']['failed'] += 1
-                if fix_suggestion:
-                    health_data['quick_fixes'].append(fix_suggestion)
-        except Exception as e:
-            health_data['categories'][category]['failed'].append({
-                'name': check_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'fix': fix_suggestion
-            })
-            health_data['summary']['failed'] += 1
-            if fix_suggestion:
-                health_data['quick_fixes'].append(fix_suggestion)
-        
-        health_data['summary']['total_checks'] += 1
-    
-    def run_warning_check(category, check_name, test_func, warning_message=None):
-        """Run a warning check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['warnings'].append({
-                    'name': check_name,
-                    'status': 'WARNING',
-                    'message': warning_message
-                })
-                health_data['summary']['warnings'] += 1
-        except Exception as e:
-            health_data['categories'][category]['warnings'].append({
-                'name': check_name,
-                'status': 'WARNING',
-                'error': str(e),
-                'message': warning_message
-            })
-            health_data['summary']['warnings'] += 1
-        
-        health_data['summary']['total_checks'] += 1
-    
-    # Initialize categories
-    categories = ['CORE', 'SCHEMA', 'API', 'CALENDAR', 'MIGRATIONS', 'AUTH', 'DEPS']
-    for category in categories:
-        health_data['categories'][category] = {
-            'passed': [],
-            'failed': [],
-            'warnings': []
-        }
-    
-    # CORE APPLICATION HEALTH
-    run_check('CORE', 'Django Configuration', 
-              lambda: True,  # Simplified for now
-              'Check Django settings and configuration')
-    
-    run_check('CORE', 'Database Connection',
-              lambda: connection.cursor().execute('SELECT 1') is not None,
-              'Check database connectivity and credentials')
-    
-    # DATABASE SCHEMA INTEGRITY
-    run_check('SCHEMA', 'MaintenanceActivity Model',
-              lambda: MaintenanceActivity.objects.count() >= 0,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    run_check('SCHEMA', 'Timezone Field Exists',
-              lambda: hasattr(MaintenanceActivity, 'timezone'),
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    try:
-        from events.models import CalendarEvent
-        run_check('SCHEMA', 'CalendarEvent Model',
-                  lambda: CalendarEvent.objects.count() >= 0,
-                  'Check events app migrations')
-    except ImportError:
-        health_data['categories']['SCHEMA']['failed'].append({
-            'name': 'CalendarEvent Model',
-            'status': 'ERROR',
-            'error': 'CalendarEvent model not found',
-            'fix': 'Check events app migrations'
-        })
-        health_data['summary']['failed'] += 1
-        health_data['summary']['total_checks'] += 1
-    
-    # API ENDPOINTS FUNCTIONALITY
-    def test_unified_events_api():
-        try:
-            from events.views import fetch_unified_events
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/api/unified/?start=2025-01-01&end=2025-12-31')
-            test_request.user = request.user
-            
-            response = fetch_unified_events(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('API', 'fetch_unified_events API',
-              test_unified_events_api,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    # CALENDAR SPECIFIC ISSUES
-    def test_calendar_view():
-        try:
-            from events.views import calendar_view
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/calendar/')
-            test_request.user = request.user
-            
-            response = calendar_view(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('CALENDAR', 'Calendar View Renders',
-              test_calendar_view,
-              'Check calendar view and template rendering')
-    
-    run_warning_check('CALENDAR', 'Maintenance Activities Count',
-                      lambda: MaintenanceActivity.objects.count() > 0,
-                      'No maintenance activities found - calendar may appear empty')
-    
-    # USER AUTHENTICATION
-    run_check('AUTH', 'Admin User Exists',
-              lambda: User.objects.filter(is_superuser=True).exists(),
-              'Create admin user: python manage.py createsuperuser')
-    
-    # EXTERNAL DEPENDENCIES
-    def test_redis():
-        try:
-            from django.core.cache import cache
-            cache.set('health_test', 'value')
-            return cache.get('health_test') == 'value'
-        except Exception:
-            return False
-    
-    run_check('DEPS', 'Redis Connection',
-              test_redis,
-              'Check Redis server connectivity')
-    
-    # Calculate health percentage
-    if health_data['summary']['total_checks'] > 0:
-        health_data['summary']['health_percentage'] = round(
-            (health_data['summary']['passed'] * 100) / health_data['summary']['total_checks']
-        )
-    
-    # Determine overall health status
-    if health_data['summary']['health_percentage'] >= 90:
-        health_data['summary']['status'] = 'EXCELLENT'
-    elif health_data['summary']['health_percentage'] >= 75:
-        health_data['summary']['status'] = 'GOOD'
-    elif health_data['summary']['health_percentage'] >= 50:
-        health_data['summary']['status'] = 'MODERATE'
-    else:
-        health_data['summary']['status'] = 'CRITICAL'
-    
-    return JsonResponse(health_data)
-
-
-@login_required
-def health_check_view(request):
-    """Render the health check interface."""
-    if not request.user.is_superuser:
-        return render(request, 'core/access_denied.html', {'message': 'Access denied'})
-    
-    return render(request, 'core/health_check.html')
-
 @login_required
 def css_customization_edit(request, pk):
     """Edit an existing CSS customization"""
@@ -7962,215 +6101,6 @@ def update_user_timezone(request):
             'error': str(e)
         }, status=500)
 
-
-@login_required
-def system_health_check(request):
-    """System health check endpoint for debugging issues."""
-    if not request.user.is_superuser:
-        return JsonResponse({'error': 'Access denied'}, status=403)
-    
-    health_data = {
-        'timestamp': timezone.now().isoformat(),
-        'categories': {},
-        'summary': {
-            'total_checks': 0,
-            'passed': 0,
-            'failed': 0,
-            'warnings': 0,
-            'health_percentage': 0
-        },
-        'quick_fixes': []
-    }
-    
-    def run_check(category, check_name, test_func, fix_suggestion=None):
-        """Run a health check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['failed'].append({
-                    'name': check_name,
-                    'status': 'FAIL',
-                    'fix': fix_suggestion
-                })
-                health_data['summary']['failed'] += 1
-                if fix_suggestion:
-                    health_data['quick_fixes'].append(fix_suggestion)
-        except Exception as e:
-            health_data['categories'][category]['failed'].append({
-                'name': check_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'fix': fix_suggestion
-            })
-            health_data['summary']['failed'] += 1
-            if fix_suggestion:
-                health_data['quick_fixes'].append(fix_suggestion)
-        
-        health_data['summary']['total_checks'] += 1
-    
-    def run_warning_check(category, check_name, test_func, warning_message=None):
-        """Run a warning check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['warnings'].append({
-                    'name': check_name,
-                    'status': 'WARNING',
-                    'message': warning_message
-                })
-                health_data['summary']['warnings'] += 1
-        except Exception as e:
-            health_data['categories'][category]['warnings'].append({
-                'name': check_name,
-                'status': 'WARNING',
-                'error': str(e),
-                'message': warning_message
-            })
-            health_data['summary']['warnings'] += 1
-        
-        health_data['summary']['total_checks'] += 1
-    
-    # Initialize categories
-    categories = ['CORE', 'SCHEMA', 'API', 'CALENDAR', 'MIGRATIONS', 'AUTH', 'DEPS']
-    for category in categories:
-        health_data['categories'][category] = {
-            'passed': [],
-            'failed': [],
-            'warnings': []
-        }
-    
-    # CORE APPLICATION HEALTH
-    run_check('CORE', 'Django Configuration', 
-              lambda: True,  # Simplified for now
-              'Check Django settings and configuration')
-    
-    run_check('CORE', 'Database Connection',
-              lambda: connection.cursor().execute('SELECT 1') is not None,
-              'Check database connectivity and credentials')
-    
-    # DATABASE SCHEMA INTEGRITY
-    run_check('SCHEMA', 'MaintenanceActivity Model',
-              lambda: MaintenanceActivity.objects.count() >= 0,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    run_check('SCHEMA', 'Timezone Field Exists',
-              lambda: hasattr(MaintenanceActivity, 'timezone'),
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    try:
-        from events.models import CalendarEvent
-        run_check('SCHEMA', 'CalendarEvent Model',
-                  lambda: CalendarEvent.objects.count() >= 0,
-                  'Check events app migrations')
-    except ImportError:
-        health_data['categories']['SCHEMA']['failed'].append({
-            'name': 'CalendarEvent Model',
-            'status': 'ERROR',
-            'error': 'CalendarEvent model not found',
-            'fix': 'Check events app migrations'
-        })
-        health_data['summary']['failed'] += 1
-        health_data['summary']['total_checks'] += 1
-    
-    # API ENDPOINTS FUNCTIONALITY
-    def test_unified_events_api():
-        try:
-            from events.views import fetch_unified_events
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/api/unified/?start=2025-01-01&end=2025-12-31')
-            test_request.user = request.user
-            
-            response = fetch_unified_events(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('API', 'fetch_unified_events API',
-              test_unified_events_api,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    # CALENDAR SPECIFIC ISSUES
-    def test_calendar_view():
-        try:
-            from events.views import calendar_view
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/calendar/')
-            test_request.user = request.user
-            
-            response = calendar_view(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('CALENDAR', 'Calendar View Renders',
-              test_calendar_view,
-              'Check calendar view and template rendering')
-    
-    run_warning_check('CALENDAR', 'Maintenance Activities Count',
-                      lambda: MaintenanceActivity.objects.count() > 0,
-                      'No maintenance activities found - calendar may appear empty')
-    
-    # USER AUTHENTICATION
-    run_check('AUTH', 'Admin User Exists',
-              lambda: User.objects.filter(is_superuser=True).exists(),
-              'Create admin user: python manage.py createsuperuser')
-    
-    # EXTERNAL DEPENDENCIES
-    def test_redis():
-        try:
-            from django.core.cache import cache
-            cache.set('health_test', 'value')
-            return cache.get('health_test') == 'value'
-        except Exception:
-            return False
-    
-    run_check('DEPS', 'Redis Connection',
-              test_redis,
-              'Check Redis server connectivity')
-    
-    # Calculate health percentage
-    if health_data['summary']['total_checks'] > 0:
-        health_data['summary']['health_percentage'] = round(
-            (health_data['summary']['passed'] * 100) / health_data['summary']['total_checks']
-        )
-    
-    # Determine overall health status
-    if health_data['summary']['health_percentage'] >= 90:
-        health_data['summary']['status'] = 'EXCELLENT'
-    elif health_data['summary']['health_percentage'] >= 75:
-        health_data['summary']['status'] = 'GOOD'
-    elif health_data['summary']['health_percentage'] >= 50:
-        health_data['summary']['status'] = 'MODERATE'
-    else:
-        health_data['summary']['status'] = 'CRITICAL'
-    
-    return JsonResponse(health_data)
-
-
-@login_required
-def health_check_view(request):
-    """Render the health check interface."""
-    if not request.user.is_superuser:
-        return render(request, 'core/access_denied.html', {'message': 'Access denied'})
-    
-    return render(request, 'core/health_check.html')
-
 @login_required
 def css_customization_delete(request, pk):
     """Delete a CSS customization"""
@@ -8258,215 +6188,6 @@ def update_user_timezone(request):
             'error': str(e)
         }, status=500)
 
-
-@login_required
-def system_health_check(request):
-    """System health check endpoint for debugging issues."""
-    if not request.user.is_superuser:
-        return JsonResponse({'error': 'Access denied'}, status=403)
-    
-    health_data = {
-        'timestamp': timezone.now().isoformat(),
-        'categories': {},
-        'summary': {
-            'total_checks': 0,
-            'passed': 0,
-            'failed': 0,
-            'warnings': 0,
-            'health_percentage': 0
-        },
-        'quick_fixes': []
-    }
-    
-    def run_check(category, check_name, test_func, fix_suggestion=None):
-        """Run a health check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['failed'].append({
-                    'name': check_name,
-                    'status': 'FAIL',
-                    'fix': fix_suggestion
-                })
-                health_data['summary']['failed'] += 1
-                if fix_suggestion:
-                    health_data['quick_fixes'].append(fix_suggestion)
-        except Exception as e:
-            health_data['categories'][category]['failed'].append({
-                'name': check_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'fix': fix_suggestion
-            })
-            health_data['summary']['failed'] += 1
-            if fix_suggestion:
-                health_data['quick_fixes'].append(fix_suggestion)
-        
-        health_data['summary']['total_checks'] += 1
-    
-    def run_warning_check(category, check_name, test_func, warning_message=None):
-        """Run a warning check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['warnings'].append({
-                    'name': check_name,
-                    'status': 'WARNING',
-                    'message': warning_message
-                })
-                health_data['summary']['warnings'] += 1
-        except Exception as e:
-            health_data['categories'][category]['warnings'].append({
-                'name': check_name,
-                'status': 'WARNING',
-                'error': str(e),
-                'message': warning_message
-            })
-            health_data['summary']['warnings'] += 1
-        
-        health_data['summary']['total_checks'] += 1
-    
-    # Initialize categories
-    categories = ['CORE', 'SCHEMA', 'API', 'CALENDAR', 'MIGRATIONS', 'AUTH', 'DEPS']
-    for category in categories:
-        health_data['categories'][category] = {
-            'passed': [],
-            'failed': [],
-            'warnings': []
-        }
-    
-    # CORE APPLICATION HEALTH
-    run_check('CORE', 'Django Configuration', 
-              lambda: True,  # Simplified for now
-              'Check Django settings and configuration')
-    
-    run_check('CORE', 'Database Connection',
-              lambda: connection.cursor().execute('SELECT 1') is not None,
-              'Check database connectivity and credentials')
-    
-    # DATABASE SCHEMA INTEGRITY
-    run_check('SCHEMA', 'MaintenanceActivity Model',
-              lambda: MaintenanceActivity.objects.count() >= 0,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    run_check('SCHEMA', 'Timezone Field Exists',
-              lambda: hasattr(MaintenanceActivity, 'timezone'),
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    try:
-        from events.models import CalendarEvent
-        run_check('SCHEMA', 'CalendarEvent Model',
-                  lambda: CalendarEvent.objects.count() >= 0,
-                  'Check events app migrations')
-    except ImportError:
-        health_data['categories']['SCHEMA']['failed'].append({
-            'name': 'CalendarEvent Model',
-            'status': 'ERROR',
-            'error': 'CalendarEvent model not found',
-            'fix': 'Check events app migrations'
-        })
-        health_data['summary']['failed'] += 1
-        health_data['summary']['total_checks'] += 1
-    
-    # API ENDPOINTS FUNCTIONALITY
-    def test_unified_events_api():
-        try:
-            from events.views import fetch_unified_events
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/api/unified/?start=2025-01-01&end=2025-12-31')
-            test_request.user = request.user
-            
-            response = fetch_unified_events(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('API', 'fetch_unified_events API',
-              test_unified_events_api,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    # CALENDAR SPECIFIC ISSUES
-    def test_calendar_view():
-        try:
-            from events.views import calendar_view
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/calendar/')
-            test_request.user = request.user
-            
-            response = calendar_view(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('CALENDAR', 'Calendar View Renders',
-              test_calendar_view,
-              'Check calendar view and template rendering')
-    
-    run_warning_check('CALENDAR', 'Maintenance Activities Count',
-                      lambda: MaintenanceActivity.objects.count() > 0,
-                      'No maintenance activities found - calendar may appear empty')
-    
-    # USER AUTHENTICATION
-    run_check('AUTH', 'Admin User Exists',
-              lambda: User.objects.filter(is_superuser=True).exists(),
-              'Create admin user: python manage.py createsuperuser')
-    
-    # EXTERNAL DEPENDENCIES
-    def test_redis():
-        try:
-            from django.core.cache import cache
-            cache.set('health_test', 'value')
-            return cache.get('health_test') == 'value'
-        except Exception:
-            return False
-    
-    run_check('DEPS', 'Redis Connection',
-              test_redis,
-              'Check Redis server connectivity')
-    
-    # Calculate health percentage
-    if health_data['summary']['total_checks'] > 0:
-        health_data['summary']['health_percentage'] = round(
-            (health_data['summary']['passed'] * 100) / health_data['summary']['total_checks']
-        )
-    
-    # Determine overall health status
-    if health_data['summary']['health_percentage'] >= 90:
-        health_data['summary']['status'] = 'EXCELLENT'
-    elif health_data['summary']['health_percentage'] >= 75:
-        health_data['summary']['status'] = 'GOOD'
-    elif health_data['summary']['health_percentage'] >= 50:
-        health_data['summary']['status'] = 'MODERATE'
-    else:
-        health_data['summary']['status'] = 'CRITICAL'
-    
-    return JsonResponse(health_data)
-
-
-@login_required
-def health_check_view(request):
-    """Render the health check interface."""
-    if not request.user.is_superuser:
-        return render(request, 'core/access_denied.html', {'message': 'Access denied'})
-    
-    return render(request, 'core/health_check.html')
-
 @login_required
 def css_preview(request):
     """Preview CSS changes in real-time"""
@@ -8565,215 +6286,6 @@ def update_user_timezone(request):
             'error': str(e)
         }, status=500)
 
-
-@login_required
-def system_health_check(request):
-    """System health check endpoint for debugging issues."""
-    if not request.user.is_superuser:
-        return JsonResponse({'error': 'Access denied'}, status=403)
-    
-    health_data = {
-        'timestamp': timezone.now().isoformat(),
-        'categories': {},
-        'summary': {
-            'total_checks': 0,
-            'passed': 0,
-            'failed': 0,
-            'warnings': 0,
-            'health_percentage': 0
-        },
-        'quick_fixes': []
-    }
-    
-    def run_check(category, check_name, test_func, fix_suggestion=None):
-        """Run a health check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['failed'].append({
-                    'name': check_name,
-                    'status': 'FAIL',
-                    'fix': fix_suggestion
-                })
-                health_data['summary']['failed'] += 1
-                if fix_suggestion:
-                    health_data['quick_fixes'].append(fix_suggestion)
-        except Exception as e:
-            health_data['categories'][category]['failed'].append({
-                'name': check_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'fix': fix_suggestion
-            })
-            health_data['summary']['failed'] += 1
-            if fix_suggestion:
-                health_data['quick_fixes'].append(fix_suggestion)
-        
-        health_data['summary']['total_checks'] += 1
-    
-    def run_warning_check(category, check_name, test_func, warning_message=None):
-        """Run a warning check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['warnings'].append({
-                    'name': check_name,
-                    'status': 'WARNING',
-                    'message': warning_message
-                })
-                health_data['summary']['warnings'] += 1
-        except Exception as e:
-            health_data['categories'][category]['warnings'].append({
-                'name': check_name,
-                'status': 'WARNING',
-                'error': str(e),
-                'message': warning_message
-            })
-            health_data['summary']['warnings'] += 1
-        
-        health_data['summary']['total_checks'] += 1
-    
-    # Initialize categories
-    categories = ['CORE', 'SCHEMA', 'API', 'CALENDAR', 'MIGRATIONS', 'AUTH', 'DEPS']
-    for category in categories:
-        health_data['categories'][category] = {
-            'passed': [],
-            'failed': [],
-            'warnings': []
-        }
-    
-    # CORE APPLICATION HEALTH
-    run_check('CORE', 'Django Configuration', 
-              lambda: True,  # Simplified for now
-              'Check Django settings and configuration')
-    
-    run_check('CORE', 'Database Connection',
-              lambda: connection.cursor().execute('SELECT 1') is not None,
-              'Check database connectivity and credentials')
-    
-    # DATABASE SCHEMA INTEGRITY
-    run_check('SCHEMA', 'MaintenanceActivity Model',
-              lambda: MaintenanceActivity.objects.count() >= 0,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    run_check('SCHEMA', 'Timezone Field Exists',
-              lambda: hasattr(MaintenanceActivity, 'timezone'),
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    try:
-        from events.models import CalendarEvent
-        run_check('SCHEMA', 'CalendarEvent Model',
-                  lambda: CalendarEvent.objects.count() >= 0,
-                  'Check events app migrations')
-    except ImportError:
-        health_data['categories']['SCHEMA']['failed'].append({
-            'name': 'CalendarEvent Model',
-            'status': 'ERROR',
-            'error': 'CalendarEvent model not found',
-            'fix': 'Check events app migrations'
-        })
-        health_data['summary']['failed'] += 1
-        health_data['summary']['total_checks'] += 1
-    
-    # API ENDPOINTS FUNCTIONALITY
-    def test_unified_events_api():
-        try:
-            from events.views import fetch_unified_events
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/api/unified/?start=2025-01-01&end=2025-12-31')
-            test_request.user = request.user
-            
-            response = fetch_unified_events(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('API', 'fetch_unified_events API',
-              test_unified_events_api,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    # CALENDAR SPECIFIC ISSUES
-    def test_calendar_view():
-        try:
-            from events.views import calendar_view
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/calendar/')
-            test_request.user = request.user
-            
-            response = calendar_view(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('CALENDAR', 'Calendar View Renders',
-              test_calendar_view,
-              'Check calendar view and template rendering')
-    
-    run_warning_check('CALENDAR', 'Maintenance Activities Count',
-                      lambda: MaintenanceActivity.objects.count() > 0,
-                      'No maintenance activities found - calendar may appear empty')
-    
-    # USER AUTHENTICATION
-    run_check('AUTH', 'Admin User Exists',
-              lambda: User.objects.filter(is_superuser=True).exists(),
-              'Create admin user: python manage.py createsuperuser')
-    
-    # EXTERNAL DEPENDENCIES
-    def test_redis():
-        try:
-            from django.core.cache import cache
-            cache.set('health_test', 'value')
-            return cache.get('health_test') == 'value'
-        except Exception:
-            return False
-    
-    run_check('DEPS', 'Redis Connection',
-              test_redis,
-              'Check Redis server connectivity')
-    
-    # Calculate health percentage
-    if health_data['summary']['total_checks'] > 0:
-        health_data['summary']['health_percentage'] = round(
-            (health_data['summary']['passed'] * 100) / health_data['summary']['total_checks']
-        )
-    
-    # Determine overall health status
-    if health_data['summary']['health_percentage'] >= 90:
-        health_data['summary']['status'] = 'EXCELLENT'
-    elif health_data['summary']['health_percentage'] >= 75:
-        health_data['summary']['status'] = 'GOOD'
-    elif health_data['summary']['health_percentage'] >= 50:
-        health_data['summary']['status'] = 'MODERATE'
-    else:
-        health_data['summary']['status'] = 'CRITICAL'
-    
-    return JsonResponse(health_data)
-
-
-@login_required
-def health_check_view(request):
-    """Render the health check interface."""
-    if not request.user.is_superuser:
-        return render(request, 'core/access_denied.html', {'message': 'Access denied'})
-    
-    return render(request, 'core/health_check.html')
-
 @login_required
 def css_toggle(request, pk):
     """Toggle CSS customization active status"""
@@ -8862,213 +6374,3 @@ def update_user_timezone(request):
             'success': False,
             'error': str(e)
         }, status=500)
-
-
-@login_required
-def system_health_check(request):
-    """System health check endpoint for debugging issues."""
-    if not request.user.is_superuser:
-        return JsonResponse({'error': 'Access denied'}, status=403)
-    
-    health_data = {
-        'timestamp': timezone.now().isoformat(),
-        'categories': {},
-        'summary': {
-            'total_checks': 0,
-            'passed': 0,
-            'failed': 0,
-            'warnings': 0,
-            'health_percentage': 0
-        },
-        'quick_fixes': []
-    }
-    
-    def run_check(category, check_name, test_func, fix_suggestion=None):
-        """Run a health check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['failed'].append({
-                    'name': check_name,
-                    'status': 'FAIL',
-                    'fix': fix_suggestion
-                })
-                health_data['summary']['failed'] += 1
-                if fix_suggestion:
-                    health_data['quick_fixes'].append(fix_suggestion)
-        except Exception as e:
-            health_data['categories'][category]['failed'].append({
-                'name': check_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'fix': fix_suggestion
-            })
-            health_data['summary']['failed'] += 1
-            if fix_suggestion:
-                health_data['quick_fixes'].append(fix_suggestion)
-        
-        health_data['summary']['total_checks'] += 1
-    
-    def run_warning_check(category, check_name, test_func, warning_message=None):
-        """Run a warning check and record results."""
-        try:
-            result = test_func()
-            if result:
-                health_data['categories'][category]['passed'].append({
-                    'name': check_name,
-                    'status': 'PASS'
-                })
-                health_data['summary']['passed'] += 1
-            else:
-                health_data['categories'][category]['warnings'].append({
-                    'name': check_name,
-                    'status': 'WARNING',
-                    'message': warning_message
-                })
-                health_data['summary']['warnings'] += 1
-        except Exception as e:
-            health_data['categories'][category]['warnings'].append({
-                'name': check_name,
-                'status': 'WARNING',
-                'error': str(e),
-                'message': warning_message
-            })
-            health_data['summary']['warnings'] += 1
-        
-        health_data['summary']['total_checks'] += 1
-    
-    # Initialize categories
-    categories = ['CORE', 'SCHEMA', 'API', 'CALENDAR', 'MIGRATIONS', 'AUTH', 'DEPS']
-    for category in categories:
-        health_data['categories'][category] = {
-            'passed': [],
-            'failed': [],
-            'warnings': []
-        }
-    
-    # CORE APPLICATION HEALTH
-    run_check('CORE', 'Django Configuration', 
-              lambda: True,  # Simplified for now
-              'Check Django settings and configuration')
-    
-    run_check('CORE', 'Database Connection',
-              lambda: connection.cursor().execute('SELECT 1') is not None,
-              'Check database connectivity and credentials')
-    
-    # DATABASE SCHEMA INTEGRITY
-    run_check('SCHEMA', 'MaintenanceActivity Model',
-              lambda: MaintenanceActivity.objects.count() >= 0,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    run_check('SCHEMA', 'Timezone Field Exists',
-              lambda: hasattr(MaintenanceActivity, 'timezone'),
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    try:
-        from events.models import CalendarEvent
-        run_check('SCHEMA', 'CalendarEvent Model',
-                  lambda: CalendarEvent.objects.count() >= 0,
-                  'Check events app migrations')
-    except ImportError:
-        health_data['categories']['SCHEMA']['failed'].append({
-            'name': 'CalendarEvent Model',
-            'status': 'ERROR',
-            'error': 'CalendarEvent model not found',
-            'fix': 'Check events app migrations'
-        })
-        health_data['summary']['failed'] += 1
-        health_data['summary']['total_checks'] += 1
-    
-    # API ENDPOINTS FUNCTIONALITY
-    def test_unified_events_api():
-        try:
-            from events.views import fetch_unified_events
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/api/unified/?start=2025-01-01&end=2025-12-31')
-            test_request.user = request.user
-            
-            response = fetch_unified_events(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('API', 'fetch_unified_events API',
-              test_unified_events_api,
-              'Run: ./scripts/simple_timezone_fix.sh')
-    
-    # CALENDAR SPECIFIC ISSUES
-    def test_calendar_view():
-        try:
-            from events.views import calendar_view
-            from django.test import RequestFactory
-            
-            factory = RequestFactory()
-            test_request = factory.get('/events/calendar/')
-            test_request.user = request.user
-            
-            response = calendar_view(test_request)
-            return response.status_code == 200
-        except Exception:
-            return False
-    
-    run_check('CALENDAR', 'Calendar View Renders',
-              test_calendar_view,
-              'Check calendar view and template rendering')
-    
-    run_warning_check('CALENDAR', 'Maintenance Activities Count',
-                      lambda: MaintenanceActivity.objects.count() > 0,
-                      'No maintenance activities found - calendar may appear empty')
-    
-    # USER AUTHENTICATION
-    run_check('AUTH', 'Admin User Exists',
-              lambda: User.objects.filter(is_superuser=True).exists(),
-              'Create admin user: python manage.py createsuperuser')
-    
-    # EXTERNAL DEPENDENCIES
-    def test_redis():
-        try:
-            from django.core.cache import cache
-            cache.set('health_test', 'value')
-            return cache.get('health_test') == 'value'
-        except Exception:
-            return False
-    
-    run_check('DEPS', 'Redis Connection',
-              test_redis,
-              'Check Redis server connectivity')
-    
-    # Calculate health percentage
-    if health_data['summary']['total_checks'] > 0:
-        health_data['summary']['health_percentage'] = round(
-            (health_data['summary']['passed'] * 100) / health_data['summary']['total_checks']
-        )
-    
-    # Determine overall health status
-    if health_data['summary']['health_percentage'] >= 90:
-        health_data['summary']['status'] = 'EXCELLENT'
-    elif health_data['summary']['health_percentage'] >= 75:
-        health_data['summary']['status'] = 'GOOD'
-    elif health_data['summary']['health_percentage'] >= 50:
-        health_data['summary']['status'] = 'MODERATE'
-    else:
-        health_data['summary']['status'] = 'CRITICAL'
-    
-    return JsonResponse(health_data)
-
-
-@login_required
-def health_check_view(request):
-    """Render the health check interface."""
-    if not request.user.is_superuser:
-        return render(request, 'core/access_denied.html', {'message': 'Access denied'})
-    
-    return render(request, 'core/health_check.html')
-
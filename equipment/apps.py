@@ -4,4 +4,8 @@ from django.apps import AppConfig
 class EquipmentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'equipment'
-    verbose_name = 'Equipment Management'
\ No newline at end of file
+    verbose_name = 'Equipment Management'
+    
+    def ready(self):
+        """Import signals when the app is ready."""
+        import equipment.signals
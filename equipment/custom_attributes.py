@@ -0,0 +1,177 @@
+"""
+Typed JSON snapshot of equipment custom field values.
+
+EquipmentCustomValue stores every value as text in an EAV table, so filtering
+on a custom field needs one join per predicate and string comparisons.
+Equipment.custom_attributes keeps the same values as a JSON object keyed by
+field name and typed from EquipmentCategoryField.field_type (numbers as JSON
+numbers, booleans as booleans, multiselect as lists, dates as ISO strings).
+equipment.signals refreshes it whenever a value or a field definition changes.
+
+On PostgreSQL the column has a GIN (jsonb_path_ops) index, so equality filters
+are containment queries answered from the index; on SQLite the same filters
+compile to JSON1 ``json_extract`` expressions.
+"""
+
+import json
+import logging
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+
+logger = logging.getLogger(__name__)
+
+TRUE_VALUES = ('true', '1', 'yes', 'on')
+NUMERIC_TYPES = ('number', 'decimal')
+
+# Query parameters: cf_<field name>[__<operator>]=<value> and sort=[-]cf_<field name>
+FILTER_PREFIX = 'cf_'
+FILTER_OPERATORS = ('exact', 'gt', 'gte', 'lt', 'lte', 'icontains')
+
+SNAPSHOT_BATCH_SIZE = 500
+
+
+def snapshot_value(field_type, value, values_json=''):
+    """
+    Convert a stored custom value to its typed JSON form.
+
+    Returns None for empty values and values that do not parse as the field
+    type; those are left out of the snapshot.
+    """
+    if field_type == 'multiselect':
+        if values_json:
+            try:
+                return json.loads(values_json)
+            except json.JSONDecodeError:
+                pass
+        return [value] if value else None
+    if value is None or value == '':
+        return None
+    if field_type == 'boolean':
+        return value.lower() in TRUE_VALUES
+    if field_type in NUMERIC_TYPES:
+        try:
+            number = float(value)
+        except ValueError:
+            return None
+        return int(number) if field_type == 'number' and number.is_integer() else number
+    return value
+
+
+def build_custom_attributes(equipment_ids):
+    """Return ``{equipment_id: snapshot}`` for ``equipment_ids`` with one query."""
+    from .models import EquipmentCustomValue
+
+    snapshots = {pk: {} for pk in equipment_ids}
+    values = EquipmentCustomValue.objects.filter(equipment_id__in=list(snapshots)).order_by().values_list(
+        'equipment_id', 'field__name', 'field__field_type', 'value', 'values_json'
+    )
+    for equipment_id, name, field_type, value, values_json in values:
+        typed = snapshot_value(field_type, value, values_json)
+        if typed is not None:
+            snapshots[equipment_id][name] = typed
+    return snapshots
+
+
+def refresh_custom_attributes(equipment_ids=None):
+    """
+    Rebuild the custom_attributes snapshot of ``equipment_ids`` (all equipment when None).
+
+    Returns the number of equipment items whose snapshot changed.
+    """
+    from .models import Equipment
+
+    equipment = Equipment.objects.order_by('pk')
+    if equipment_ids is not None:
+        equipment = equipment.filter(pk__in=list(equipment_ids))
+    current = list(equipment.values_list('pk', 'custom_attributes'))
+
+    changed = 0
+    for start in range(0, len(current), SNAPSHOT_BATCH_SIZE):
+        batch = current[start:start + SNAPSHOT_BATCH_SIZE]
+        snapshots = build_custom_attributes([pk for pk, _ in batch])
+        stale = [Equipment(pk=pk, custom_attributes=snapshots[pk]) for pk, old in batch if old != snapshots[pk]]
+        Equipment.objects.bulk_update(stale, ['custom_attributes'])
+        changed += len(stale)
+    return changed
+
+
+def _parse_filter_value(field_type, raw):
+    """Coerce a query-string value to the type stored in the snapshot."""
+    if field_type == 'boolean':
+        return raw.lower() in TRUE_VALUES
+    if field_type in NUMERIC_TYPES:
+        return float(raw)
+    return raw
+
+
+def parse_custom_attribute_params(params):
+    """
+    Extract custom field filters from query parameters.
+
+    Returns a list of ``(field name, operator, raw value)`` for every
+    ``cf_<name>`` / ``cf_<name>__<operator>`` parameter with a value.
+    """
+    filters = []
+    for key in params:
+        if not key.startswith(FILTER_PREFIX):
+            continue
+        raw = params.get(key)
+        if raw in (None, ''):
+            continue
+        name, _, operator = key[len(FILTER_PREFIX):].partition('__')
+        filters.append((name, operator or 'exact', raw))
+    return filters
+
+
+def filter_by_custom_attributes(queryset, filters, field_types):
+    """
+    Apply ``(name, operator, raw value)`` filters to an Equipment queryset.
+
+    Args:
+        filters: Output of parse_custom_attribute_params().
+        field_types: ``{field name: field_type}`` used to coerce values.
+
+    Raises:
+        ValueError: For an unknown field or operator, or a value that does
+            not parse as the field type.
+    """
+    postgres = connection.vendor == 'postgresql'
+    for index, (name, operator, raw) in enumerate(filters):
+        if name not in field_types:
+            raise ValueError(f"Unknown custom field '{name}'")
+        if operator not in FILTER_OPERATORS:
+            raise ValueError(f"Unsupported operator '{operator}' for custom field '{name}'")
+        field_type = field_types[name]
+        value = _parse_filter_value(field_type, raw)
+
+        if operator == 'exact' and field_type == 'multiselect':
+            if postgres:
+                queryset = queryset.filter(custom_attributes__contains={name: [value]})
+            else:
+                # Match the quoted element inside the JSON array text
+                queryset = queryset.annotate(**{f'_cf_{index}': KeyTextTransform(name, 'custom_attributes')}).filter(
+                    **{f'_cf_{index}__icontains': json.dumps(value)}
+                )
+        elif operator == 'exact' and postgres:
+            # Containment is answered from the GIN (jsonb_path_ops) index
+            queryset = queryset.filter(custom_attributes__contains={name: value})
+        elif operator == 'icontains':
+            queryset = queryset.annotate(**{f'_cf_{index}': KeyTextTransform(name, 'custom_attributes')}).filter(
+                **{f'_cf_{index}__icontains': raw}
+            )
+        else:
+            queryset = queryset.annotate(**{f'_cf_{index}': KeyTransform(name, 'custom_attributes')}).filter(
+                Q(**{f'_cf_{index}__{operator}': value})
+            )
+    return queryset
+
+
+def order_by_custom_attribute(queryset, sort):
+    """Order by ``cf_<name>`` (or ``-cf_<name>``), keeping equipment without a value last."""
+    descending = sort.startswith('-')
+    name = sort.lstrip('-')[len(FILTER_PREFIX):]
+    expression = KeyTransform(name, 'custom_attributes')
+    ordering = expression.desc(nulls_last=True) if descending else expression.asc(nulls_last=True)
+    return queryset.order_by(ordering, 'name')
@@ -0,0 +1,148 @@
+"""
+Data assembly for the equipment detail page.
+
+Every tab of the detail page is filled from a fixed set of queries: one
+conditional aggregate for the maintenance status counts and last completion,
+one query each for recent activities, reports (joined through their activity),
+issues (plus their tags) with one grouped count, components, documents, and
+the field configuration with prefetched custom values. The page therefore
+costs the same number of queries however much history the equipment has.
+"""
+
+from django.db.models import Count, Max, Q
+
+ACTIVITY_STATUSES = ('completed', 'pending', 'overdue', 'scheduled', 'in_progress', 'cancelled')
+ISSUE_STATUSES = ('open', 'in_progress', 'resolved')
+RECENT_ACTIVITY_LIMIT = 10
+
+# Enough levels for Site > POD > MDC > room paths without a query per parent;
+# location_path() loads any deeper ancestors in one more query
+DETAIL_SELECT_RELATED = (
+    'category',
+    'location__parent_location__parent_location__parent_location',
+)
+
+
+def maintenance_summary(equipment):
+    """
+    Count the equipment's maintenance activities per status in one query.
+
+    Returns a dict with ``<status>_count`` for each of ACTIVITY_STATUSES,
+    ``maintenance_status`` (the text of Equipment.get_maintenance_status) and
+    ``last_maintenance`` (date of the latest completion, or None).
+    """
+    from maintenance.models import MaintenanceActivity
+
+    aggregates = {
+        f'{status}_count': Count('id', filter=Q(status=status)) for status in ACTIVITY_STATUSES
+    }
+    summary = MaintenanceActivity.objects.filter(equipment=equipment).aggregate(
+        last_completed=Max('actual_end', filter=Q(status='completed')),
+        **aggregates,
+    )
+
+    last_completed = summary.pop('last_completed')
+    pending = summary['pending_count']
+    summary['maintenance_status'] = (
+        f"{pending} pending maintenance activities" if pending > 0 else "No pending maintenance"
+    )
+    summary['last_maintenance'] = last_completed.date() if last_completed else None
+    return summary
+
+
+def issue_summary(equipment):
+    """Return the equipment's issues (tags prefetched) and ``<status>_issues_count`` values."""
+    issues = list(equipment.issues.select_related('created_by').prefetch_related('tags').order_by('-created_at'))
+    counts = dict(equipment.issues.order_by().values_list('status').annotate(total=Count('id')))
+    summary = {f'{status}_issues_count': counts.get(status, 0) for status in ISSUE_STATUSES}
+    summary['issues'] = issues
+    return summary
+
+
+def location_path(location):
+    """
+    Return the 'Site > POD > MDC' path of ``location``, like Location.get_full_path().
+
+    Parents already loaded by select_related are used as they are; any further
+    ancestors are fetched one level per query with only the columns the path
+    needs, as build_location_index does. The result is kept on ``location``
+    for the other parts of the page that show it.
+    """
+    from core.models import Location
+
+    if hasattr(location, '_location_path'):
+        return location._location_path
+    parent_field = Location._meta.get_field('parent_location')
+    names = []
+    node = location
+    while node is not None:
+        names.append(node.name)
+        if node.parent_location_id is None:
+            break
+        if not parent_field.is_cached(node):
+            ancestors = Location.objects.order_by().values_list('parent_location_id', 'name')
+            parent_id, seen = node.parent_location_id, set()
+            while parent_id is not None and parent_id not in seen:
+                seen.add(parent_id)
+                row = ancestors.filter(id=parent_id).first()
+                if row is None:
+                    break
+                parent_id, name = row
+                names.append(name)
+            break
+        node = node.parent_location
+    location._location_path = ' > '.join(reversed(names))
+    return location._location_path
+
+
+def build_equipment_detail_context(equipment):
+    """
+    Assemble the template context for the equipment detail page.
+
+    ``equipment`` should be loaded with DETAIL_SELECT_RELATED so the location
+    path needs no extra queries for the usual hierarchy depths.
+    """
+    from maintenance.models import MaintenanceReport
+    from .models import get_configured_fields_for_equipment, prefetch_custom_values
+
+    context = {'equipment': equipment}
+    context['location_path'] = location_path(equipment.location) if equipment.location_id else ''
+    context.update(maintenance_summary(equipment))
+
+    maintenance_reports = list(
+        MaintenanceReport.objects.filter(
+            maintenance_activity__equipment=equipment
+        ).select_related('maintenance_activity').order_by('-created_at')
+    )
+    context['maintenance_reports'] = maintenance_reports
+    context['maintenance_docs_count'] = len(maintenance_reports)
+
+    context['maintenance_activities'] = list(
+        equipment.maintenance_activities.select_related('activity_type', 'assigned_to').order_by(
+            '-scheduled_start'
+        )[:RECENT_ACTIVITY_LIMIT]
+    )
+
+    # Native custom fields by group, from the same prefetch the configured fields use
+    prefetch_custom_values([equipment])
+    custom_fields_by_group = {}
+    for field_info in equipment.get_all_custom_fields():
+        if not field_info['is_conditional']:
+            field = field_info['field']
+            custom_fields_by_group.setdefault(field.field_group or 'General', []).append(field)
+    context['custom_fields_by_group'] = custom_fields_by_group
+
+    try:
+        context['configured_fields'] = get_configured_fields_for_equipment(equipment)
+    except Exception:
+        # Table doesn't exist yet - use default structure
+        context['configured_fields'] = {
+            'basic': [],
+            'technical': [],
+            'hidden': [],
+        }
+
+    context['components'] = equipment.components.all().order_by('name')
+    context['documents'] = equipment.documents.all().order_by('-created_at')
+    context.update(issue_summary(equipment))
+    return context
@@ -5,7 +5,7 @@ Forms for equipment management.
 from django import forms
 from crispy_forms.helper import FormHelper
 from crispy_forms.layout import Layout, Fieldset, Row, Column, Submit
-from .models import Equipment, EquipmentComponent, EquipmentDocument, EquipmentCategoryField, EquipmentCustomValue, EquipmentCategoryConditionalField, EquipmentIssue, IssueTag
+from .models import Equipment, EquipmentComponent, EquipmentDocument, EquipmentCategoryField, EquipmentCustomValue, EquipmentCategoryConditionalField, EquipmentIssue, IssueTag, prefetch_custom_values
 from core.models import EquipmentCategory, Location
 
 
@@ -155,44 +155,51 @@ class DynamicEquipmentForm(EquipmentForm):
             return
         
         # Get all custom fields (native and conditional) for this category
-        all_fields = []
-        
-        # Get native fields from the category
-        native_fields = EquipmentCategoryField.objects.filter(
-            category=category,
-            is_active=True
-        ).order_by('sort_order')
-        
-        for field in native_fields:
-            all_fields.append({
-                'field': field,
-                'is_conditional': False,
-                'effective_label': field.label,
-                'effective_help_text': field.help_text,
-                'effective_required': field.required,
-                'effective_default_value': field.default_value,
-                'effective_sort_order': field.sort_order,
-                'effective_field_group': field.field_group or 'General',
-            })
-        
-        # Get conditional fields assigned to this category
-        conditional_fields = EquipmentCategoryConditionalField.objects.filter(
-            target_category=category,
-            is_active=True
-        ).select_related('field', 'source_category').order_by('override_sort_order', 'field__sort_order')
-        
-        for conditional in conditional_fields:
-            all_fields.append({
-                'field': conditional.field,
-                'is_conditional': True,
-                'source_category': conditional.source_category,
-                'effective_label': conditional.get_effective_label(),
-                'effective_help_text': conditional.get_effective_help_text(),
-                'effective_required': conditional.get_effective_required(),
-                'effective_default_value': conditional.get_effective_default_value(),
-                'effective_sort_order': conditional.get_effective_sort_order(),
-                'effective_field_group': conditional.get_effective_field_group(),
-            })
+        value_objects = None
+        if self.instance and self.instance.pk and self.instance.category_id == category.id:
+            # Field definitions and the instance's current values in two queries
+            prefetch_custom_values([self.instance])
+            value_objects = self.instance._custom_data['value_objects']
+            all_fields = self.instance.get_all_custom_fields()
+        else:
+            all_fields = []
+        
+            # Get native fields from the category
+            native_fields = EquipmentCategoryField.objects.filter(
+                category=category,
+                is_active=True
+            ).order_by('sort_order')
+        
+            for field in native_fields:
+                all_fields.append({
+                    'field': field,
+                    'is_conditional': False,
+                    'effective_label': field.label,
+                    'effective_help_text': field.help_text,
+                    'effective_required': field.required,
+                    'effective_default_value': field.default_value,
+                    'effective_sort_order': field.sort_order,
+                    'effective_field_group': field.field_group or 'General',
+                })
+        
+            # Get conditional fields assigned to this category
+            conditional_fields = EquipmentCategoryConditionalField.objects.filter(
+                target_category=category,
+                is_active=True
+            ).select_related('field', 'source_category').order_by('override_sort_order', 'field__sort_order')
+        
+            for conditional in conditional_fields:
+                all_fields.append({
+                    'field': conditional.field,
+                    'is_conditional': True,
+                    'source_category': conditional.source_category,
+                    'effective_label': conditional.get_effective_label(),
+                    'effective_help_text': conditional.get_effective_help_text(),
+                    'effective_required': conditional.get_effective_required(),
+                    'effective_default_value': conditional.get_effective_default_value(),
+                    'effective_sort_order': conditional.get_effective_sort_order(),
+                    'effective_field_group': conditional.get_effective_field_group(),
+                })
         
         # Sort by effective sort order
         all_fields.sort(key=lambda x: x['effective_sort_order'])
@@ -223,7 +230,10 @@ class DynamicEquipmentForm(EquipmentForm):
                         
                         # Get raw value from database for proper form field binding
                         try:
-                            value_obj = self.instance.custom_values.filter(field=field).first()
+                            if value_objects is not None:
+                                value_obj = value_objects.get(field.id)
+                            else:
+                                value_obj = self.instance.custom_values.filter(field=field).first()
                             if value_obj:
                                 if field.field_type == 'multiselect':
                                     # Get list of values for multiselect
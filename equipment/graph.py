@@ -0,0 +1,385 @@
+"""
+In-memory equipment dependency graph.
+
+EquipmentGraph loads active EquipmentConnection rows with one query (plus one
+for equipment status) into adjacency lists, and answers cascade-status,
+downstream-impact and upstream-path questions with O(V + E) traversals instead
+of a query per hop.
+
+The fleet-wide graph is cached (see get_equipment_graph) under a version
+number that equipment.signals bumps whenever a connection changes or an
+equipment item's status changes. Connection cycle checks also run against it
+(see would_create_cycle and bulk_create_connections).
+"""
+
+import logging
+from collections import deque
+
+from django.core.cache import cache
+from django.db import transaction
+
+from core.utils import bump_cache_version, get_cache_version
+
+logger = logging.getLogger(__name__)
+
+# Statuses that take equipment (and everything critically downstream of it) offline
+OFFLINE_STATUSES = frozenset(('inactive', 'maintenance', 'retired'))
+CASCADE_OFFLINE = 'cascade_offline'
+
+GRAPH_VERSION_KEY = 'equipment_graph:version'
+GRAPH_CACHE_TIMEOUT = 3600  # 1 hour; the version key makes stale graphs unreachable anyway
+
+
+class EquipmentGraph:
+    """
+    Directed graph of active equipment connections (upstream -> downstream).
+
+    Nodes are equipment IDs. Each node keeps its raw status and is_active flag
+    so cascade status can be derived without touching the database.
+    """
+
+    def __init__(self, nodes, edges):
+        """
+        Args:
+            nodes: Iterable of ``(equipment_id, status, is_active)``.
+            edges: Iterable of ``(upstream_id, downstream_id, is_critical)``.
+        """
+        self.status = {}
+        self.is_active = {}
+        for equipment_id, status, is_active in nodes:
+            self.status[equipment_id] = status
+            self.is_active[equipment_id] = is_active
+
+        self.downstream = {}
+        self.upstream = {}
+        self.critical_downstream = {}
+        self.critical_upstream = {}
+        self.edge_count = 0
+        for upstream_id, downstream_id, is_critical in edges:
+            self.downstream.setdefault(upstream_id, []).append(downstream_id)
+            self.upstream.setdefault(downstream_id, []).append(upstream_id)
+            if is_critical:
+                self.critical_downstream.setdefault(upstream_id, []).append(downstream_id)
+                self.critical_upstream.setdefault(downstream_id, []).append(upstream_id)
+            self.edge_count += 1
+
+        self._effective = None
+
+    @classmethod
+    def build(cls, equipment_ids=None):
+        """
+        Load the graph from the database.
+
+        Args:
+            equipment_ids: Optional iterable restricting the graph to connections
+                between these equipment items; None loads the whole fleet.
+        """
+        from .models import Equipment, EquipmentConnection
+
+        equipment = Equipment.objects.order_by()
+        connections = EquipmentConnection.objects.filter(is_active=True).order_by()
+        if equipment_ids is not None:
+            equipment_ids = list(equipment_ids)
+            equipment = equipment.filter(id__in=equipment_ids)
+            connections = connections.filter(
+                upstream_equipment_id__in=equipment_ids,
+                downstream_equipment_id__in=equipment_ids,
+            )
+
+        return cls(
+            equipment.values_list('id', 'status', 'is_active'),
+            connections.values_list('upstream_equipment_id', 'downstream_equipment_id', 'is_critical'),
+        )
+
+    def __contains__(self, equipment_id):
+        return equipment_id in self.status
+
+    def __len__(self):
+        return len(self.status)
+
+    def is_offline(self, equipment_id):
+        """Mirror of Equipment.is_offline for a node."""
+        return self.status.get(equipment_id) in OFFLINE_STATUSES or not self.is_active.get(equipment_id, True)
+
+    def _propagates(self, equipment_id):
+        # Offline equipment reports its own status; only the offline statuses
+        # themselves take critical downstream equipment down with them.
+        return self.status.get(equipment_id) in OFFLINE_STATUSES
+
+    def effective_statuses(self):
+        """
+        Return ``{equipment_id: effective status}`` for every node.
+
+        Offline roots are propagated breadth-first along critical edges; a node
+        that is online itself becomes ``cascade_offline`` the first time it is
+        reached. Each node and edge is visited at most once, so this is O(V + E)
+        and safe on graphs that (incorrectly) contain cycles.
+        """
+        if self._effective is not None:
+            return self._effective
+
+        effective = dict(self.status)
+        queue = deque(node for node in self.status if self.is_offline(node) and self._propagates(node))
+        while queue:
+            node = queue.popleft()
+            for child in self.critical_downstream.get(node, ()):
+                if effective.get(child) == CASCADE_OFFLINE or self.is_offline(child):
+                    continue
+                effective[child] = CASCADE_OFFLINE
+                queue.append(child)
+
+        self._effective = effective
+        return effective
+
+    def effective_status(self, equipment_id):
+        """Effective status of one node (``cascade_offline`` when a critical upstream is down)."""
+        return self.effective_statuses().get(equipment_id)
+
+    def has_offline_upstream(self, equipment_id):
+        """Whether any critical upstream node is offline or cascade offline."""
+        effective = self.effective_statuses()
+        return any(
+            effective.get(parent) in OFFLINE_STATUSES or effective.get(parent) == CASCADE_OFFLINE
+            for parent in self.critical_upstream.get(equipment_id, ())
+        )
+
+    def _traverse(self, seeds, adjacency):
+        seeds = list(seeds)
+        visited = set(seeds)
+        order = []
+        queue = deque(seeds)
+        while queue:
+            node = queue.popleft()
+            for neighbour in adjacency.get(node, ()):
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    order.append(neighbour)
+                    queue.append(neighbour)
+        return order
+
+    def downstream_impact(self, seeds, critical_only=True):
+        """
+        Equipment IDs that lose service if all ``seeds`` go offline.
+
+        One multi-source breadth-first traversal; the seeds themselves are not
+        included. Results are in breadth-first order.
+        """
+        adjacency = self.critical_downstream if critical_only else self.downstream
+        return self._traverse(seeds, adjacency)
+
+    def upstream_of(self, equipment_id, critical_only=True):
+        """Every equipment ID the node depends on, nearest first."""
+        adjacency = self.critical_upstream if critical_only else self.upstream
+        return self._traverse([equipment_id], adjacency)
+
+    def upstream_path(self, equipment_id):
+        """
+        Explain a cascade: the critical path from an offline root down to the node.
+
+        Returns a list of equipment IDs starting at the offline equipment and
+        ending at ``equipment_id``, or an empty list when the node is not
+        cascade offline.
+        """
+        effective = self.effective_statuses()
+        if effective.get(equipment_id) != CASCADE_OFFLINE:
+            return []
+
+        parents = {equipment_id: None}
+        queue = deque([equipment_id])
+        while queue:
+            node = queue.popleft()
+            for parent in self.critical_upstream.get(node, ()):
+                if parent in parents:
+                    continue
+                parents[parent] = node
+                if effective.get(parent) in OFFLINE_STATUSES:
+                    path = [parent]
+                    while path[-1] != equipment_id:
+                        path.append(parents[path[-1]])
+                    return path
+                if effective.get(parent) == CASCADE_OFFLINE:
+                    queue.append(parent)
+        return []
+
+
+def _current_version():
+    return get_cache_version(GRAPH_VERSION_KEY)
+
+
+def invalidate_equipment_graph():
+    """Make the cached fleet graph stale; the next get_equipment_graph rebuilds it."""
+    bump_cache_version(GRAPH_VERSION_KEY)
+
+
+_local_graph = {'version': None, 'graph': None}
+
+
+def peek_equipment_graph():
+    """Return the current cached fleet graph without building it, or None."""
+    version = _current_version()
+    if _local_graph['version'] == version:
+        return _local_graph['graph']
+    return cache.get(f'equipment_graph:{version}')
+
+
+def get_equipment_graph():
+    """
+    Return the fleet-wide EquipmentGraph, built at most once per version.
+
+    The graph is kept in the shared cache for other processes and in a
+    process-local slot so repeated calls within a request cost one cache read.
+    """
+    version = _current_version()
+    if _local_graph['version'] == version:
+        return _local_graph['graph']
+
+    cache_key = f'equipment_graph:{version}'
+    graph = cache.get(cache_key)
+    if graph is None:
+        graph = EquipmentGraph.build()
+        graph.effective_statuses()
+        cache.set(cache_key, graph, GRAPH_CACHE_TIMEOUT)
+        logger.info(f"Built equipment graph v{version}: {len(graph)} equipment, {graph.edge_count} connections")
+
+    _local_graph['version'] = version
+    _local_graph['graph'] = graph
+    return graph
+
+
+def note_connection_write():
+    """
+    Record a connection write in the current transaction.
+
+    Until it commits, cycle checks in this thread cannot trust the cached
+    graph (which is only invalidated on commit) and read connections directly.
+    The record is a pending on-commit callback, so it is dropped along with
+    the writes when the transaction or savepoint rolls back.
+    """
+    transaction.on_commit(_connection_writes_committed)
+
+
+def _connection_writes_committed():
+    pass
+
+
+def _has_uncommitted_connection_writes():
+    connection = transaction.get_connection()
+    return connection.in_atomic_block and any(
+        func is _connection_writes_committed for _, func, _ in connection.run_on_commit
+    )
+
+
+def load_connection_adjacency():
+    """
+    Return ``(adjacency, existing_pairs)`` for all connections in one query.
+
+    ``adjacency`` maps upstream ID to downstream IDs over active connections;
+    ``existing_pairs`` holds every (upstream, downstream) pair, active or not,
+    since the pair is unique either way.
+    """
+    from .models import EquipmentConnection
+
+    adjacency = {}
+    existing_pairs = set()
+    rows = EquipmentConnection.objects.order_by().values_list(
+        'upstream_equipment_id', 'downstream_equipment_id', 'is_active'
+    )
+    for upstream_id, downstream_id, is_active in rows:
+        existing_pairs.add((upstream_id, downstream_id))
+        if is_active:
+            adjacency.setdefault(upstream_id, []).append(downstream_id)
+    return adjacency, existing_pairs
+
+
+def _reaches(adjacency, source, target):
+    """Whether ``target`` is reachable from ``source``."""
+    if source == target:
+        return True
+    visited = {source}
+    queue = deque([source])
+    while queue:
+        node = queue.popleft()
+        for neighbour in adjacency.get(node, ()):
+            if neighbour == target:
+                return True
+            if neighbour not in visited:
+                visited.add(neighbour)
+                queue.append(neighbour)
+    return False
+
+
+def would_create_cycle(upstream_id, downstream_id):
+    """
+    Whether adding an active ``upstream -> downstream`` connection creates a cycle.
+
+    Answered from the cached graph with no queries when it is current, or from
+    one connection query when it is cold or this transaction has changed
+    connections the cache has not seen yet.
+    """
+    if upstream_id == downstream_id:
+        return True
+    graph = None if _has_uncommitted_connection_writes() else peek_equipment_graph()
+    if graph is not None:
+        adjacency = graph.downstream
+    else:
+        adjacency, _ = load_connection_adjacency()
+    return _reaches(adjacency, downstream_id, upstream_id)
+
+
+def bulk_create_connections(rows, created_by=None):
+    """
+    Validate and create many connections in one pass.
+
+    Args:
+        rows: Iterable of dicts with ``upstream_id``, ``downstream_id`` and
+            optional ``connection_type``, ``is_critical``, ``description``.
+        created_by: User recorded as creator of the new connections.
+
+    Every row is checked against the existing connections plus the rows
+    accepted before it (self-connections, duplicates, unknown equipment,
+    cycles) using one equipment query and one connection query, and the
+    accepted rows are inserted with bulk_create.
+
+    Returns:
+        ``(created, errors)`` where ``errors`` is a list of ``(row index, message)``.
+    """
+    from .models import Equipment, EquipmentConnection
+
+    rows = list(rows)
+    referenced = {row[key] for row in rows for key in ('upstream_id', 'downstream_id')}
+    known = set(Equipment.objects.filter(id__in=referenced).values_list('id', flat=True))
+    adjacency, existing_pairs = load_connection_adjacency()
+
+    accepted = []
+    errors = []
+    for index, row in enumerate(rows):
+        upstream_id, downstream_id = row['upstream_id'], row['downstream_id']
+        if upstream_id not in known or downstream_id not in known:
+            missing = [pk for pk in (upstream_id, downstream_id) if pk not in known]
+            errors.append((index, f"Unknown equipment: {', '.join(map(str, missing))}"))
+        elif upstream_id == downstream_id:
+            errors.append((index, "Equipment cannot connect to itself."))
+        elif (upstream_id, downstream_id) in existing_pairs:
+            errors.append((index, "Connection already exists between these equipment."))
+        elif _reaches(adjacency, downstream_id, upstream_id):
+            errors.append((index, "This connection would create a circular dependency."))
+        else:
+            existing_pairs.add((upstream_id, downstream_id))
+            adjacency.setdefault(upstream_id, []).append(downstream_id)
+            accepted.append(EquipmentConnection(
+                upstream_equipment_id=upstream_id,
+                downstream_equipment_id=downstream_id,
+                connection_type=row.get('connection_type') or 'power',
+                is_critical=row.get('is_critical', True),
+                description=row.get('description', ''),
+                created_by=created_by,
+                updated_by=created_by,
+            ))
+
+    with transaction.atomic():
+        created = EquipmentConnection.objects.bulk_create(accepted, batch_size=1000)
+        # bulk_create sends no post_save signals, so invalidate explicitly
+        if created:
+            note_connection_write()
+            transaction.on_commit(invalidate_equipment_graph)
+    return created, errors
@@ -0,0 +1,221 @@
+"""
+Set-based equipment KPI computation and KPI snapshot maintenance.
+
+KPIs are computed for any number of equipment items with a single grouped
+aggregate query over maintenance activities and stored in
+EquipmentKPISnapshot rows, which pages read instead of recomputing. A full
+fleet refresh takes a fixed handful of queries regardless of fleet size, and
+the snapshot table doubles as the source for fleet-wide KPI rankings.
+"""
+
+import logging
+import threading
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Avg, Count, DurationField, ExpressionWrapper, F, Max, Min, Q, Sum
+from django.utils import timezone
+
+from core.utils import build_location_index
+from .models import Equipment, EquipmentIssue, EquipmentKPISnapshot
+
+logger = logging.getLogger(__name__)
+
+# Completed activities count as on time when they finish within this grace period
+ON_TIME_GRACE = timedelta(hours=24)
+
+SNAPSHOT_FIELDS = [
+    'total_activities', 'completed_count', 'on_time_count', 'completion_rate',
+    'on_time_rate', 'avg_duration_hours', 'avg_time_between_days',
+    'total_downtime_hours', 'last_completed_at', 'open_issue_count',
+    'site', 'category', 'computed_at',
+]
+
+# KPIs that fleet rankings may sort and filter on
+RANKABLE_KPIS = (
+    'completion_rate', 'on_time_rate', 'avg_time_between_days',
+    'avg_duration_hours', 'open_issue_count', 'total_downtime_hours',
+    'total_activities', 'completed_count',
+)
+
+OPEN_ISSUE_STATUSES = ('open', 'in_progress')
+
+
+def _hours(duration):
+    return duration.total_seconds() / 3600 if duration is not None else None
+
+
+def activity_kpi_rows(equipment_ids=None):
+    """
+    Aggregate activity KPIs per equipment in one GROUP BY query.
+
+    The mean time between completed activities is the mean gap between
+    consecutive completion times, which telescopes to
+    ``(last - first) / (n - 1)``; it therefore comes out of the same
+    aggregate via Min/Max instead of needing a LAG window pass.
+    """
+    from maintenance.models import MaintenanceActivity
+
+    duration = ExpressionWrapper(F('actual_end') - F('actual_start'), output_field=DurationField())
+    completed = Q(status='completed')
+    timed = completed & Q(actual_start__isnull=False, actual_end__isnull=False)
+
+    activities = MaintenanceActivity.objects.all()
+    if equipment_ids is not None:
+        activities = activities.filter(equipment_id__in=equipment_ids)
+
+    return activities.order_by().values('equipment_id').annotate(
+        total_activities=Count('id'),
+        completed_count=Count('id', filter=completed),
+        on_time_count=Count('id', filter=completed & Q(actual_end__lte=F('scheduled_end') + ON_TIME_GRACE)),
+        avg_duration=Avg(duration, filter=timed),
+        total_duration=Sum(duration, filter=timed),
+        ended_count=Count('actual_end', filter=completed),
+        first_completed_at=Min('actual_end', filter=completed),
+        last_completed_at=Max('actual_end', filter=completed),
+    )
+
+
+def open_issue_counts(equipment_ids=None):
+    """Return a dict of equipment ID to open issue count from one GROUP BY query."""
+    issues = EquipmentIssue.objects.filter(status__in=OPEN_ISSUE_STATUSES)
+    if equipment_ids is not None:
+        issues = issues.filter(equipment_id__in=equipment_ids)
+    return dict(issues.order_by().values('equipment_id').annotate(n=Count('id')).values_list('equipment_id', 'n'))
+
+
+def build_snapshot(equipment_id, row=None, computed_at=None, **extra):
+    """
+    Build an (unsaved) EquipmentKPISnapshot from an aggregate row.
+
+    ``extra`` carries the non-activity columns (``site_id``, ``category_id``,
+    ``open_issue_count``).
+    """
+    row = row or {}
+    total = row.get('total_activities', 0)
+    completed = row.get('completed_count', 0)
+    on_time = row.get('on_time_count', 0)
+
+    avg_time_between = None
+    ended = row.get('ended_count', 0)
+    if completed >= 2 and ended >= 2:
+        span = row['last_completed_at'] - row['first_completed_at']
+        avg_time_between = span.total_seconds() / 86400 / (ended - 1)
+
+    return EquipmentKPISnapshot(
+        equipment_id=equipment_id,
+        total_activities=total,
+        completed_count=completed,
+        on_time_count=on_time,
+        # Undefined without activities / completions: NULL, so rankings sort them last
+        completion_rate=(completed / total * 100) if total else None,
+        on_time_rate=(on_time / completed * 100) if completed else None,
+        avg_duration_hours=_hours(row.get('avg_duration')),
+        avg_time_between_days=avg_time_between,
+        total_downtime_hours=_hours(row.get('total_duration')) or 0,
+        last_completed_at=row.get('last_completed_at'),
+        computed_at=computed_at or timezone.now(),
+        **extra,
+    )
+
+
+def refresh_kpi_snapshots(equipment_ids=None):
+    """
+    Recompute and upsert KPI snapshots.
+
+    Args:
+        equipment_ids: Iterable of equipment IDs, or None for the whole fleet.
+
+    Returns:
+        dict mapping equipment ID to its refreshed snapshot.
+    """
+    equipment = Equipment.objects.order_by()
+    if equipment_ids is not None:
+        equipment_ids = list(equipment_ids)
+        equipment = equipment.filter(id__in=equipment_ids)
+    equipment = list(equipment.values_list('id', 'category_id', 'location_id'))
+
+    computed_at = timezone.now()
+    rows_by_equipment = {row['equipment_id']: row for row in activity_kpi_rows(equipment_ids)}
+    issue_counts = open_issue_counts(equipment_ids)
+    # A targeted refresh (after an activity save) resolves just these locations' chains
+    locations = build_location_index(
+        None if equipment_ids is None else [location_id for _, _, location_id in equipment]
+    )
+    snapshots = {
+        equipment_id: build_snapshot(
+            equipment_id,
+            rows_by_equipment.get(equipment_id),
+            computed_at,
+            site_id=locations.get(location_id, (None, None))[0],
+            category_id=category_id,
+            open_issue_count=issue_counts.get(equipment_id, 0),
+        )
+        for equipment_id, category_id, location_id in equipment
+    }
+    EquipmentKPISnapshot.objects.bulk_create(
+        snapshots.values(),
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=['equipment'],
+        update_fields=SNAPSHOT_FIELDS,
+    )
+    return snapshots
+
+
+def rank_snapshots(kpi, descending=False, site_id=None, category_id=None):
+    """
+    Return KPI snapshots ordered by one KPI, optionally limited to a site or category.
+
+    Equipment with no value for the KPI (e.g. no MTBM yet, or no completed
+    activities for the on-time rate) sorts last in either direction so "worst N" lists are not padded with empty rows.
+    """
+    if kpi not in RANKABLE_KPIS:
+        raise ValueError(f"Unknown KPI '{kpi}'. Choose from: {', '.join(RANKABLE_KPIS)}")
+
+    snapshots = EquipmentKPISnapshot.objects.select_related('equipment', 'site', 'category')
+    if site_id is not None:
+        snapshots = snapshots.filter(site_id=site_id)
+    if category_id is not None:
+        snapshots = snapshots.filter(category_id=category_id)
+
+    order = F(kpi).desc(nulls_last=True) if descending else F(kpi).asc(nulls_last=True)
+    return snapshots.order_by(order, 'equipment_id')
+
+
+def get_kpi_snapshot(equipment):
+    """Return the stored KPI snapshot for equipment, computing it on first use."""
+    snapshot = EquipmentKPISnapshot.objects.filter(equipment=equipment).first()
+    if snapshot is None:
+        snapshot = refresh_kpi_snapshots([equipment.pk])[equipment.pk]
+    return snapshot
+
+
+_pending = threading.local()
+
+
+def schedule_kpi_refresh(equipment_id):
+    """
+    Refresh an equipment's KPI snapshot once the current transaction commits.
+
+    Several activity changes inside one transaction (bulk status updates,
+    imports) are coalesced: the first commit callback refreshes every pending
+    equipment item in one query and the remaining callbacks find nothing to do.
+    """
+    pending = getattr(_pending, 'ids', None)
+    if pending is None:
+        pending = _pending.ids = set()
+    pending.add(equipment_id)
+    transaction.on_commit(_flush_pending_refreshes)
+
+
+def _flush_pending_refreshes():
+    equipment_ids = getattr(_pending, 'ids', None) or set()
+    _pending.ids = set()
+    if not equipment_ids:
+        return
+    try:
+        existing = Equipment.objects.filter(id__in=equipment_ids).values_list('id', flat=True)
+        refresh_kpi_snapshots(existing)
+    except Exception as e:
+        logger.error(f"Error refreshing KPI snapshots for equipment {sorted(equipment_ids)}: {str(e)}")
@@ -0,0 +1,93 @@
+"""
+Management command to bulk import equipment connections from a CSV file.
+All rows are validated (including circular dependencies) in one pass before inserting.
+"""
+
+import csv
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from equipment.graph import bulk_create_connections
+from equipment.models import Equipment, EquipmentConnection
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y'}
+
+
+class Command(BaseCommand):
+    help = (
+        'Import equipment connections from a CSV with Upstream and Downstream equipment names '
+        'and optional Connection Type, Critical and Description columns'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_file', help='Path to the CSV file')
+        parser.add_argument(
+            '--user',
+            help='Username recorded as creator of the imported connections',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate every row and report errors without creating connections',
+        )
+
+    def handle(self, *args, **options):
+        created_by = None
+        if options['user']:
+            created_by = User.objects.filter(username=options['user']).first()
+            if created_by is None:
+                raise CommandError(f"User '{options['user']}' does not exist")
+
+        try:
+            with open(options['csv_file'], newline='', encoding='utf-8') as f:
+                records = list(csv.DictReader(f))
+        except OSError as e:
+            raise CommandError(f"Cannot read {options['csv_file']}: {e}")
+
+        if records and not {'Upstream', 'Downstream'} <= set(records[0]):
+            raise CommandError('CSV must have Upstream and Downstream columns')
+
+        names = {record[column].strip() for record in records for column in ('Upstream', 'Downstream')}
+        ids_by_name = dict(Equipment.objects.filter(name__in=names).values_list('name', 'id'))
+        valid_types = {choice for choice, _ in EquipmentConnection.CONNECTION_TYPE_CHOICES}
+
+        rows = []
+        row_numbers = []
+        for row_number, record in enumerate(records, start=2):
+            upstream = record['Upstream'].strip()
+            downstream = record['Downstream'].strip()
+            connection_type = (record.get('Connection Type') or 'power').strip().lower()
+            missing = [name for name in (upstream, downstream) if name not in ids_by_name]
+            if missing:
+                self.stdout.write(self.style.WARNING(f"Row {row_number}: unknown equipment {', '.join(missing)}"))
+                continue
+            if connection_type not in valid_types:
+                self.stdout.write(self.style.WARNING(f"Row {row_number}: invalid connection type '{connection_type}'"))
+                continue
+            critical = (record.get('Critical') or '').strip().lower()
+            rows.append({
+                'upstream_id': ids_by_name[upstream],
+                'downstream_id': ids_by_name[downstream],
+                'connection_type': connection_type,
+                'is_critical': critical in TRUE_VALUES if critical else True,
+                'description': (record.get('Description') or '').strip(),
+            })
+            row_numbers.append(row_number)
+
+        with transaction.atomic():
+            created, errors = bulk_create_connections(rows, created_by=created_by)
+            for index, message in errors:
+                self.stdout.write(self.style.WARNING(f"Row {row_numbers[index]}: {message}"))
+            if options['dry_run']:
+                transaction.set_rollback(True)
+                self.stdout.write(self.style.SUCCESS(
+                    f"Dry run: {len(created)} connections would be created, {len(errors)} rejected"
+                ))
+                return
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {len(created)} connections ({len(errors)} rejected, "
+            f"{len(records) - len(rows)} skipped)"
+        ))
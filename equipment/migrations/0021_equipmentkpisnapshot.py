@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-19 04:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('equipment', '0020_add_equipment_field_configuration'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EquipmentKPISnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_activities', models.PositiveIntegerField(default=0)),
+                ('completed_count', models.PositiveIntegerField(default=0)),
+                ('on_time_count', models.PositiveIntegerField(default=0, help_text='Completed activities that finished within 24 hours of their scheduled end')),
+                ('completion_rate', models.FloatField(default=0, help_text='Completed activities as a percentage of all activities')),
+                ('on_time_rate', models.FloatField(default=0, help_text='On-time activities as a percentage of completed activities')),
+                ('avg_duration_hours', models.FloatField(blank=True, help_text='Mean actual duration of completed activities', null=True)),
+                ('avg_time_between_days', models.FloatField(blank=True, help_text='Mean time between completed activities', null=True)),
+                ('total_downtime_hours', models.FloatField(default=0, help_text='Sum of actual durations of completed activities')),
+                ('last_completed_at', models.DateTimeField(blank=True, null=True)),
+                ('computed_at', models.DateTimeField(help_text='When these KPIs were last computed')),
+                ('equipment', models.OneToOneField(help_text='Equipment these KPIs belong to', on_delete=django.db.models.deletion.CASCADE, related_name='kpi_snapshot', to='equipment.equipment')),
+            ],
+            options={
+                'verbose_name': 'Equipment KPI Snapshot',
+                'verbose_name_plural': 'Equipment KPI Snapshots',
+            },
+        ),
+    ]
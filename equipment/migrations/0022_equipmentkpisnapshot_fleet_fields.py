@@ -0,0 +1,46 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0027_add_status_filters_to_dashboard_settings'),
+        ('equipment', '0021_equipmentkpisnapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='equipmentkpisnapshot',
+            name='category',
+            field=models.ForeignKey(blank=True, help_text='Equipment category when KPIs were computed', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='core.equipmentcategory'),
+        ),
+        migrations.AddField(
+            model_name='equipmentkpisnapshot',
+            name='open_issue_count',
+            field=models.PositiveIntegerField(default=0, help_text='Issues that are open or in progress'),
+        ),
+        migrations.AddField(
+            model_name='equipmentkpisnapshot',
+            name='site',
+            field=models.ForeignKey(blank=True, help_text='Site the equipment was located at when KPIs were computed', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='core.location'),
+        ),
+        migrations.AddIndex(
+            model_name='equipmentkpisnapshot',
+            index=models.Index(fields=['category', 'on_time_rate'], name='equipment_e_categor_7034be_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='equipmentkpisnapshot',
+            index=models.Index(fields=['category', 'completion_rate'], name='equipment_e_categor_fc9ede_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='equipmentkpisnapshot',
+            index=models.Index(fields=['site', 'on_time_rate'], name='equipment_e_site_id_030edd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='equipmentkpisnapshot',
+            index=models.Index(fields=['site', 'completion_rate'], name='equipment_e_site_id_5e01b8_idx'),
+        ),
+    ]
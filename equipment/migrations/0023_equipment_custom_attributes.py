@@ -0,0 +1,82 @@
+# Generated by Django 4.2.7 on 2026-10-19 09:40
+
+import json
+
+from django.db import migrations, models
+
+GIN_INDEX_NAME = 'equipment_custom_attrs_gin'
+
+
+def create_gin_index(apps, schema_editor):
+    """GIN (jsonb_path_ops) index for containment filters; PostgreSQL only."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {GIN_INDEX_NAME} '
+        'ON equipment_equipment USING gin (custom_attributes jsonb_path_ops)'
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {GIN_INDEX_NAME}')
+
+
+def snapshot_value(field_type, value, values_json=''):
+    """Frozen copy of equipment.custom_attributes.snapshot_value as of this migration."""
+    if field_type == 'multiselect':
+        if values_json:
+            try:
+                return json.loads(values_json)
+            except json.JSONDecodeError:
+                pass
+        return [value] if value else None
+    if value is None or value == '':
+        return None
+    if field_type == 'boolean':
+        return value.lower() in ('true', '1', 'yes', 'on')
+    if field_type in ('number', 'decimal'):
+        try:
+            number = float(value)
+        except ValueError:
+            return None
+        return int(number) if field_type == 'number' and number.is_integer() else number
+    return value
+
+
+def populate_custom_attributes(apps, schema_editor):
+    Equipment = apps.get_model('equipment', 'Equipment')
+    EquipmentCustomValue = apps.get_model('equipment', 'EquipmentCustomValue')
+
+    snapshots = {}
+    values = EquipmentCustomValue.objects.order_by().values_list(
+        'equipment_id', 'field__name', 'field__field_type', 'value', 'values_json'
+    )
+    for equipment_id, name, field_type, value, values_json in values.iterator():
+        typed = snapshot_value(field_type, value, values_json)
+        if typed is not None:
+            snapshots.setdefault(equipment_id, {})[name] = typed
+
+    Equipment.objects.bulk_update(
+        [Equipment(pk=pk, custom_attributes=snapshot) for pk, snapshot in snapshots.items()],
+        ['custom_attributes'],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('equipment', '0022_equipmentkpisnapshot_fleet_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='equipment',
+            name='custom_attributes',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Custom field values keyed by field name, maintained automatically'),
+        ),
+        migrations.RunPython(create_gin_index, drop_gin_index),
+        migrations.RunPython(populate_custom_attributes, migrations.RunPython.noop),
+    ]
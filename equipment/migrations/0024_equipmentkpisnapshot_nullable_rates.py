@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-19 14:10
+
+from django.db import migrations, models
+
+
+def clear_undefined_rates(apps, schema_editor):
+    """Rates stored as 0 for a zero denominator become NULL."""
+    EquipmentKPISnapshot = apps.get_model('equipment', 'EquipmentKPISnapshot')
+    EquipmentKPISnapshot.objects.filter(total_activities=0).update(completion_rate=None)
+    EquipmentKPISnapshot.objects.filter(completed_count=0).update(on_time_rate=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('equipment', '0023_equipment_custom_attributes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='equipmentkpisnapshot',
+            name='completion_rate',
+            field=models.FloatField(blank=True, help_text='Completed activities as a percentage of all activities (empty without activities)', null=True),
+        ),
+        migrations.AlterField(
+            model_name='equipmentkpisnapshot',
+            name='on_time_rate',
+            field=models.FloatField(blank=True, help_text='On-time activities as a percentage of completed activities (empty without completions)', null=True),
+        ),
+        migrations.RunPython(clear_undefined_rates, migrations.RunPython.noop),
+    ]
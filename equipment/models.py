@@ -100,6 +100,14 @@ class Equipment(TimeStampedModel):
     # Additional tracking fields
     commissioning_date = models.DateField(null=True, blank=True)
     warranty_expiry_date = models.DateField(null=True, blank=True)
+    
+    # Typed snapshot of EquipmentCustomValue rows for indexed filtering (see equipment.custom_attributes)
+    custom_attributes = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Custom field values keyed by field name, maintained automatically"
+    )
 
     # Custom manager for natural sorting
     objects = NaturalSortManager()
@@ -304,6 +312,8 @@ class Equipment(TimeStampedModel):
     
     def get_custom_value(self, field_name):
         """Get the value of a custom field by name."""
+        if hasattr(self, '_custom_data'):
+            return self._custom_data['values'].get(field_name)
         try:
             field = self.category.custom_fields.get(name=field_name, is_active=True)
             value_obj = self.custom_values.filter(field=field).first()
@@ -320,12 +330,15 @@ class Equipment(TimeStampedModel):
             value_obj, created = self.custom_values.get_or_create(field=field)
             value_obj.set_value(value)
             value_obj.save()
+            self.__dict__.pop('_custom_data', None)
             return value_obj
         except EquipmentCategoryField.DoesNotExist:
             return None
     
     def get_custom_values_dict(self):
         """Get all custom values as a dictionary."""
+        if hasattr(self, '_custom_data'):
+            return dict(self._custom_data['values'])
         result = {}
         for field in self.get_custom_fields():
             result[field.name] = self.get_custom_value(field.name)
@@ -354,6 +367,9 @@ class Equipment(TimeStampedModel):
 
     def get_all_custom_fields(self):
         """Get both native and conditional custom fields for this equipment."""
+        if hasattr(self, '_custom_data'):
+            return list(self._custom_data['fields'])
+        
         # Get native fields from the equipment's category
         native_fields = self.get_custom_fields()
         
@@ -408,6 +424,8 @@ class Equipment(TimeStampedModel):
 
     def get_conditional_value(self, field_name):
         """Get the value of a conditional field by name."""
+        if hasattr(self, '_custom_data'):
+            return self._custom_data['conditional_values'].get(field_name)
         try:
             conditional = self.get_conditional_fields().get(field__name=field_name)
             value_obj = self.custom_values.filter(field=conditional.field).first()
@@ -424,6 +442,7 @@ class Equipment(TimeStampedModel):
             value_obj, created = self.custom_values.get_or_create(field=conditional.field)
             value_obj.set_value(value)
             value_obj.save()
+            self.__dict__.pop('_custom_data', None)
             return value_obj
         except EquipmentCategoryConditionalField.DoesNotExist:
             return None
@@ -454,58 +473,29 @@ class Equipment(TimeStampedModel):
         """
         Get the effective status considering cascading offline from upstream equipment.
         Returns the actual status or 'cascade_offline' if upstream equipment is offline.
+        Upstream status comes from the cached dependency graph (equipment.graph).
         """
         # First check own status
         if self.is_offline():
             return self.status
         
         # Check if any critical upstream equipment is offline
-        from equipment.models import EquipmentConnection
-        critical_upstream = EquipmentConnection.objects.filter(
-            downstream_equipment=self,
-            is_active=True,
-            is_critical=True
-        ).select_related('upstream_equipment')
-        
-        for connection in critical_upstream:
-            upstream = connection.upstream_equipment
-            # Recursively check upstream status
-            upstream_status = upstream.get_effective_status()
-            if upstream_status in ['inactive', 'maintenance', 'retired', 'cascade_offline']:
-                return 'cascade_offline'
+        from equipment.graph import get_equipment_graph
+        if get_equipment_graph().has_offline_upstream(self.id):
+            return 'cascade_offline'
         
         return self.status
     
     def get_all_affected_downstream(self):
         """
         Get all equipment that would be affected if this equipment goes offline.
-        Returns a list of equipment that are downstream through critical connections.
+        Returns a list of equipment that are downstream through critical connections,
+        nearest first.
         """
-        affected = []
-        visited = set()
-        to_check = [self]
-        
-        while to_check:
-            current = to_check.pop(0)
-            if current.id in visited:
-                continue
-            visited.add(current.id)
-            
-            # Get all downstream equipment through critical connections
-            from equipment.models import EquipmentConnection
-            critical_downstream = EquipmentConnection.objects.filter(
-                upstream_equipment=current,
-                is_active=True,
-                is_critical=True
-            ).select_related('downstream_equipment')
-            
-            for connection in critical_downstream:
-                downstream = connection.downstream_equipment
-                if downstream.id not in visited:
-                    affected.append(downstream)
-                    to_check.append(downstream)
-        
-        return affected
+        from equipment.graph import get_equipment_graph
+        affected_ids = get_equipment_graph().downstream_impact([self.id])
+        equipment_by_id = Equipment.objects.in_bulk(affected_ids)
+        return [equipment_by_id[pk] for pk in affected_ids if pk in equipment_by_id]
     
     def get_connection_to(self, other_equipment):
         """Get the connection from this equipment to another equipment."""
@@ -599,30 +589,15 @@ class EquipmentConnection(TimeStampedModel):
             )
     
     def _creates_circular_dependency(self):
-        """Check if this connection would create a circular dependency."""
-        if not self.downstream_equipment or not self.upstream_equipment:
+        """
+        Check if this connection would create a circular dependency.
+        Uses the cached dependency graph, so it costs at most one query.
+        """
+        if not self.downstream_equipment_id or not self.upstream_equipment_id:
             return False
         
-        # Check if upstream is already downstream of the proposed downstream
-        visited = set()
-        to_check = [self.downstream_equipment]
-        
-        while to_check:
-            current = to_check.pop(0)
-            if current.id in visited:
-                continue
-            visited.add(current.id)
-            
-            # If we found the upstream equipment in the downstream chain, it's circular
-            if current == self.upstream_equipment:
-                return True
-            
-            # Add all downstream equipment of current to check
-            for conn in current.downstream_connections.filter(is_active=True):
-                if conn.downstream_equipment.id not in visited:
-                    to_check.append(conn.downstream_equipment)
-        
-        return False
+        from equipment.graph import would_create_cycle
+        return would_create_cycle(self.upstream_equipment_id, self.downstream_equipment_id)
 
 
 class EquipmentDocument(TimeStampedModel):
@@ -1125,6 +1100,144 @@ class EquipmentCategoryConditionalField(TimeStampedModel):
         return self.override_field_group or self.field.field_group or 'General'
 
 
+def _custom_field_info(field, conditional=None):
+    """Describe a native field (or a conditional assignment) the way get_all_custom_fields does."""
+    if conditional is None:
+        return {
+            'field': field,
+            'is_conditional': False,
+            'source_category': field.category,
+            'effective_label': field.label,
+            'effective_help_text': field.help_text,
+            'effective_required': field.required,
+            'effective_default_value': field.default_value,
+            'effective_sort_order': field.sort_order,
+            'effective_field_group': field.field_group or 'General',
+        }
+    return {
+        'field': field,
+        'is_conditional': True,
+        'source_category': conditional.source_category,
+        'effective_label': conditional.get_effective_label(),
+        'effective_help_text': conditional.get_effective_help_text(),
+        'effective_required': conditional.get_effective_required(),
+        'effective_default_value': conditional.get_effective_default_value(),
+        'effective_sort_order': conditional.get_effective_sort_order(),
+        'effective_field_group': conditional.get_effective_field_group(),
+    }
+
+
+def prefetch_custom_values(equipment_list):
+    """
+    Load custom field definitions and values for a page of equipment in two queries.
+
+    The first query fetches every active native field of the equipment
+    categories together with the active conditional assignments targeting
+    them; the second fetches all EquipmentCustomValue rows for the equipment.
+    Each instance gets a ``_custom_data`` dict with its field list and
+    pre-rendered display values, which get_custom_value, get_conditional_value,
+    get_custom_values_dict, get_all_custom_fields (and so the get_custom_value
+    template filter) use instead of querying per field.
+
+    Returns the equipment as a list.
+    """
+    from django.db.models import F, FilteredRelation, Q
+
+    equipment_list = list(equipment_list)
+    category_ids = {equipment.category_id for equipment in equipment_list} - {None}
+
+    fields_by_id = {}
+    native_fields = {category_id: [] for category_id in category_ids}
+    conditionals = {category_id: [] for category_id in category_ids}
+    if category_ids:
+        rows = EquipmentCategoryField.objects.annotate(
+            assignment=FilteredRelation(
+                'conditional_assignments',
+                condition=Q(
+                    conditional_assignments__target_category_id__in=category_ids,
+                    conditional_assignments__is_active=True,
+                ),
+            ),
+        ).filter(
+            Q(category_id__in=category_ids, is_active=True) | Q(assignment__id__isnull=False)
+        ).annotate(
+            assignment_id=F('assignment__id'),
+            assignment_source_id=F('assignment__source_category_id'),
+            assignment_target_id=F('assignment__target_category_id'),
+            assignment_label=F('assignment__override_label'),
+            assignment_help_text=F('assignment__override_help_text'),
+            assignment_required=F('assignment__override_required'),
+            assignment_default_value=F('assignment__override_default_value'),
+            assignment_sort_order=F('assignment__override_sort_order'),
+            assignment_field_group=F('assignment__override_field_group'),
+        ).select_related('category').order_by('sort_order', 'name')
+
+        for row in rows:
+            field = fields_by_id.get(row.id)
+            if field is None:
+                field = fields_by_id[row.id] = row
+                if field.is_active and field.category_id in native_fields:
+                    native_fields[field.category_id].append(field)
+            if row.assignment_id is None:
+                continue
+            conditional = EquipmentCategoryConditionalField(
+                id=row.assignment_id,
+                source_category_id=row.assignment_source_id,
+                target_category_id=row.assignment_target_id,
+                field=field,
+                is_active=True,
+                override_label=row.assignment_label,
+                override_help_text=row.assignment_help_text,
+                override_required=row.assignment_required,
+                override_default_value=row.assignment_default_value,
+                override_sort_order=row.assignment_sort_order,
+                override_field_group=row.assignment_field_group,
+            )
+            if conditional.source_category_id == field.category_id:
+                conditional.source_category = field.category
+            conditionals[conditional.target_category_id].append(conditional)
+
+    value_objects = {}
+    if fields_by_id:
+        values = EquipmentCustomValue.objects.filter(
+            equipment_id__in=[equipment.pk for equipment in equipment_list],
+            field_id__in=list(fields_by_id),
+        ).order_by()
+        for value_obj in values:
+            value_obj.field = fields_by_id[value_obj.field_id]
+            value_objects.setdefault(value_obj.equipment_id, {})[value_obj.field_id] = value_obj
+
+    field_lists = {}
+    for category_id in category_ids:
+        conditionals[category_id].sort(
+            key=lambda conditional: (conditional.override_sort_order or 0, conditional.field.sort_order)
+        )
+        field_list = [_custom_field_info(field) for field in native_fields[category_id]]
+        field_list += [_custom_field_info(c.field, c) for c in conditionals[category_id]]
+        field_list.sort(key=lambda info: info['effective_sort_order'])
+        field_lists[category_id] = field_list
+
+    for equipment in equipment_list:
+        own_values = value_objects.get(equipment.pk, {})
+        data = {
+            'fields': field_lists.get(equipment.category_id, []),
+            'values': {},
+            'conditional_values': {},
+            'value_objects': own_values,
+        }
+        for field in native_fields.get(equipment.category_id, []):
+            value_obj = own_values.get(field.id)
+            data['values'][field.name] = value_obj.get_display_value() if value_obj else field.default_value
+        for conditional in conditionals.get(equipment.category_id, []):
+            value_obj = own_values.get(conditional.field_id)
+            data['conditional_values'][conditional.field.name] = (
+                value_obj.get_display_value() if value_obj else conditional.get_effective_default_value()
+            )
+        equipment._custom_data = data
+
+    return equipment_list
+
+
 class IssueTag(TimeStampedModel):
     """
     Tags for equipment issues.
@@ -1264,6 +1377,68 @@ class EquipmentIssue(TimeStampedModel):
         self.save()
 
 
+class EquipmentKPISnapshot(models.Model):
+    """
+    Precomputed maintenance KPIs for a piece of equipment.
+    Refreshed by equipment.kpis whenever the equipment's maintenance activities change,
+    so KPI pages read one row instead of walking every activity. Site and category
+    are denormalized so fleet-wide rankings filter and sort on this table alone.
+    """
+    equipment = models.OneToOneField(
+        Equipment,
+        on_delete=models.CASCADE,
+        related_name='kpi_snapshot',
+        help_text="Equipment these KPIs belong to"
+    )
+    site = models.ForeignKey(
+        Location,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="Site the equipment was located at when KPIs were computed"
+    )
+    category = models.ForeignKey(
+        EquipmentCategory,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="Equipment category when KPIs were computed"
+    )
+    total_activities = models.PositiveIntegerField(default=0)
+    completed_count = models.PositiveIntegerField(default=0)
+    on_time_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Completed activities that finished within 24 hours of their scheduled end"
+    )
+    completion_rate = models.FloatField(
+        null=True, blank=True, help_text="Completed activities as a percentage of all activities (empty without activities)"
+    )
+    on_time_rate = models.FloatField(
+        null=True, blank=True, help_text="On-time activities as a percentage of completed activities (empty without completions)"
+    )
+    avg_duration_hours = models.FloatField(null=True, blank=True, help_text="Mean actual duration of completed activities")
+    avg_time_between_days = models.FloatField(null=True, blank=True, help_text="Mean time between completed activities")
+    total_downtime_hours = models.FloatField(default=0, help_text="Sum of actual durations of completed activities")
+    last_completed_at = models.DateTimeField(null=True, blank=True)
+    open_issue_count = models.PositiveIntegerField(default=0, help_text="Issues that are open or in progress")
+    computed_at = models.DateTimeField(help_text="When these KPIs were last computed")
+
+    class Meta:
+        verbose_name = "Equipment KPI Snapshot"
+        verbose_name_plural = "Equipment KPI Snapshots"
+        indexes = [
+            models.Index(fields=['category', 'on_time_rate']),
+            models.Index(fields=['category', 'completion_rate']),
+            models.Index(fields=['site', 'on_time_rate']),
+            models.Index(fields=['site', 'completion_rate']),
+        ]
+
+    def __str__(self):
+        return f"KPIs for {self.equipment_id} @ {self.computed_at:%Y-%m-%d %H:%M}"
+
+
 class EquipmentFieldConfiguration(TimeStampedModel):
     """
     Configuration for equipment field display, ordering, and grouping.
@@ -1363,6 +1538,7 @@ def get_field_configurations():
 def get_configured_fields_for_equipment(equipment):
     """Get fields organized by group for an equipment instance."""
     from django.db.models import Q
+    from .detail import location_path
     
     try:
         configs = get_field_configurations()
@@ -1374,7 +1550,7 @@ def get_configured_fields_for_equipment(equipment):
     standard_field_map = {
         'name': ('name', equipment.name),
         'category': ('category', equipment.category.name if equipment.category else None),
-        'location': ('location', equipment.location.get_full_path() if equipment.location else None),
+        'location': ('location', location_path(equipment.location) if equipment.location else None),
         'manufacturer': ('manufacturer', equipment.manufacturer),
         'model_number': ('model_number', equipment.model_number),
         'manufacturer_serial': ('manufacturer_serial', equipment.manufacturer_serial),
@@ -1425,6 +1601,8 @@ def get_configured_fields_for_equipment(equipment):
     
     # Add custom fields
     if equipment.category:
+        if not hasattr(equipment, '_custom_data'):
+            prefetch_custom_values([equipment])
         custom_fields_by_group = equipment.get_all_custom_fields_by_group()
         for group_name, fields in custom_fields_by_group.items():
             for field_info in fields:
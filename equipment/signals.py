@@ -0,0 +1,78 @@
+"""
+Django signals for equipment app.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Equipment, EquipmentConnection, EquipmentCategoryField, EquipmentCustomValue
+from .custom_attributes import build_custom_attributes, refresh_custom_attributes
+from .graph import invalidate_equipment_graph, note_connection_write, peek_equipment_graph
+from core.services.map_data_service import invalidate_customer_maps
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=EquipmentConnection)
+@receiver(post_delete, sender=EquipmentConnection)
+def invalidate_graph_on_connection_change(sender, instance, **kwargs):
+    """Rebuild the cached dependency graph after a connection is added, changed or removed."""
+    note_connection_write()
+    transaction.on_commit(invalidate_equipment_graph)
+
+
+@receiver(post_save, sender=Equipment)
+def invalidate_graph_on_status_change(sender, instance, created, **kwargs):
+    """Rebuild the cached dependency graph when equipment status (or active flag) changes."""
+    try:
+        graph = peek_equipment_graph()
+        unchanged = (
+            graph is not None
+            and not created
+            and instance.id in graph
+            and graph.status[instance.id] == instance.status
+            and graph.is_active[instance.id] == instance.is_active
+        )
+        if not unchanged:
+            transaction.on_commit(invalidate_equipment_graph)
+    except Exception as e:
+        logger.error(f"Error checking equipment graph for equipment {instance.id}: {str(e)}")
+        transaction.on_commit(invalidate_equipment_graph)
+
+
+@receiver(post_delete, sender=Equipment)
+def invalidate_graph_on_equipment_delete(sender, instance, **kwargs):
+    """Drop deleted equipment (and its cascaded connections) from the cached graph."""
+    transaction.on_commit(invalidate_equipment_graph)
+
+
+@receiver(post_save, sender=Equipment)
+@receiver(post_delete, sender=Equipment)
+def invalidate_maps_on_equipment_change(sender, instance, **kwargs):
+    """Rebuild cached customer maps after equipment is added, renamed, moved or removed."""
+    transaction.on_commit(invalidate_customer_maps)
+
+
+@receiver(post_save, sender=EquipmentCustomValue)
+@receiver(post_delete, sender=EquipmentCustomValue)
+def sync_custom_attributes_on_value_change(sender, instance, **kwargs):
+    """Keep the equipment's typed custom_attributes snapshot in step with its custom values."""
+    equipment_id = instance.equipment_id
+    snapshot = build_custom_attributes([equipment_id])[equipment_id]
+    Equipment.objects.filter(pk=equipment_id).update(custom_attributes=snapshot)
+    # A later save() of an already-loaded instance must not write the old snapshot back
+    cached = instance._state.fields_cache.get('equipment')
+    if cached is not None:
+        cached.custom_attributes = snapshot
+
+
+@receiver(post_save, sender=EquipmentCategoryField)
+def sync_custom_attributes_on_field_change(sender, instance, created, **kwargs):
+    """Re-key and re-type snapshots when a field is renamed or changes type."""
+    if created:
+        return
+    equipment_ids = instance.values.values_list('equipment_id', flat=True)
+    changed = refresh_custom_attributes(equipment_ids)
+    if changed:
+        logger.info(f"Refreshed custom attributes of {changed} equipment after field '{instance.name}' changed")
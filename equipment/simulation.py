@@ -0,0 +1,110 @@
+"""
+What-if outage simulation over the equipment dependency graph.
+
+Answers "what goes down if we take these units offline for this window" with
+one multi-source traversal of the cached graph (critical connections only)
+and a fixed number of queries, however many units are taken out.
+"""
+
+from core.utils import build_location_index
+from .graph import get_equipment_graph
+
+# Activities in these states are not going to happen, so they cannot clash with an outage
+INACTIVE_ACTIVITY_STATUSES = ('completed', 'cancelled')
+
+
+def _impact_counts(entries, key, names):
+    counts = {}
+    for entry in entries:
+        bucket = counts.setdefault(entry[key], {'seeds': 0, 'affected': 0})
+        bucket['seeds' if entry['is_seed'] else 'affected'] += 1
+    return [
+        {'id': pk, 'name': names.get(pk, 'Unassigned'), **bucket}
+        for pk, bucket in sorted(counts.items(), key=lambda item: -(item[1]['seeds'] + item[1]['affected']))
+    ]
+
+
+def simulate_outage(equipment_ids, start=None, end=None):
+    """
+    Simulate taking ``equipment_ids`` offline between ``start`` and ``end``.
+
+    Returns a dict with:
+        seeds / affected: the equipment taken offline and everything that
+            loses service through critical connections, as dicts with id,
+            name, status, site_id and customer_id.
+        unknown_ids: requested IDs that are not known equipment.
+        impact_by_site / impact_by_customer: seed and affected counts per
+            site and per customer, largest first.
+        maintenance_overlaps: open maintenance activities on any seed or
+            affected equipment that overlap the window (only when both
+            ``start`` and ``end`` are given).
+    """
+    from core.models import Customer, Location
+    from maintenance.models import MaintenanceActivity
+    from .models import Equipment
+
+    graph = get_equipment_graph()
+    requested = list(dict.fromkeys(equipment_ids))
+    seeds = [pk for pk in requested if pk in graph]
+    seed_set = set(seeds)
+    affected = graph.downstream_impact(seeds)
+    involved = seeds + affected
+
+    equipment = {
+        pk: (name, status, location_id)
+        for pk, name, status, location_id
+        in Equipment.objects.filter(id__in=involved).order_by().values_list('id', 'name', 'status', 'location_id')
+    }
+    locations = build_location_index()
+
+    entries = []
+    for pk in involved:
+        if pk not in equipment:
+            continue
+        name, status, location_id = equipment[pk]
+        site_id, customer_id = locations.get(location_id, (None, None))
+        entries.append({
+            'id': pk,
+            'name': name,
+            'status': status,
+            'site_id': site_id,
+            'customer_id': customer_id,
+            'is_seed': pk in seed_set,
+        })
+
+    site_ids = {entry['site_id'] for entry in entries} - {None}
+    customer_ids = {entry['customer_id'] for entry in entries} - {None}
+    site_names = dict(Location.objects.filter(id__in=site_ids).order_by().values_list('id', 'name')) if site_ids else {}
+    customer_names = dict(Customer.objects.filter(id__in=customer_ids).order_by().values_list('id', 'name')) if customer_ids else {}
+
+    overlaps = []
+    if start is not None and end is not None and entries:
+        activities = MaintenanceActivity.objects.filter(
+            equipment_id__in=[entry['id'] for entry in entries],
+            scheduled_start__lt=end,
+            scheduled_end__gt=start,
+        ).exclude(
+            status__in=INACTIVE_ACTIVITY_STATUSES
+        ).order_by('scheduled_start').values_list(
+            'id', 'equipment_id', 'title', 'status', 'scheduled_start', 'scheduled_end'
+        )
+        for activity_id, equipment_id, title, status, scheduled_start, scheduled_end in activities:
+            overlaps.append({
+                'activity_id': activity_id,
+                'equipment_id': equipment_id,
+                'equipment_name': equipment[equipment_id][0],
+                'title': title,
+                'status': status,
+                'scheduled_start': scheduled_start,
+                'scheduled_end': scheduled_end,
+                'on_seed': equipment_id in seed_set,
+            })
+
+    return {
+        'seeds': [entry for entry in entries if entry['is_seed']],
+        'affected': [entry for entry in entries if not entry['is_seed']],
+        'unknown_ids': [pk for pk in requested if pk not in seed_set],
+        'impact_by_site': _impact_counts(entries, 'site_id', site_names),
+        'impact_by_customer': _impact_counts(entries, 'customer_id', customer_names),
+        'maintenance_overlaps': overlaps,
+    }
@@ -0,0 +1,18 @@
+"""
+Celery tasks for equipment app.
+"""
+
+from celery import shared_task
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def refresh_fleet_kpis():
+    """Recompute KPI snapshots for every equipment item."""
+    from .kpis import refresh_kpi_snapshots
+
+    snapshots = refresh_kpi_snapshots()
+    logger.info(f"Refreshed KPI snapshots for {len(snapshots)} equipment items")
+    return len(snapshots)
@@ -3,7 +3,9 @@ URL configuration for equipment app.
 """
 
 from django.urls import path
-from . import views
+from core.utils import LazyViews
+
+views = LazyViews('equipment.views')
 
 app_name = 'equipment'
 
@@ -20,8 +22,10 @@ urlpatterns = [
     # AJAX endpoints
     path('api/data/', views.get_equipment_data, name='get_equipment_data'),
     path('api/search/', views.search_equipment, name='search_equipment'),
+    path('api/kpis/', views.fleet_kpi_ranking, name='fleet_kpi_ranking'),
     path('api/connections/', views.create_connection, name='create_connection'),
     path('api/connections/<int:connection_id>/', views.delete_connection, name='delete_connection'),
+    path('api/outage-simulation/', views.simulate_outage, name='simulate_outage'),
     
     # Components
     path('<int:equipment_id>/components/', views.equipment_components, name='equipment_components'),
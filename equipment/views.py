@@ -8,6 +8,7 @@ import logging
 import csv
 import io
 import os
+from urllib.parse import urlencode
 from django.shortcuts import render, get_object_or_404, redirect
 from django.urls import reverse
 from django.contrib.auth.decorators import login_required
@@ -21,6 +22,7 @@ from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.clickjacking import xframe_options_exempt
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 
 import re
 from datetime import datetime, timedelta
@@ -32,10 +34,15 @@ except ImportError:
     PyPDF2 = None
     PYPDF2_AVAILABLE = False
 
+from .detail import DETAIL_SELECT_RELATED, build_equipment_detail_context, maintenance_summary
+from .custom_attributes import (
+    FILTER_PREFIX, filter_by_custom_attributes, order_by_custom_attribute, parse_custom_attribute_params,
+)
 from .models import Equipment, EquipmentDocument, EquipmentComponent, EquipmentCategoryField, EquipmentIssue, EquipmentFieldConfiguration
 from core.models import EquipmentCategory, Location, natural_sort_key
 from core.logging_utils import log_error, log_view_access, log_api_call
 from maintenance.models import MaintenanceReport
+from maintenance.analytics import ActivityFrame, monthly_series
 from .forms import EquipmentForm, DynamicEquipmentForm, EquipmentComponentForm, EquipmentDocumentForm, IssueLogForm
 
 logger = logging.getLogger(__name__)
@@ -181,6 +188,32 @@ def equipment_list(request):
     if status:
         queryset = queryset.filter(status=status)
     
+    # Filter and sort by custom field values (cf_<field>[__gt|gte|lt|lte|icontains]=value, sort=[-]cf_<field>)
+    custom_filters = parse_custom_attribute_params(request.GET)
+    sort = request.GET.get('sort', '')
+    custom_sort = sort if sort.lstrip('-').startswith(FILTER_PREFIX) else ''
+    custom_query = ''
+    if custom_filters or custom_sort:
+        names = {name for name, _, _ in custom_filters}
+        if custom_sort:
+            names.add(custom_sort.lstrip('-')[len(FILTER_PREFIX):])
+        custom_fields = EquipmentCategoryField.objects.filter(name__in=names)
+        if category_id:
+            custom_fields = custom_fields.filter(
+                Q(category_id=category_id) | Q(conditional_assignments__target_category_id=category_id)
+            )
+        field_types = dict(custom_fields.values_list('name', 'field_type'))
+        try:
+            queryset = filter_by_custom_attributes(queryset, custom_filters, field_types)
+            if custom_sort:
+                queryset = order_by_custom_attribute(queryset, custom_sort)
+            custom_query = '&' + urlencode(
+                [(key, value) for key, value in request.GET.items() if key.startswith(FILTER_PREFIX)]
+                + ([('sort', custom_sort)] if custom_sort else [])
+            )
+        except ValueError as e:
+            messages.warning(request, f"Custom field filter ignored: {e}")
+    
     # Pagination
     paginator = Paginator(queryset, 25)
     page_number = request.GET.get('page')
@@ -237,6 +270,8 @@ def equipment_list(request):
         'selected_status': status,
         'selected_site': selected_site,
         'selected_site_id': selected_site_id,
+        'custom_filters': custom_filters,
+        'custom_query': custom_query,
     }
     
     return render(request, 'equipment/equipment_list.html', context)
@@ -310,16 +345,14 @@ def equipment_detail(request, equipment_id):
     """Display detailed information for specific equipment."""
     log_view_access('equipment_detail', request, request.user)
     equipment = get_object_or_404(
-        Equipment.objects.select_related('category', 'location'),
+        Equipment.objects.select_related(*DETAIL_SELECT_RELATED),
         id=equipment_id
     )
     
-    # Get maintenance status (replaces the broken maintenance schedule from original)
-    maintenance_status = equipment.get_maintenance_status()
-    last_maintenance = equipment.get_last_maintenance_date()
-    
     # For AJAX requests, return JSON (like original)
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        summary = maintenance_summary(equipment)
+        last_maintenance = summary['last_maintenance']
         equipment_data = {
             'id': equipment.id,
             'name': equipment.name,
@@ -336,85 +369,13 @@ def equipment_detail(request, equipment_id):
             'installed_upgrades': equipment.installed_upgrades,
             'dga_due_date': equipment.dga_due_date.isoformat() if equipment.dga_due_date else None,
             'next_maintenance_date': equipment.next_maintenance_date.isoformat() if equipment.next_maintenance_date else None,
-            'maintenance_status': maintenance_status,
+            'maintenance_status': summary['maintenance_status'],
             'last_maintenance': last_maintenance.isoformat() if last_maintenance else None,
         }
         return JsonResponse({'status': 'success', 'equipment': equipment_data})
     
-    # Get counts for maintenance reports tab
-    completed_count = equipment.maintenance_activities.filter(status='completed').count()
-    pending_count = equipment.maintenance_activities.filter(status='pending').count()
-    overdue_count = equipment.maintenance_activities.filter(status='overdue').count()
-    
-    # Count maintenance reports through maintenance activities
-    maintenance_reports = []
-    for activity in equipment.maintenance_activities.all():
-        maintenance_reports.extend(activity.reports.all())
-    maintenance_docs_count = len(maintenance_reports)
-    
-    # Get additional status counts for better reporting
-    scheduled_count = equipment.maintenance_activities.filter(status='scheduled').count()
-    in_progress_count = equipment.maintenance_activities.filter(status='in_progress').count()
-    cancelled_count = equipment.maintenance_activities.filter(status='cancelled').count()
-    
-    # Get custom fields grouped by field group
-    custom_fields_by_group = equipment.get_custom_fields_by_group()
-    
-    # Get configured fields organized by group
-    configured_fields = None
-    try:
-        from equipment.models import get_configured_fields_for_equipment
-        configured_fields = get_configured_fields_for_equipment(equipment)
-    except Exception:
-        # Table doesn't exist yet - use default structure
-        configured_fields = {
-            'basic': [],
-            'technical': [],
-            'hidden': [],
-        }
-    
-    # Get maintenance activities for the maintenance tab
-    maintenance_activities = equipment.maintenance_activities.all().order_by('-scheduled_start')[:10]
-    
-    # Get maintenance reports for the reports tab
-    maintenance_reports = []
-    for activity in equipment.maintenance_activities.all():
-        maintenance_reports.extend(activity.reports.all())
-    
-    # Get components for the components tab
-    components = equipment.components.all().order_by('name')
-    
-    # Get documents for the documents tab
-    documents = equipment.documents.all().order_by('-created_at')
-    
-    # Get issues for the issues tab
-    issues = equipment.issues.all().order_by('-created_at')
-    open_issues_count = issues.filter(status='open').count()
-    in_progress_issues_count = issues.filter(status='in_progress').count()
-    resolved_issues_count = issues.filter(status='resolved').count()
-    
-    context = {
-        'equipment': equipment,
-        'maintenance_status': maintenance_status,
-        'last_maintenance': last_maintenance,
-        'completed_count': completed_count,
-        'pending_count': pending_count,
-        'overdue_count': overdue_count,
-        'scheduled_count': scheduled_count,
-        'in_progress_count': in_progress_count,
-        'cancelled_count': cancelled_count,
-        'maintenance_docs_count': maintenance_docs_count,
-        'custom_fields_by_group': custom_fields_by_group,
-        'configured_fields': configured_fields,
-        'maintenance_activities': maintenance_activities,
-        'maintenance_reports': maintenance_reports,
-        'components': components,
-        'documents': documents,
-        'issues': issues,
-        'open_issues_count': open_issues_count,
-        'in_progress_issues_count': in_progress_issues_count,
-        'resolved_issues_count': resolved_issues_count,
-    }
+    # Status counts, reports, issues and fields for every tab in a fixed number of queries
+    context = build_equipment_detail_context(equipment)
     
     return render(request, 'equipment/equipment_detail.html', context)
 
@@ -422,11 +383,8 @@ def equipment_detail(request, equipment_id):
 @login_required
 def equipment_kpi_tracker(request, equipment_id):
     """KPI tracker for a specific equipment with timeline visualization."""
-    from maintenance.models import MaintenanceActivity
-    from equipment.models import EquipmentIssue
     from django.utils import timezone
-    from django.db.models import Avg, Sum, Count, Q
-    from datetime import timedelta
+    from equipment.kpis import get_kpi_snapshot
     
     equipment = get_object_or_404(
         Equipment.objects.select_related('category', 'location'),
@@ -435,79 +393,44 @@ def equipment_kpi_tracker(request, equipment_id):
     
     # Get all maintenance activities for this equipment
     all_activities = equipment.maintenance_activities.all().order_by('scheduled_start')
-    completed_activities = all_activities.filter(status='completed')
-    
-    # Calculate KPIs
-    total_activities = all_activities.count()
-    completed_count = completed_activities.count()
-    completion_rate = (completed_count / total_activities * 100) if total_activities > 0 else 0
-    
-    # On-time completion rate (completed within scheduled window)
-    on_time_count = 0
-    for activity in completed_activities:
-        if activity.actual_end and activity.scheduled_end:
-            # Consider on-time if completed within 24 hours of scheduled end
-            if activity.actual_end <= activity.scheduled_end + timedelta(hours=24):
-                on_time_count += 1
-    on_time_rate = (on_time_count / completed_count * 100) if completed_count > 0 else 0
-    
-    # Average maintenance duration
-    avg_duration = None
-    durations = []
-    for activity in completed_activities:
-        if activity.actual_start and activity.actual_end:
-            duration = (activity.actual_end - activity.actual_start).total_seconds() / 3600  # hours
-            durations.append(duration)
-    if durations:
-        avg_duration = sum(durations) / len(durations)
-    
-    # Average time between maintenance (MTBF - Mean Time Between Failures/Maintenance)
-    avg_time_between = None
-    if completed_activities.count() >= 2:
-        activities_sorted = list(completed_activities.order_by('actual_end'))
-        intervals = []
-        for i in range(1, len(activities_sorted)):
-            if activities_sorted[i].actual_end and activities_sorted[i-1].actual_end:
-                interval = (activities_sorted[i].actual_end - activities_sorted[i-1].actual_end).days
-                intervals.append(interval)
-        if intervals:
-            avg_time_between = sum(intervals) / len(intervals)
-    
-    # Total downtime (sum of all maintenance durations)
-    total_downtime_hours = sum(durations) if durations else 0
+    
+    # Activity KPIs are precomputed and refreshed whenever activities change
+    snapshot = get_kpi_snapshot(equipment)
     
     # Uptime calculation (if equipment has commissioning date)
     uptime_percentage = None
     if equipment.commissioning_date:
         total_days = (timezone.now().date() - equipment.commissioning_date).days
         if total_days > 0:
-            downtime_days = total_downtime_hours / 24
+            downtime_days = snapshot.total_downtime_hours / 24
             uptime_days = total_days - downtime_days
             uptime_percentage = (uptime_days / total_days * 100) if total_days > 0 else 100
     
     # Issue statistics
     all_issues = equipment.issues.all()
-    open_issues = all_issues.filter(status='open').count()
-    resolved_issues = all_issues.filter(status='resolved').count()
-    critical_issues = all_issues.filter(severity='critical', status__in=['open', 'in_progress']).count()
-    
-    # Recent activity (last 12 months)
-    twelve_months_ago = timezone.now() - timedelta(days=365)
-    recent_activities = all_activities.filter(scheduled_start__gte=twelve_months_ago)
-    recent_completed = recent_activities.filter(status='completed').count()
-    recent_completion_rate = (recent_completed / recent_activities.count() * 100) if recent_activities.count() > 0 else 0
-    
-    # Overdue activities
-    overdue_count = all_activities.filter(
-        status__in=['scheduled', 'pending', 'in_progress'],
-        scheduled_end__lt=timezone.now()
-    ).count()
+    issue_stats = all_issues.aggregate(
+        open_issues=Count('id', filter=Q(status='open')),
+        resolved_issues=Count('id', filter=Q(status='resolved')),
+        critical_issues=Count('id', filter=Q(severity='critical', status__in=['open', 'in_progress'])),
+    )
+    
+    # The 12-month window depends on "now" and overdue flips with check_overdue_maintenance, so neither is snapshotted
+    now = timezone.now()
+    twelve_months_ago = now - timedelta(days=365)
+    recent_stats = all_activities.aggregate(
+        recent_total=Count('id', filter=Q(scheduled_start__gte=twelve_months_ago)),
+        recent_completed=Count('id', filter=Q(scheduled_start__gte=twelve_months_ago, status='completed')),
+        overdue_count=Count('id', filter=Q(status='overdue')),
+    )
+    recent_total = recent_stats['recent_total']
+    recent_completion_rate = (recent_stats['recent_completed'] / recent_total * 100) if recent_total > 0 else 0
+    overdue_count = recent_stats['overdue_count']
     
     # Build timeline data for visualization
     timeline_events = []
     
     # Add maintenance activities to timeline
-    for activity in all_activities.order_by('scheduled_start'):
+    for activity in all_activities.select_related('activity_type'):
         timeline_events.append({
             'type': 'maintenance',
             'title': activity.title or activity.activity_type.name if activity.activity_type else 'Maintenance',
@@ -537,17 +460,10 @@ def equipment_kpi_tracker(request, equipment_id):
     # Sort timeline by timestamp
     timeline_events.sort(key=lambda x: x['timestamp'], reverse=True)
     
-    # Monthly activity count for chart
-    monthly_data = {}
-    for activity in completed_activities:
-        if activity.actual_end:
-            month_key = activity.actual_end.strftime('%Y-%m')
-            monthly_data[month_key] = monthly_data.get(month_key, 0) + 1
-    
-    # Status distribution
-    status_distribution = {}
-    for activity in all_activities:
-        status_distribution[activity.status] = status_distribution.get(activity.status, 0) + 1
+    # Monthly completions and status distribution for charts
+    activity_frame = ActivityFrame.from_queryset(all_activities)
+    monthly_data = activity_frame.monthly_counts('actual_end', status='completed')
+    status_distribution = activity_frame.status_distribution()
     
     # Convert to JSON for template
     import json
@@ -557,17 +473,17 @@ def equipment_kpi_tracker(request, equipment_id):
     context = {
         'equipment': equipment,
         'kpis': {
-            'total_activities': total_activities,
-            'completed_count': completed_count,
-            'completion_rate': round(completion_rate, 1),
-            'on_time_rate': round(on_time_rate, 1),
-            'avg_duration_hours': round(avg_duration, 2) if avg_duration else None,
-            'avg_time_between_days': round(avg_time_between, 1) if avg_time_between else None,
-            'total_downtime_hours': round(total_downtime_hours, 2),
+            'total_activities': snapshot.total_activities,
+            'completed_count': snapshot.completed_count,
+            'completion_rate': round(snapshot.completion_rate, 1) if snapshot.completion_rate is not None else None,
+            'on_time_rate': round(snapshot.on_time_rate, 1) if snapshot.on_time_rate is not None else None,
+            'avg_duration_hours': round(snapshot.avg_duration_hours, 2) if snapshot.avg_duration_hours else None,
+            'avg_time_between_days': round(snapshot.avg_time_between_days, 1) if snapshot.avg_time_between_days else None,
+            'total_downtime_hours': round(snapshot.total_downtime_hours, 2),
             'uptime_percentage': round(uptime_percentage, 2) if uptime_percentage else None,
-            'open_issues': open_issues,
-            'resolved_issues': resolved_issues,
-            'critical_issues': critical_issues,
+            'open_issues': issue_stats['open_issues'],
+            'resolved_issues': issue_stats['resolved_issues'],
+            'critical_issues': issue_stats['critical_issues'],
             'recent_completion_rate': round(recent_completion_rate, 1),
             'overdue_count': overdue_count,
         },
@@ -788,6 +704,86 @@ def search_equipment(request):
     })
 
 
+@login_required
+def fleet_kpi_ranking(request):
+    """
+    Rank equipment across the fleet by a KPI (AJAX endpoint).
+
+    Reads the nightly KPI snapshots, e.g. the worst 50 transformers by on-time
+    rate: ``?kpi=on_time_rate&category=<id>&items_per_page=50``. Rankings are
+    ascending (worst first for rate KPIs) unless ``order=desc``.
+    """
+    from equipment.kpis import RANKABLE_KPIS, rank_snapshots
+
+    try:
+        kpi = request.GET.get('kpi', 'on_time_rate')
+        if kpi not in RANKABLE_KPIS:
+            return JsonResponse({
+                'status': 'error',
+                'message': f"Unknown KPI '{kpi}'. Choose from: {', '.join(RANKABLE_KPIS)}",
+            }, status=400)
+
+        # Non-integers raise ValueError, answered with a 400 below
+        page = int(request.GET.get('page', 1))
+        items_per_page = max(1, min(int(request.GET.get('items_per_page', 50)), 500))
+        site_id = request.GET.get('site') or None
+        category_id = request.GET.get('category') or None
+
+        snapshots = rank_snapshots(
+            kpi,
+            descending=request.GET.get('order') == 'desc',
+            site_id=int(site_id) if site_id else None,
+            category_id=int(category_id) if category_id else None,
+        )
+        paginator = Paginator(snapshots, items_per_page)
+        page_obj = paginator.get_page(page)
+
+        first_rank = page_obj.start_index()
+        results = []
+        for offset, snapshot in enumerate(page_obj):
+            results.append({
+                'rank': first_rank + offset,
+                'equipment_id': snapshot.equipment_id,
+                'equipment_name': snapshot.equipment.name,
+                'site_name': snapshot.site.name if snapshot.site else '',
+                'category_name': snapshot.category.name if snapshot.category else '',
+                'completion_rate': snapshot.completion_rate,
+                'on_time_rate': snapshot.on_time_rate,
+                'avg_time_between_days': snapshot.avg_time_between_days,
+                'avg_duration_hours': snapshot.avg_duration_hours,
+                'open_issue_count': snapshot.open_issue_count,
+                'total_downtime_hours': snapshot.total_downtime_hours,
+                'total_activities': snapshot.total_activities,
+                'completed_count': snapshot.completed_count,
+                'computed_at': snapshot.computed_at.isoformat(),
+            })
+
+        return JsonResponse({
+            'status': 'success',
+            'kpi': kpi,
+            'results': results,
+            'pagination': {
+                'total_records': paginator.count,
+                'total_pages': paginator.num_pages,
+                'current_page': page_obj.number,
+                'items_per_page': items_per_page,
+                'has_next': page_obj.has_next(),
+                'has_previous': page_obj.has_previous(),
+            },
+        })
+    except ValueError as e:
+        return JsonResponse({
+            'status': 'error',
+            'message': f'Invalid parameter: {str(e)}',
+        }, status=400)
+    except Exception as e:
+        logger.error(f"Error in fleet_kpi_ranking: {str(e)}")
+        return JsonResponse({
+            'status': 'error',
+            'message': f'Failed to rank equipment KPIs: {str(e)}',
+        })
+
+
 @login_required
 def equipment_components(request, equipment_id):
     """View and manage equipment components."""
@@ -1683,8 +1679,8 @@ def analyze_reports(request, equipment_id):
     try:
         equipment = get_object_or_404(Equipment, id=equipment_id)
         
-        # Get maintenance activities for trends
-        activities = equipment.maintenance_activities.all()
+        # Load the activity columns once; trends, patterns and insights share them
+        activities = ActivityFrame.from_queryset(equipment.maintenance_activities.all())
         
         # Generate maintenance trends (last 12 months)
         trends = generate_maintenance_trends(activities)
@@ -1756,30 +1752,12 @@ def extract_text_from_file(file_path):
 
 
 def generate_maintenance_trends(activities):
-    """Generate maintenance activity trends over time."""
-    # Get last 12 months
-    end_date = datetime.now()
+    """Generate maintenance activity trends over the last 12 months from an ActivityFrame."""
+    end_date = timezone.now()
     start_date = end_date - timedelta(days=365)
     
-    # Group activities by month
-    monthly_data = {}
-    for activity in activities.filter(scheduled_start__gte=start_date):
-        month_key = activity.scheduled_start.strftime('%Y-%m')
-        if month_key not in monthly_data:
-            monthly_data[month_key] = 0
-        monthly_data[month_key] += 1
-    
-    # Create labels and data for chart
-    labels = []
-    data = []
-    
-    current_date = start_date
-    while current_date <= end_date:
-        month_key = current_date.strftime('%Y-%m')
-        labels.append(current_date.strftime('%b %Y'))
-        data.append(monthly_data.get(month_key, 0))
-        current_date = current_date.replace(day=1) + timedelta(days=32)
-        current_date = current_date.replace(day=1)
+    monthly_data = activities.monthly_counts('scheduled_start', since=start_date.timestamp())
+    labels, data = monthly_series(monthly_data, start_date.date(), end_date.date())
     
     return {
         'labels': labels,
@@ -1788,12 +1766,12 @@ def generate_maintenance_trends(activities):
 
 
 def analyze_maintenance_patterns(activities):
-    """Analyze maintenance activity patterns."""
+    """Analyze maintenance activity patterns from an ActivityFrame."""
     findings = []
     
     # Analyze completion rates
     total_activities = activities.count()
-    completed_activities = activities.filter(status='completed').count()
+    completed_activities = activities.count('completed')
     if total_activities > 0:
         completion_rate = (completed_activities / total_activities) * 100
         findings.append({
@@ -1803,7 +1781,7 @@ def analyze_maintenance_patterns(activities):
         })
     
     # Analyze overdue activities
-    overdue_activities = activities.filter(status='overdue').count()
+    overdue_activities = activities.count('overdue')
     if overdue_activities > 0:
         findings.append({
             'type': 'Overdue Activities',
@@ -1812,34 +1790,56 @@ def analyze_maintenance_patterns(activities):
         })
     
     # Analyze activity types
-    activity_types = activities.values('activity_type__name').annotate(
-        count=Count('id')
-    ).order_by('-count')[:3]
-    
+    activity_types = activities.top_activity_types(3)
     if activity_types:
-        most_common = activity_types[0]
+        name, count = activity_types[0]
         findings.append({
             'type': 'Most Common Activity',
-            'description': f'Most frequent maintenance type: {most_common["activity_type__name"]} ({most_common["count"]} times)',
+            'description': f'Most frequent maintenance type: {name} ({count} times)',
             'confidence': 85
         })
     
+    # Analyze the rhythm of completed maintenance
+    intervals = activities.interval_stats()
+    if intervals and intervals['count'] >= 2:
+        regular = intervals['variation'] is not None and intervals['variation'] < 0.5
+        findings.append({
+            'type': 'Maintenance Interval',
+            'description': (
+                f"Maintenance is completed every {intervals['mean_days']:.1f} days on average "
+                f"(median {intervals['median_days']:.1f}, range {intervals['min_days']:.1f}-{intervals['max_days']:.1f}); "
+                f"the schedule is {'regular' if regular else 'irregular'}"
+            ),
+            'confidence': 80 if regular else 60
+        })
+    
+    # Flag activities with unusual durations
+    outlier_ids, outlier_hours = activities.duration_outliers()
+    if outlier_ids.size:
+        findings.append({
+            'type': 'Duration Outliers',
+            'description': (
+                f'{outlier_ids.size} completed activities took unusually long or short '
+                f'({", ".join(f"{hours:.1f}h" for hours in outlier_hours[:5])})'
+            ),
+            'confidence': 75,
+            'activity_ids': [int(pk) for pk in outlier_ids],
+        })
+    
     return {'findings': findings}
 
 
 def generate_maintenance_insights(equipment, activities):
-    """Generate actionable insights from maintenance data."""
+    """Generate actionable insights from an ActivityFrame."""
     insights = []
     
     # Check for overdue activities
-    overdue_count = activities.filter(status='overdue').count()
+    overdue_count = activities.count('overdue')
     if overdue_count > 0:
         insights.append(f"⚠️ {overdue_count} maintenance activities are overdue and require immediate attention")
     
     # Check maintenance frequency
-    recent_activities = activities.filter(
-        scheduled_start__gte=datetime.now() - timedelta(days=30)
-    ).count()
+    recent_activities = activities.count_since((timezone.now() - timedelta(days=30)).timestamp())
     
     if recent_activities == 0:
         insights.append("📅 No maintenance activities scheduled in the last 30 days")
@@ -2437,6 +2437,74 @@ def delete_connection(request, connection_id):
         }, status=500)
 
 
+@login_required
+@require_http_methods(["POST"])
+def simulate_outage(request):
+    """
+    What-if outage simulation (AJAX endpoint).
+
+    Expects JSON ``{"equipment_ids": [...], "start": ISO datetime, "end": ISO datetime}``
+    and returns everything that would lose service, impact per site and
+    customer, and open maintenance activities overlapping the window.
+    """
+    from django.utils.dateparse import parse_datetime
+    from equipment.simulation import simulate_outage as run_simulation
+    
+    try:
+        data = json.loads(request.body)
+        equipment_ids = [int(pk) for pk in data.get('equipment_ids', [])]
+        if not equipment_ids:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'At least one equipment ID is required'
+            }, status=400)
+        
+        window = {}
+        for key in ('start', 'end'):
+            value = data.get(key)
+            if not value:
+                window[key] = None
+                continue
+            parsed = parse_datetime(value)
+            if parsed is None:
+                return JsonResponse({
+                    'status': 'error',
+                    'message': f'Invalid {key} datetime: {value}'
+                }, status=400)
+            if timezone.is_naive(parsed):
+                parsed = timezone.make_aware(parsed)
+            window[key] = parsed
+        
+        if window['start'] and window['end'] and window['end'] <= window['start']:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'End of the outage window must be after its start'
+            }, status=400)
+        
+        result = run_simulation(equipment_ids, window['start'], window['end'])
+        for overlap in result['maintenance_overlaps']:
+            overlap['scheduled_start'] = overlap['scheduled_start'].isoformat()
+            overlap['scheduled_end'] = overlap['scheduled_end'].isoformat()
+        
+        return JsonResponse({
+            'status': 'success',
+            'affected_count': len(result['affected']),
+            **result,
+        })
+        
+    except (json.JSONDecodeError, TypeError, ValueError) as e:
+        return JsonResponse({
+            'status': 'error',
+            'message': f'Invalid request: {str(e)}'
+        }, status=400)
+    except Exception as e:
+        logger.error(f"Error simulating outage: {str(e)}")
+        return JsonResponse({
+            'status': 'error',
+            'message': f'Error simulating outage: {str(e)}'
+        }, status=500)
+
+
 @login_required
 def log_issue(request, equipment_id):
     """Log a new issue for equipment. Supports both regular POST and AJAX."""
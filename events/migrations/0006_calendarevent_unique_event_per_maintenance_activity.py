@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-19 05:20
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def remove_duplicate_activity_events(apps, schema_editor):
+    """Keep the oldest calendar event of each maintenance activity so the unique constraint can be added."""
+    CalendarEvent = apps.get_model('events', 'CalendarEvent')
+    keep_ids = CalendarEvent.objects.filter(
+        maintenance_activity__isnull=False
+    ).values('maintenance_activity').annotate(keep_id=Min('id')).values('keep_id')
+    CalendarEvent.objects.filter(maintenance_activity__isnull=False).exclude(id__in=keep_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_alter_calendarevent_event_type'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_activity_events, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='calendarevent',
+            constraint=models.UniqueConstraint(fields=('maintenance_activity',), name='unique_event_per_maintenance_activity'),
+        ),
+    ]
@@ -88,6 +88,10 @@ class CalendarEvent(TimeStampedModel):
             models.Index(fields=['equipment', 'event_date']),
             models.Index(fields=['event_type', 'priority']),
         ]
+        constraints = [
+            # At most one event per maintenance activity; lets bulk materialization ignore conflicts
+            models.UniqueConstraint(fields=['maintenance_activity'], name='unique_event_per_maintenance_activity'),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.equipment.name} ({self.event_date})"
@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 def invalidate_dashboard_cache_on_event_delete(sender, instance, **kwargs):
     """Invalidate dashboard cache when a calendar event is deleted."""
     try:
-        from core.views import invalidate_dashboard_cache
+        from core.dashboard_cache import invalidate_dashboard_cache
         
         # Invalidate dashboard cache for all users since calendar events affect dashboard data
         invalidate_dashboard_cache()
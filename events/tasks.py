@@ -4,8 +4,6 @@ Celery tasks for events app.
 
 from celery import shared_task
 from django.utils import timezone
-from django.core.mail import send_mail
-from django.conf import settings
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,8 +11,9 @@ logger = logging.getLogger(__name__)
 
 @shared_task
 def send_event_reminders():
-    """Send reminders for upcoming events."""
+    """Send one reminder digest per assignee for tomorrow's events."""
     from .models import CalendarEvent
+    from core.services.notification_service import ReminderDigestService
     from datetime import timedelta
     
     tomorrow = timezone.now().date() + timedelta(days=1)
@@ -22,30 +21,33 @@ def send_event_reminders():
         event_date=tomorrow,
         is_completed=False,
         assigned_to__isnull=False
-    ).select_related('assigned_to', 'equipment')
+    ).exclude(assigned_to__email='').select_related('assigned_to', 'equipment').order_by('assigned_to_id', 'start_time')
     
-    reminders_sent = 0
-    for event in upcoming_events:
-        try:
-            if event.assigned_to.email:
-                send_mail(
-                    subject=f"Event Reminder: {event.title}",
-                    message=f"You have an event scheduled for tomorrow:\n\n"
-                           f"Title: {event.title}\n"
-                           f"Equipment: {event.equipment.name}\n"
-                           f"Date: {event.event_date}\n"
-                           f"Type: {event.get_event_type_display()}\n",
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[event.assigned_to.email],
-                    fail_silently=False,
-                )
-                reminders_sent += 1
-                logger.info(f"Sent event reminder to {event.assigned_to.email} for {event.title}")
-        except Exception as e:
-            logger.error(f"Error sending event reminder for event {event.id}: {str(e)}")
+    reminders = [
+        (
+            event.assigned_to.email,
+            event.title,
+            [
+                f"Title: {event.title}",
+                f"Equipment: {event.equipment.name}",
+                f"Date: {event.event_date}",
+                f"Type: {event.get_event_type_display()}",
+            ],
+        )
+        for event in upcoming_events
+    ]
+    result = ReminderDigestService().send_reminders(
+        reminders,
+        subject_prefix="Event Reminder",
+        intro="You have an event scheduled for tomorrow:",
+        digest_intro="You have {count} events scheduled for tomorrow:",
+    )
     
-    logger.info(f"Sent {reminders_sent} event reminders")
-    return reminders_sent
+    logger.info(
+        f"Sent {result['reminders_sent']} event reminders in {len(result['delivered'])} digests "
+        f"over {result['connections']} connections ({len(result['failed'])} digests failed)"
+    )
+    return result['reminders_sent']
 
 
 @shared_task
@@ -57,62 +59,110 @@ def cleanup_old_events():
     when calendar events are created without proper linking.
     """
     from .models import CalendarEvent
+    from core.services.bulk_delete_service import BatchedDeleter
     from datetime import timedelta
     
+    deleter = BatchedDeleter(CalendarEvent)
+    
     # Remove completed events older than 1 year
     cutoff_date = timezone.now().date() - timedelta(days=365)
     old_events = CalendarEvent.objects.filter(
         event_date__lt=cutoff_date,
         is_completed=True
     )
-    
-    deleted_count = old_events.count()
-    old_events.delete()
+    deleted_count = deleter.delete(old_events)['deleted']
     
     # Clean up orphaned calendar events (those with maintenance_activity=None)
     # These are "ghost" events left behind when maintenance activities were deleted
     orphaned_events = CalendarEvent.objects.filter(maintenance_activity__isnull=True)
-    orphaned_count = orphaned_events.count()
-    orphaned_events.delete()
+    orphaned_count = deleter.delete(orphaned_events)['deleted']
     
     total_deleted = deleted_count + orphaned_count
+    if total_deleted:
+        # Raw chunked deletes skip the post_delete signal, so start a new
+        # dashboard generation once here
+        from core.dashboard_cache import bump_dashboard_generation
+        bump_dashboard_generation()
     logger.info(f"Cleaned up {deleted_count} old completed events and {orphaned_count} orphaned calendar events (total: {total_deleted})")
     return total_deleted
 
 
-@shared_task  
-def generate_maintenance_events():
-    """Generate calendar events from maintenance activities."""
+@shared_task
+def generate_maintenance_events(batch_size=1000):
+    """Generate calendar events for scheduled maintenance activities that have none.
+    
+    Activities are read in primary-key batches through a NOT EXISTS anti-join
+    and their events inserted with one bulk_create per batch. The unique
+    constraint on CalendarEvent.maintenance_activity plus ignore_conflicts
+    makes concurrent runs safe: an activity another worker materialized first
+    is skipped rather than duplicated.
+    
+    The created count is the batch's activities that had an event after the
+    insert but not before it. An event another worker commits in between is
+    counted by both runs, so under concurrency the counts are approximate;
+    the events themselves are never duplicated.
+    """
     from .models import CalendarEvent
     from maintenance.models import MaintenanceActivity
+    from django.db import transaction
+    from django.db.models import Exists, OuterRef
+    import time
     
-    created_count = 0
+    pending = MaintenanceActivity.objects.filter(status='scheduled').exclude(
+        Exists(CalendarEvent.objects.filter(maintenance_activity=OuterRef('pk')))
+    ).order_by('pk').values(
+        'pk', 'title', 'description', 'equipment_id', 'scheduled_start', 'scheduled_end',
+        'assigned_to_id', 'priority', 'created_by_id'
+    )
     
-    # Find maintenance activities without corresponding calendar events
-    activities = MaintenanceActivity.objects.filter(
-        calendar_events__isnull=True,
-        status='scheduled'
-    ).select_related('equipment')
+    created_count = 0
+    skipped_count = 0
+    batches = 0
+    last_pk = 0
     
-    for activity in activities:
-        try:
-            event = CalendarEvent.objects.create(
-                title=f"Maintenance: {activity.title}",
-                description=activity.description,
+    while True:
+        started = time.perf_counter()
+        rows = list(pending.filter(pk__gt=last_pk)[:batch_size])
+        if not rows:
+            break
+        last_pk = rows[-1]['pk']
+        activity_ids = [row['pk'] for row in rows]
+        
+        events = [
+            CalendarEvent(
+                title=f"Maintenance: {row['title']}",
+                description=row['description'],
                 event_type='maintenance',
-                equipment=activity.equipment,
-                maintenance_activity=activity,
-                event_date=activity.scheduled_start.date(),
-                start_time=activity.scheduled_start.time(),
-                end_time=activity.scheduled_end.time() if activity.scheduled_end else None,
-                assigned_to=activity.assigned_to,
-                priority=activity.priority,
-                created_by_id=1  # System user
+                equipment_id=row['equipment_id'],
+                maintenance_activity_id=row['pk'],
+                event_date=row['scheduled_start'].date(),
+                start_time=row['scheduled_start'].time(),
+                end_time=row['scheduled_end'].time() if row['scheduled_end'] else None,
+                assigned_to_id=row['assigned_to_id'],
+                priority=row['priority'],
+                created_by_id=row['created_by_id'],
+            )
+            for row in rows
+        ]
+        
+        with transaction.atomic():
+            materialized = CalendarEvent.objects.filter(maintenance_activity_id__in=activity_ids)
+            before = set(materialized.values_list('maintenance_activity_id', flat=True))
+            CalendarEvent.objects.bulk_create(
+                [event for event in events if event.maintenance_activity_id not in before], ignore_conflicts=True
             )
-            created_count += 1
-            logger.info(f"Created calendar event for maintenance activity: {activity.title}")
-        except Exception as e:
-            logger.error(f"Error creating calendar event for activity {activity.id}: {str(e)}")
+            created = len(set(materialized.values_list('maintenance_activity_id', flat=True)) - before)
+        
+        batches += 1
+        created_count += created
+        skipped_count += len(rows) - created
+        logger.info(
+            f"Calendar event batch {batches}: created {created}, skipped {len(rows) - created} "
+            f"in {time.perf_counter() - started:.3f}s"
+        )
     
-    logger.info(f"Generated {created_count} calendar events from maintenance activities")
-    return created_count
\ No newline at end of file
+    logger.info(
+        f"Generated {created_count} calendar events from maintenance activities "
+        f"({skipped_count} skipped, {batches} batches)"
+    )
+    return {'created': created_count, 'skipped': skipped_count, 'batches': batches}
@@ -3,7 +3,9 @@ URL configuration for events app.
 """
 
 from django.urls import path
-from . import views
+from core.utils import LazyViews
+
+views = LazyViews('events.views')
 
 app_name = 'events'
 
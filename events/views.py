@@ -531,7 +531,7 @@ def delete_event_ajax(request, event_id):
             
             # Invalidate dashboard cache before deleting the event
             try:
-                from core.views import invalidate_dashboard_cache
+                from core.dashboard_cache import invalidate_dashboard_cache
                 invalidate_dashboard_cache(user_id=request.user.id)
             except Exception as cache_error:
                 print(f"Warning: Could not invalidate dashboard cache: {cache_error}")
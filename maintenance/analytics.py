@@ -0,0 +1,184 @@
+"""
+Vectorized analytics over maintenance activities.
+
+ActivityFrame pulls the few columns the analytics need with a single query and
+keeps them as NumPy arrays. Monthly buckets, status distributions,
+completion-interval statistics and duration outliers are then array
+operations, instead of re-filtering the queryset once per month or per
+pattern and walking model instances in Python.
+
+Timestamps are stored as float epoch seconds (UTC) with NaN for missing
+values, so bucketing matches the UTC months the database stores.
+"""
+
+import numpy as np
+
+
+SECONDS_PER_HOUR = 3600.0
+SECONDS_PER_DAY = 86400.0
+
+FRAME_FIELDS = (
+    'id', 'status', 'activity_type__name',
+    'scheduled_start', 'scheduled_end', 'actual_start', 'actual_end',
+)
+
+TIME_FIELDS = ('scheduled_start', 'scheduled_end', 'actual_start', 'actual_end')
+
+
+def _epoch_seconds(values):
+    """Convert a sequence of aware datetimes (or None) to float epoch seconds."""
+    return np.fromiter(
+        (value.timestamp() if value is not None else np.nan for value in values),
+        dtype=np.float64,
+        count=len(values),
+    )
+
+
+def _to_months(seconds):
+    """Convert (non-NaN) epoch seconds to datetime64 month buckets."""
+    return seconds.astype(np.int64).astype('datetime64[s]').astype('datetime64[M]')
+
+
+def monthly_series(month_counts, start_date, end_date):
+    """
+    Expand a ``{'YYYY-MM': count}`` mapping into chart labels and data.
+
+    Every month from ``start_date`` through ``end_date`` gets a slot, with
+    zero for months that have no entry.
+    """
+    months = np.arange(
+        np.datetime64(start_date, 'M'),
+        np.datetime64(end_date, 'M') + np.timedelta64(1, 'M'),
+    )
+    labels = [month.strftime('%b %Y') for month in months.astype(object)]
+    data = [month_counts.get(str(month), 0) for month in months]
+    return labels, data
+
+
+class ActivityFrame:
+    """Column arrays for a set of maintenance activities."""
+
+    def __init__(self, ids, statuses, activity_types, scheduled_start, scheduled_end, actual_start, actual_end):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.statuses = np.asarray(statuses, dtype=str)
+        self.activity_types = np.asarray(activity_types, dtype=str)
+        self.scheduled_start = np.asarray(scheduled_start, dtype=np.float64)
+        self.scheduled_end = np.asarray(scheduled_end, dtype=np.float64)
+        self.actual_start = np.asarray(actual_start, dtype=np.float64)
+        self.actual_end = np.asarray(actual_end, dtype=np.float64)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a frame from ``FRAME_FIELDS``-ordered tuples."""
+        rows = list(rows)
+        if not rows:
+            return cls([], [], [], [], [], [], [])
+        ids, statuses, activity_types, *times = zip(*rows)
+        return cls(
+            ids,
+            statuses,
+            [name or '' for name in activity_types],
+            *(_epoch_seconds(column) for column in times),
+        )
+
+    @classmethod
+    def from_queryset(cls, activities):
+        """Load a frame from a MaintenanceActivity queryset with one query."""
+        return cls.from_rows(activities.order_by().values_list(*FRAME_FIELDS))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def count(self, status=None):
+        """Number of activities, optionally only those with ``status``."""
+        if status is None:
+            return len(self)
+        return int(np.count_nonzero(self.statuses == status))
+
+    def count_since(self, seconds, field='scheduled_start'):
+        """Number of activities whose ``field`` is at or after epoch ``seconds``."""
+        return int(np.count_nonzero(getattr(self, field) >= seconds))
+
+    def status_distribution(self):
+        """Return ``{status: count}`` for every status present."""
+        statuses, counts = np.unique(self.statuses, return_counts=True)
+        return {str(status): int(count) for status, count in zip(statuses, counts)}
+
+    def top_activity_types(self, limit=3):
+        """Return up to ``limit`` ``(activity type name, count)`` pairs, most frequent first."""
+        names, counts = np.unique(self.activity_types, return_counts=True)
+        order = np.argsort(-counts, kind='stable')[:limit]
+        return [(str(names[i]), int(counts[i])) for i in order]
+
+    def monthly_counts(self, field='scheduled_start', since=None, status=None):
+        """
+        Count activities per UTC month of ``field``.
+
+        Args:
+            field: One of TIME_FIELDS to bucket on; activities without a value are skipped.
+            since: Optional epoch seconds lower bound on ``field``.
+            status: Optional status the activities must have.
+
+        Returns:
+            dict mapping ``'YYYY-MM'`` to a count, in month order.
+        """
+        if field not in TIME_FIELDS:
+            raise ValueError(f"Cannot bucket on '{field}'")
+        seconds = getattr(self, field)
+        mask = ~np.isnan(seconds)
+        if since is not None:
+            mask &= seconds >= since
+        if status is not None:
+            mask &= self.statuses == status
+        months, counts = np.unique(_to_months(seconds[mask]), return_counts=True)
+        return {str(month): int(count) for month, count in zip(months, counts)}
+
+    def _completed(self):
+        return self.statuses == 'completed'
+
+    def durations_hours(self):
+        """Return ids and actual durations (hours) of completed activities with both timestamps."""
+        mask = self._completed() & ~np.isnan(self.actual_start) & ~np.isnan(self.actual_end)
+        return self.ids[mask], (self.actual_end[mask] - self.actual_start[mask]) / SECONDS_PER_HOUR
+
+    def completion_intervals_days(self):
+        """Days between consecutive completions, in completion order."""
+        ends = self.actual_end[self._completed()]
+        return np.diff(np.sort(ends[~np.isnan(ends)])) / SECONDS_PER_DAY
+
+    def interval_stats(self):
+        """
+        Summary statistics of the time between consecutive completions.
+
+        Returns None when there are fewer than two completions.
+        """
+        intervals = self.completion_intervals_days()
+        if intervals.size == 0:
+            return None
+        mean = float(intervals.mean())
+        std = float(intervals.std())
+        return {
+            'count': int(intervals.size),
+            'mean_days': mean,
+            'median_days': float(np.median(intervals)),
+            'std_days': std,
+            'min_days': float(intervals.min()),
+            'max_days': float(intervals.max()),
+            # Coefficient of variation: low values mean a regular maintenance rhythm
+            'variation': std / mean if mean > 0 else None,
+        }
+
+    def duration_outliers(self, fence=1.5, min_samples=4):
+        """
+        Return ``(ids, hours)`` of completed activities with unusual durations.
+
+        Uses Tukey's fences: durations outside ``[Q1 - fence*IQR, Q3 + fence*IQR]``.
+        Fewer than ``min_samples`` durations never produce outliers.
+        """
+        ids, hours = self.durations_hours()
+        if hours.size < min_samples:
+            return ids[:0], hours[:0]
+        q1, q3 = np.percentile(hours, [25, 75])
+        spread = fence * (q3 - q1)
+        mask = (hours < q1 - spread) | (hours > q3 + spread)
+        return ids[mask], hours[mask]
@@ -4,7 +4,7 @@ Use with caution - this will permanently delete all maintenance data.
 """
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from core.services.bulk_delete_service import BatchedDeleter
 from maintenance.models import MaintenanceActivity, MaintenanceSchedule
 from events.models import CalendarEvent
 from django.contrib.auth.models import User
@@ -24,6 +24,12 @@ class Command(BaseCommand):
             action='store_true',
             help='Keep maintenance schedules (only delete activities and events)',
         )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Rows deleted per transaction (default: BULK_DELETE_CONFIG chunk_size)',
+        )
 
     def handle(self, *args, **options):
         if not options['confirm']:
@@ -32,55 +38,67 @@ class Command(BaseCommand):
                 'Use --confirm to proceed with the deletion.'
             )
 
+        config = {'chunk_size': options['chunk_size']} if options['chunk_size'] else None
+        
         try:
-            with transaction.atomic():
-                # Count existing records
-                activity_count = MaintenanceActivity.objects.count()
-                event_count = CalendarEvent.objects.count()
-                schedule_count = MaintenanceSchedule.objects.count()
-                
-                self.stdout.write(
-                    self.style.WARNING(
-                        f'Found {activity_count} maintenance activities, '
-                        f'{event_count} calendar events, and '
-                        f'{schedule_count} maintenance schedules'
-                    )
+            # Count existing records
+            activity_count = MaintenanceActivity.objects.count()
+            event_count = CalendarEvent.objects.count()
+            schedule_count = MaintenanceSchedule.objects.count()
+            
+            self.stdout.write(
+                self.style.WARNING(
+                    f'Found {activity_count} maintenance activities, '
+                    f'{event_count} calendar events, and '
+                    f'{schedule_count} maintenance schedules'
                 )
-                
-                # Delete calendar events first (they reference maintenance activities)
-                if event_count > 0:
-                    self.stdout.write('Deleting calendar events...')
-                    CalendarEvent.objects.all().delete()
-                    self.stdout.write(
-                        self.style.SUCCESS(f'Deleted {event_count} calendar events')
-                    )
-                
-                # Delete maintenance activities
-                if activity_count > 0:
-                    self.stdout.write('Deleting maintenance activities...')
-                    MaintenanceActivity.objects.all().delete()
-                    self.stdout.write(
-                        self.style.SUCCESS(f'Deleted {activity_count} maintenance activities')
-                    )
-                
-                # Delete maintenance schedules (optional)
-                if not options['keep_schedules'] and schedule_count > 0:
-                    self.stdout.write('Deleting maintenance schedules...')
-                    MaintenanceSchedule.objects.all().delete()
-                    self.stdout.write(
-                        self.style.SUCCESS(f'Deleted {schedule_count} maintenance schedules')
-                    )
-                elif options['keep_schedules']:
-                    self.stdout.write(
-                        self.style.WARNING('Keeping maintenance schedules as requested')
-                    )
-                
+            )
+            
+            # Each chunk commits on its own, so the purge never holds locks for the whole run
+            # Delete calendar events first (they reference maintenance activities)
+            if event_count > 0:
+                self.stdout.write('Deleting calendar events...')
+                result = BatchedDeleter(CalendarEvent, config=config).delete(CalendarEvent.objects.all())
+                self._report(result, 'calendar events')
+            
+            # Delete maintenance activities
+            if activity_count > 0:
+                self.stdout.write('Deleting maintenance activities...')
+                result = BatchedDeleter(
+                    MaintenanceActivity, also_delete=[(CalendarEvent, 'maintenance_activity')], config=config
+                ).delete(MaintenanceActivity.objects.all())
+                self._report(result, 'maintenance activities')
+            
+            # Delete maintenance schedules (optional)
+            if not options['keep_schedules'] and schedule_count > 0:
+                self.stdout.write('Deleting maintenance schedules...')
+                result = BatchedDeleter(MaintenanceSchedule, config=config).delete(MaintenanceSchedule.objects.all())
+                self._report(result, 'maintenance schedules')
+            elif options['keep_schedules']:
                 self.stdout.write(
-                    self.style.SUCCESS(
-                        '\n✅ Successfully cleared all maintenance data!\n'
-                        'The system is now clean and ready for fresh data.'
-                    )
+                    self.style.WARNING('Keeping maintenance schedules as requested')
+                )
+            
+            # Raw deletes skip post_delete signals: refresh KPIs and dashboards once
+            from core.dashboard_cache import bump_dashboard_generation
+            from equipment.kpis import refresh_kpi_snapshots
+            refresh_kpi_snapshots()
+            bump_dashboard_generation()
+            
+            self.stdout.write(
+                self.style.SUCCESS(
+                    '\n✅ Successfully cleared all maintenance data!\n'
+                    'The system is now clean and ready for fresh data.'
                 )
-                
+            )
+            
         except Exception as e:
             raise CommandError(f'Error clearing maintenance data: {str(e)}')
+
+    def _report(self, result, label):
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Deleted {result['deleted']} {label} in {result['chunks']} chunks "
+                f"({result['seconds']}s, {result['rows_per_second']} rows/s)"
+            )
+        )
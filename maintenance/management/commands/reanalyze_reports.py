@@ -0,0 +1,125 @@
+"""
+Management command to re-analyze the content of all maintenance reports.
+Analysis runs in a multiprocessing pool and results are written back with bulk updates.
+"""
+
+import multiprocessing
+import time
+from collections import deque
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+
+from maintenance.models import MaintenanceReport
+from maintenance.report_analysis import analyze_report_batch
+
+
+def _iter_batches(queryset, batch_size):
+    """Yield lists of (id, content) pairs from the queryset."""
+    batch = []
+    for row in queryset.iterator(chunk_size=batch_size):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class Command(BaseCommand):
+    help = 'Re-analyze the content of all maintenance reports in parallel and update analyzed_data'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=multiprocessing.cpu_count(),
+            help='Number of worker processes (default: CPU count, 1 disables the pool)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of reports per worker batch and bulk update (default: 500)',
+        )
+        parser.add_argument(
+            '--unprocessed-only',
+            action='store_true',
+            help='Only analyze reports that have not been processed yet',
+        )
+
+    def handle(self, *args, **options):
+        processes = max(1, options['processes'])
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        queryset = MaintenanceReport.objects.exclude(content='').order_by('pk')
+        if options['unprocessed_only']:
+            queryset = queryset.filter(is_processed=False)
+        rows = queryset.values_list('id', 'content')
+
+        total = queryset.count()
+        if not total:
+            self.stdout.write(self.style.WARNING('No reports with content to analyze'))
+            return
+
+        self.stdout.write(f'Analyzing {total} reports with {processes} process(es)...')
+        started = time.perf_counter()
+        processed = failed = 0
+
+        if processes == 1:
+            results = map(analyze_report_batch, _iter_batches(rows, batch_size))
+            processed, failed = self._write_results(results)
+        else:
+            # Forked workers must not inherit open database connections
+            connections.close_all()
+            with multiprocessing.Pool(processes=processes) as pool:
+                results = self._dispatch(pool, _iter_batches(rows, batch_size), processes * 2)
+                processed, failed = self._write_results(results)
+
+        elapsed = time.perf_counter() - started
+        rate = processed / elapsed if elapsed else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Analyzed {processed} reports ({failed} failed) in {elapsed:.2f}s '
+                f'({rate:.0f} reports/s)'
+            )
+        )
+
+    def _dispatch(self, pool, batches, max_pending):
+        """
+        Submit batches to the pool and yield their results in order.
+
+        Reading from the database stays on the main thread (unlike Pool.imap,
+        which consumes its input from a helper thread), and at most
+        ``max_pending`` batches are held in memory at a time.
+        """
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.apply_async(analyze_report_batch, (batch,)))
+            if len(pending) >= max_pending:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+    def _write_results(self, results):
+        """Bulk update analyzed reports batch by batch as workers return them."""
+        processed = failed = 0
+        for batch in results:
+            reports = []
+            for report_id, analyzed_data, error in batch:
+                reports.append(MaintenanceReport(
+                    id=report_id,
+                    analyzed_data=analyzed_data,
+                    is_processed=not error,
+                    processing_errors=error,
+                ))
+                if error:
+                    failed += 1
+            with transaction.atomic():
+                MaintenanceReport.objects.bulk_update(
+                    reports, ['analyzed_data', 'is_processed', 'processing_errors']
+                )
+            processed += len(reports)
+        return processed, failed
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-19 04:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maintenance', '0012_add_deenergization_required'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='maintenancereport',
+            name='analyzed_data',
+            field=models.JSONField(blank=True, default=dict, help_text='Structured data extracted from the report (issues, parts, measurements, etc.)'),
+        ),
+        migrations.AddField(
+            model_name='maintenancereport',
+            name='content',
+            field=models.TextField(blank=True, help_text='Report content (extracted from document or manually entered)'),
+        ),
+        migrations.AddField(
+            model_name='maintenancereport',
+            name='is_processed',
+            field=models.BooleanField(default=False, help_text='Whether this report has been processed for analysis'),
+        ),
+        migrations.AddField(
+            model_name='maintenancereport',
+            name='processing_errors',
+            field=models.TextField(blank=True, help_text='Any errors encountered during processing'),
+        ),
+    ]
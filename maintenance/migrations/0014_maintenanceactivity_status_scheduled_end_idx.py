@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 04:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maintenance', '0013_maintenancereport_analysis_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='maintenanceactivity',
+            index=models.Index(fields=['status', 'scheduled_end'], name='maintenance_status_be781c_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maintenance', '0014_maintenanceactivity_status_scheduled_end_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='maintenanceactivity',
+            name='status_before_overdue',
+            field=models.CharField(blank=True, choices=[('scheduled', 'Scheduled'), ('pending', 'Pending'), ('in_progress', 'In Progress'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('overdue', 'Overdue')], default='', editable=False, help_text='Status restored when an overdue activity is rescheduled into the future', max_length=20),
+        ),
+    ]
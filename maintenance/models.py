@@ -181,6 +181,10 @@ class MaintenanceActivity(TimeStampedModel):
     
     # Status and priority
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='scheduled')
+    status_before_overdue = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, blank=True, default='', editable=False,
+        help_text="Status restored when an overdue activity is rescheduled into the future"
+    )
     priority = models.CharField(max_length=10, choices=PRIORITY_CHOICES, default='medium')
     
     # Scheduling - Fixed from original disconnected schedule table
@@ -252,6 +256,7 @@ class MaintenanceActivity(TimeStampedModel):
             models.Index(fields=['equipment', 'status']),
             models.Index(fields=['scheduled_start']),
             models.Index(fields=['status', 'priority']),
+            models.Index(fields=['status', 'scheduled_end']),
         ]
 
     def __str__(self):
@@ -329,6 +334,8 @@ class MaintenanceActivity(TimeStampedModel):
         # Update status based on dates
         now = timezone.now()
         if self.scheduled_end and self.scheduled_end < now and self.status not in ['completed', 'cancelled']:
+            if self.status != 'overdue':
+                self.status_before_overdue = self.status
             self.status = 'overdue'
 
     def save(self, *args, **kwargs):
@@ -348,6 +355,12 @@ class MaintenanceActivity(TimeStampedModel):
         if self.actual_end and timezone.is_naive(self.actual_end):
             self.actual_end = timezone.make_aware(self.actual_end)
         
+        # Rescheduled into the future: back to the status it had before going overdue
+        if self.status == 'overdue' and self.scheduled_end and self.scheduled_end >= timezone.now():
+            self.status = self.status_before_overdue or 'scheduled'
+        if self.status != 'overdue':
+            self.status_before_overdue = ''
+        
         super().save(*args, **kwargs)
 
     def get_duration(self):
@@ -778,7 +791,28 @@ class MaintenanceReport(TimeStampedModel):
         blank=True,
         help_text="Summary of findings from the report"
     )
-    
+
+    content = models.TextField(
+        blank=True,
+        help_text="Report content (extracted from document or manually entered)"
+    )
+
+    analyzed_data = models.JSONField(
+        blank=True,
+        default=dict,
+        help_text="Structured data extracted from the report (issues, parts, measurements, etc.)"
+    )
+
+    is_processed = models.BooleanField(
+        default=False,
+        help_text="Whether this report has been processed for analysis"
+    )
+
+    processing_errors = models.TextField(
+        blank=True,
+        help_text="Any errors encountered during processing"
+    )
+
     STATUS_CHOICES = [
         ('draft', 'Draft'),
         ('completed', 'Completed'),
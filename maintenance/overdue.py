@@ -0,0 +1,152 @@
+"""
+Set-based overdue transition for maintenance activities.
+
+Open activities whose scheduled end has passed are moved to
+``status='overdue'`` by a single ``UPDATE ... RETURNING`` statement, so views
+can filter on the indexed status column instead of repeating time-range
+predicates. Only the rows that actually changed come back from the update,
+and only those get a timeline entry, a dashboard cache bump for their site
+and an overdue notification. The status an activity had before it went
+overdue is kept in ``status_before_overdue``, so overdue activities whose
+scheduled end was moved back into the future return to it (or to
+'scheduled') in the same pass.
+"""
+
+import logging
+
+from django.db import connection, transaction
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Statuses that become overdue once scheduled_end has passed
+OPEN_STATUSES = ('scheduled', 'pending', 'in_progress')
+
+
+def _supports_update_returning():
+    # PostgreSQL and SQLite >= 3.35 accept RETURNING on UPDATE, the same
+    # backends Django lets return columns from INSERT
+    return connection.features.can_return_columns_from_insert
+
+
+def _update_returning(now):
+    """Flip open, past-due activities to overdue; returns the changed rows."""
+    from .models import MaintenanceActivity
+
+    meta = MaintenanceActivity._meta
+    quote = connection.ops.quote_name
+    columns = ', '.join(quote(meta.get_field(name).column) for name in ('id', 'equipment', 'assigned_to', 'title'))
+    placeholders = ', '.join(['%s'] * len(OPEN_STATUSES))
+    sql = (
+        f"UPDATE {quote(meta.db_table)} "
+        f"SET {quote('status_before_overdue')} = {quote('status')}, "
+        f"{quote('status')} = %s, {quote('updated_at')} = %s "
+        f"WHERE {quote('status')} IN ({placeholders}) AND {quote('scheduled_end')} < %s "
+        f"RETURNING {columns}"
+    )
+    adapted_now = connection.ops.adapt_datetimefield_value(now)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, ['overdue', adapted_now, *OPEN_STATUSES, adapted_now])
+        return cursor.fetchall()
+
+
+def _select_then_update(now):
+    """Fallback for backends without UPDATE ... RETURNING: lock, read, then update by id."""
+    from .models import MaintenanceActivity
+
+    due = MaintenanceActivity.objects.select_for_update().filter(
+        status__in=OPEN_STATUSES, scheduled_end__lt=now
+    )
+    rows = list(due.values_list('id', 'equipment_id', 'assigned_to_id', 'title'))
+    MaintenanceActivity.objects.filter(id__in=[row[0] for row in rows]).update(
+        status='overdue', status_before_overdue=F('status'), updated_at=now
+    )
+    return rows
+
+
+def _reset_rescheduled(now):
+    """Move overdue activities whose scheduled end is in the future back to their earlier status."""
+    from .models import MaintenanceActivity
+
+    rescheduled = MaintenanceActivity.objects.select_for_update().filter(status='overdue', scheduled_end__gte=now)
+    rows = [
+        (activity_id, equipment_id, title, previous or 'scheduled')
+        for activity_id, equipment_id, title, previous in rescheduled.values_list(
+            'id', 'equipment_id', 'title', 'status_before_overdue'
+        )
+    ]
+    MaintenanceActivity.objects.filter(id__in=[row[0] for row in rows]).update(
+        status=Case(
+            When(status_before_overdue='', then=Value('scheduled')),
+            default=F('status_before_overdue'),
+        ),
+        status_before_overdue='',
+        updated_at=now,
+    )
+    return rows
+
+
+def affected_site_ids(equipment_ids):
+    """Return the site id of each given equipment's location, however deeply it is nested."""
+    from core.utils import build_location_index
+    from equipment.models import Equipment
+
+    location_ids = set(
+        Equipment.objects.filter(id__in=equipment_ids, location__isnull=False).values_list('location_id', flat=True)
+    )
+    index = build_location_index(location_ids)
+    return {index[location_id][0] for location_id in location_ids if index.get(location_id, (None,))[0]}
+
+
+def transition_overdue_activities(now=None):
+    """
+    Mark newly overdue activities and record the change.
+
+    Returns a list of ``(id, equipment_id, assigned_to_id, title)`` tuples for
+    the activities that became overdue in this call; activities that were
+    already overdue are not returned again. Overdue activities rescheduled
+    into the future are reset to their earlier status but not returned.
+    """
+    from .models import MaintenanceActivity, MaintenanceTimelineEntry
+
+    status_labels = dict(MaintenanceActivity.STATUS_CHOICES)
+    now = now or timezone.now()
+    with transaction.atomic():
+        rows = _update_returning(now) if _supports_update_returning() else _select_then_update(now)
+        reset = _reset_rescheduled(now)
+        if not rows and not reset:
+            return []
+
+        MaintenanceTimelineEntry.objects.bulk_create([
+            MaintenanceTimelineEntry(
+                activity_id=activity_id,
+                entry_type='status_change',
+                title='Status Changed to Overdue',
+                description=f"Scheduled end passed before '{title}' was completed.",
+            )
+            for activity_id, equipment_id, assigned_to_id, title in rows
+        ] + [
+            MaintenanceTimelineEntry(
+                activity_id=activity_id,
+                entry_type='status_change',
+                title=f'Status Changed to {status_labels.get(status, status)}',
+                description=f"Scheduled end of '{title}' moved into the future.",
+            )
+            for activity_id, equipment_id, title, status in reset
+        ])
+
+        site_ids = affected_site_ids({row[1] for row in rows} | {row[1] for row in reset})
+        transaction.on_commit(lambda: _bump_dashboards(site_ids))
+
+    logger.info(
+        f"Marked {len(rows)} maintenance activities overdue and reset {len(reset)} rescheduled ones "
+        f"across {len(site_ids)} sites"
+    )
+    return rows
+
+
+def _bump_dashboards(site_ids):
+    from core.dashboard_cache import bump_dashboard_generation
+
+    bump_dashboard_generation(site_ids)
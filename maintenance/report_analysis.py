@@ -0,0 +1,174 @@
+"""
+Text analysis for maintenance reports.
+
+Extracts issues, parts replaced, measurements, dates and work hours from
+free-form report content. All regular expressions are compiled once at import
+time, and a single tokenizer pass over the content decides which extractors
+actually have something to find, so reports without e.g. numbers or part
+keywords never pay for those patterns.
+
+This module has no Django dependencies so it can be used from worker
+processes (see the ``reanalyze_reports`` management command).
+"""
+
+import re
+
+
+SEVERITY_KEYWORDS = (
+    ('critical', ('critical', 'severe', 'emergency')),
+    ('high', ('major', 'serious')),
+    ('low', ('minor', 'small')),
+)
+
+_ISSUES_SECTION_RE = re.compile(r'(issues found:|issues:)([\s\S]+?)(\n\s*\n|$)', re.IGNORECASE)
+
+# Each extractor pattern is keyed by the trigger token that must be present in
+# the lowercased content for the pattern to possibly match.
+_ISSUE_PATTERNS = (
+    ('issue', re.compile(r'issue[s]?\s*:?  *([^.\n]+)')),
+    ('problem', re.compile(r'problem[s]?\s*:?  *([^.\n]+)')),
+    ('fault', re.compile(r'fault[s]?\s*:?  *([^.\n]+)')),
+    ('error', re.compile(r'error[s]?\s*:?  *([^.\n]+)')),
+    ('failure', re.compile(r'failure[s]?\s*:?  *([^.\n]+)')),
+)
+
+_PARTS_PATTERNS = (
+    ('replaced', re.compile(r'replaced\s+([^.\n]+)')),
+    ('changed', re.compile(r'changed\s+([^.\n]+)')),
+    ('installed', re.compile(r'installed\s+new\s+([^.\n]+)')),
+    ('part', re.compile(r'part[s]?\s*:?\s*([^.\n]+)')),
+)
+
+_MEASUREMENT_PATTERNS = (
+    re.compile(r'(\d+(?:\.\d+)?)\s*(?:psi|bar|pa|kpa|mpa|°c|°f|volts?|v|amps?|a|watts?|w|rpm|hz|khz|mhz)'),
+    re.compile(r'temperature\s*:?\s*(\d+(?:\.\d+)?)\s*(?:°c|°f)'),
+    re.compile(r'pressure\s*:?\s*(\d+(?:\.\d+)?)\s*(?:psi|bar|pa|kpa|mpa)'),
+)
+
+_DATE_PATTERNS = (
+    re.compile(r'\d{1,2}/\d{1,2}/\d{2,4}'),
+    re.compile(r'\d{4}-\d{2}-\d{2}'),
+    re.compile(r'\d{1,2}-\d{1,2}-\d{2,4}'),
+)
+
+_HOURS_PATTERNS = (
+    re.compile(r'(\d+(?:\.\d+)?)\s*hours?'),
+    re.compile(r'(\d+(?:\.\d+)?)\s*hrs?'),
+    re.compile(r'worked\s+(\d+(?:\.\d+)?)\s*hours?'),
+)
+
+_TRIGGER_WORDS_RE = re.compile(r'issue|problem|fault|error|failure|replaced|changed|installed|part')
+_DIGIT_RE = re.compile(r'\d')
+
+
+def classify_severity(text):
+    """Return the severity bucket for a piece of (lowercased) issue text."""
+    for severity, keywords in SEVERITY_KEYWORDS:
+        if any(word in text for word in keywords):
+            return severity
+    return 'medium'
+
+
+def scan_triggers(content_lower):
+    """
+    Tokenize the content once and return the set of extractor triggers present.
+
+    Keyword triggers come from a single scan with one alternation pattern;
+    ``'digit'`` is added when the content contains any number at all, which
+    gates the measurement, date and work-hour extractors.
+    """
+    found = set(_TRIGGER_WORDS_RE.findall(content_lower))
+    if _DIGIT_RE.search(content_lower):
+        found.add('digit')
+    return found
+
+
+def analyze_report_content(content):
+    """Analyze report content to extract structured data."""
+    analyzed_data = {
+        'issues': [],
+        'parts_replaced': [],
+        'measurements': [],
+        'dates': [],
+        'technicians': [],
+        'work_hours': None,
+    }
+    content_lower = content.lower()
+    triggers = scan_triggers(content_lower)
+
+    # Issues listed under an 'Issues found:' / 'Issues:' section header
+    issues_section = _ISSUES_SECTION_RE.search(content)
+    if issues_section:
+        for line in issues_section.group(2).splitlines():
+            line = line.strip('-•* ').strip()
+            if not line:
+                continue
+            analyzed_data['issues'].append({
+                'text': line,
+                'severity': classify_severity(line.lower()),
+                'position': content.find(line)
+            })
+
+    for trigger, pattern in _ISSUE_PATTERNS:
+        if trigger not in triggers:
+            continue
+        for match in pattern.finditer(content_lower):
+            issue_text = match.group(1).strip()
+            analyzed_data['issues'].append({
+                'text': issue_text,
+                'severity': classify_severity(issue_text),
+                'position': match.start()
+            })
+
+    for trigger, pattern in _PARTS_PATTERNS:
+        if trigger not in triggers:
+            continue
+        for match in pattern.finditer(content_lower):
+            analyzed_data['parts_replaced'].append({
+                'part': match.group(1).strip(),
+                'position': match.start()
+            })
+
+    if 'digit' not in triggers:
+        return analyzed_data
+
+    for pattern in _MEASUREMENT_PATTERNS:
+        for match in pattern.finditer(content_lower):
+            value = match.group(1)
+            analyzed_data['measurements'].append({
+                'value': float(value),
+                'unit': match.group(0).replace(value, '').strip(),
+                'position': match.start()
+            })
+
+    for pattern in _DATE_PATTERNS:
+        for match in pattern.finditer(content):
+            analyzed_data['dates'].append({
+                'date': match.group(0),
+                'position': match.start()
+            })
+
+    for pattern in _HOURS_PATTERNS:
+        match = pattern.search(content_lower)
+        if match:
+            analyzed_data['work_hours'] = float(match.group(1))
+            break
+
+    return analyzed_data
+
+
+def analyze_report_batch(batch):
+    """
+    Analyze a batch of ``(report_id, content)`` pairs.
+
+    Returns a list of ``(report_id, analyzed_data, error)`` tuples where
+    ``error`` is an empty string on success. Designed to be mapped over a
+    multiprocessing pool, so it must stay a module-level function.
+    """
+    results = []
+    for report_id, content in batch:
+        try:
+            results.append((report_id, analyze_report_content(content or ''), ''))
+        except Exception as e:
+            results.append((report_id, {}, str(e)))
+    return results
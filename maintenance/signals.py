@@ -415,3 +415,14 @@ def create_maintenance_schedules_for_equipment(sender, instance, created, **kwar
                 
         except Exception as e:
             logger.error(f"Error creating maintenance schedules for equipment {instance.id}: {str(e)}")
+
+
+@receiver(post_save, sender=MaintenanceActivity)
+@receiver(post_delete, sender=MaintenanceActivity)
+def refresh_equipment_kpi_snapshot(sender, instance, **kwargs):
+    """Refresh the equipment KPI snapshot once activity changes (e.g. completion) are committed."""
+    try:
+        from equipment.kpis import schedule_kpi_refresh
+        schedule_kpi_refresh(instance.equipment_id)
+    except Exception as e:
+        logger.error(f"Error scheduling KPI refresh for maintenance activity {instance.id}: {str(e)}")
@@ -4,8 +4,6 @@ Celery tasks for maintenance app.
 
 from celery import shared_task
 from django.utils import timezone
-from django.core.mail import send_mail
-from django.conf import settings
 import logging
 
 logger = logging.getLogger(__name__)
@@ -37,8 +35,9 @@ def generate_scheduled_maintenance():
 
 @shared_task
 def send_maintenance_reminders():
-    """Send reminders for upcoming maintenance activities."""
+    """Send one reminder digest per technician for tomorrow's maintenance activities."""
     from .models import MaintenanceActivity
+    from core.services.notification_service import ReminderDigestService
     from datetime import timedelta
     
     tomorrow = timezone.now().date() + timedelta(days=1)
@@ -46,45 +45,71 @@ def send_maintenance_reminders():
         scheduled_start__date=tomorrow,
         status='scheduled',
         assigned_to__isnull=False
-    ).select_related('assigned_to', 'equipment')
+    ).exclude(assigned_to__email='').order_by('assigned_to_id', 'scheduled_start').values_list(
+        'assigned_to__email', 'title', 'equipment__name', 'scheduled_start'
+    )
     
-    reminders_sent = 0
-    for activity in upcoming_activities:
-        try:
-            if activity.assigned_to.email:
-                send_mail(
-                    subject=f"Maintenance Reminder: {activity.title}",
-                    message=f"You have a maintenance activity scheduled for tomorrow:\n\n"
-                           f"Title: {activity.title}\n"
-                           f"Equipment: {activity.equipment.name}\n"
-                           f"Scheduled: {activity.scheduled_start}\n",
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[activity.assigned_to.email],
-                    fail_silently=False,
-                )
-                reminders_sent += 1
-                logger.info(f"Sent reminder to {activity.assigned_to.email} for {activity.title}")
-        except Exception as e:
-            logger.error(f"Error sending reminder for activity {activity.id}: {str(e)}")
+    reminders = [
+        (email, title, [f"Title: {title}", f"Equipment: {equipment_name}", f"Scheduled: {scheduled_start}"])
+        for email, title, equipment_name, scheduled_start in upcoming_activities
+    ]
+    result = ReminderDigestService().send_reminders(
+        reminders,
+        subject_prefix="Maintenance Reminder",
+        intro="You have a maintenance activity scheduled for tomorrow:",
+        digest_intro="You have {count} maintenance activities scheduled for tomorrow:",
+    )
     
-    logger.info(f"Sent {reminders_sent} maintenance reminders")
-    return reminders_sent
+    logger.info(
+        f"Sent {result['reminders_sent']} maintenance reminders in {len(result['delivered'])} digests "
+        f"over {result['connections']} connections ({len(result['failed'])} digests failed)"
+    )
+    return result['reminders_sent']
 
 
 @shared_task
 def check_overdue_maintenance():
-    """Check for overdue maintenance and create alerts."""
+    """Mark newly overdue maintenance activities and notify their assignees."""
+    from .overdue import transition_overdue_activities
+    
+    changed = transition_overdue_activities()
+    
+    if changed:
+        logger.warning(f"{len(changed)} maintenance activities became overdue")
+        activity_ids = [activity_id for activity_id, equipment_id, assigned_to_id, title in changed if assigned_to_id]
+        if activity_ids:
+            try:
+                notify_overdue_activities.delay(activity_ids)
+            except Exception as e:
+                logger.error(f"Could not enqueue overdue notifications: {str(e)}")
+    
+    return len(changed)
+
+
+@shared_task
+def notify_overdue_activities(activity_ids):
+    """Send one overdue digest per assignee for the given activities."""
     from .models import MaintenanceActivity
+    from core.services.notification_service import ReminderDigestService
     
     overdue_activities = MaintenanceActivity.objects.filter(
-        scheduled_end__lt=timezone.now(),
-        status__in=['scheduled', 'pending', 'in_progress']
-    ).select_related('equipment', 'assigned_to')
-    
-    overdue_count = overdue_activities.count()
+        id__in=activity_ids,
+        status='overdue',
+        assigned_to__isnull=False
+    ).exclude(assigned_to__email='').order_by('assigned_to_id', 'scheduled_end').values_list(
+        'assigned_to__email', 'title', 'equipment__name', 'scheduled_end'
+    )
     
-    if overdue_count > 0:
-        logger.warning(f"Found {overdue_count} overdue maintenance activities")
-        # Here you could send notifications to supervisors, create alerts, etc.
+    reminders = [
+        (email, title, [f"Title: {title}", f"Equipment: {equipment_name}", f"Was due: {scheduled_end}"])
+        for email, title, equipment_name, scheduled_end in overdue_activities
+    ]
+    result = ReminderDigestService().send_reminders(
+        reminders,
+        subject_prefix="Overdue Maintenance",
+        intro="A maintenance activity assigned to you is now overdue:",
+        digest_intro="{count} maintenance activities assigned to you are now overdue:",
+    )
     
-    return overdue_count
\ No newline at end of file
+    logger.info(f"Sent {result['reminders_sent']} overdue notifications in {len(result['delivered'])} digests")
+    return result['reminders_sent']
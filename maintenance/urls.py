@@ -3,7 +3,9 @@ URL configuration for maintenance app.
 """
 
 from django.urls import path
-from . import views
+from core.utils import LazyViews
+
+views = LazyViews('maintenance.views')
 
 app_name = 'maintenance'
 
@@ -44,6 +44,8 @@ from .models import (
 from .forms import (
     EquipmentCategoryScheduleForm, GlobalScheduleForm, ScheduleOverrideForm
 )
+from .report_analysis import analyze_report_content
+from .analytics import monthly_series
 
 from django.contrib.auth.models import User
 from core.models import Location
@@ -106,7 +108,7 @@ def get_all_descendant_location_ids(site, include_inactive=False):
         for (location_id,) in results:
             location_ids.add(location_id)
     
-    logger.info(f"get_all_descendant_location_ids: Site {site.name} (ID: {site.id}) has {len(location_ids)} total location IDs: {sorted(location_ids)}")
+    logger.debug(f"get_all_descendant_location_ids: Site {site.name} (ID: {site.id}) has {len(location_ids)} total location IDs")
     return location_ids
 
 
@@ -169,8 +171,7 @@ def maintenance_list(request):
         
         # Get overdue maintenance
         overdue_activities = base_queryset.filter(
-            scheduled_end__lt=timezone.now(),
-            status__in=['scheduled', 'pending']
+            status='overdue'
         ).order_by('scheduled_start')[:10]
         
         # Get in progress
@@ -251,8 +252,7 @@ def maintenance_list(request):
             ).order_by('scheduled_start')[:10]
             
             overdue_activities = base_queryset.filter(
-                scheduled_end__lt=timezone.now(),
-                status__in=['scheduled', 'pending']
+                status='overdue'
             ).order_by('scheduled_start')[:10]
             
             in_progress = base_queryset.filter(
@@ -1852,21 +1852,8 @@ def maintenance_reports(request):
         month_key = item['month'].strftime('%Y-%m')
         monthly_trends[month_key] = item['count']
     
-    # Create labels and data for trends chart
-    trends_labels = []
-    trends_data = []
-    
-    # Generate all months in range
-    current_date = start_date.replace(day=1)
-    while current_date <= end_date:
-        month_key = current_date.strftime('%Y-%m')
-        trends_labels.append(current_date.strftime('%b %Y'))
-        trends_data.append(monthly_trends.get(month_key, 0))
-        # Move to next month
-        if current_date.month == 12:
-            current_date = current_date.replace(year=current_date.year + 1, month=1)
-        else:
-            current_date = current_date.replace(month=current_date.month + 1)
+    # Create labels and data for trends chart, one slot per month in range
+    trends_labels, trends_data = monthly_series(monthly_trends, start_date, end_date)
     
     trends_json = json.dumps({
         'labels': trends_labels,
@@ -1920,8 +1907,7 @@ def maintenance_reports(request):
 def overdue_maintenance(request):
     """List overdue maintenance activities."""
     overdue_activities = MaintenanceActivity.objects.filter(
-        scheduled_end__lt=timezone.now(),
-        status__in=['scheduled', 'pending', 'in_progress']
+        status='overdue'
     ).select_related('equipment', 'activity_type', 'assigned_to').order_by('scheduled_end')
     
     context = {'overdue_activities': overdue_activities}
@@ -1945,7 +1931,7 @@ def delete_activity(request, activity_id):
         
         # Invalidate dashboard cache for current user only (signal invalidates all, but this is more targeted)
         try:
-            from core.views import invalidate_dashboard_cache
+            from core.dashboard_cache import invalidate_dashboard_cache
             invalidate_dashboard_cache(user_id=request.user.id)
         except Exception as cache_error:
             logger.warning(f"Could not invalidate dashboard cache: {cache_error}")
@@ -2801,132 +2787,6 @@ def analyze_report(request, report_id):
         return JsonResponse({'error': 'Failed to analyze report'}, status=500)
 
 
-def analyze_report_content(content):
-    """Analyze report content to extract structured data."""
-    analyzed_data = {
-        'issues': [],
-        'parts_replaced': [],
-        'measurements': [],
-        'dates': [],
-        'technicians': [],
-        'work_hours': None,
-    }
-    import re
-    # Convert to lowercase for case-insensitive matching
-    content_lower = content.lower()
-
-    # --- Enhanced: Extract issues from 'Issues found:' sections and bullet points ---
-    # Find 'issues found:' or 'issues:' section
-    issues_section = re.search(r'(issues found:|issues:)([\s\S]+?)(\n\s*\n|$)', content, re.IGNORECASE)
-    if issues_section:
-        issues_block = issues_section.group(2)
-        # Extract bullet points or lines
-        for line in issues_block.splitlines():
-            line = line.strip('-•* ').strip()
-            if not line:
-                continue
-            # Only consider lines that are not empty and not a section header
-            severity = 'medium'  # Default severity
-            lcline = line.lower()
-            if any(word in lcline for word in ['critical', 'severe', 'emergency']):
-                severity = 'critical'
-            elif any(word in lcline for word in ['major', 'serious']):
-                severity = 'high'
-            elif any(word in lcline for word in ['minor', 'small']):
-                severity = 'low'
-            analyzed_data['issues'].append({
-                'text': line,
-                'severity': severity,
-                'position': content.find(line)
-            })
-
-    # --- Existing: Extract issues (basic pattern matching) ---
-    issue_patterns = [
-        r'issue[s]?\s*:?  *([^.\n]+)',
-        r'problem[s]?\s*:?  *([^.\n]+)',
-        r'fault[s]?\s*:?  *([^.\n]+)',
-        r'error[s]?\s*:?  *([^.\n]+)',
-        r'failure[s]?\s*:?  *([^.\n]+)',
-    ]
-    for pattern in issue_patterns:
-        matches = re.finditer(pattern, content_lower)
-        for match in matches:
-            issue_text = match.group(1).strip()
-            severity = 'medium'  # Default severity
-            if any(word in issue_text for word in ['critical', 'severe', 'emergency']):
-                severity = 'critical'
-            elif any(word in issue_text for word in ['major', 'serious']):
-                severity = 'high'
-            elif any(word in issue_text for word in ['minor', 'small']):
-                severity = 'low'
-            analyzed_data['issues'].append({
-                'text': issue_text,
-                'severity': severity,
-                'position': match.start()
-            })
-
-    # --- Existing: Extract parts replaced ---
-    parts_patterns = [
-        r'replaced\s+([^.\n]+)',
-        r'changed\s+([^.\n]+)',
-        r'installed\s+new\s+([^.\n]+)',
-        r'part[s]?\s*:?\s*([^.\n]+)',
-    ]
-    for pattern in parts_patterns:
-        matches = re.finditer(pattern, content_lower)
-        for match in matches:
-            part_text = match.group(1).strip()
-            analyzed_data['parts_replaced'].append({
-                'part': part_text,
-                'position': match.start()
-            })
-
-    # --- Existing: Extract measurements ---
-    measurement_patterns = [
-        r'(\d+(?:\.\d+)?)\s*(?:psi|bar|pa|kpa|mpa|°c|°f|volts?|v|amps?|a|watts?|w|rpm|hz|khz|mhz)',
-        r'temperature\s*:?\s*(\d+(?:\.\d+)?)\s*(?:°c|°f)',
-        r'pressure\s*:?\s*(\d+(?:\.\d+)?)\s*(?:psi|bar|pa|kpa|mpa)',
-    ]
-    for pattern in measurement_patterns:
-        matches = re.finditer(pattern, content_lower)
-        for match in matches:
-            value = match.group(1)
-            unit = match.group(0).replace(value, '').strip()
-            analyzed_data['measurements'].append({
-                'value': float(value),
-                'unit': unit,
-                'position': match.start()
-            })
-
-    # --- Existing: Extract dates ---
-    date_patterns = [
-        r'\d{1,2}/\d{1,2}/\d{2,4}',
-        r'\d{4}-\d{2}-\d{2}',
-        r'\d{1,2}-\d{1,2}-\d{2,4}',
-    ]
-    for pattern in date_patterns:
-        matches = re.finditer(pattern, content)
-        for match in matches:
-            analyzed_data['dates'].append({
-                'date': match.group(0),
-                'position': match.start()
-            })
-
-    # --- Existing: Extract work hours ---
-    hours_patterns = [
-        r'(\d+(?:\.\d+)?)\s*hours?',
-        r'(\d+(?:\.\d+)?)\s*hrs?',
-        r'worked\s+(\d+(?:\.\d+)?)\s*hours?',
-    ]
-    for pattern in hours_patterns:
-        match = re.search(pattern, content_lower)
-        if match:
-            analyzed_data['work_hours'] = float(match.group(1))
-            break
-
-    return analyzed_data
-
-
 @login_required
 @require_http_methods(["GET"])
 def get_reports_for_equipment(request, equipment_id):
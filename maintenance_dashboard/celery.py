@@ -4,8 +4,11 @@ Celery configuration for maintenance_dashboard project.
 
 import os
 import logging
-from celery import Celery
+from celery import Celery, Task
 from django.conf import settings
+from kombu.exceptions import OperationalError
+
+from core.cache_backends import CircuitBreaker
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'maintenance_dashboard.settings')
@@ -15,7 +18,38 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'maintenance_dashboard.settings'
 # when running worker + beat in the same process
 os.environ.setdefault('DJANGO_DB_CONN_MAX_AGE', '0')
 
-app = Celery('maintenance_dashboard')
+# Opened by a publish that fails; further publishes then fail fast with
+# OperationalError until the breaker lets another one through
+broker_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0)
+
+
+class BrokerCircuitTask(Task):
+    """
+    Fail fast while the broker is unreachable instead of probing it at import.
+
+    Publish errors reach the caller, which decides whether to run the work
+    itself, retry later or report the failure. Tasks only run in-process
+    under the explicit ``task_always_eager`` setting (development).
+    """
+
+    def apply_async(self, args=None, kwargs=None, **options):
+        if self.app.conf.task_always_eager:
+            return super().apply_async(args, kwargs, **options)
+        if not broker_breaker.allow():
+            raise OperationalError(f"Celery broker unreachable: {broker_breaker.last_error}")
+        try:
+            result = super().apply_async(args, kwargs, **options)
+        except OperationalError as e:
+            if broker_breaker.record_failure(e):
+                logging.warning(
+                    f"Celery broker unreachable: {e}. Failing publishes for {broker_breaker.reset_timeout:.0f}s."
+                )
+            raise
+        broker_breaker.record_success()
+        return result
+
+
+app = Celery('maintenance_dashboard', task_cls=BrokerCircuitTask)
 
 # Using a string here means the worker doesn't have to serialize
 # the configuration object to child processes.
@@ -26,10 +60,12 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 app.conf.worker_disable_rate_limits = False
 app.conf.worker_send_task_events = True
 app.conf.task_send_sent_event = True
-# Disable superuser privileges - workers should not run as root
-import os
-if os.geteuid() == 0:
-    logging.warning("Celery worker is running as root. This is not recommended for security.")
+
+def drop_root_privileges():
+    """Switch to appuser when started as root; called when a worker, beat or the web server starts."""
+    if os.geteuid() != 0:
+        return
+    logging.warning("Running as root. This is not recommended for security.")
     # Try to switch to non-root user if available
     try:
         import pwd
@@ -61,23 +97,8 @@ def configure_celery_broker():
             task_eager_propagates=True,
         )
         logging.info("Celery configured with memory/RPC broker for development")
-    else:
-        # Try to configure Redis broker
-        try:
-            import redis
-            # Test Redis connection
-            redis_url = broker_url.replace('/0', '')  # Remove database number for connection test
-            r = redis.Redis.from_url(redis_url, socket_connect_timeout=2, socket_timeout=2)
-            r.ping()
-            logging.info("Redis connection successful, using Redis broker")
-        except Exception as e:
-            logging.warning(f"Redis connection failed: {e}. Falling back to memory broker.")
-            app.conf.update(
-                broker_url='memory://',
-                result_backend='rpc://',
-                task_always_eager=True,
-                task_eager_propagates=True,
-            )
+    # A Redis broker is not contacted here: BrokerCircuitTask fails publishes
+    # fast once it is found unreachable
 
 # Configure broker on startup
 configure_celery_broker()
@@ -95,7 +116,12 @@ except (AttributeError, ImportError):
 
 # Close database connections after each task to prevent connection issues
 # This is especially important when running worker + beat in the same process
-from celery.signals import task_postrun, beat_init, worker_process_init
+from celery.signals import task_postrun, beat_init, worker_init, worker_process_init
+
+@worker_init.connect
+def init_worker(sender=None, **kwargs):
+    """Drop root privileges before the worker starts consuming."""
+    drop_root_privileges()
 
 @worker_process_init.connect
 def init_worker_process(sender=None, **kwargs):
@@ -128,6 +154,7 @@ def close_db_after_task(sender=None, **kwargs):
 def init_beat_scheduler(sender=None, **kwargs):
     """Ensure database connections are ready when beat scheduler starts."""
     import time
+    drop_root_privileges()
     import django
     from django.db import connections, connection
     from django.db.utils import OperationalError
@@ -216,13 +216,16 @@ LOGGING = {
             'format': '{levelname} {asctime} {name} {funcName}:{lineno} {message}',
             'style': '{',
         },
+        'json': {
+            '()': 'core.log_pipeline.JsonFormatter',
+        },
     },
     'handlers': {
         'file': {
             'level': 'INFO',
             'class': 'logging.handlers.RotatingFileHandler',
             'filename': BASE_DIR / 'debug.log',
-            'formatter': 'detailed',
+            'formatter': 'json',
             'maxBytes': 10485760,  # 10MB
             'backupCount': 5,
         },
@@ -235,7 +238,7 @@ LOGGING = {
             'level': 'ERROR',
             'class': 'logging.handlers.RotatingFileHandler',
             'filename': BASE_DIR / 'error.log',
-            'formatter': 'detailed',
+            'formatter': 'json',
             'maxBytes': 10485760,  # 10MB
             'backupCount': 5,
         },
@@ -243,7 +246,7 @@ LOGGING = {
             'level': 'WARNING',
             'class': 'logging.handlers.RotatingFileHandler',
             'filename': BASE_DIR / 'security.log',
-            'formatter': 'detailed',
+            'formatter': 'json',
             'maxBytes': 10485760,  # 10MB
             'backupCount': 5,
         },
@@ -319,14 +322,30 @@ FALLBACK_LOGGING = {
     },
 }
 
+# Handlers run on a background thread behind a bounded queue (core.log_pipeline):
+# logging calls only enqueue, full queues drop and count instead of blocking, and
+# bursts of DEBUG/INFO records from one call site are sampled.
+LOG_PIPELINE_CONFIG = {
+    'enabled': config('LOG_PIPELINE_ENABLED', default=True, cast=bool),
+    'queue_size': config('LOG_PIPELINE_QUEUE_SIZE', default=10000, cast=int),
+    'sample_burst': config('LOG_PIPELINE_SAMPLE_BURST', default=50, cast=int),
+    'sample_window': config('LOG_PIPELINE_SAMPLE_WINDOW', default=1.0, cast=float),
+    'sample_rate': config('LOG_PIPELINE_SAMPLE_RATE', default=100, cast=int),
+}
+# Django re-applies LOGGING during setup; keep the queue in place when it does
+LOGGING_CONFIG = 'core.log_pipeline.dict_config'
+
 # Try to configure logging, fall back to simple configuration if it fails
 try:
-    import logging.config
-    logging.config.dictConfig(LOGGING)
+    from core.log_pipeline import configure_logging
+    configure_logging(LOGGING, LOG_PIPELINE_CONFIG)
 except Exception as e:
     print(f"Warning: Failed to configure advanced logging: {e}")
     print("Falling back to simple console logging...")
+    # Stop Django from applying the failing configuration again during setup
+    LOGGING_CONFIG = None
     try:
+        import logging.config
         logging.config.dictConfig(FALLBACK_LOGGING)
     except Exception as fallback_error:
         print(f"Warning: Failed to configure fallback logging: {fallback_error}")
@@ -381,6 +400,10 @@ CELERY_ACCEPT_CONTENT = ['application/json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+# Fail fast when the broker is down; publishes then raise OperationalError
+# for the caller to handle (see BrokerCircuitTask in maintenance_dashboard/celery.py)
+CELERY_BROKER_CONNECTION_TIMEOUT = 2
+CELERY_TASK_PUBLISH_RETRY_POLICY = {'max_retries': 2, 'interval_start': 0, 'interval_step': 0.2, 'interval_max': 0.5}
 CELERY_BEAT_SCHEDULE = {
     'generate-scheduled-maintenance': {
         'task': 'maintenance.tasks.generate_scheduled_maintenance',
@@ -392,7 +415,7 @@ CELERY_BEAT_SCHEDULE = {
     },
     'check-overdue-maintenance': {
         'task': 'maintenance.tasks.check_overdue_maintenance',
-        'schedule': 14400.0,  # Every 4 hours (reduced from 2 hours)
+        'schedule': 900.0,  # Every 15 minutes - a single set-based UPDATE
     },
     'send-event-reminders': {
         'task': 'events.tasks.send_event_reminders',
@@ -406,6 +429,19 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'events.tasks.cleanup_old_events',
         'schedule': 604800.0,  # Weekly
     },
+    'refresh-fleet-kpis': {
+        'task': 'equipment.tasks.refresh_fleet_kpis',
+        'schedule': 86400.0,  # Nightly
+    },
+    'prune-log-store': {
+        'task': 'core.tasks.prune_log_store',
+        'schedule': 86400.0,  # Daily - drops whole day partitions
+    },
+    'refresh-health-snapshot': {
+        'task': 'core.tasks.refresh_health_snapshot',
+        'schedule': 30.0,  # Health endpoints serve this snapshot
+        'options': {'expires': 25.0},
+    },
 }
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 
@@ -413,31 +449,37 @@ CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 # Use Redis if available, fall back to database for development
 USE_REDIS = config('USE_REDIS', default=True, cast=bool)
 
-# Test Redis connectivity and fall back gracefully
 def get_cache_config():
     """Get cache configuration with Redis fallback."""
     if USE_REDIS and not DEBUG:
-        # Try Redis for production
-        try:
-            import redis
-            r = redis.Redis.from_url(REDIS_URL, socket_connect_timeout=2, socket_timeout=2)
-            r.ping()  # Test connection
-            return {
-                'default': {
-                    'BACKEND': 'django_redis.cache.RedisCache',
-                    'LOCATION': f'{REDIS_URL}/1',
-                    'OPTIONS': {
+        # Nothing connects here: ResilientCache reaches Redis on first use and
+        # serves from the database cache while Redis is unreachable
+        return {
+            'default': {
+                'BACKEND': 'core.cache_backends.ResilientCache',
+                'LOCATION': f'{REDIS_URL}/1',
+                'OPTIONS': {
+                    'PRIMARY_BACKEND': 'django_redis.cache.RedisCache',
+                    'PRIMARY_OPTIONS': {
                         'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+                        'SOCKET_CONNECT_TIMEOUT': config('REDIS_CACHE_CONNECT_TIMEOUT', default=0.5, cast=float),
+                        'SOCKET_TIMEOUT': config('REDIS_CACHE_TIMEOUT', default=1.0, cast=float),
                     },
-                    'KEY_PREFIX': 'maintenance_dashboard',
-                    'TIMEOUT': 300,  # 5 minutes default timeout
-                }
-            }, 'django.contrib.sessions.backends.cache'
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Redis connection failed: {e}. Falling back to database cache.")
-    
+                    'FALLBACK': 'database',
+                    'FAILURE_THRESHOLD': 3,
+                    'RESET_TIMEOUT': config('REDIS_CACHE_RETRY_AFTER', default=30, cast=float),
+                },
+                'KEY_PREFIX': 'maintenance_dashboard',
+                'TIMEOUT': 300,  # 5 minutes default timeout
+            },
+            'database': {
+                'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+                'LOCATION': 'cache_table',
+                'KEY_PREFIX': 'maintenance_dashboard',
+                'TIMEOUT': 300,
+            },
+        }, 'django.contrib.sessions.backends.cached_db'
+
     # Use database cache as fallback
     try:
         from django.core.cache.backends.db import DatabaseCache
@@ -470,6 +512,19 @@ EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='noreply@maintenance-dashboard.com')
 
+# Reminder digests: one message per recipient, sent over one connection per chunk
+REMINDER_DIGEST_CONFIG = {
+    'chunk_size': config('REMINDER_DIGEST_CHUNK_SIZE', default=500, cast=int),
+    'max_retries': config('REMINDER_DIGEST_MAX_RETRIES', default=2, cast=int),
+    'retry_delay': config('REMINDER_DIGEST_RETRY_DELAY', default=5, cast=int),
+}
+
+# Bulk deletes: rows removed per transaction, and an optional pause between chunks
+BULK_DELETE_CONFIG = {
+    'chunk_size': config('BULK_DELETE_CHUNK_SIZE', default=1000, cast=int),
+    'pause': config('BULK_DELETE_PAUSE', default=0.0, cast=float),
+}
+
 # System Monitoring Configuration
 MONITORING_ENABLED = config('MONITORING_ENABLED', default=True, cast=bool)
 MONITORING_SLOW_REQUEST_THRESHOLD = config('MONITORING_SLOW_REQUEST_THRESHOLD', default=5.0, cast=float)
@@ -486,4 +541,64 @@ DOCKER_LOGS_CONFIG = {
     'rate_limit': config('DOCKER_LOGS_RATE_LIMIT', default=10, cast=int),
     'timeout': config('DOCKER_LOGS_TIMEOUT', default=30, cast=int),
     'require_superuser': config('DOCKER_LOGS_REQUIRE_SUPERUSER', default=True, cast=bool),
+}
+
+# Shared log follower behind the live log stream (one reader per process).
+# Streams end before the gunicorn timeout and the browser reconnects.
+# Each stream holds a gthread worker thread (GUNICORN_THREADS per process),
+# so max_streams must stay below the thread count; extra viewers get a 503
+# and fall back to polling.
+LOG_FOLLOWER_CONFIG = {
+    'poll_interval': config('LOG_FOLLOWER_POLL_INTERVAL', default=1.0, cast=float),
+    'queue_size': config('LOG_FOLLOWER_QUEUE_SIZE', default=1000, cast=int),
+    'stream_seconds': config('LOG_FOLLOWER_STREAM_SECONDS', default=55, cast=int),
+    'heartbeat_seconds': config('LOG_FOLLOWER_HEARTBEAT_SECONDS', default=15, cast=int),
+    'max_streams': config('LOG_FOLLOWER_MAX_STREAMS', default=2, cast=int),
+}
+
+# Docker log collection (core.tasks.collect_docker_logs) through the Engine API socket
+DOCKER_LOG_COLLECTOR_CONFIG = {
+    'socket_path': config('DOCKER_SOCKET_PATH', default='/var/run/docker.sock'),
+    'logs_dir': config('DOCKER_LOG_COLLECTOR_DIR', default='/app/logs'),
+    'workers': config('DOCKER_LOG_COLLECTOR_WORKERS', default=8, cast=int),
+    'timeout': config('DOCKER_LOG_COLLECTOR_TIMEOUT', default=15, cast=int),
+    'initial_tail': config('DOCKER_LOG_COLLECTOR_INITIAL_TAIL', default=1000, cast=int),
+    'max_bytes': config('DOCKER_LOG_COLLECTOR_MAX_BYTES', default=10 * 1024 * 1024, cast=int),
+    'backups': config('DOCKER_LOG_COLLECTOR_BACKUPS', default=3, cast=int),
+}
+
+# Searchable log store: SQLite FTS5, one database file per UTC day
+LOG_STORE_CONFIG = {
+    'enabled': config('LOG_STORE_ENABLED', default=True, cast=bool),
+    'directory': config('LOG_STORE_DIR', default='/app/logs/store'),
+    'retention_days': config('LOG_STORE_RETENTION_DAYS', default=14, cast=int),
+    'max_page_size': config('LOG_STORE_MAX_PAGE_SIZE', default=500, cast=int),
+    'busy_timeout': config('LOG_STORE_BUSY_TIMEOUT', default=30, cast=int),
+}
+
+# Health probes (core.services.health_probe_service), refreshed by Celery beat
+HEALTH_PROBE_CONFIG = {
+    'snapshot_path': config('HEALTH_SNAPSHOT_PATH', default='/app/logs/health_snapshot.json'),
+    'stale_after': config('HEALTH_SNAPSHOT_STALE_AFTER', default=120, cast=int),
+    'timeout': config('HEALTH_PROBE_TIMEOUT', default=5.0, cast=float),
+    'max_workers': config('HEALTH_PROBE_WORKERS', default=16, cast=int),
+    'background_refresh': config('HEALTH_BACKGROUND_REFRESH', default=True, cast=bool),
+}
+
+# Database statistics pages (core.services.database_stats_service)
+DATABASE_STATS_CONFIG = {
+    'cache_ttl': config('DATABASE_STATS_CACHE_TTL', default=60, cast=int),
+    'exact_ttl': config('DATABASE_STATS_EXACT_TTL', default=3600, cast=int),
+    'recent_days': config('DATABASE_STATS_RECENT_DAYS', default=7, cast=int),
+}
+
+# Database backups (core.tasks.run_database_backup)
+BACKUP_CONFIG = {
+    'directory': config('BACKUP_DIR', default=str(BASE_DIR / 'backups')),
+    'format': config('BACKUP_FORMAT', default='auto'),  # auto, jsonl or pg_dump
+    'compression': config('BACKUP_COMPRESSION', default='gzip'),  # gzip or zstd
+    'compression_level': config('BACKUP_COMPRESSION_LEVEL', default=6, cast=int),
+    'chunk_size': config('BACKUP_CHUNK_SIZE', default=2000, cast=int),
+    'retention_days': config('BACKUP_RETENTION_DAYS', default=30, cast=int),
+    'keep_min': config('BACKUP_KEEP_MIN', default=3, cast=int),
 }
\ No newline at end of file
@@ -8,4 +8,8 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'maintenance_dashboard.settings')
 
-application = get_wsgi_application()
\ No newline at end of file
+application = get_wsgi_application()
+
+from maintenance_dashboard.celery import drop_root_privileges  # noqa: E402
+
+drop_root_privileges()
\ No newline at end of file
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark searches over the day-partitioned SQLite FTS5 log store.
+
+Fills a temporary LogStore with a week of synthetic container logs, then
+times typical troubleshooting queries across the whole week: the latest
+page, a container filter, a level filter, full-text matches (common and
+rare terms) and following a cursor to the next page. Reports ingest rate
+and query latency.
+
+Usage:
+    python scripts/benchmarks/log_store_benchmark.py [--days 7] [--lines-per-day 200000] [--containers 20]
+"""
+
+import argparse
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from django.conf import settings
+
+LEVELS = ['INFO'] * 80 + ['DEBUG'] * 10 + ['WARNING'] * 7 + ['ERROR'] * 3
+PATHS = ['/api/equipment/', '/api/maintenance/', '/dashboard/', '/events/calendar/', '/health/']
+
+
+def generate_day(day_start, lines, containers, rng):
+    step = 86400 * 1_000_000_000 // lines
+    base = int(day_start.timestamp()) * 1_000_000_000
+    for index in range(lines):
+        level = rng.choice(LEVELS)
+        container = f'app{rng.randrange(containers):02d}'
+        if level == 'ERROR':
+            message = f'{level} worker {rng.randrange(8)} request failed: OperationalError timeout id={rng.randrange(10 ** 6)}'
+        else:
+            message = f'{level} GET {rng.choice(PATHS)}{rng.randrange(5000)}/ 200 {rng.randrange(900)}ms id={rng.randrange(10 ** 6)}'
+        yield base + index * step, container, 'STDERR' if level in ('WARNING', 'ERROR') else 'STDOUT', message
+
+
+def timed(label, func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  {label:<48} {best * 1000:8.1f} ms   {len(result['entries']):>4} rows")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--days', type=int, default=7)
+    parser.add_argument('--lines-per-day', type=int, default=200000)
+    parser.add_argument('--containers', type=int, default=20)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='log-store-')
+    settings.configure(LOG_STORE_CONFIG={'directory': directory, 'retention_days': args.days + 1})
+    from core.services.log_store_service import LogStore
+
+    store = LogStore()
+    rng = random.Random(42)
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    start = today - timedelta(days=args.days - 1)
+
+    print(f"Ingesting {args.days} days x {args.lines_per_day:,} lines into {directory} ...")
+    started = time.perf_counter()
+    for offset in range(args.days):
+        store.add(generate_day(start + timedelta(days=offset), args.lines_per_day, args.containers, rng))
+    elapsed = time.perf_counter() - started
+    total = args.days * args.lines_per_day
+    print(f"  {total:,} entries in {elapsed:.1f}s ({total / elapsed:,.0f} entries/s)\n")
+
+    week = {'start': start, 'end': today + timedelta(days=1)}
+    print("Queries over the whole range (best of 3):")
+    page = timed('latest 100', lambda: store.search(**week))
+    timed('next page via cursor', lambda: store.search(cursor=page['next_cursor'], **week))
+    timed('one container', lambda: store.search(containers=['app07'], **week))
+    timed('level ERROR', lambda: store.search(levels=['ERROR'], **week))
+    timed('text "OperationalError" (3% of rows)', lambda: store.search(text='OperationalError', **week))
+    timed('text "maintenance" (20% of rows)', lambda: store.search(text='maintenance', **week))
+    timed('text + container + level', lambda: store.search(text='timeout', containers=['app03'], levels=['ERROR'], **week))
+    timed('text with no match', lambda: store.search(text='nonexistentterm', **week))
+
+    shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
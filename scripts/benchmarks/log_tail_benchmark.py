@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark the reverse-seek log tail reader against readlines() slicing.
+
+Writes synthetic Docker JSON log files of the requested sizes to a temporary
+directory, then reads the last N lines of each both ways: the way the log
+viewer used to (``f.readlines()[-N:]``) and with ``core.log_tail.tail_lines``,
+checks that both return the same lines and reports the time each takes.
+
+Usage:
+    python scripts/benchmarks/log_tail_benchmark.py [--sizes 10M,1G] [--lines 100,1000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.log_tail import tail_lines
+
+UNITS = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+
+def parse_size(text):
+    text = text.strip().upper()
+    if text[-1] in UNITS:
+        return int(float(text[:-1]) * UNITS[text[-1]])
+    return int(text)
+
+
+def write_log(path, size):
+    """Write Docker JSON log lines until the file reaches ``size`` bytes."""
+    block = ''.join(
+        json.dumps({
+            'log': f'GET /api/equipment/{i}/ HTTP/1.1 200 {i * 37 % 9000} request_id={i:08x}\n',
+            'stream': 'stderr' if i % 11 == 0 else 'stdout',
+            'time': f'2026-10-19T05:{i % 60:02d}:{i % 60:02d}.{i:06d}Z',
+        }) + '\n'
+        for i in range(2000)
+    ).encode('utf-8')
+    with open(path, 'wb') as f:
+        written = 0
+        while written < size:
+            f.write(block)
+            written += len(block)
+
+
+def legacy_tail(path, lines):
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.readlines()[-lines:]
+
+
+def measure(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10M,1G', help='Comma-separated file sizes (K/M/G suffixes)')
+    parser.add_argument('--lines', default='100,1000', help='Comma-separated tail lengths')
+    args = parser.parse_args()
+
+    sizes = [parse_size(size) for size in args.sizes.split(',')]
+    tail_lengths = [int(lines) for lines in args.lines.split(',')]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            path = os.path.join(directory, f'container-{size}-json.log')
+            write_log(path, size)
+            actual = os.path.getsize(path)
+            print(f"\n{actual / 1024 ** 2:,.0f} MB log file")
+            for lines in tail_lengths:
+                legacy_time, legacy_result = measure(legacy_tail, path, lines)
+                tail_time, tail_result = measure(tail_lines, path, lines)
+                assert tail_result == legacy_result, 'tail_lines disagrees with readlines()'
+                print(f"  last {lines:>5} lines: readlines {legacy_time * 1000:10.1f} ms   "
+                      f"tail_lines {tail_time * 1000:7.2f} ms   ({legacy_time / tail_time:,.0f}x)")
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
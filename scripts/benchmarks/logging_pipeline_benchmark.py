@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Benchmark request throughput under heavy logging, with and without the queue pipeline.
+
+Simulates request-handling threads that each do a little work, wait on
+I/O once (a database round trip) and log a burst of INFO lines (plus the
+occasional warning) through a copy of the
+project's file handlers: size-rotated files, writing to a temporary
+directory with a small maxBytes so rotations happen during the run. Runs
+the same load three ways:
+
+- direct:            handlers attached to the logger, as settings used to do
+- queue:             core.log_pipeline with sampling effectively off
+- queue + sampling:  core.log_pipeline with the default sampling settings
+
+and reports requests per second, per-request latency (p50/p99/max),
+records written and records dropped (counted from the pipeline's
+"queue full" notices).
+
+With one request thread per process, as under the gunicorn sync workers,
+the listener keeps up and nothing is dropped. With many CPU-bound threads
+logging at full speed (e.g. --threads 16 --requests 125) the listener only
+gets a share of the GIL, the queue fills and records are dropped and counted
+instead of slowing requests down; sampling keeps that case lossless.
+
+Usage:
+    python scripts/benchmarks/logging_pipeline_benchmark.py [--threads 1] [--requests 2000] [--lines 40]
+"""
+
+import argparse
+import logging
+import logging.config
+import os
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core import log_pipeline
+
+logger = logging.getLogger('core.benchmark')
+
+DROP_NOTICE = re.compile(r'Logging queue full: dropped (\d+) log records')
+
+
+def logging_config(directory):
+    def rotating(name, level):
+        return {
+            'level': level,
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': os.path.join(directory, name),
+            'formatter': 'json',
+            'maxBytes': 1024 * 1024,
+            'backupCount': 10000,  # Keep every rotated file so written records can be counted
+        }
+
+    return {
+        'version': 1,
+        'disable_existing_loggers': False,
+        'formatters': {'json': {'()': 'core.log_pipeline.JsonFormatter'}},
+        'handlers': {
+            'file': rotating('debug.log', 'INFO'),
+            'error_file': rotating('error.log', 'ERROR'),
+        },
+        'loggers': {
+            'core': {'handlers': ['file', 'error_file'], 'level': 'INFO', 'propagate': False},
+        },
+    }
+
+
+def handle_request(index, lines, io_wait):
+    total = 0
+    for i in range(200):
+        total += i * index
+    for line in range(lines):
+        logger.info(f"request {index} step {line} checksum={total}")
+        if line == lines // 2:
+            # Database / cache round trip
+            time.sleep(io_wait)
+    if index % 10 == 0:
+        logger.warning(f"request {index} slow path taken")
+
+
+def count_records(directory):
+    """Return (records written, records reported dropped by the pipeline's notices)."""
+    written = dropped = 0
+    for name in os.listdir(directory):
+        if not name.startswith('debug.log'):
+            continue
+        with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+            for line in f:
+                match = DROP_NOTICE.search(line)
+                if match:
+                    dropped += int(match.group(1))
+                else:
+                    written += 1
+    return written, dropped
+
+
+def run(label, threads, requests, lines, io_wait, setup):
+    directory = tempfile.mkdtemp(prefix='log-pipeline-')
+    pipeline = setup(logging_config(directory))
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(offset):
+        mine = []
+        for index in range(offset, requests * threads, threads):
+            started = time.perf_counter()
+            handle_request(index, lines, io_wait)
+            mine.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(mine)
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(offset,)) for offset in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    dropped = 0
+    if pipeline is not None:
+        pipeline.drain(timeout=60)
+        dropped = pipeline.take_dropped()
+    for handler in logging.getLogger('core').handlers:
+        for target in getattr(handler, 'handlers', [handler]):
+            target.flush()
+
+    written, reported = count_records(directory)
+    latencies.sort()
+    print(f"  {label:<18} {len(latencies) / elapsed:9,.0f} req/s   "
+          f"p50 {statistics.median(latencies) * 1000:6.2f} ms   "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:6.2f} ms   "
+          f"max {latencies[-1] * 1000:7.2f} ms   "
+          f"{written:>9,} written   {dropped + reported:>7,} dropped")
+    shutil.rmtree(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=1, help='Request threads (1 = a gunicorn sync worker)')
+    parser.add_argument('--requests', type=int, default=2000, help='Requests per thread')
+    parser.add_argument('--lines', type=int, default=40, help='INFO lines logged per request')
+    parser.add_argument('--io-wait', type=float, default=0.002, help='Seconds each request waits on I/O')
+    parser.add_argument('--queue-size', type=int, default=10000)
+    args = parser.parse_args()
+
+    print(f"{args.threads} threads x {args.requests} requests x {args.lines} log lines per request, "
+          f"{args.io_wait * 1000:g} ms I/O wait per request\n")
+
+    def direct(config):
+        logging.config.dictConfig(config)
+        return None
+
+    def queued(config):
+        return log_pipeline.configure_logging(config, {'queue_size': args.queue_size, 'sample_burst': 10 ** 9})
+
+    def sampled(config):
+        return log_pipeline.configure_logging(config, {'queue_size': args.queue_size})
+
+    run('direct', args.threads, args.requests, args.lines, args.io_wait, direct)
+    run('queue', args.threads, args.requests, args.lines, args.io_wait, queued)
+    run('queue + sampling', args.threads, args.requests, args.lines, args.io_wait, sampled)
+
+
+if __name__ == '__main__':
+    main()
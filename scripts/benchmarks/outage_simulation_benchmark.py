@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark outage simulation on the in-memory equipment dependency graph.
+
+Builds a synthetic electrical one-line (a layered DAG with tens of thousands of
+connections), then compares a per-unit list.pop(0) traversal — what calling
+Equipment.get_all_affected_downstream for each unit used to do, minus its
+query per visited node — with one multi-source EquipmentGraph traversal.
+
+Usage:
+    python scripts/benchmarks/outage_simulation_benchmark.py [--nodes 30000] [--seeds 300]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'maintenance_dashboard.settings')
+import django
+django.setup()
+
+from equipment.graph import EquipmentGraph
+
+
+def generate_graph(node_count, fan_in=2, seed=11):
+    """Layered DAG: every node is fed by up to ``fan_in`` nodes from earlier layers."""
+    rng = random.Random(seed)
+    nodes = [(pk, 'active', True) for pk in range(node_count)]
+    edges = []
+    for pk in range(1, node_count):
+        for upstream in {rng.randrange(max(0, pk - 500), pk) for _ in range(fan_in)}:
+            edges.append((upstream, pk, rng.random() < 0.8))
+    return nodes, edges
+
+
+def legacy_affected(graph, seeds):
+    """Union of per-seed breadth-first searches using list.pop(0)."""
+    affected = set()
+    for seed in seeds:
+        visited = set()
+        to_check = [seed]
+        while to_check:
+            current = to_check.pop(0)
+            if current in visited:
+                continue
+            visited.add(current)
+            for downstream in graph.critical_downstream.get(current, ()):
+                if downstream not in visited:
+                    affected.add(downstream)
+                    to_check.append(downstream)
+    return affected - set(seeds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--nodes', type=int, default=30000)
+    parser.add_argument('--seeds', type=int, default=300)
+    args = parser.parse_args()
+
+    nodes, edges = generate_graph(args.nodes)
+    started = time.perf_counter()
+    graph = EquipmentGraph(nodes, edges)
+    build_time = time.perf_counter() - started
+    print(f"Graph: {len(graph)} equipment, {graph.edge_count} connections (built in {build_time:.3f}s)")
+
+    seeds = random.Random(5).sample(range(args.nodes), args.seeds)
+
+    started = time.perf_counter()
+    legacy = legacy_affected(graph, seeds)
+    legacy_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    affected = graph.downstream_impact(seeds)
+    graph_time = time.perf_counter() - started
+
+    assert set(affected) == legacy, "affected equipment differs"
+    print(f"Affected equipment: {len(affected)}")
+    print(f"Per-unit traversals:        {legacy_time:.3f}s")
+    print(f"Multi-source traversal:     {graph_time:.4f}s  ({legacy_time / graph_time:.0f}x)")
+
+    graph.status.update({pk: 'maintenance' for pk in seeds})
+    graph._effective = None
+    started = time.perf_counter()
+    statuses = graph.effective_statuses()
+    cascade_time = time.perf_counter() - started
+    cascaded = sum(1 for status in statuses.values() if status == 'cascade_offline')
+    print(f"Fleet cascade status:       {cascade_time:.4f}s  ({cascaded} cascade offline)")
+
+
+if __name__ == '__main__':
+    main()
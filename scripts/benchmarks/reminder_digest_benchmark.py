@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark reminder digests against one send_mail call per reminder.
+
+Starts a local SMTP stand-in (a minimal threaded SMTP responder on
+127.0.0.1 that accepts everything and counts sessions and messages), then
+delivers the same synthetic reminders both ways through Django's real SMTP
+backend: once with send_mail per reminder, as the reminder tasks used to,
+and once through ReminderDigestService. Reports SMTP connections, messages
+and wall time for each.
+
+Usage:
+    python scripts/benchmarks/reminder_digest_benchmark.py [--reminders 5000] [--technicians 250]
+"""
+
+import argparse
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from django.conf import settings
+
+
+class SMTPStandIn(socketserver.StreamRequestHandler):
+    """Just enough SMTP to satisfy smtplib: every command succeeds."""
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self.wfile.write(b'220 localhost SMTP stand-in\r\n')
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line[:4].upper()
+            if command in (b'EHLO', b'HELO'):
+                self.wfile.write(b'250 localhost\r\n')
+            elif command == b'DATA':
+                self.wfile.write(b'354 End data with <CR><LF>.<CR><LF>\r\n')
+                while self.rfile.readline() not in (b'.\r\n', b''):
+                    pass
+                with server.lock:
+                    server.messages += 1
+                self.wfile.write(b'250 OK\r\n')
+            elif command == b'QUIT':
+                self.wfile.write(b'221 Bye\r\n')
+                return
+            else:
+                self.wfile.write(b'250 OK\r\n')
+
+
+class CountingSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), SMTPStandIn)
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.connections = 0
+        self.messages = 0
+
+
+def generate_reminders(count, technicians):
+    return [
+        (
+            f'tech{i % technicians}@example.com',
+            f'Inspection {i}',
+            [f'Title: Inspection {i}', f'Equipment: TX-{i % 997}', 'Scheduled: tomorrow 08:00'],
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_send(reminders):
+    from django.core.mail import send_mail
+
+    for email, title, lines in reminders:
+        send_mail(
+            subject=f"Maintenance Reminder: {title}",
+            message="You have a maintenance activity scheduled for tomorrow:\n\n" + "\n".join(lines) + "\n",
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipient_list=[email],
+            fail_silently=False,
+        )
+
+
+def digest_send(reminders):
+    from core.services.notification_service import ReminderDigestService
+
+    return ReminderDigestService().send_reminders(
+        reminders,
+        subject_prefix="Maintenance Reminder",
+        intro="You have a maintenance activity scheduled for tomorrow:",
+        digest_intro="You have {count} maintenance activities scheduled for tomorrow:",
+    )
+
+
+def measure(server, func, *args):
+    server.reset()
+    started = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - started, server.connections, server.messages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reminders', type=int, default=5000)
+    parser.add_argument('--technicians', type=int, default=250)
+    parser.add_argument('--chunk-size', type=int, default=500)
+    args = parser.parse_args()
+
+    server = CountingSMTPServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    settings.configure(
+        EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend',
+        EMAIL_HOST='127.0.0.1',
+        EMAIL_PORT=server.server_address[1],
+        EMAIL_USE_TLS=False,
+        DEFAULT_FROM_EMAIL='noreply@maintenance-dashboard.com',
+        REMINDER_DIGEST_CONFIG={'chunk_size': args.chunk_size, 'max_retries': 2, 'retry_delay': 0},
+    )
+
+    reminders = generate_reminders(args.reminders, args.technicians)
+    print(f"Delivering {len(reminders)} reminders for {args.technicians} technicians "
+          f"to the SMTP stand-in on port {server.server_address[1]}...")
+
+    legacy_time, legacy_connections, legacy_messages = measure(server, legacy_send, reminders)
+    digest_time, digest_connections, digest_messages = measure(server, digest_send, reminders)
+    server.shutdown()
+
+    print(f"send_mail per reminder: {legacy_time:.3f}s  {legacy_connections} connections  {legacy_messages} messages")
+    print(f"Reminder digests:       {digest_time:.3f}s  {digest_connections} connections  {digest_messages} messages")
+    print(f"Speedup: {legacy_time / digest_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
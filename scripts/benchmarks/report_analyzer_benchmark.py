@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Benchmark the precompiled report analyzer against the original implementation.
+
+Generates a synthetic corpus of maintenance report texts, verifies that both
+analyzers produce identical output and times them, sequentially and with a
+multiprocessing pool.
+
+Usage:
+    python scripts/benchmarks/report_analyzer_benchmark.py [--reports 20000] [--processes 4]
+"""
+
+import argparse
+import multiprocessing
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from maintenance.report_analysis import analyze_report_batch, analyze_report_content
+
+
+def legacy_analyze_report_content(content):
+    """Original per-call implementation from maintenance.views (reference only)."""
+    analyzed_data = {
+        'issues': [],
+        'parts_replaced': [],
+        'measurements': [],
+        'dates': [],
+        'technicians': [],
+        'work_hours': None,
+    }
+    import re
+    # Convert to lowercase for case-insensitive matching
+    content_lower = content.lower()
+
+    # --- Enhanced: Extract issues from 'Issues found:' sections and bullet points ---
+    # Find 'issues found:' or 'issues:' section
+    issues_section = re.search(r'(issues found:|issues:)([\s\S]+?)(\n\s*\n|$)', content, re.IGNORECASE)
+    if issues_section:
+        issues_block = issues_section.group(2)
+        # Extract bullet points or lines
+        for line in issues_block.splitlines():
+            line = line.strip('-•* ').strip()
+            if not line:
+                continue
+            # Only consider lines that are not empty and not a section header
+            severity = 'medium'  # Default severity
+            lcline = line.lower()
+            if any(word in lcline for word in ['critical', 'severe', 'emergency']):
+                severity = 'critical'
+            elif any(word in lcline for word in ['major', 'serious']):
+                severity = 'high'
+            elif any(word in lcline for word in ['minor', 'small']):
+                severity = 'low'
+            analyzed_data['issues'].append({
+                'text': line,
+                'severity': severity,
+                'position': content.find(line)
+            })
+
+    # --- Existing: Extract issues (basic pattern matching) ---
+    issue_patterns = [
+        r'issue[s]?\s*:?  *([^.\n]+)',
+        r'problem[s]?\s*:?  *([^.\n]+)',
+        r'fault[s]?\s*:?  *([^.\n]+)',
+        r'error[s]?\s*:?  *([^.\n]+)',
+        r'failure[s]?\s*:?  *([^.\n]+)',
+    ]
+    for pattern in issue_patterns:
+        matches = re.finditer(pattern, content_lower)
+        for match in matches:
+            issue_text = match.group(1).strip()
+            severity = 'medium'  # Default severity
+            if any(word in issue_text for word in ['critical', 'severe', 'emergency']):
+                severity = 'critical'
+            elif any(word in issue_text for word in ['major', 'serious']):
+                severity = 'high'
+            elif any(word in issue_text for word in ['minor', 'small']):
+                severity = 'low'
+            analyzed_data['issues'].append({
+                'text': issue_text,
+                'severity': severity,
+                'position': match.start()
+            })
+
+    # --- Existing: Extract parts replaced ---
+    parts_patterns = [
+        r'replaced\s+([^.\n]+)',
+        r'changed\s+([^.\n]+)',
+        r'installed\s+new\s+([^.\n]+)',
+        r'part[s]?\s*:?\s*([^.\n]+)',
+    ]
+    for pattern in parts_patterns:
+        matches = re.finditer(pattern, content_lower)
+        for match in matches:
+            part_text = match.group(1).strip()
+            analyzed_data['parts_replaced'].append({
+                'part': part_text,
+                'position': match.start()
+            })
+
+    # --- Existing: Extract measurements ---
+    measurement_patterns = [
+        r'(\d+(?:\.\d+)?)\s*(?:psi|bar|pa|kpa|mpa|°c|°f|volts?|v|amps?|a|watts?|w|rpm|hz|khz|mhz)',
+        r'temperature\s*:?\s*(\d+(?:\.\d+)?)\s*(?:°c|°f)',
+        r'pressure\s*:?\s*(\d+(?:\.\d+)?)\s*(?:psi|bar|pa|kpa|mpa)',
+    ]
+    for pattern in measurement_patterns:
+        matches = re.finditer(pattern, content_lower)
+        for match in matches:
+            value = match.group(1)
+            unit = match.group(0).replace(value, '').strip()
+            analyzed_data['measurements'].append({
+                'value': float(value),
+                'unit': unit,
+                'position': match.start()
+            })
+
+    # --- Existing: Extract dates ---
+    date_patterns = [
+        r'\d{1,2}/\d{1,2}/\d{2,4}',
+        r'\d{4}-\d{2}-\d{2}',
+        r'\d{1,2}-\d{1,2}-\d{2,4}',
+    ]
+    for pattern in date_patterns:
+        matches = re.finditer(pattern, content)
+        for match in matches:
+            analyzed_data['dates'].append({
+                'date': match.group(0),
+                'position': match.start()
+            })
+
+    # --- Existing: Extract work hours ---
+    hours_patterns = [
+        r'(\d+(?:\.\d+)?)\s*hours?',
+        r'(\d+(?:\.\d+)?)\s*hrs?',
+        r'worked\s+(\d+(?:\.\d+)?)\s*hours?',
+    ]
+    for pattern in hours_patterns:
+        match = re.search(pattern, content_lower)
+        if match:
+            analyzed_data['work_hours'] = float(match.group(1))
+            break
+
+    return analyzed_data
+
+
+
+SNIPPETS = [
+    "Routine inspection completed on {date}. No issues found.",
+    "Issues found:\n- Minor oil leak at {part}\n- Critical hot spot on bushing\n\nFollow-up scheduled.",
+    "Replaced {part}. Installed new {part} per OEM spec.",
+    "Measured {value} psi on the main tank and {value} volts on the secondary.",
+    "Temperature: {value} °c, pressure: {value} kpa after {value} hours of operation.",
+    "Technician worked {value} hours. Problem: serious vibration at {value} rpm.",
+    "Fault: relay tripped on {date}; error code cleared after reset.",
+    "Parts: {part}, {part}. Changed {part} and gasket.",
+    "Visual check of enclosure, grounding and labels satisfactory.",
+]
+PARTS = ['gasket', 'breather', 'silica gel', 'fan motor', 'bushing', 'cooling pump', 'tap changer contact']
+
+
+def build_corpus(count, seed=42):
+    """Build a reproducible list of synthetic report texts."""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        paragraphs = []
+        for snippet in rng.sample(SNIPPETS, rng.randint(2, 6)):
+            paragraphs.append(snippet.format(
+                date=f"{rng.randint(1, 12)}/{rng.randint(1, 28)}/20{rng.randint(20, 26)}",
+                part=rng.choice(PARTS),
+                value=round(rng.uniform(1, 500), 1),
+            ))
+        corpus.append("\n\n".join(paragraphs))
+    return corpus
+
+
+def timed(label, func):
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<32} {elapsed:8.3f}s")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reports', type=int, default=20000, help='Number of synthetic reports')
+    parser.add_argument('--processes', type=int, default=multiprocessing.cpu_count(), help='Pool size')
+    parser.add_argument('--batch-size', type=int, default=500, help='Reports per pool batch')
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.reports)
+    print(f"Corpus: {len(corpus)} reports, {sum(map(len, corpus)) / 1024:.0f} KiB")
+
+    legacy, legacy_time = timed('legacy (recompile per call)', lambda: [legacy_analyze_report_content(c) for c in corpus])
+    current, current_time = timed('precompiled, sequential', lambda: [analyze_report_content(c) for c in corpus])
+
+    if legacy != current:
+        mismatches = sum(1 for a, b in zip(legacy, current) if a != b)
+        print(f"❌ Output mismatch in {mismatches} reports")
+        return 1
+    print("✅ Outputs identical")
+
+    batches = [
+        list(enumerate(corpus[i:i + args.batch_size], start=i))
+        for i in range(0, len(corpus), args.batch_size)
+    ]
+    with multiprocessing.Pool(processes=args.processes) as pool:
+        _, pool_time = timed(f'precompiled, pool x{args.processes}', lambda: pool.map(analyze_report_batch, batches))
+
+    print(f"Speedup sequential: {legacy_time / current_time:.2f}x, pooled: {legacy_time / pool_time:.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -492,7 +492,10 @@ main() {
     
     # Start application
     if [ "$1" = "web" ] || [ "$1" = "gunicorn" ]; then
-        exec gunicorn --bind 0.0.0.0:8000 --workers 3 --timeout 120 maintenance_dashboard.wsgi:application
+        # gthread workers: a live log stream (core.views.log_stream_sse) holds one
+        # thread, not a whole worker; LOG_FOLLOWER_MAX_STREAMS caps them per process
+        exec gunicorn --bind 0.0.0.0:8000 --workers 3 --worker-class gthread --threads "${GUNICORN_THREADS:-4}" \
+            --timeout 120 maintenance_dashboard.wsgi:application
 elif [ "$1" = "celery" ]; then
     # Run both worker and beat in the same process to reduce container count
     # Switch to non-root user for security (appuser created in Dockerfile)
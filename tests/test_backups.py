@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming, compressed database backups.
+"""
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from core.models import Customer, Location
+from core.services.backup_service import BackupService
+from core.tasks import BACKUP_PROGRESS_KEY, BACKUP_SLOT_KEY
+
+
+class BackupServiceTest(TestCase):
+    """Test full and incremental archives, checksums, restore and retention."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.service = BackupService(config={'directory': self.directory, 'chunk_size': 2})
+        self.site = Location.objects.create(name='North Site', is_site=True)
+        Location.objects.create(name='Hall A', is_site=False, parent_location=self.site)
+        self.customer = Customer.objects.create(name='Acme')
+
+    def read_archive(self, name):
+        with gzip.open(os.path.join(self.directory, name), 'rt', encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    def test_full_backup(self):
+        progress = []
+        entry = self.service.create_backup(progress=progress.append)
+
+        self.assertEqual(entry['kind'], 'full')
+        self.assertTrue(entry['name'].endswith('.jsonl.gz'))
+        self.assertEqual(entry['models']['core.Location'], 2)
+        objects = self.read_archive(entry['name'])
+        self.assertEqual(len(objects), entry['rows'])
+        self.assertIn({'model': 'core.customer', 'pk': self.customer.pk}, [{'model': o['model'], 'pk': o['pk']} for o in objects])
+        self.assertFalse(any(o['model'] in ('contenttypes.contenttype', 'sessions.session') for o in objects))
+
+        # Checksums in the manifest and the sha256sum file
+        self.assertTrue(self.service.verify(entry['name']))
+        with open(os.path.join(self.directory, entry['name'] + '.sha256')) as f:
+            self.assertEqual(f.read(), f"{entry['sha256']}  {entry['name']}\n")
+        self.assertEqual(self.service.list_backups()[0]['name'], entry['name'])
+        self.assertEqual(progress[-1], {'stage': 'done', 'name': entry['name'], 'size': entry['size']})
+        self.assertIn('models_total', progress[0])
+
+        # The archive restores with loaddata
+        self.customer.delete()
+        call_command('loaddata', os.path.join(self.directory, entry['name']), verbosity=0)
+        self.assertTrue(Customer.objects.filter(name='Acme').exists())
+
+    def test_incremental_backup(self):
+        an_hour_ago = timezone.now() - timedelta(hours=1)
+        Location.objects.update(updated_at=an_hour_ago)
+        Customer.objects.update(updated_at=an_hour_ago)
+        self.service.create_backup()
+        Customer.objects.filter(pk=self.customer.pk).update(name='Acme Ltd', updated_at=timezone.now())
+
+        entry = self.service.create_backup(kind='incremental')
+        self.assertEqual(entry['kind'], 'incremental')
+        self.assertIsNotNone(entry['since'])
+        objects = self.read_archive(entry['name'])
+        # Only the changed customer among models with updated_at
+        self.assertEqual([o['fields']['name'] for o in objects if o['model'] == 'core.customer'], ['Acme Ltd'])
+        self.assertNotIn('core.location', {o['model'] for o in objects})
+
+    def test_incremental_without_base_is_full(self):
+        self.assertEqual(self.service.create_backup(kind='incremental')['kind'], 'full')
+
+    def test_retention(self):
+        now = timezone.now()
+        manifest = {'backups': []}
+        for days, kind in ((60, 'full'), (50, 'incremental'), (40, 'full'), (35, 'incremental'), (20, 'full'), (1, 'incremental')):
+            name = f'backup_{days}_{kind}.jsonl.gz'
+            open(os.path.join(self.directory, name), 'w').close()
+            manifest['backups'].append({'name': name, 'kind': kind, 'started_at': (now - timedelta(days=days)).isoformat()})
+        self.service.write_manifest(manifest)
+
+        service = BackupService(config={'directory': self.directory, 'retention_days': 30, 'keep_min': 2})
+        removed = service.prune(now=now)
+        self.assertEqual(removed, ['backup_60_full.jsonl.gz', 'backup_50_incremental.jsonl.gz'])
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'backup_60_full.jsonl.gz')))
+        self.assertEqual([entry['name'] for entry in service.list_backups()][-1], 'backup_40_full.jsonl.gz')
+
+
+class BackupViewTest(TestCase):
+    """The backup view queues the task instead of dumping in the request."""
+
+    def setUp(self):
+        cache.delete_many([BACKUP_PROGRESS_KEY, BACKUP_SLOT_KEY])
+        self.addCleanup(cache.delete_many, [BACKUP_PROGRESS_KEY, BACKUP_SLOT_KEY])
+        self.client.force_login(User.objects.create_superuser(username='admin', password='pw', email='a@example.com'))
+
+    def test_queues_backup_once(self):
+        with mock.patch('core.tasks.run_database_backup.delay') as delay:
+            delay.return_value.id = 'task-1'
+            response = self.client.post(reverse('core:backup_database'), {'kind': 'incremental'})
+            self.assertEqual(response.status_code, 202)
+            self.assertEqual(response.json()['task_id'], 'task-1')
+            delay.assert_called_once_with('incremental')
+
+            self.assertEqual(self.client.post(reverse('core:backup_database')).status_code, 409)
+        self.assertEqual(self.client.get(reverse('core:backup_status')).json()['progress']['stage'], 'queued')
+
+    def test_takes_over_a_stale_slot(self):
+        """A slot whose backup stopped reporting an hour ago is taken over, once."""
+        stale = (timezone.now() - timedelta(hours=2)).isoformat()
+        cache.set(BACKUP_SLOT_KEY, stale, None)
+        cache.set(BACKUP_PROGRESS_KEY, {'stage': 'dumping', 'kind': 'full', 'updated_at': stale})
+        with mock.patch('core.tasks.run_database_backup.delay') as delay:
+            delay.return_value.id = 'task-2'
+            self.assertEqual(self.client.post(reverse('core:backup_database')).status_code, 202)
+            self.assertEqual(self.client.post(reverse('core:backup_database')).status_code, 409)
+        self.assertNotEqual(cache.get(BACKUP_SLOT_KEY), stale)
+
+    def test_progress_of_an_earlier_backup_does_not_free_the_slot(self):
+        cache.set(BACKUP_SLOT_KEY, timezone.now().isoformat(), None)
+        cache.set(BACKUP_PROGRESS_KEY, {
+            'stage': 'done', 'kind': 'full', 'updated_at': (timezone.now() - timedelta(minutes=5)).isoformat(),
+        })
+        with mock.patch('core.tasks.run_database_backup.delay') as delay:
+            self.assertEqual(self.client.post(reverse('core:backup_database')).status_code, 409)
+        delay.assert_not_called()
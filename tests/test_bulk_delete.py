@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for chunked bulk deletion.
+"""
+
+from datetime import timedelta
+from django.test import TestCase
+from django.utils import timezone
+from core.models import Location, EquipmentCategory
+from core.services.bulk_delete_service import BatchedDeleter
+from equipment.models import Equipment
+from events.models import CalendarEvent, EventComment
+from maintenance.models import (
+    MaintenanceActivity, MaintenanceActivityType, MaintenanceChecklist, MaintenanceReport,
+    MaintenanceTimelineEntry, ActivityTypeCategory,
+)
+
+
+class BatchedDeleterTest(TestCase):
+    """Test that chunks remove dependents first and leave unrelated rows alone."""
+
+    def setUp(self):
+        location = Location.objects.create(name='Purge Site', is_site=True)
+        self.equipment = Equipment.objects.create(
+            name='TX-1', category=EquipmentCategory.objects.create(name='Transformers'), location=location,
+            manufacturer_serial='SN-TX-1', asset_tag='AT-TX-1',
+        )
+        self.activity_type = MaintenanceActivityType.objects.create(
+            name='Inspection', category=ActivityTypeCategory.objects.create(name='Preventive'), frequency_days=30,
+        )
+        now = timezone.now()
+        activities = MaintenanceActivity.objects.bulk_create([
+            MaintenanceActivity(
+                equipment=self.equipment, activity_type=self.activity_type, title=f'Inspection {i}',
+                status='completed' if i == 0 else 'scheduled',
+                scheduled_start=now + timedelta(days=i), scheduled_end=now + timedelta(days=i, hours=1),
+            )
+            for i in range(7)
+        ])
+        MaintenanceTimelineEntry.objects.bulk_create([
+            MaintenanceTimelineEntry(activity=a, entry_type='note', title='Note', description='n') for a in activities
+        ])
+        MaintenanceChecklist.objects.bulk_create([
+            MaintenanceChecklist(activity=a, activity_type=self.activity_type, item_text='Check oil') for a in activities
+        ])
+        MaintenanceReport.objects.bulk_create([
+            MaintenanceReport(maintenance_activity=a, title='Report', file='r.pdf') for a in activities
+        ])
+        events = CalendarEvent.objects.bulk_create([
+            CalendarEvent(
+                title=a.title, equipment=self.equipment, event_date=now.date(), maintenance_activity=a,
+            )
+            for a in activities
+        ])
+        EventComment.objects.bulk_create([EventComment(event=e, comment='c') for e in events])
+        self.kept = activities[0]
+
+    def test_chunks_delete_dependents(self):
+        """Scheduled activities go in chunks of two along with everything hanging off them."""
+        result = BatchedDeleter(
+            MaintenanceActivity, also_delete=[(CalendarEvent, 'maintenance_activity')], config={'chunk_size': 2}
+        ).delete(MaintenanceActivity.objects.filter(status='scheduled'))
+
+        self.assertEqual(result['deleted'], 6)
+        self.assertEqual(result['chunks'], 3)
+        self.assertEqual(result['by_model']['events.EventComment'], 6)
+        self.assertEqual(list(MaintenanceActivity.objects.values_list('id', flat=True)), [self.kept.id])
+        for model, fk in (
+            (MaintenanceTimelineEntry, 'activity'), (MaintenanceChecklist, 'activity'),
+            (MaintenanceReport, 'maintenance_activity'), (CalendarEvent, 'maintenance_activity'),
+        ):
+            self.assertEqual(model.objects.count(), 1, model)
+            self.assertTrue(model.objects.filter(**{fk: self.kept}).exists())
+        self.assertEqual(EventComment.objects.count(), 1)
+
+    def test_set_null_references_are_cleared(self):
+        """Without also_delete, calendar events survive with their activity link nulled."""
+        BatchedDeleter(MaintenanceActivity).delete(MaintenanceActivity.objects.all())
+
+        self.assertEqual(CalendarEvent.objects.count(), 7)
+        self.assertFalse(CalendarEvent.objects.filter(maintenance_activity__isnull=False).exists())
+
+    def test_protected_relations_are_refused(self):
+        """Models guarded by PROTECT are left to the ORM."""
+        with self.assertRaises(ValueError):
+            BatchedDeleter(MaintenanceActivityType).delete(MaintenanceActivityType.objects.all())
+        self.assertTrue(MaintenanceActivityType.objects.exists())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Tests for the circuit-breaking cache backend and the Celery broker circuit.
+"""
+
+from unittest import mock
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import SimpleTestCase, override_settings
+from kombu.exceptions import OperationalError
+from core.cache_backends import CircuitBreaker, ResilientCache
+from core.services.database_stats_service import DatabaseStatsService
+from core.services.health_probe_service import HealthProbe, HealthProbeService, probe_cache
+from maintenance_dashboard.celery import app, broker_breaker
+
+
+class FlakyCache(LocMemCache):
+    """Local-memory cache that raises ConnectionError while ``down`` is set."""
+
+    down = False
+    calls = 0
+
+    def get(self, *args, **kwargs):
+        FlakyCache.calls += 1
+        if FlakyCache.down:
+            raise ConnectionError('Connection refused')
+        return super().get(*args, **kwargs)
+
+    def set(self, *args, **kwargs):
+        FlakyCache.calls += 1
+        if FlakyCache.down:
+            raise ConnectionError('Connection refused')
+        return super().set(*args, **kwargs)
+
+    def delete_many(self, *args, **kwargs):
+        FlakyCache.calls += 1
+        if FlakyCache.down:
+            raise ConnectionError('Connection refused')
+        return super().delete_many(*args, **kwargs)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CircuitBreakerTest(SimpleTestCase):
+    """Test opening, the single half-open probe and closing."""
+
+    def test_states(self):
+        clock = Clock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.record_failure(ConnectionError('refused')))
+        self.assertTrue(breaker.record_failure(ConnectionError('refused')))
+        self.assertEqual(breaker.state, 'open')
+        self.assertFalse(breaker.allow())
+
+        clock.now = 10
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())  # Only one probe at a time
+        breaker.record_failure(ConnectionError('refused'))
+        self.assertEqual(breaker.state, 'open')
+
+        clock.now = 20
+        self.assertTrue(breaker.allow())
+        self.assertTrue(breaker.record_success())
+        self.assertEqual(breaker.status(), {'state': 'closed', 'failures': 0, 'last_error': 'refused', 'open_for': None})
+
+
+class ResilientCacheTest(SimpleTestCase):
+    """Test lazy connection, failover, re-probing and recovery."""
+
+    def setUp(self):
+        FlakyCache.down = False
+        FlakyCache.calls = 0
+        self.addCleanup(setattr, FlakyCache, 'down', False)
+
+    def make_cache(self, location):
+        cache = ResilientCache(location, {
+            'KEY_PREFIX': 'test',
+            'OPTIONS': {
+                'PRIMARY_BACKEND': f'{__name__}.FlakyCache',
+                'FALLBACK': {'LOCATION': f'{location}-fallback'},
+                'FAILURE_THRESHOLD': 2,
+                'RESET_TIMEOUT': 30,
+            },
+        })
+        cache.breaker.clock = Clock()
+        return cache
+
+    def test_connects_lazily(self):
+        cache = self.make_cache('lazy')
+        self.assertIsNone(cache._primary)
+        cache.set('key', 'value')
+        self.assertEqual(cache.get('key'), 'value')
+        self.assertEqual(cache.primary.get('key'), 'value')
+        self.assertEqual(cache.status()['mode'], 'primary')
+
+    def test_failover_and_recovery(self):
+        cache = self.make_cache('failover')
+        cache.set('session', 'stale')
+        FlakyCache.down = True
+
+        # The first failures fall through to the fallback, then the breaker opens
+        self.assertIsNone(cache.get('session'))
+        cache.set('session', 'fresh')
+        self.assertEqual(cache.status()['mode'], 'fallback')
+        calls = FlakyCache.calls
+        self.assertEqual(cache.get('session'), 'fresh')
+        self.assertEqual(FlakyCache.calls, calls)  # The primary is left alone while open
+
+        # After the reset timeout one call re-probes the primary
+        cache.breaker.clock.now = 30
+        self.assertEqual(cache.get('session'), 'fresh')
+        self.assertEqual(FlakyCache.calls, calls + 1)  # Its invalidation failed first
+        self.assertEqual(cache.status()['state'], 'open')
+
+        FlakyCache.down = False
+        cache.breaker.clock.now = 60
+        # Recovery clears the stale entry the primary still held
+        self.assertIsNone(cache.get('session'))
+        self.assertEqual(cache.status()['mode'], 'primary')
+
+    def test_recovery_keeps_unrelated_keys(self):
+        """Only keys changed in the fallback are deleted; other processes' entries (the backup slot) stay."""
+        cache = self.make_cache('recovery')
+        cache.set('database_backup:running', 'job-1', None)
+        cache.set('dashboard:generation', 7)
+        cache.set('session', 'stale')
+        FlakyCache.down = True
+        cache.set('session', 'fresh')
+        cache.set('session', 'fresh')
+        cache.fallback.set('database_backup:running', 'job-2')
+        self.assertFalse(cache.add('database_backup:running', 'job-3'))
+        cache.set_many({'other': 1}, version=2)
+        self.assertEqual(cache.status()['mode'], 'fallback')
+
+        FlakyCache.down = False
+        cache.breaker.clock.now = 30
+        self.assertIsNone(cache.get('session'))  # Invalidated, not the stale primary copy
+        self.assertEqual(cache.status()['mode'], 'primary')
+        self.assertEqual(cache.get('database_backup:running'), 'job-1')
+        self.assertEqual(cache.get('dashboard:generation'), 7)
+        self.assertIsNone(cache.primary.get('other', version=2))
+
+    def test_other_errors_do_not_open_the_breaker(self):
+        cache = self.make_cache('errors')
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                cache.incr('missing')
+        self.assertEqual(cache.status()['state'], 'closed')
+
+    def test_health_probe_reports_fallback(self):
+        cache = self.make_cache('health')
+        FlakyCache.down = True
+        cache.set('key', 'value')
+        cache.set('key', 'value')
+        with mock.patch('django.core.cache.cache', cache):
+            snapshot = HealthProbeService(
+                config={'background_refresh': False}, probes=[HealthProbe('Cache', probe_cache, 'DEPS')]
+            ).run_probes()
+        self.assertEqual(snapshot['probes']['Cache']['status'], 'WARNING')
+        self.assertIn('Connection refused', snapshot['probes']['Cache']['message'])
+
+
+@app.task
+def add(x, y):
+    return x + y
+
+
+class BrokerCircuitTest(SimpleTestCase):
+    """Publishes fail fast while the broker cannot be reached; only eager mode runs in-process."""
+
+    def setUp(self):
+        broker_breaker.record_success()
+        self.addCleanup(broker_breaker.record_success)
+        always_eager = app.conf.task_always_eager
+        app.conf.task_always_eager = False
+        self.addCleanup(setattr, app.conf, 'task_always_eager', always_eager)
+
+    def test_fails_fast_when_publishing_fails(self):
+        with mock.patch('celery.app.task.Task.apply_async', side_effect=OperationalError('refused')) as apply_async:
+            with self.assertRaisesMessage(OperationalError, 'refused'):
+                add.delay(2, 3)
+            with self.assertRaisesMessage(OperationalError, 'Celery broker unreachable: refused'):
+                add.delay(1, 1)
+        # The breaker opened after the first failure; the second publish was not attempted
+        self.assertEqual(apply_async.call_count, 1)
+        self.assertEqual(broker_breaker.state, 'open')
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_callers_handle_the_error(self):
+        """A caller's own fallback runs again: exact database stats are reported as not pending."""
+        broker_breaker.record_failure(OperationalError('refused'))
+        with mock.patch('celery.app.task.Task.apply_async') as apply_async:
+            self.assertFalse(DatabaseStatsService().queue_exact())
+        apply_async.assert_not_called()
+
+    def test_eager_setting_runs_in_process(self):
+        app.conf.task_always_eager = True
+        broker_breaker.record_failure(OperationalError('refused'))
+        self.assertEqual(add.delay(2, 3).get(), 5)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk loading of equipment custom field values and the custom_attributes snapshot.
+"""
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from core.models import Location, EquipmentCategory
+from equipment.models import (
+    Equipment, EquipmentCategoryField, EquipmentCategoryConditionalField, prefetch_custom_values,
+)
+from equipment.templatetags.equipment_filters import get_custom_value
+
+
+class PrefetchCustomValuesTest(TestCase):
+    """Test that prefetch_custom_values matches the per-field lookups."""
+
+    def setUp(self):
+        """Set up transformers with native fields and a conditional field from switchgear."""
+        self.location = Location.objects.create(name='Field Site', is_site=True)
+        self.transformers = EquipmentCategory.objects.create(name='Transformers')
+        self.switchgear = EquipmentCategory.objects.create(name='Switchgear')
+        EquipmentCategoryField.objects.create(
+            category=self.transformers, name='oil_type', label='Oil Type', default_value='Mineral', sort_order=2,
+        )
+        EquipmentCategoryField.objects.create(
+            category=self.transformers, name='cooling', label='Cooling', field_type='boolean', sort_order=1,
+        )
+        EquipmentCategoryField.objects.create(
+            category=self.transformers, name='retired_field', label='Retired', is_active=False,
+        )
+        arc_flash = EquipmentCategoryField.objects.create(
+            category=self.switchgear, name='arc_flash', label='Arc Flash', default_value='Unknown', sort_order=5,
+        )
+        EquipmentCategoryConditionalField.objects.create(
+            source_category=self.switchgear, target_category=self.transformers, field=arc_flash,
+            override_label='Arc Flash Category', override_sort_order=3,
+        )
+
+        self.equipment = []
+        for i in range(3):
+            equipment = Equipment.objects.create(
+                name=f'TX-{i}', category=self.transformers, location=self.location,
+                manufacturer_serial=f'SN-TX-{i}', asset_tag=f'AT-TX-{i}',
+            )
+            self.equipment.append(equipment)
+        self.equipment[0].set_custom_value('oil_type', 'FR3')
+        self.equipment[0].set_custom_value('cooling', 'true')
+        self.equipment[1].set_conditional_value('arc_flash', 'Category 2')
+
+    def test_matches_per_field_lookups(self):
+        """Prefetched values and field lists equal the uncached methods."""
+        expected = [
+            (e.get_custom_values_dict(), e.get_conditional_value('arc_flash'), e.get_all_custom_fields())
+            for e in Equipment.objects.filter(id__in=[e.id for e in self.equipment]).order_by('name')
+        ]
+        equipment_list = prefetch_custom_values(
+            Equipment.objects.filter(id__in=[e.id for e in self.equipment]).order_by('name')
+        )
+
+        for equipment, (values, conditional_value, fields) in zip(equipment_list, expected):
+            self.assertEqual(equipment.get_custom_values_dict(), values)
+            self.assertEqual(equipment.get_conditional_value('arc_flash'), conditional_value)
+            self.assertEqual(
+                [(f['field'].id, f['effective_label'], f['is_conditional']) for f in equipment.get_all_custom_fields()],
+                [(f['field'].id, f['effective_label'], f['is_conditional']) for f in fields],
+            )
+        self.assertEqual(equipment_list[0].get_custom_values_dict(), {'cooling': 'Yes', 'oil_type': 'FR3'})
+        self.assertEqual(equipment_list[1].get_conditional_value('arc_flash'), 'Category 2')
+        self.assertEqual(equipment_list[2].get_conditional_value('arc_flash'), 'Unknown')
+
+    def test_two_queries_for_a_page(self):
+        """A page of equipment costs two queries; template filter lookups cost none."""
+        equipment_list = list(Equipment.objects.filter(id__in=[e.id for e in self.equipment]))
+        with self.assertNumQueries(2):
+            prefetch_custom_values(equipment_list)
+        with self.assertNumQueries(0):
+            for equipment in equipment_list:
+                get_custom_value(equipment, 'oil_type')
+                get_custom_value(equipment, 'retired_field')
+                equipment.get_all_custom_fields()
+
+    def test_set_value_drops_prefetched_data(self):
+        """Writing a value discards the stale prefetched values."""
+        equipment = prefetch_custom_values([self.equipment[2]])[0]
+        self.assertEqual(equipment.get_custom_value('oil_type'), 'Mineral')
+        equipment.set_custom_value('oil_type', 'Silicone')
+        self.assertEqual(equipment.get_custom_value('oil_type'), 'Silicone')
+
+
+class CustomAttributesTest(TestCase):
+    """Test the typed custom_attributes snapshot and equipment_list custom field filters."""
+
+    def setUp(self):
+        """Set up transformers with kVA ratings at two sites."""
+        self.user = User.objects.create_user(username='cfuser', password='testpass123')
+        self.client.login(username='cfuser', password='testpass123')
+        self.site_a = Location.objects.create(name='Site A', is_site=True)
+        self.site_b = Location.objects.create(name='Site B', is_site=True)
+        self.category = EquipmentCategory.objects.create(name='Transformers')
+        EquipmentCategoryField.objects.create(category=self.category, name='kva', label='kVA', field_type='number')
+        EquipmentCategoryField.objects.create(category=self.category, name='oil_type', label='Oil Type')
+        EquipmentCategoryField.objects.create(
+            category=self.category, name='sealed', label='Sealed', field_type='boolean',
+        )
+
+        self.units = {}
+        for name, location, kva, oil in [
+            ('TX-1', self.site_a, '1500', 'Mineral'),
+            ('TX-2', self.site_a, '3000', 'FR3'),
+            ('TX-3', self.site_a, '5000', 'Mineral'),
+            ('TX-4', self.site_b, '4000', 'Mineral'),
+        ]:
+            equipment = Equipment.objects.create(
+                name=name, category=self.category, location=location,
+                manufacturer_serial=f'SN-{name}', asset_tag=f'AT-{name}',
+            )
+            equipment.set_custom_value('kva', kva)
+            equipment.set_custom_value('oil_type', oil)
+            self.units[name] = equipment
+        self.units['TX-1'].set_custom_value('sealed', 'yes')
+
+    def list_names(self, **params):
+        response = self.client.get(reverse('equipment:equipment_list'), params)
+        self.assertEqual(response.status_code, 200)
+        return [equipment.name for equipment in response.context['page_obj']]
+
+    def test_snapshot_is_typed_and_synced(self):
+        """Values are stored with their field types and follow updates and deletes."""
+        tx1 = Equipment.objects.get(name='TX-1')
+        self.assertEqual(tx1.custom_attributes, {'kva': 1500, 'oil_type': 'Mineral', 'sealed': True})
+
+        tx1.custom_values.get(field__name='sealed').delete()
+        tx1.set_custom_value('kva', '1750')
+        tx1.refresh_from_db()
+        self.assertEqual(tx1.custom_attributes, {'kva': 1750, 'oil_type': 'Mineral'})
+
+        field = EquipmentCategoryField.objects.get(name='oil_type')
+        field.name = 'insulating_fluid'
+        field.save()
+        tx1.refresh_from_db()
+        self.assertEqual(tx1.custom_attributes, {'kva': 1750, 'insulating_fluid': 'Mineral'})
+
+    def test_equipment_list_custom_filters(self):
+        """Range and equality filters combine with the site filter; sort orders numerically."""
+        self.assertEqual(self.list_names(site_id=self.site_a.id, cf_kva__gt='2500'), ['TX-2', 'TX-3'])
+        self.assertEqual(self.list_names(site_id='all', cf_oil_type='Mineral', cf_kva__gte='4000'), ['TX-3', 'TX-4'])
+        self.assertEqual(self.list_names(site_id='all', cf_sealed='true'), ['TX-1'])
+        self.assertEqual(self.list_names(site_id='all', sort='-cf_kva'), ['TX-3', 'TX-4', 'TX-2', 'TX-1'])
+        # Unknown fields are reported and ignored
+        self.assertEqual(len(self.list_names(site_id='all', cf_missing='x')), 4)
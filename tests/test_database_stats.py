@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the estimated, cached database statistics.
+"""
+
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from core.models import Customer, Location
+from core.services.database_stats_service import DatabaseStatsService
+from equipment.models import Equipment
+from maintenance.models import MaintenanceActivity
+
+# SQLite's MAX(rowid) estimate is exact while nothing has been deleted; the
+# PostgreSQL statistics lag behind uncommitted test data
+EXACT_ESTIMATES = connection.vendor == 'sqlite'
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class DatabaseStatsServiceTest(TestCase):
+    """Test catalog estimates, grouped breakdowns, caching and exact counts."""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        site = Location.objects.create(name='North Site', is_site=True)
+        Location.objects.create(name='Hall A', is_site=False, parent_location=site)
+        Location.objects.create(name='Hall B', is_site=False, parent_location=site, is_active=False)
+        Customer.objects.create(name='Acme')
+
+    def test_estimates_are_cached(self):
+        service = DatabaseStatsService()
+        stats = service.get_stats()
+        self.assertTrue(stats['tables']['Locations']['estimated'])
+        self.assertIsInstance(stats['tables']['Locations']['count'], int)
+        if EXACT_ESTIMATES:
+            self.assertEqual(stats['tables']['Locations']['count'], 3)
+            self.assertEqual(stats['tables']['Customers']['count'], 1)
+        self.assertIsNotNone(stats['database_size'])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(service.get_stats()['tables'], stats['tables'])
+
+    def test_breakdowns_use_one_query_per_table(self):
+        service = DatabaseStatsService()
+        grouped = [table for table in service.tables if table[2] or table[3]]
+        with self.assertNumQueries(len(grouped)):
+            breakdowns = service.breakdowns()
+        self.assertEqual(set(breakdowns), {label for label, _, _, _ in grouped})
+        self.assertEqual(breakdowns['Locations'], {'total': 3, 'is_site': {True: 1, False: 2}, 'is_active': {True: 2, False: 1}})
+        self.assertEqual(breakdowns['Calendar Events'], {'total': 0, 'recent': 0})
+
+        stats = service.get_stats(breakdowns=True)
+        self.assertFalse(stats['tables']['Locations']['estimated'])
+        self.assertTrue(stats['tables']['Users']['estimated'])
+
+    def test_exact_counts_run_in_background(self):
+        service = DatabaseStatsService()
+        with mock.patch('core.tasks.refresh_exact_database_stats.delay') as delay:
+            self.assertTrue(service.get_stats(exact=True)['exact_pending'])
+            self.assertTrue(service.get_stats(exact=True)['exact_pending'])
+        delay.assert_called_once_with('default')
+
+        service.refresh_exact()
+        stats = service.get_stats(exact=True)
+        self.assertFalse(stats['exact_pending'])
+        self.assertEqual(stats['tables']['Locations'], {**stats['tables']['Locations'], 'count': 3, 'estimated': False})
+
+    def test_api(self):
+        self.client.force_login(User.objects.create_superuser(username='admin', password='pw', email='a@example.com'))
+        data = self.client.get(reverse('core:database_stats_api')).json()
+        self.assertEqual(data['status'], 'success')
+        locations = data['tables']['Locations']
+        self.assertEqual(set(locations), {'count', 'size', 'estimated'})
+        self.assertTrue(locations['estimated'])
+        self.assertIsInstance(locations['count'], int)
+        if EXACT_ESTIMATES:
+            self.assertEqual(locations, {'count': 3, 'size': None, 'estimated': True})
+
+    def test_postgresql_estimates(self):
+        """Tracked empty tables count 0; tables with no usable statistics are counted exactly."""
+        rows = [
+            # (relname, reltuples, n_live_tup, n_tup_ins + n_tup_del, size)
+            (MaintenanceActivity._meta.db_table, -1, 12, 12, '64 kB'),
+            (Equipment._meta.db_table, -1, 0, 4, '16 kB'),
+            (Customer._meta.db_table, 7, 0, 0, '16 kB'),
+            (Location._meta.db_table, -1, 0, 0, '8192 bytes'),
+        ]
+        service = DatabaseStatsService()
+        fake = mock.MagicMock(vendor='postgresql')
+        fake.cursor.return_value.__enter__.return_value.fetchall.return_value = rows
+        with mock.patch.object(DatabaseStatsService, 'connection', fake):
+            estimates = service.estimate_counts()
+
+        self.assertEqual(estimates[MaintenanceActivity._meta.db_table], {'count': 12, 'size': '64 kB'})
+        self.assertEqual(estimates[Equipment._meta.db_table]['count'], 0)
+        self.assertEqual(estimates[Customer._meta.db_table]['count'], 7)
+        self.assertEqual(estimates[Location._meta.db_table], {'count': 3, 'size': '8192 bytes'})
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Tests for the Docker Engine API log collector, against a fake daemon on a unix socket.
+"""
+
+import json
+import os
+import shutil
+import socketserver
+import struct
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlparse
+from django.test import SimpleTestCase
+from core.log_tail import not_header, tail_lines
+from core.services.docker_log_collector import DockerLogCollector, iter_log_frames, parse_timestamp
+
+BASE = '2026-10-19T05:00:00.{:09d}Z'
+
+
+def frame(stream, text):
+    data = text.encode('utf-8')
+    return struct.pack('>BxxxL', stream, len(data)) + data
+
+
+class FakeDockerHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        daemon = self.server.daemon
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        daemon.requests.append((url.path, query))
+        if url.path == '/containers/json':
+            self.reply(json.dumps(daemon.containers).encode(), 'application/json')
+            return
+        container_id = url.path.split('/')[2]
+        if container_id not in daemon.logs:
+            self.reply(b'{"message": "No such container"}', 'application/json', status=404)
+            return
+        entries = daemon.logs[container_id]
+        if 'since' in query:
+            since = int(query['since'][0].replace('.', ''))
+            entries = [e for e in entries if parse_timestamp(e[1]) >= since]
+        elif 'tail' in query:
+            entries = entries[-int(query['tail'][0]):]
+        body = b''.join(frame(stream, f'{stamp} {text}\n') for stream, stamp, text in entries)
+        self.reply(body, 'application/vnd.docker.multiplexed-stream')
+
+    def reply(self, body, content_type, status=200):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeDockerDaemon:
+    def __init__(self, socket_path):
+        self.containers = []
+        self.logs = {}
+        self.requests = []
+        self.server = socketserver.ThreadingUnixStreamServer(socket_path, FakeDockerHandler)
+        self.server.daemon = self
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def add_container(self, container_id, name, lines=0):
+        self.containers.append({'Id': container_id, 'Names': [f'/{name}'], 'Image': f'{name}:latest'})
+        self.logs[container_id] = []
+        self.write(container_id, lines)
+
+    def write(self, container_id, count):
+        entries = self.logs[container_id]
+        for _ in range(count):
+            index = len(entries)
+            entries.append((2 if index % 5 == 4 else 1, BASE.format(index * 1000), f'{container_id} line {index}'))
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class DockerLogCollectorTest(SimpleTestCase):
+    """Test incremental, concurrent collection from the Engine API."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.logs_dir = os.path.join(self.directory, 'logs')
+        self.daemon = FakeDockerDaemon(os.path.join(self.directory, 'docker.sock'))
+        self.addCleanup(self.daemon.stop)
+
+    def collector(self, **config):
+        collector = DockerLogCollector(config={
+            'socket_path': os.path.join(self.directory, 'docker.sock'), 'logs_dir': self.logs_dir,
+            'workers': 4, 'initial_tail': 3, **config,
+        })
+        self.addCleanup(collector.client.close)
+        return collector
+
+    def lines(self, name):
+        return [line.rstrip('\n') for line in tail_lines(os.path.join(self.logs_dir, f'{name}.log'), 0, keep=not_header)]
+
+    def test_incremental_collection(self):
+        """The first run takes the tail; later runs append only newer lines, across all containers."""
+        for index in range(6):
+            self.daemon.add_container(f'c{index}', f'app{index}', lines=5)
+
+        summary = self.collector().collect()
+        self.assertEqual(summary['containers_successful'], 6)
+        self.assertEqual(summary['lines_collected'], 18)
+        self.assertEqual(self.lines('app0'), [
+            '[2026-10-19 05:00:00] [STDOUT] c0 line 2',
+            '[2026-10-19 05:00:00] [STDOUT] c0 line 3',
+            '[2026-10-19 05:00:00] [STDERR] c0 line 4',
+        ])
+
+        self.daemon.write('c0', 2)
+        summary = self.collector().collect()
+        self.assertEqual(summary['lines_collected'], 2)
+        self.assertEqual([line[-9:] for line in self.lines('app0')], ['c0 line 2', 'c0 line 3', 'c0 line 4', 'c0 line 5', 'c0 line 6'])
+        self.assertEqual(self.lines('app1')[-1][-9:], 'c1 line 4')
+
+        # The cursor was sent back as ``since``
+        since = [query['since'][0] for path, query in self.daemon.requests if path == '/containers/c0/logs' and 'since' in query]
+        self.assertEqual(since, ['1792386000.000004000'])
+
+        with open(os.path.join(self.logs_dir, 'collection_summary.json')) as f:
+            self.assertEqual(json.load(f)['results']['app0']['file'], os.path.join(self.logs_dir, 'app0.log'))
+
+    def test_failures_and_rotation(self):
+        """A failing container does not stop the others; large files are rotated."""
+        self.daemon.add_container('good', 'good', lines=3)
+        self.daemon.containers.append({'Id': 'gone', 'Names': ['/gone'], 'Image': 'gone'})
+
+        collector = self.collector(max_bytes=400, backups=2)
+        summary = collector.collect()
+        self.assertEqual(summary['results']['gone'], {'status': 'error', 'error': '404 No such container'})
+        self.assertEqual(summary['results']['good']['lines'], 3)
+
+        for _ in range(3):
+            self.daemon.write('good', 4)
+            collector.collect()
+        log_file = os.path.join(self.logs_dir, 'good.log')
+        self.assertTrue(os.path.exists(log_file + '.1'))
+        self.assertFalse(os.path.exists(log_file + '.3'))
+        self.assertLessEqual(os.path.getsize(log_file), 400)
+        self.assertTrue(self.lines('good')[-1].endswith('good line 14'))
+        with open(log_file) as f:
+            self.assertTrue(f.readline().startswith('# Container: good'))
+
+    def test_frames(self):
+        """Lines split across frames are joined per stream; raw TTY output is read as stdout."""
+        body = frame(1, 'par') + frame(2, 'err\n') + frame(1, 'tial\nnext')
+        self.assertEqual(
+            iter_log_frames(body, 'application/vnd.docker.multiplexed-stream'),
+            [('STDERR', 'err'), ('STDOUT', 'partial'), ('STDOUT', 'next')],
+        )
+        self.assertEqual(iter_log_frames(b'tty one\ntty two\n'), [('STDOUT', 'tty one'), ('STDOUT', 'tty two')])
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for the equipment detail page data assembly.
+"""
+
+from datetime import timedelta
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from core.models import Location, EquipmentCategory
+from equipment.detail import DETAIL_SELECT_RELATED, build_equipment_detail_context, location_path
+from equipment.models import Equipment, EquipmentIssue, IssueTag
+from maintenance.models import MaintenanceActivity, MaintenanceActivityType, MaintenanceReport, ActivityTypeCategory
+
+
+class EquipmentDetailQueriesTest(TestCase):
+    """Test that the detail page costs a fixed number of queries."""
+
+    def setUp(self):
+        """Set up a transformer in a nested location with an activity type to log work against."""
+        self.user = User.objects.create_user(username='detailuser', password='testpass123', is_staff=True)
+        self.client.login(username='detailuser', password='testpass123')
+        site = Location.objects.create(name='Site', is_site=True)
+        pod = Location.objects.create(name='POD 1', parent_location=site)
+        mdc = Location.objects.create(name='MDC A', parent_location=pod)
+        self.equipment = Equipment.objects.create(
+            name='TX-1', category=EquipmentCategory.objects.create(name='Transformers'), location=mdc,
+            manufacturer_serial='SN-TX-1', asset_tag='AT-TX-1',
+        )
+        self.activity_type = MaintenanceActivityType.objects.create(
+            name='Inspection',
+            category=ActivityTypeCategory.objects.create(name='Preventive'),
+            frequency_days=30,
+        )
+        self.tag = IssueTag.objects.create(name='Oil leak')
+
+    def add_history(self, count, statuses=('completed', 'pending', 'overdue')):
+        """Add ``count`` activities, each with a report and an issue."""
+        now = timezone.now()
+        activities = MaintenanceActivity.objects.bulk_create([
+            MaintenanceActivity(
+                equipment=self.equipment,
+                activity_type=self.activity_type,
+                title=f'Inspection {i}',
+                status=statuses[i % len(statuses)],
+                scheduled_start=now - timedelta(days=i),
+                scheduled_end=now - timedelta(days=i) + timedelta(hours=1),
+                actual_end=now - timedelta(days=i) if statuses[i % len(statuses)] == 'completed' else None,
+            )
+            for i in range(count)
+        ])
+        MaintenanceReport.objects.bulk_create([
+            MaintenanceReport(maintenance_activity=activity, title=f'Report {activity.title}', file='r.pdf')
+            for activity in activities
+        ])
+        for i in range(count):
+            issue = EquipmentIssue.objects.create(
+                equipment=self.equipment, title=f'Issue {i}', status=('open', 'resolved')[i % 2],
+                created_by=self.user,
+            )
+            issue.tags.add(self.tag)
+
+    def count_page_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('equipment:equipment_detail', args=[self.equipment.id]))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_summary_counts(self):
+        """Status, report and issue counts come out of the consolidated queries."""
+        self.add_history(6)
+        context = build_equipment_detail_context(Equipment.objects.get(id=self.equipment.id))
+
+        self.assertEqual(
+            (context['completed_count'], context['pending_count'], context['overdue_count']), (2, 2, 2)
+        )
+        self.assertEqual(context['maintenance_status'], '2 pending maintenance activities')
+        self.assertEqual(context['last_maintenance'], timezone.now().date())
+        self.assertEqual(context['maintenance_docs_count'], 6)
+        self.assertEqual((context['open_issues_count'], context['resolved_issues_count']), (3, 3))
+        self.assertEqual(len(context['issues']), 6)
+
+    def test_query_count_does_not_grow_with_history(self):
+        """Rendering the page with 20 activities costs the same as with 2."""
+        self.add_history(2)
+        small = self.count_page_queries()
+        self.add_history(18)
+        self.assertEqual(self.count_page_queries(), small)
+
+    def test_deep_location_path(self):
+        """Ancestors past the select_related depth are fetched one small query per level."""
+        self.add_history(2)
+        shallow = self.count_page_queries()
+        parent = self.equipment.location
+        for name in ('Room 1', 'Rack 4', 'Shelf 2'):
+            parent = Location.objects.create(name=name, parent_location=parent)
+        Equipment.objects.filter(id=self.equipment.id).update(location=parent)
+
+        # POD 1 and Site lie beyond the select_related chain
+        self.assertEqual(self.count_page_queries(), shallow + 2)
+        context = build_equipment_detail_context(
+            Equipment.objects.select_related(*DETAIL_SELECT_RELATED).get(id=self.equipment.id)
+        )
+        self.assertEqual(context['location_path'], 'Site > POD 1 > MDC A > Room 1 > Rack 4 > Shelf 2')
+
+    def test_location_path_without_select_related(self):
+        """A plain get (as in edit_equipment) walks only the equipment's own ancestors."""
+        Location.objects.create(name='Unrelated Site', is_site=True)
+        equipment = Equipment.objects.get(id=self.equipment.id)
+        with self.assertNumQueries(3):
+            self.assertEqual(location_path(equipment.location), 'Site > POD 1 > MDC A')
+        with self.assertNumQueries(0):
+            location_path(equipment.location)
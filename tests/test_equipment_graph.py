@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-memory equipment dependency graph.
+"""
+
+import json
+from datetime import timedelta
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from core.models import Customer, Location, EquipmentCategory
+from equipment.models import Equipment, EquipmentConnection
+from equipment.graph import (
+    EquipmentGraph, bulk_create_connections, get_equipment_graph, invalidate_equipment_graph, would_create_cycle,
+)
+from maintenance.models import MaintenanceActivity, MaintenanceActivityType, ActivityTypeCategory
+
+# The query-count assertions assume a cache that does not itself hit the database
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class GraphFixtureMixin:
+    """Shared one-line fixture for graph tests."""
+
+    def setUp(self):
+        """Set up a utility -> transformer -> panel -> load one-line."""
+        self.location = Location.objects.create(name='Graph Site', is_site=True)
+        self.category = EquipmentCategory.objects.create(name='Electrical')
+        self.utility = self.create_equipment('Utility')
+        self.transformer = self.create_equipment('TX')
+        self.panel = self.create_equipment('Panel')
+        self.load = self.create_equipment('Load')
+        self.backup = self.create_equipment('Backup')
+        self.connect(self.utility, self.transformer)
+        self.connect(self.transformer, self.panel)
+        self.connect(self.panel, self.load)
+        self.connect(self.backup, self.panel, is_critical=False)
+        invalidate_equipment_graph()
+
+    def create_equipment(self, name, status='active'):
+        return Equipment.objects.create(
+            name=name,
+            category=self.category,
+            location=self.location,
+            status=status,
+            manufacturer_serial=f'SN-{name}',
+            asset_tag=f'AT-{name}',
+        )
+
+    def connect(self, upstream, downstream, is_critical=True):
+        return EquipmentConnection.objects.create(
+            upstream_equipment=upstream,
+            downstream_equipment=downstream,
+            is_critical=is_critical,
+        )
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class EquipmentGraphTest(GraphFixtureMixin, TestCase):
+    """Test cascade status and traversals over the dependency graph."""
+
+    def test_cascade_offline_propagation(self):
+        """Critical downstream equipment of offline equipment is cascade offline."""
+        Equipment.objects.filter(id=self.transformer.id).update(status='maintenance')
+        statuses = EquipmentGraph.build().effective_statuses()
+
+        self.assertEqual(statuses[self.utility.id], 'active')
+        self.assertEqual(statuses[self.transformer.id], 'maintenance')
+        self.assertEqual(statuses[self.panel.id], 'cascade_offline')
+        self.assertEqual(statuses[self.load.id], 'cascade_offline')
+        self.assertEqual(statuses[self.backup.id], 'active')
+
+    def test_downstream_impact_and_upstream_path(self):
+        """Impact follows critical edges only; upstream_path explains the cascade."""
+        graph = EquipmentGraph.build()
+        self.assertEqual(graph.downstream_impact([self.utility.id]), [self.transformer.id, self.panel.id, self.load.id])
+        self.assertEqual(graph.downstream_impact([self.backup.id]), [])
+
+        Equipment.objects.filter(id=self.utility.id).update(status='inactive')
+        graph = EquipmentGraph.build()
+        self.assertEqual(graph.upstream_path(self.load.id), [self.utility.id, self.transformer.id, self.panel.id, self.load.id])
+
+    def test_model_methods_use_cached_graph(self):
+        """Equipment methods answer from the cached graph without per-hop queries."""
+        get_equipment_graph()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.load.get_effective_status(), 'active')
+        self.assertEqual(
+            [equipment.id for equipment in self.utility.get_all_affected_downstream()],
+            [self.transformer.id, self.panel.id, self.load.id],
+        )
+
+    def test_status_change_invalidates_graph(self):
+        """Saving a status change rebuilds the cached graph after commit."""
+        self.assertEqual(self.load.get_effective_status(), 'active')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.transformer.status = 'maintenance'
+            self.transformer.save()
+        self.assertEqual(self.load.get_effective_status(), 'cascade_offline')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            EquipmentConnection.objects.filter(downstream_equipment=self.panel, upstream_equipment=self.transformer).delete()
+        self.assertEqual(self.load.get_effective_status(), 'active')
+
+
+class ConnectionCycleTest(GraphFixtureMixin, TestCase):
+    """Test cycle validation for single and bulk connection writes."""
+
+    def test_clean_rejects_cycle_with_at_most_one_query(self):
+        """A connection closing a loop is rejected without per-hop queries."""
+        connection = EquipmentConnection(upstream_equipment=self.load, downstream_equipment=self.utility)
+        with self.assertNumQueries(1):
+            self.assertTrue(connection._creates_circular_dependency())
+        with self.assertRaises(ValidationError):
+            connection.clean()
+        self.assertFalse(would_create_cycle(self.utility.id, self.load.id))
+
+    def test_uncommitted_connection_is_seen(self):
+        """Connections added earlier in the same transaction count towards cycles."""
+        get_equipment_graph()
+        extra = self.create_equipment('Extra')
+        self.connect(self.load, extra)
+        self.assertTrue(would_create_cycle(extra.id, self.utility.id))
+
+    def test_bulk_create_validates_in_one_pass(self):
+        """Bulk import rejects duplicates, self-loops and cycles formed within the batch."""
+        a = self.create_equipment('A')
+        b = self.create_equipment('B')
+        with self.assertNumQueries(5):
+            created, errors = bulk_create_connections([
+                {'upstream_id': self.load.id, 'downstream_id': a.id},
+                {'upstream_id': a.id, 'downstream_id': b.id, 'is_critical': False},
+                {'upstream_id': b.id, 'downstream_id': self.utility.id},
+                {'upstream_id': a.id, 'downstream_id': a.id},
+                {'upstream_id': self.utility.id, 'downstream_id': self.transformer.id},
+            ])
+
+        self.assertEqual(len(created), 2)
+        self.assertEqual([index for index, _ in errors], [2, 3, 4])
+        self.assertIn('circular', errors[0][1])
+        self.assertTrue(EquipmentConnection.objects.filter(upstream_equipment=a, downstream_equipment=b, is_critical=False).exists())
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ConnectionRollbackTest(GraphFixtureMixin, TransactionTestCase):
+    """Test that rolled-back connection writes stop bypassing the cached graph."""
+
+    def test_rollback_restores_cached_checks(self):
+        extra = self.create_equipment('Extra')
+        get_equipment_graph()
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.connect(self.load, extra)
+                with self.assertNumQueries(1):
+                    self.assertTrue(would_create_cycle(extra.id, self.utility.id))
+                raise RuntimeError('form save failed')
+
+        with transaction.atomic():
+            with self.assertNumQueries(0):
+                self.assertFalse(would_create_cycle(extra.id, self.utility.id))
+
+        # A rolled-back savepoint drops its writes the same way
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    self.connect(self.load, extra)
+                    raise RuntimeError('row rejected')
+            except RuntimeError:
+                pass
+            with self.assertNumQueries(0):
+                self.assertFalse(would_create_cycle(extra.id, self.utility.id))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class OutageSimulationTest(GraphFixtureMixin, TestCase):
+    """Test the what-if outage simulation API."""
+
+    def setUp(self):
+        """Add a second customer's site fed from the same utility."""
+        super().setUp()
+        self.user = User.objects.create_user(username='planner', password='testpass123')
+        self.customer = Customer.objects.create(name='Acme')
+        Location.objects.filter(id=self.location.id).update(customer=self.customer)
+        self.other_site = Location.objects.create(name='Other Site', is_site=True)
+        self.room = Location.objects.create(name='Room', parent_location=self.other_site)
+        self.remote = Equipment.objects.create(
+            name='Remote',
+            category=self.category,
+            location=self.room,
+            manufacturer_serial='SN-Remote',
+            asset_tag='AT-Remote',
+        )
+        self.connect(self.transformer, self.remote)
+        invalidate_equipment_graph()
+        self.client.login(username='planner', password='testpass123')
+
+    def post(self, payload):
+        return self.client.post(
+            reverse('equipment:simulate_outage'),
+            data=json.dumps(payload),
+            content_type='application/json',
+        )
+
+    def test_simulation_impact_and_overlaps(self):
+        """Affected equipment, per-site/customer counts and overlapping work are reported."""
+        start = timezone.now() + timedelta(days=1)
+        end = start + timedelta(hours=8)
+        activity_type = MaintenanceActivityType.objects.create(
+            name='IR Scan',
+            category=ActivityTypeCategory.objects.create(name='Predictive'),
+            frequency_days=90,
+        )
+        overlapping = MaintenanceActivity.objects.create(
+            equipment=self.panel,
+            activity_type=activity_type,
+            title='Panel IR scan',
+            scheduled_start=start + timedelta(hours=2),
+            scheduled_end=start + timedelta(hours=3),
+        )
+        MaintenanceActivity.objects.create(
+            equipment=self.panel,
+            activity_type=activity_type,
+            title='Next week',
+            scheduled_start=start + timedelta(days=7),
+            scheduled_end=start + timedelta(days=7, hours=1),
+        )
+
+        get_equipment_graph()
+        # Session + user, then equipment, locations, site names, customer names, activities
+        with self.assertNumQueries(7):
+            response = self.post({
+                'equipment_ids': [self.transformer.id, 999999],
+                'start': start.isoformat(),
+                'end': end.isoformat(),
+            })
+        data = response.json()
+
+        self.assertEqual(data['status'], 'success')
+        self.assertEqual(
+            {entry['id'] for entry in data['affected']},
+            {self.panel.id, self.load.id, self.remote.id},
+        )
+        self.assertEqual(data['unknown_ids'], [999999])
+        by_site = {row['id']: row for row in data['impact_by_site']}
+        self.assertEqual(by_site[self.location.id]['seeds'], 1)
+        self.assertEqual(by_site[self.location.id]['affected'], 2)
+        self.assertEqual(by_site[self.other_site.id]['affected'], 1)
+        by_customer = {row['id']: row for row in data['impact_by_customer']}
+        self.assertEqual(by_customer[self.customer.id]['name'], 'Acme')
+        self.assertEqual(by_customer[None]['affected'], 1)
+        self.assertEqual([row['activity_id'] for row in data['maintenance_overlaps']], [overlapping.id])
+
+    def test_simulation_requires_equipment(self):
+        """An empty seed list is rejected."""
+        response = self.post({'equipment_ids': []})
+        self.assertEqual(response.status_code, 400)
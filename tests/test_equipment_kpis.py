@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Tests for set-based equipment KPI computation and KPI snapshots.
+"""
+
+from datetime import timedelta
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth.models import User
+from django.utils import timezone
+from core.models import Location, EquipmentCategory
+from equipment.models import Equipment, EquipmentKPISnapshot
+from equipment.kpis import rank_snapshots, refresh_kpi_snapshots, get_kpi_snapshot
+from maintenance.models import MaintenanceActivity, MaintenanceActivityType, ActivityTypeCategory
+
+
+class EquipmentKPISnapshotTest(TestCase):
+    """Test KPI aggregation and snapshot refresh."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(username='kpiuser', password='testpass123')
+        self.location = Location.objects.create(name='KPI Site', is_site=True)
+        self.category = EquipmentCategory.objects.create(name='Transformers')
+        self.equipment = Equipment.objects.create(
+            name='TX-1',
+            category=self.category,
+            location=self.location,
+            manufacturer_serial='SN-KPI-1',
+            asset_tag='AT-KPI-1',
+        )
+        activity_category = ActivityTypeCategory.objects.create(name='Preventive')
+        self.activity_type = MaintenanceActivityType.objects.create(
+            name='T-A-1',
+            category=activity_category,
+            frequency_days=30,
+        )
+        self.base = timezone.now() - timedelta(days=100)
+
+    def create_activity(self, day, status='completed', late_hours=0, duration_hours=2):
+        scheduled_start = self.base + timedelta(days=day)
+        scheduled_end = scheduled_start + timedelta(hours=2)
+        actual_start = actual_end = None
+        if status == 'completed':
+            actual_end = scheduled_end + timedelta(hours=late_hours)
+            actual_start = actual_end - timedelta(hours=duration_hours)
+        return MaintenanceActivity.objects.create(
+            equipment=self.equipment,
+            activity_type=self.activity_type,
+            title=f'Activity day {day}',
+            status=status,
+            scheduled_start=scheduled_start,
+            scheduled_end=scheduled_end,
+            actual_start=actual_start,
+            actual_end=actual_end,
+            created_by=self.user,
+        )
+
+    def test_snapshot_values(self):
+        """KPIs match the per-activity definitions."""
+        self.create_activity(0, duration_hours=2)
+        self.create_activity(10, late_hours=48, duration_hours=4)
+        self.create_activity(30, duration_hours=3)
+        self.create_activity(40, status='scheduled')
+
+        snapshot = refresh_kpi_snapshots([self.equipment.id])[self.equipment.id]
+
+        self.assertEqual(snapshot.total_activities, 4)
+        self.assertEqual(snapshot.completed_count, 3)
+        self.assertEqual(snapshot.on_time_count, 2)
+        self.assertAlmostEqual(snapshot.completion_rate, 75.0)
+        self.assertAlmostEqual(snapshot.on_time_rate, 200 / 3)
+        self.assertAlmostEqual(snapshot.avg_duration_hours, 3.0)
+        self.assertAlmostEqual(snapshot.total_downtime_hours, 9.0)
+        # Completions at day 0, day 12 (48h late) and day 30
+        self.assertAlmostEqual(snapshot.avg_time_between_days, 15.0)
+
+    def test_equipment_without_activities(self):
+        """Equipment with no activities gets an empty snapshot."""
+        snapshot = get_kpi_snapshot(self.equipment)
+
+        self.assertEqual(snapshot.total_activities, 0)
+        self.assertIsNone(snapshot.completion_rate)
+        self.assertIsNone(snapshot.on_time_rate)
+        self.assertIsNone(snapshot.avg_duration_hours)
+        self.assertIsNone(snapshot.avg_time_between_days)
+        self.assertEqual(EquipmentKPISnapshot.objects.count(), 1)
+
+    def test_snapshot_refreshed_on_activity_completion(self):
+        """Completing an activity refreshes the stored snapshot."""
+        activity = self.create_activity(0, status='scheduled')
+        with self.captureOnCommitCallbacks(execute=True):
+            activity.status = 'completed'
+            activity.actual_start = activity.scheduled_start
+            activity.actual_end = activity.scheduled_end
+            activity.save()
+
+        snapshot = EquipmentKPISnapshot.objects.get(equipment=self.equipment)
+        self.assertEqual(snapshot.completed_count, 1)
+        self.assertEqual(snapshot.completion_rate, 100)
+
+
+class FleetKPIRankingTest(TestCase):
+    """Test fleet-wide KPI rollup and ranking."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(username='fleetuser', password='testpass123')
+        self.site = Location.objects.create(name='Fleet Site', is_site=True)
+        self.room = Location.objects.create(name='Room 1', parent_location=self.site)
+        self.transformers = EquipmentCategory.objects.create(name='Transformers')
+        self.breakers = EquipmentCategory.objects.create(name='Breakers')
+        activity_category = ActivityTypeCategory.objects.create(name='Preventive')
+        self.activity_type = MaintenanceActivityType.objects.create(
+            name='F-A-1',
+            category=activity_category,
+            frequency_days=30,
+        )
+        self.base = timezone.now() - timedelta(days=60)
+
+    def create_equipment(self, name, category, late_completions, on_time_completions):
+        equipment = Equipment.objects.create(
+            name=name,
+            category=category,
+            location=self.room,
+            manufacturer_serial=f'SN-{name}',
+            asset_tag=f'AT-{name}',
+        )
+        for index in range(late_completions + on_time_completions):
+            scheduled_end = self.base + timedelta(days=index)
+            late = index < late_completions
+            MaintenanceActivity.objects.create(
+                equipment=equipment,
+                activity_type=self.activity_type,
+                title=f'{name} activity {index}',
+                status='completed',
+                scheduled_start=scheduled_end - timedelta(hours=2),
+                scheduled_end=scheduled_end,
+                actual_start=scheduled_end - timedelta(hours=2),
+                actual_end=scheduled_end + timedelta(days=3 if late else 0),
+                created_by=self.user,
+            )
+        return equipment
+
+    def test_rollup_resolves_site_category_and_open_issues(self):
+        """Fleet refresh stores the equipment's site, category and open issues."""
+        from equipment.models import EquipmentIssue
+        equipment = self.create_equipment('TX-A', self.transformers, 0, 1)
+        EquipmentIssue.objects.create(equipment=equipment, title='Leak', description='Oil leak')
+        EquipmentIssue.objects.create(equipment=equipment, title='Old', description='Done', status='closed')
+
+        snapshot = refresh_kpi_snapshots()[equipment.id]
+
+        self.assertEqual(snapshot.site_id, self.site.id)
+        self.assertEqual(snapshot.category_id, self.transformers.id)
+        self.assertEqual(snapshot.open_issue_count, 1)
+
+    def test_ranking_api_filters_and_orders(self):
+        """The ranking API returns the worst equipment in a category first."""
+        worst = self.create_equipment('TX-W', self.transformers, 3, 1)
+        best = self.create_equipment('TX-B', self.transformers, 0, 2)
+        self.create_equipment('BR-1', self.breakers, 4, 0)
+        refresh_kpi_snapshots()
+
+        self.client.login(username='fleetuser', password='testpass123')
+        response = self.client.get(reverse('equipment:fleet_kpi_ranking'), {
+            'kpi': 'on_time_rate',
+            'category': self.transformers.id,
+            'items_per_page': 50,
+        })
+
+        data = response.json()
+        self.assertEqual(data['status'], 'success')
+        self.assertEqual([row['equipment_id'] for row in data['results']], [worst.id, best.id])
+        self.assertAlmostEqual(data['results'][0]['on_time_rate'], 25.0)
+        self.assertEqual(data['pagination']['total_records'], 2)
+
+    def test_equipment_without_completions_ranks_last(self):
+        """Equipment with no completed activities has no on-time rate and sorts after every rated one."""
+        rated = self.create_equipment('TX-R', self.transformers, 1, 0)
+        unrated = self.create_equipment('TX-U', self.transformers, 0, 0)
+        MaintenanceActivity.objects.create(
+            equipment=unrated,
+            activity_type=self.activity_type,
+            title='TX-U scheduled',
+            status='scheduled',
+            scheduled_start=self.base,
+            scheduled_end=self.base + timedelta(hours=2),
+            created_by=self.user,
+        )
+        refresh_kpi_snapshots()
+
+        self.assertIsNone(EquipmentKPISnapshot.objects.get(equipment=unrated).on_time_rate)
+        for descending in (False, True):
+            ranked = [snapshot.equipment_id for snapshot in rank_snapshots('on_time_rate', descending=descending)]
+            self.assertEqual(ranked, [rated.id, unrated.id])
+
+    def test_ranking_api_clamps_page_size(self):
+        """items_per_page below 1 is clamped; non-integers are rejected."""
+        self.create_equipment('TX-A', self.transformers, 0, 1)
+        refresh_kpi_snapshots()
+        self.client.login(username='fleetuser', password='testpass123')
+        url = reverse('equipment:fleet_kpi_ranking')
+
+        data = self.client.get(url, {'items_per_page': 0}).json()
+        self.assertEqual((data['status'], data['pagination']['items_per_page']), ('success', 1))
+        self.assertEqual(self.client.get(url, {'items_per_page': 'ten'}).status_code, 400)
+
+    def test_targeted_refresh_loads_only_the_location_chain(self):
+        """Refreshing one equipment item does not scan the whole Location table."""
+        equipment = self.create_equipment('TX-A', self.transformers, 0, 1)
+        for index in range(5):
+            Location.objects.create(name=f'Other {index}', is_site=True)
+
+        with CaptureQueriesContext(connection) as queries:
+            snapshot = refresh_kpi_snapshots([equipment.id])[equipment.id]
+        self.assertEqual(snapshot.site_id, self.site.id)
+        location_queries = [q['sql'] for q in queries.captured_queries if 'core_location' in q['sql']]
+        # Room 1, then its parent site
+        self.assertEqual(len(location_queries), 2)
+        self.assertTrue(all('WHERE' in sql for sql in location_queries))
+
+    def test_ranking_api_rejects_unknown_kpi(self):
+        """Only whitelisted KPI columns can be ranked."""
+        self.client.login(username='fleetuser', password='testpass123')
+        response = self.client.get(reverse('equipment:fleet_kpi_ranking'), {'kpi': 'equipment__name'})
+        self.assertEqual(response.status_code, 400)
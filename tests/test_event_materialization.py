@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk calendar-event materialization.
+"""
+
+from datetime import timedelta
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.utils import timezone
+from core.models import Location, EquipmentCategory
+from equipment.models import Equipment
+from events.models import CalendarEvent
+from events.tasks import generate_maintenance_events
+from maintenance.models import MaintenanceActivity, MaintenanceActivityType, ActivityTypeCategory
+
+
+class GenerateMaintenanceEventsTest(TestCase):
+    """Test batched, idempotent event generation."""
+
+    def setUp(self):
+        location = Location.objects.create(name='Event Site', is_site=True)
+        self.equipment = Equipment.objects.create(
+            name='TX-1', category=EquipmentCategory.objects.create(name='Transformers'), location=location,
+            manufacturer_serial='SN-TX-1', asset_tag='AT-TX-1',
+        )
+        activity_type = MaintenanceActivityType.objects.create(
+            name='Inspection', category=ActivityTypeCategory.objects.create(name='Preventive'), frequency_days=30,
+        )
+        self.planner = User.objects.create_user(username='planner')
+        self.tech = User.objects.create_user(username='tech')
+        start = timezone.now() + timedelta(days=3)
+        self.activities = MaintenanceActivity.objects.bulk_create([
+            MaintenanceActivity(
+                equipment=self.equipment, activity_type=activity_type, title=f'Inspection {i}',
+                status='completed' if i == 0 else 'scheduled', assigned_to=self.tech, created_by=self.planner,
+                scheduled_start=start + timedelta(days=i), scheduled_end=start + timedelta(days=i, hours=2),
+            )
+            for i in range(6)
+        ])
+        CalendarEvent.objects.create(
+            title='Existing', event_type='maintenance', equipment=self.equipment,
+            maintenance_activity=self.activities[1], event_date=start.date(),
+        )
+
+    def test_creates_missing_events_in_batches(self):
+        """Scheduled activities without an event get one; reruns create nothing."""
+        result = generate_maintenance_events(batch_size=2)
+
+        self.assertEqual(result, {'created': 4, 'skipped': 0, 'batches': 2})
+        self.assertEqual(CalendarEvent.objects.count(), 5)
+        event = CalendarEvent.objects.get(maintenance_activity=self.activities[2])
+        self.assertEqual(event.title, 'Maintenance: Inspection 2')
+        self.assertEqual(event.event_date, self.activities[2].scheduled_start.date())
+        self.assertEqual((event.assigned_to, event.created_by), (self.tech, self.planner))
+        self.assertFalse(CalendarEvent.objects.filter(maintenance_activity=self.activities[0]).exists())
+
+        self.assertEqual(generate_maintenance_events(batch_size=2), {'created': 0, 'skipped': 0, 'batches': 0})
+
+    def test_one_event_per_activity(self):
+        """The unique constraint rejects a second event for the same activity."""
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            CalendarEvent.objects.create(
+                title='Duplicate', event_type='maintenance', equipment=self.equipment,
+                maintenance_activity=self.activities[1], event_date=timezone.now().date(),
+            )
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for the health probe registry and the snapshot-serving health endpoints.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from core.services.health_probe_service import HealthProbe, HealthProbeService, ProbeWarning
+
+
+def passing():
+    return {'response_time': 0.001}
+
+
+def warning():
+    raise ProbeWarning('No periodic tasks have run')
+
+
+def failing():
+    raise RuntimeError('connection refused')
+
+
+def slow():
+    time.sleep(0.5)
+
+
+class HealthProbeServiceTest(SimpleTestCase):
+    """Test concurrent probe runs, timeouts and snapshot storage."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.config = {'snapshot_path': os.path.join(self.directory, 'health.json'), 'background_refresh': False}
+
+    def service(self, *probes):
+        return HealthProbeService(config=self.config, probes=probes)
+
+    def test_runs_probes_concurrently_with_timeouts(self):
+        service = self.service(
+            HealthProbe('Database', passing, 'CORE', critical=True),
+            HealthProbe('Beat', warning, 'DEPS'),
+            HealthProbe('Redis', failing, 'DEPS', fix='Check Redis'),
+            HealthProbe('Worker', slow, 'DEPS', timeout=0.1),
+            HealthProbe('Calendar', slow, 'CALENDAR'),
+        )
+        started = time.perf_counter()
+        snapshot = service.run_probes()
+        # Both slow probes ran side by side; the timed-out one did not hold up the run
+        self.assertLess(time.perf_counter() - started, 0.9)
+
+        probes = snapshot['probes']
+        self.assertEqual(probes['Database']['status'], 'PASS')
+        self.assertEqual(probes['Database']['details'], {'response_time': 0.001})
+        self.assertEqual(probes['Beat'], {**probes['Beat'], 'status': 'WARNING', 'message': 'No periodic tasks have run'})
+        self.assertEqual((probes['Redis']['status'], probes['Redis']['fix']), ('FAIL', 'Check Redis'))
+        self.assertEqual(probes['Worker']['status'], 'TIMEOUT')
+        self.assertEqual(probes['Calendar']['status'], 'PASS')
+        self.assertEqual(snapshot['summary'], {
+            'status': 'warning', 'total_checks': 5, 'passed': 2, 'failed': 2, 'warnings': 1, 'health_percentage': 40,
+        })
+
+    def test_critical_failure(self):
+        snapshot = self.service(HealthProbe('Database', failing, 'CORE', critical=True)).run_probes()
+        self.assertEqual(snapshot['summary']['status'], 'critical')
+
+    def test_snapshot_age_and_storage(self):
+        service = self.service(HealthProbe('Database', passing, 'CORE', critical=True))
+        self.assertEqual(service.get_snapshot()['summary']['status'], 'unknown')
+
+        snapshot = service.refresh()
+        self.assertEqual(service.get_snapshot(now=snapshot['generated_ts'] + 30)['age_seconds'], 30)
+        self.assertFalse(service.get_snapshot(now=snapshot['generated_ts'] + 30)['stale'])
+        self.assertTrue(service.get_snapshot(now=snapshot['generated_ts'] + 121)['stale'])
+
+        # A newer snapshot written by another process (the Celery worker) is picked up
+        newer = {**snapshot, 'generated_ts': snapshot['generated_ts'] + 60, 'summary': {**snapshot['summary'], 'status': 'warning'}}
+        with open(self.config['snapshot_path'], 'w') as f:
+            json.dump(newer, f)
+        os.utime(self.config['snapshot_path'], ns=(time.time_ns() + 10 ** 9,) * 2)
+        self.assertEqual(service.get_snapshot()['summary']['status'], 'warning')
+
+
+class HealthEndpointTest(TestCase):
+    """The health endpoints serve the stored snapshot."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.config = {'snapshot_path': os.path.join(self.directory, 'health.json'), 'background_refresh': False}
+        settings_override = override_settings(HEALTH_PROBE_CONFIG=self.config)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def store(self, *probes):
+        HealthProbeService(probes=probes).refresh()
+
+    def test_simple_health_check_does_not_query_database(self):
+        self.store(HealthProbe('Database Connection', passing, 'CORE', critical=True), HealthProbe('Redis', failing, 'DEPS'))
+        with self.assertNumQueries(0):
+            response = self.client.get('/health/simple/')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual((data['status'], data['health'], data['failing']), ('ok', 'warning', ['Redis']))
+        self.assertFalse(data['stale'])
+
+        self.store(HealthProbe('Database Connection', failing, 'CORE', critical=True))
+        response = self.client.get('/health/simple/')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['failing'], ['Database Connection'])
+
+    def test_system_health_check_groups_by_category(self):
+        self.store(
+            HealthProbe('Database Connection', passing, 'CORE', critical=True),
+            HealthProbe('Celery Beat', warning, 'DEPS'),
+            HealthProbe('Admin User Exists', failing, 'AUTH', fix='Create admin user'),
+        )
+        self.client.force_login(User.objects.create_superuser(username='admin', password='pw', email='a@example.com'))
+        data = self.client.get(reverse('core:system_health_check')).json()
+
+        self.assertEqual([check['name'] for check in data['categories']['CORE']['passed']], ['Database Connection'])
+        self.assertEqual(data['categories']['DEPS']['warnings'][0]['message'], 'No periodic tasks have run')
+        self.assertEqual(data['categories']['AUTH']['failed'][0]['fix'], 'Create admin user')
+        self.assertEqual(data['quick_fixes'], ['Create admin user'])
+        self.assertEqual((data['summary']['health_percentage'], data['summary']['status']), (33, 'CRITICAL'))
+
+        data = self.client.get(reverse('core:comprehensive_health_check')).json()
+        self.assertEqual(data['overall_status'], 'warning')
+        self.assertEqual([check['status'] for check in data['checks']], ['success', 'warning', 'error'])
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared log follower and its Server-Sent Events stream.
+"""
+
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from core.log_follower import LogFollower, format_event_id, iter_sse, parse_event_id
+
+
+class LogFollowerTest(SimpleTestCase):
+    """Test reading, rotation handling and fan-out, driving poll() directly."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, 'web.log')
+        self.append(b'old line\n')
+        self.follower = LogFollower(config={'queue_size': 3}, use_inotify=False)
+        # Keep the background thread out of the way; the tests call poll() themselves
+        patcher = patch('core.log_follower.threading.Thread')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def append(self, data, path=None):
+        with open(path or self.path, 'ab') as f:
+            f.write(data)
+
+    def lines(self, subscription):
+        return [line for _, line in subscription.get_batch(timeout=0)]
+
+    def test_follows_new_lines_only(self):
+        """Existing content is skipped; partial lines wait for their newline."""
+        subscription = self.follower.subscribe({self.path: 'web'})
+        self.append(b'first\nsecond\r\nthi')
+        self.follower.poll()
+        self.assertEqual(subscription.get_batch(timeout=0), [('web', 'first'), ('web', 'second')])
+        self.append(b'rd\n')
+        self.follower.poll()
+        self.assertEqual(self.lines(subscription), ['third'])
+
+    def test_rotation_and_truncation(self):
+        """Lines written before a rename are kept; the new file and a truncated file are read from the start."""
+        subscription = self.follower.subscribe({self.path: 'web'})
+        self.append(b'before rotation\n')
+        os.rename(self.path, self.path + '.1')
+        self.append(b'late write to old file\n', path=self.path + '.1')
+        self.append(b'new file\n')
+        self.follower.poll()
+        self.assertEqual(self.lines(subscription), ['before rotation', 'late write to old file', 'new file'])
+
+        with open(self.path, 'wb') as f:
+            f.write(b'after\n')
+        self.follower.poll()
+        self.assertEqual(self.lines(subscription), ['after'])
+
+    def test_one_reader_many_subscribers(self):
+        """Every subscriber gets each line from a single read; slow ones drop and count."""
+        subscriptions = [self.follower.subscribe({self.path: 'web'}) for _ in range(10)]
+        self.assertEqual(len(self.follower._files), 1)
+
+        self.append(b''.join(f'line {i}\n'.encode() for i in range(5)))
+        self.assertEqual(self.follower.poll(), 5)
+        for subscription in subscriptions:
+            self.assertEqual(self.lines(subscription), ['line 0', 'line 1', 'line 2'])
+            self.assertEqual(subscription.take_dropped(), 2)
+            self.assertEqual(subscription.take_dropped(), 0)
+
+        for subscription in subscriptions:
+            subscription.close()
+        self.assertEqual(self.follower.subscriber_count, 0)
+        self.assertEqual(self.follower._files, {})
+
+    def test_sse_stream(self):
+        """The stream sends batched log events, drop counts and closes its subscription."""
+        subscription = self.follower.subscribe({self.path: 'web'}, keep=lambda line: not line.startswith('#'))
+        self.append(b'# header\none\ntwo\nthree\nfour\n')
+        self.follower.poll()
+
+        ticks = iter([0, 0, 100])
+        events = list(iter_sse(subscription, stream_seconds=10, heartbeat_seconds=0.01, clock=lambda: next(ticks)))
+
+        self.assertEqual(events[0], 'retry: 1000\n\n')
+        self.assertEqual(events[1], 'event: dropped\ndata: {"count": 1}\n\n')
+        inode = os.stat(self.path).st_ino
+        self.assertEqual(events[2], (
+            f'id: web:{inode}:32\n'
+            'event: log\ndata: [{"container": "web", "line": "one"}, {"container": "web", "line": "two"}, '
+            '{"container": "web", "line": "three"}]\n\n'
+        ))
+        self.assertEqual(len(events), 3)
+        self.assertTrue(subscription.closed)
+        self.assertEqual(self.follower.subscriber_count, 0)
+
+    def test_resume_from_event_id(self):
+        """A subscription resuming from an earlier position first gets the lines written since."""
+        first = self.follower.subscribe({self.path: 'web'})
+        self.append(b'one\ntwo\n')
+        self.follower.poll()
+        first.get_batch(timeout=0)
+        event_id = format_event_id(first.positions)
+        first.close()
+
+        self.append(b'three\nfour\n')
+        resumed = self.follower.subscribe({self.path: 'web'}, resume=parse_event_id(event_id))
+        self.append(b'five\n')
+        self.follower.poll()
+        self.assertEqual(self.lines(resumed), ['three', 'four', 'five'])
+        self.assertEqual(resumed.positions['web'], (os.stat(self.path).st_ino, os.path.getsize(self.path)))
+
+    def test_resume_after_rotation(self):
+        """A position in a rotated-away file replays the current file from the top."""
+        inode = os.stat(self.path).st_ino
+        os.rename(self.path, self.path + '.1')
+        self.append(b'rotated\n')
+        subscription = self.follower.subscribe({self.path: 'web'}, resume={'web': (inode, 9), 'db': (1, 2)})
+        self.assertEqual(self.lines(subscription), ['rotated'])
+        self.assertEqual(parse_event_id('web:1:2,bad,db:x:3'), {'web': (1, 2)})
+
+    def test_stream_cap(self):
+        """Only max_streams streams are open at once; ordinary subscriptions are not counted."""
+        self.follower.config['max_streams'] = 1
+        self.follower.subscribe({self.path: 'web'})
+        stream = self.follower.open_stream({self.path: 'web'})
+        self.assertIsNotNone(stream)
+        self.assertIsNone(self.follower.open_stream({self.path: 'web'}))
+        stream.close()
+        self.assertIsNotNone(self.follower.open_stream({self.path: 'web'}))
+
+
+@override_settings(DOCKER_LOGS_CONFIG={'enabled': True, 'debug_only': False, 'require_superuser': True})
+class LogStreamViewTest(TestCase):
+    """Test the SSE endpoint's access control and response."""
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(username='admin', password='pw', email='admin@example.com')
+        self.client.force_login(self.admin)
+
+    def test_unknown_container(self):
+        with patch('core.services.log_streaming_service.LogStreamingService.get_available_containers', return_value=[]):
+            response = self.client.get(reverse('core:log_stream_sse'), {'containers': 'missing'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_event_stream_headers(self):
+        handle, path = tempfile.mkstemp(suffix='.log')
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        containers = [{'name': 'web', 'log_file': path}, {'name': 'db', 'log_file': None}]
+        with patch('core.services.log_streaming_service.LogStreamingService.get_available_containers', return_value=containers):
+            response = self.client.get(reverse('core:log_stream_sse'), {'containers': 'web'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+        self.assertEqual(next(iter(response.streaming_content)), b'retry: 1000\n\n')
+        response.close()
+
+    def test_streams_over_the_cap_are_refused(self):
+        handle, path = tempfile.mkstemp(suffix='.log')
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        containers = [{'name': 'web', 'log_file': path}]
+        with patch('core.services.log_streaming_service.LogStreamingService.get_available_containers', return_value=containers), \
+                patch('core.log_follower.LogFollower.open_stream', return_value=None):
+            response = self.client.get(reverse('core:log_stream_sse'), {'containers': 'web'})
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '30')
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for the queue-based logging pipeline.
+"""
+
+import json
+import logging
+import sys
+from django.test import SimpleTestCase
+from core.log_pipeline import JsonFormatter, QueuePipeline, QueueingHandler, SamplingFilter, install_pipeline
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def make_record(level=logging.INFO, msg='message %s', args=('arg',), lineno=10, **extra):
+    record = logging.LogRecord('core.test', level, '/app/core/views.py', lineno, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class JsonFormatterTest(SimpleTestCase):
+
+    def test_structured_fields(self):
+        try:
+            raise ValueError('bad value')
+        except ValueError:
+            record = logging.LogRecord('core.test', logging.ERROR, '/app/core/views.py', 42, 'failed for %s', ('pump',), sys.exc_info())
+        record.request_id = 'abc123'
+        entry = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(entry['level'], 'ERROR')
+        self.assertEqual(entry['logger'], 'core.test')
+        self.assertEqual(entry['message'], 'failed for pump')
+        self.assertEqual(entry['line'], 42)
+        self.assertEqual(entry['request_id'], 'abc123')
+        self.assertIn('ValueError: bad value', entry['exception'])
+        self.assertNotIn('_json', entry)
+
+
+class SamplingFilterTest(SimpleTestCase):
+
+    def test_samples_bursts_per_call_site(self):
+        now = [0.0]
+        sampler = SamplingFilter(burst=3, window=1.0, rate=5, clock=lambda: now[0])
+
+        passed = [sampler.filter(record) and record for record in (make_record() for _ in range(20))]
+        kept = [record for record in passed if record]
+        # First 3, then seen == 8, 13 and 18
+        self.assertEqual(len(kept), 6)
+        self.assertEqual(getattr(kept[3], 'sampled', 0), 4)
+
+        # Other call sites and warnings are unaffected
+        self.assertTrue(sampler.filter(make_record(lineno=11)))
+        self.assertTrue(sampler.filter(make_record(level=logging.WARNING)))
+
+        # A new window starts over and reports what the old one skipped
+        now[0] = 1.5
+        record = make_record()
+        self.assertTrue(sampler.filter(record))
+        self.assertEqual(record.sampled, 2)
+
+
+class QueuePipelineTest(SimpleTestCase):
+
+    def test_routes_records_and_counts_drops(self):
+        """Records reach the logger's own handlers; a full queue drops, counts and reports."""
+        pipeline = QueuePipeline(queue_size=2)
+        everything, errors = CollectingHandler(), CollectingHandler(logging.ERROR)
+        handler = QueueingHandler(pipeline, [everything, errors])
+
+        for index in range(5):
+            handler.handle(make_record(msg='record %d', args=(index,)))
+        self.assertEqual(pipeline.dropped, 3)
+
+        pipeline.start()
+        self.addCleanup(pipeline.stop)
+        pipeline.drain()
+        handler.handle(make_record(level=logging.ERROR, msg='after', args=()))
+        pipeline.drain()
+
+        self.assertEqual(
+            [record.getMessage() for record in everything.records],
+            ['record 0', 'record 1', 'after', 'Logging queue full: dropped 3 log records'],
+        )
+        self.assertEqual([record.getMessage() for record in errors.records], ['after'])
+        self.assertIsNone(everything.records[0].args)
+
+    def test_install_keeps_routing(self):
+        logger = logging.getLogger('tests.log_pipeline')
+        collecting = CollectingHandler()
+        logger.handlers = [collecting]
+        self.addCleanup(setattr, logger, 'handlers', [])
+
+        pipeline = install_pipeline(['tests.log_pipeline'])
+        self.assertIsInstance(logger.handlers[0], QueueingHandler)
+        self.assertEqual(logger.handlers[0].handlers, (collecting,))
+
+        logger.warning('queued %s', 'warning')
+        pipeline.drain()
+        self.assertEqual([record.getMessage() for record in collecting.records], ['queued warning'])
+
+    def test_propagated_records_are_sampled_once_per_handler(self):
+        """A record reaching both a logger's and the root's queue handler is not counted twice."""
+        logger = logging.getLogger('tests.log_pipeline.sampled')
+        root = logging.getLogger()
+        own, root_handler = CollectingHandler(), CollectingHandler()
+        logger.handlers, logger.level = [own], logging.INFO
+        self.addCleanup(setattr, logger, 'handlers', [])
+        self.addCleanup(setattr, logger, 'level', logging.NOTSET)
+        root_handlers = root.handlers
+        root.handlers = [root_handler]
+        self.addCleanup(setattr, root, 'handlers', root_handlers)
+
+        pipeline = install_pipeline(['tests.log_pipeline.sampled'], {'sample_burst': 3, 'sample_rate': 1000})
+        self.assertIsNot(logger.handlers[0].filters[0], root.handlers[0].filters[0])
+        for index in range(3):
+            logger.info('burst %d', index)
+        pipeline.drain()
+        self.assertEqual(len(own.records), 3)
+        self.assertEqual(len(root_handler.records), 3)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the day-partitioned full-text log store.
+"""
+
+import os
+import shutil
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from core.services.log_store_service import LogStore, detect_level, to_nanos
+
+DAY = datetime(2026, 10, 12, tzinfo=timezone.utc)
+
+
+class LogStoreTest(SimpleTestCase):
+    """Test ingestion, filtered search, pagination and retention."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.store = LogStore(config={'directory': self.directory})
+        entries = []
+        for day in range(3):
+            for minute in range(10):
+                moment = DAY + timedelta(days=day, hours=12, minutes=minute)
+                container = 'web' if minute % 2 else 'worker'
+                message = f'ERROR payment-gateway timeout #{day}-{minute}' if minute == 7 else f'INFO GET /api/{day}/{minute}'
+                entries.append((to_nanos(moment), container, 'stdout', message))
+        self.assertEqual(self.store.add(entries), 30)
+
+    def messages(self, result):
+        return [entry['message'] for entry in result['entries']]
+
+    def test_partitions_by_day(self):
+        self.assertEqual(self.store.partitions(), [date(2026, 10, 12), date(2026, 10, 13), date(2026, 10, 14)])
+
+    def test_filters(self):
+        """Time range, container, level and text filters combine."""
+        result = self.store.search(start=DAY + timedelta(days=1), end=DAY + timedelta(days=2), containers=['web'], limit=3)
+        self.assertEqual(self.messages(result), ['INFO GET /api/1/9', 'ERROR payment-gateway timeout #1-7', 'INFO GET /api/1/5'])
+        self.assertEqual(result['entries'][0]['timestamp'], '2026-10-13T12:09:00+00:00')
+        self.assertEqual(result['entries'][0]['stream'], 'STDOUT')
+
+        result = self.store.search(levels=['error'], text='payment-gateway timeout')
+        self.assertEqual(self.messages(result), [f'ERROR payment-gateway timeout #{day}-7' for day in (2, 1, 0)])
+        self.assertEqual({entry['level'] for entry in result['entries']}, {'ERROR'})
+
+        # FTS5 syntax is taken literally rather than raising
+        self.assertEqual(self.store.search(text='"unbalanced AND (NEAR')['entries'], [])
+
+    def test_cursor_pagination_across_partitions(self):
+        """Following next_cursor returns every entry exactly once, newest first."""
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            result = self.store.search(limit=7, cursor=cursor)
+            seen.extend(self.messages(result))
+            pages += 1
+            cursor = result['next_cursor']
+            if cursor is None:
+                break
+        self.assertEqual(pages, 5)
+        self.assertEqual(len(seen), 30)
+        self.assertEqual(len(set(seen)), 30)
+        self.assertEqual(seen[0], 'INFO GET /api/2/9')
+        self.assertEqual(seen[-1], 'INFO GET /api/0/0')
+
+    def test_prune_drops_partitions(self):
+        self.assertEqual(self.store.prune(retention_days=1, today=date(2026, 10, 14)), [date(2026, 10, 12)])
+        self.assertFalse(os.path.exists(self.store.partition_path(date(2026, 10, 12))))
+        self.assertEqual(len(self.store.search(start=DAY)['entries']), 20)
+
+    def test_ingest_file_is_incremental(self):
+        """Only new complete lines are stored; a replaced file is read from the start."""
+        path = os.path.join(self.directory, 'syslog')
+        now = datetime(2026, 10, 14, 18, tzinfo=timezone.utc)
+        with open(path, 'w') as f:
+            f.write('Oct 14 13:00:00 host cron[1]: job started\n# comment\nno timestamp warning\npartial')
+        self.assertEqual(self.store.ingest_file(path, 'system:syslog', now=now), 2)
+        self.assertEqual(self.store.ingest_file(path, 'system:syslog', now=now), 0)
+        with open(path, 'a') as f:
+            f.write(' line\n')
+        self.assertEqual(self.store.ingest_file(path, 'system:syslog', now=now), 1)
+
+        result = self.store.search(containers=['system:syslog'])
+        self.assertEqual(self.messages(result), ['partial line', 'no timestamp warning', 'Oct 14 13:00:00 host cron[1]: job started'])
+        self.assertEqual(result['entries'][1]['level'], 'WARNING')
+        self.assertEqual(result['entries'][1]['timestamp'], '2026-10-14T13:00:00+00:00')
+
+        os.remove(path)
+        with open(path, 'w') as f:
+            f.write('2026-10-14 17:00:00 restarted\n')
+        self.assertEqual(self.store.ingest_file(path, 'system:syslog', now=now), 1)
+
+    def test_detect_level(self):
+        self.assertEqual(detect_level('[2026-10-14] WARN disk 91%'), 'WARNING')
+        self.assertEqual(detect_level('celery@worker ready.'), 'INFO')
+        self.assertEqual(detect_level('Traceback ... fatal: boom'), 'CRITICAL')
+
+
+@override_settings(DOCKER_LOGS_CONFIG={'enabled': True, 'debug_only': False, 'require_superuser': True})
+class SearchLogsViewTest(TestCase):
+    """Test the search API's parameters and pagination."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        settings_override = override_settings(LOG_STORE_CONFIG={'directory': self.directory})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        now = datetime.now(timezone.utc)
+        LogStore().add([(to_nanos(now - timedelta(minutes=i)), 'web', 'stderr', f'ERROR failure {i}') for i in range(3)])
+        self.client.force_login(User.objects.create_superuser(username='admin', password='pw', email='a@example.com'))
+
+    def test_search(self):
+        response = self.client.get(reverse('core:search_logs'), {'q': 'failure', 'levels': 'error', 'limit': 2})
+        data = response.json()
+        self.assertEqual([entry['message'] for entry in data['entries']], ['ERROR failure 0', 'ERROR failure 1'])
+        response = self.client.get(reverse('core:search_logs'), {'q': 'failure', 'cursor': data['next_cursor']})
+        self.assertEqual([entry['message'] for entry in response.json()['entries']], ['ERROR failure 2'])
+
+    def test_invalid_parameters(self):
+        self.assertEqual(self.client.get(reverse('core:search_logs'), {'start': 'yesterday'}).status_code, 400)
+        self.assertEqual(self.client.get(reverse('core:search_logs'), {'cursor': 'bogus'}).status_code, 400)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the reverse-seek log tail reader.
+"""
+
+import json
+import os
+import tempfile
+from django.test import SimpleTestCase
+from core.log_tail import not_header, tail_lines
+from core.services.log_streaming_service import LogStreamingService
+
+
+class TailLinesTest(SimpleTestCase):
+    """Test that tail_lines matches readlines() slicing on awkward files."""
+
+    def write(self, content):
+        handle, path = tempfile.mkstemp(suffix='.log')
+        with os.fdopen(handle, 'wb') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def readlines_tail(self, path, lines):
+        with open(path, 'r', encoding='utf-8', errors='replace', newline=None) as f:
+            all_lines = f.readlines()
+        return all_lines[-lines:] if lines > 0 else all_lines
+
+    def test_matches_readlines(self):
+        """Every block size and line count agrees with the full read."""
+        contents = [
+            b'',
+            b'\n',
+            b'no newline at all',
+            b'one\ntwo\nthree\n',
+            b'one\ntwo\nthree',
+            b'\n\nblank lines\n\n',
+            'café ☃ snow\nnaïve\n'.encode('utf-8') * 5,
+            b'windows\r\nline endings\r\n',
+        ]
+        for content in contents:
+            path = self.write(content)
+            for block_size in (1, 2, 3, 7, 64 * 1024):
+                for lines in (0, 1, 2, 5, 100):
+                    self.assertEqual(
+                        tail_lines(path, lines, block_size=block_size), self.readlines_tail(path, lines),
+                        (content, block_size, lines),
+                    )
+
+    def test_keep_filters_before_counting(self):
+        """Header lines are skipped without reducing the number of lines returned."""
+        path = self.write(b'# header\nfirst\n# note\nsecond\nthird\n')
+        self.assertEqual(tail_lines(path, 3, keep=not_header, block_size=4), ['first\n', 'second\n', 'third\n'])
+
+    def test_docker_json_tail(self):
+        """Only the requested tail of a Docker JSON log is parsed and formatted."""
+        entries = [
+            json.dumps({'log': f'message {i}\n', 'stream': 'stderr' if i % 2 else 'stdout', 'time': '2026-10-19T05:00:00Z'})
+            for i in range(50)
+        ]
+        path = self.write(('\n'.join(entries) + '\nnot json\n').encode('utf-8'))
+        output = LogStreamingService().read_docker_json_logs(path, lines=3).splitlines()
+        self.assertEqual(output[0], '[2026-10-19 05:00:00] [STDOUT] message 48')
+        self.assertEqual(output[-1], 'not json')
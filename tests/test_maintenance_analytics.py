@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for vectorized maintenance activity analytics.
+"""
+
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from django.test import SimpleTestCase
+from maintenance.analytics import ActivityFrame, monthly_series
+
+
+def at(day, hour=0):
+    return datetime(2026, 1, 1, tzinfo=dt_timezone.utc) + timedelta(days=day, hours=hour)
+
+
+class ActivityFrameTest(SimpleTestCase):
+    """Test ActivityFrame aggregations against hand-computed values."""
+
+    def setUp(self):
+        rows = []
+        # Completed every 10 days, 2 hours each, except one 30 hour job
+        for index, day in enumerate((0, 10, 20, 30, 40)):
+            hours = 30 if day == 20 else 2
+            rows.append((index + 1, 'completed', 'Inspection', at(day), at(day, 2), at(day), at(day, hours)))
+        rows.append((6, 'overdue', 'Cleaning', at(50), at(50, 2), None, None))
+        rows.append((7, 'scheduled', None, at(70), at(70, 2), None, None))
+        self.frame = ActivityFrame.from_rows(rows)
+
+    def test_counts_and_distribution(self):
+        self.assertEqual(len(self.frame), 7)
+        self.assertEqual(self.frame.count('completed'), 5)
+        self.assertEqual(self.frame.status_distribution(), {'completed': 5, 'overdue': 1, 'scheduled': 1})
+        self.assertEqual(self.frame.top_activity_types(1), [('Inspection', 5)])
+
+    def test_monthly_counts(self):
+        self.assertEqual(self.frame.monthly_counts('scheduled_start'), {'2026-01': 4, '2026-02': 2, '2026-03': 1})
+        self.assertEqual(self.frame.monthly_counts('actual_end', status='completed'), {'2026-01': 4, '2026-02': 1})
+        self.assertEqual(self.frame.monthly_counts('scheduled_start', since=at(40).timestamp()), {'2026-02': 2, '2026-03': 1})
+
+    def test_interval_stats_and_outliers(self):
+        stats = self.frame.interval_stats()
+        self.assertEqual(stats['count'], 4)
+        self.assertAlmostEqual(stats['mean_days'], 10.0)
+        outlier_ids, outlier_hours = self.frame.duration_outliers()
+        self.assertEqual(list(outlier_ids), [3])
+        self.assertAlmostEqual(outlier_hours[0], 30.0)
+
+    def test_empty_frame(self):
+        frame = ActivityFrame.from_rows([])
+        self.assertEqual(frame.count(), 0)
+        self.assertEqual(frame.status_distribution(), {})
+        self.assertEqual(frame.monthly_counts(), {})
+        self.assertIsNone(frame.interval_stats())
+        self.assertEqual(frame.duration_outliers()[0].size, 0)
+
+    def test_monthly_series_fills_gaps(self):
+        labels, data = monthly_series({'2026-01': 3, '2026-03': 1}, date(2025, 12, 15), date(2026, 3, 2))
+        self.assertEqual(labels, ['Dec 2025', 'Jan 2026', 'Feb 2026', 'Mar 2026'])
+        self.assertEqual(data, [0, 3, 0, 1])
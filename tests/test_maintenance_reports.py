@@ -9,7 +9,7 @@ import sys
 import json
 import tempfile
 from datetime import timedelta
-from django.test import TestCase, Client, TransactionTestCase
+from django.test import SimpleTestCase, TestCase, Client, TransactionTestCase
 from django.contrib.auth.models import User
 from django.urls import reverse
 from django.utils import timezone
@@ -439,6 +439,51 @@ class MaintenanceReportAnalysisTest(TestCase):
         self.assertIn('2024-01-15', date_strings)
 
 
+class ReportAnalyzerModuleTest(SimpleTestCase):
+    """Test the precompiled report analyzer used by views and the re-analysis command."""
+
+    def test_views_use_precompiled_analyzer(self):
+        """The view-level helper is the report_analysis implementation."""
+        from maintenance import report_analysis
+        from maintenance.views import analyze_report_content
+
+        self.assertIs(analyze_report_content, report_analysis.analyze_report_content)
+
+    def test_scan_triggers(self):
+        """The tokenizer reports keyword triggers and the presence of numbers."""
+        from maintenance.report_analysis import scan_triggers
+
+        self.assertEqual(scan_triggers('replaced gasket, fault cleared'), {'replaced', 'fault'})
+        self.assertEqual(scan_triggers('measured 12 psi'), {'digit'})
+        self.assertEqual(scan_triggers('visual check ok'), set())
+
+    def test_content_without_triggers(self):
+        """Reports without keywords or numbers produce empty results."""
+        from maintenance.report_analysis import analyze_report_content
+
+        analyzed_data = analyze_report_content('Visual check of enclosure satisfactory.')
+
+        self.assertEqual(analyzed_data['issues'], [])
+        self.assertEqual(analyzed_data['parts_replaced'], [])
+        self.assertEqual(analyzed_data['measurements'], [])
+        self.assertEqual(analyzed_data['dates'], [])
+        self.assertIsNone(analyzed_data['work_hours'])
+
+    def test_analyze_report_batch(self):
+        """Batch analysis returns one result per report and captures errors."""
+        from maintenance.report_analysis import analyze_report_batch
+
+        results = analyze_report_batch([(1, 'Replaced breather after 2 hours'), (2, None), (3, 42)])
+
+        self.assertEqual([r[0] for r in results], [1, 2, 3])
+        self.assertEqual(results[0][1]['work_hours'], 2.0)
+        self.assertEqual(results[0][1]['parts_replaced'][0]['part'], 'breather after 2 hours')
+        self.assertEqual(results[0][2], '')
+        self.assertEqual(results[1][1]['issues'], [])
+        self.assertEqual(results[2][1], {})
+        self.assertTrue(results[2][2])
+
+
 def run_tests():
     """Run all tests and display results."""
     print("=" * 60)
@@ -456,7 +501,8 @@ def run_tests():
     failures = test_runner.run_tests([
         'test_maintenance_reports.MaintenanceReportModelTest',
         'test_maintenance_reports.MaintenanceReportViewsTest',
-        'test_maintenance_reports.MaintenanceReportAnalysisTest'
+        'test_maintenance_reports.MaintenanceReportAnalysisTest',
+        'test_maintenance_reports.ReportAnalyzerModuleTest'
     ])
     
     if failures:
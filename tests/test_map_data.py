@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the customer map data API.
+"""
+
+import json
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.urls import reverse
+from core.models import Customer, Location, EquipmentCategory
+from core.services.map_data_service import invalidate_customer_maps
+from equipment.models import Equipment, EquipmentConnection
+from equipment.graph import invalidate_equipment_graph
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class MapDataApiTest(TestCase):
+    """Test the bulk-loaded, cached customer map data."""
+
+    def setUp(self):
+        """Set up two customers, one with a site, a pod and connected equipment."""
+        cache.clear()
+        self.user = User.objects.create_user(username='mapuser', password='testpass123')
+        self.client.login(username='mapuser', password='testpass123')
+        self.category = EquipmentCategory.objects.create(name='Electrical')
+
+        self.acme = Customer.objects.create(name='Acme', code='ACME')
+        self.empty = Customer.objects.create(name='Empty Co', code='EMPTY')
+        self.site = Location.objects.create(name='Acme Site', is_site=True, customer=self.acme)
+        self.pod = Location.objects.create(name='Pod 1', parent_location=self.site)
+
+        self.utility = self.create_equipment('Utility', self.site)
+        self.panel = self.create_equipment('Panel', self.pod, status='maintenance')
+        self.load = self.create_equipment('Load', self.pod)
+        EquipmentConnection.objects.create(upstream_equipment=self.utility, downstream_equipment=self.panel)
+        EquipmentConnection.objects.create(upstream_equipment=self.panel, downstream_equipment=self.load)
+        invalidate_equipment_graph()
+        invalidate_customer_maps()
+
+    def create_equipment(self, name, location, status='active'):
+        return Equipment.objects.create(
+            name=name,
+            category=self.category,
+            location=location,
+            status=status,
+            manufacturer_serial=f'SN-{name}',
+            asset_tag=f'AT-{name}',
+        )
+
+    def get_maps(self, **params):
+        response = self.client.get(reverse('core:map_data_api'), params)
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual(data['status'], 'success')
+        return data['customers']
+
+    def test_map_data_groups_and_cascade(self):
+        """Customers without equipment are skipped; sites group their pods."""
+        maps = self.get_maps()
+
+        self.assertEqual([m['customer']['name'] for m in maps], ['Acme'])
+        acme = maps[0]
+        self.assertEqual(acme['stats']['equipment_count'], 3)
+        self.assertEqual(acme['stats']['location_count'], 2)
+        self.assertEqual(acme['stats']['maintenance_count'], 1)
+        self.assertEqual(acme['stats']['connection_count'], 2)
+        self.assertEqual(acme['location_groups'], [{
+            'site': {'id': self.site.id, 'name': 'Acme Site'},
+            'locations': [{'id': self.pod.id, 'name': 'Pod 1', 'equipment_ids': [self.load.id, self.panel.id]}],
+        }])
+        statuses = {e['name']: e['effective_status'] for e in acme['equipment']}
+        self.assertEqual(statuses, {'Load': 'cascade_offline', 'Panel': 'maintenance', 'Utility': 'active'})
+
+    def test_map_data_is_cached_until_change(self):
+        """A warm cache answers without map queries; a change bumps the version."""
+        self.get_maps()
+        with self.assertNumQueries(3):
+            # Session, user and the customer list only
+            self.get_maps()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.load.name = 'Critical Load'
+            self.load.save()
+        names = [e['name'] for e in self.get_maps()[0]['equipment']]
+        self.assertIn('Critical Load', names)
+
+    def test_map_data_single_customer(self):
+        """customer_id limits the result; invalid values are rejected."""
+        self.assertEqual(self.get_maps(customer_id=self.empty.id), [])
+        self.assertEqual(len(self.get_maps(customer_id=self.acme.id)), 1)
+        response = self.client.get(reverse('core:map_data_api'), {'customer_id': 'abc'})
+        self.assertEqual(response.status_code, 400)
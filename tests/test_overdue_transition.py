@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for the set-based overdue status transition.
+"""
+
+from datetime import timedelta
+from unittest import mock
+from django.core import mail
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.contrib.auth.models import User
+from django.utils import timezone
+from core.models import Location, EquipmentCategory
+from core.dashboard_cache import dashboard_generation_key, dashboard_stats_key, invalidate_dashboard_cache
+from core.utils import get_cache_version
+from equipment.models import Equipment
+from maintenance.models import (
+    MaintenanceActivity, MaintenanceActivityType, MaintenanceTimelineEntry, ActivityTypeCategory,
+)
+from maintenance.overdue import transition_overdue_activities
+from maintenance.tasks import notify_overdue_activities
+
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DashboardCacheTest(SimpleTestCase):
+    """Test that invalidation moves the dashboard statistics to a new generation."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_site_invalidation(self):
+        site_key, other_key, all_key = dashboard_stats_key(1), dashboard_stats_key(2), dashboard_stats_key()
+        invalidate_dashboard_cache(site_id=1)
+        self.assertNotEqual(dashboard_stats_key(1), site_key)
+        self.assertNotEqual(dashboard_stats_key(), all_key)
+        self.assertEqual(dashboard_stats_key(2), other_key)
+
+    def test_global_invalidation(self):
+        site_key, all_key = dashboard_stats_key(1), dashboard_stats_key()
+        invalidate_dashboard_cache()
+        self.assertNotEqual(dashboard_stats_key(1), site_key)
+        self.assertNotEqual(dashboard_stats_key(), all_key)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class OverdueTransitionTest(TestCase):
+    """Test that only newly overdue activities change status and get side effects."""
+
+    def setUp(self):
+        cache.clear()
+        self.site = Location.objects.create(name='Overdue Site', is_site=True)
+        pod = Location.objects.create(name='POD 1', parent_location=self.site)
+        equipment = Equipment.objects.create(
+            name='TX-1', category=EquipmentCategory.objects.create(name='Transformers'), location=pod,
+            manufacturer_serial='SN-TX-1', asset_tag='AT-TX-1',
+        )
+        activity_type = MaintenanceActivityType.objects.create(
+            name='Inspection', category=ActivityTypeCategory.objects.create(name='Preventive'), frequency_days=30,
+        )
+        self.tech = User.objects.create_user(username='tech', email='tech@example.com')
+        now = timezone.now()
+        past, future = now - timedelta(days=2), now + timedelta(days=2)
+        cases = [
+            ('late scheduled', 'scheduled', past),
+            ('late pending', 'pending', past),
+            ('late in progress', 'in_progress', past),
+            ('late completed', 'completed', past),
+            ('late cancelled', 'cancelled', past),
+            ('already overdue', 'overdue', past),
+            ('on time', 'scheduled', future),
+            ('rescheduled', 'overdue', future),
+        ]
+        MaintenanceActivity.objects.bulk_create([
+            MaintenanceActivity(
+                equipment=equipment, activity_type=activity_type, title=title, status=status,
+                assigned_to=self.tech, scheduled_start=end - timedelta(hours=1), scheduled_end=end,
+            )
+            for title, status, end in cases
+        ])
+
+    def test_transitions_only_the_delta(self):
+        """Open, past-due activities flip once; rescheduled ones go back; terminal ones are untouched."""
+        site_generation = get_cache_version(dashboard_generation_key(self.site.id))
+        with self.captureOnCommitCallbacks(execute=True):
+            changed = transition_overdue_activities()
+
+        self.assertEqual(sorted(row[3] for row in changed), ['late in progress', 'late pending', 'late scheduled'])
+        statuses = dict(MaintenanceActivity.objects.values_list('title', 'status'))
+        self.assertEqual(statuses['late pending'], 'overdue')
+        self.assertEqual(statuses['late completed'], 'completed')
+        self.assertEqual(statuses['on time'], 'scheduled')
+        self.assertEqual(statuses['rescheduled'], 'scheduled')
+        self.assertEqual(
+            sorted(MaintenanceTimelineEntry.objects.values_list('title', flat=True)),
+            ['Status Changed to Overdue'] * 3 + ['Status Changed to Scheduled'],
+        )
+        self.assertGreater(get_cache_version(dashboard_generation_key(self.site.id)), site_generation)
+
+        # A second run finds nothing new to change or record
+        self.assertEqual(transition_overdue_activities(), [])
+        self.assertEqual(MaintenanceTimelineEntry.objects.count(), 4)
+
+    def test_save_resets_rescheduled_activity(self):
+        """Moving an overdue activity's scheduled end into the future makes it scheduled again."""
+        activity = MaintenanceActivity.objects.get(title='already overdue')
+        activity.scheduled_end = timezone.now() + timedelta(days=1)
+        activity.save()
+        activity.refresh_from_db()
+        self.assertEqual(activity.status, 'scheduled')
+
+    def test_rescheduled_activity_keeps_its_earlier_status(self):
+        """In-progress work that went overdue is in progress again once rescheduled, by either path."""
+        transition_overdue_activities()
+        MaintenanceActivity.objects.filter(title__in=['late in progress', 'late pending']).update(
+            scheduled_end=timezone.now() + timedelta(days=1)
+        )
+        transition_overdue_activities()
+        statuses = dict(MaintenanceActivity.objects.values_list('title', 'status'))
+        self.assertEqual(statuses['late in progress'], 'in_progress')
+        self.assertEqual(statuses['late pending'], 'pending')
+        self.assertTrue(MaintenanceTimelineEntry.objects.filter(title='Status Changed to In Progress').exists())
+
+        activity = MaintenanceActivity.objects.get(title='late in progress')
+        activity.scheduled_end = timezone.now() - timedelta(hours=1)
+        activity.clean()
+        activity.save()
+        self.assertEqual((activity.status, activity.status_before_overdue), ('overdue', 'in_progress'))
+        activity.scheduled_end = timezone.now() + timedelta(days=1)
+        activity.save()
+        activity.refresh_from_db()
+        self.assertEqual((activity.status, activity.status_before_overdue), ('in_progress', ''))
+
+    def test_fallback_update_keeps_earlier_status(self):
+        """Backends without UPDATE ... RETURNING record the earlier status too."""
+        with mock.patch('maintenance.overdue._supports_update_returning', return_value=False):
+            transition_overdue_activities()
+        self.assertEqual(
+            MaintenanceActivity.objects.get(title='late in progress').status_before_overdue, 'in_progress'
+        )
+
+    def test_notifications_cover_only_changed_activities(self):
+        """The assignee gets one digest listing just the newly overdue activities."""
+        changed = transition_overdue_activities()
+        self.assertEqual(notify_overdue_activities([row[0] for row in changed]), 3)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, 'Overdue Maintenance: 3 items')
+        self.assertNotIn('already overdue', mail.outbox[0].body)
+
+    def test_deep_hierarchy_bumps_the_site(self):
+        """Equipment five levels below the site still invalidates that site's dashboard."""
+        parent = self.site
+        for name in ('POD 2', 'MDC A', 'Room 1', 'Rack 4'):
+            parent = Location.objects.create(name=name, parent_location=parent)
+        Equipment.objects.filter(name='TX-1').update(location=parent)
+
+        site_generation = get_cache_version(dashboard_generation_key(self.site.id))
+        with self.captureOnCommitCallbacks(execute=True):
+            transition_overdue_activities()
+        self.assertGreater(get_cache_version(dashboard_generation_key(self.site.id)), site_generation)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for batched reminder digests.
+"""
+
+from datetime import datetime, time, timedelta
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase, SimpleTestCase, override_settings
+from django.contrib.auth.models import User
+from django.utils import timezone
+from core.models import Location, EquipmentCategory
+from core.services.notification_service import ReminderDigestService
+from equipment.models import Equipment
+from maintenance.models import MaintenanceActivity, MaintenanceActivityType, ActivityTypeCategory
+from maintenance.tasks import send_maintenance_reminders
+
+BACKEND = f'{__name__}.CountingBackend'
+
+
+class CountingBackend(EmailBackend):
+    """locmem backend that counts opened connections and can refuse chosen recipients."""
+
+    opened = 0
+    refuse = {}
+
+    def open(self):
+        CountingBackend.opened += 1
+        return True
+
+    def send_messages(self, messages):
+        for message in messages:
+            for address in message.to:
+                if CountingBackend.refuse.get(address, 0) > 0:
+                    CountingBackend.refuse[address] -= 1
+                    raise OSError(f"Recipient {address} refused")
+        return super().send_messages(messages)
+
+
+def reset_backend(refuse=None):
+    CountingBackend.opened = 0
+    CountingBackend.refuse = dict(refuse or {})
+
+
+@override_settings(EMAIL_BACKEND=BACKEND)
+class ReminderDigestServiceTest(SimpleTestCase):
+    """Test digest grouping, chunking and retries."""
+
+    def setUp(self):
+        reset_backend()
+        self.reminders = [
+            (f'tech{i % 3}@example.com', f'Job {i}', [f'Title: Job {i}']) for i in range(9)
+        ] + [('solo@example.com', 'Only job', ['Title: Only job']), ('', 'No email', [])]
+
+    def test_one_digest_per_recipient_over_one_connection(self):
+        """Nine jobs for three technicians become three digests on one connection."""
+        result = ReminderDigestService({'chunk_size': 100}).send_reminders(
+            self.reminders, 'Maintenance Reminder', 'One job:', 'You have {count} jobs:'
+        )
+
+        self.assertEqual(CountingBackend.opened, 1)
+        self.assertEqual(result['reminders_sent'], 10)
+        self.assertEqual(len(mail.outbox), 4)
+        digest = next(m for m in mail.outbox if m.to == ['tech0@example.com'])
+        self.assertEqual(digest.subject, 'Maintenance Reminder: 3 items')
+        self.assertIn('You have 3 jobs:', digest.body)
+        solo = next(m for m in mail.outbox if m.to == ['solo@example.com'])
+        self.assertEqual(solo.subject, 'Maintenance Reminder: Only job')
+
+    def test_chunking_and_retry_of_failed_recipients(self):
+        """Chunks get their own connection; a refused recipient is retried and then delivered."""
+        reset_backend(refuse={'tech1@example.com': 1})
+        delays = []
+        result = ReminderDigestService({'chunk_size': 2, 'retry_delay': 3}, sleep=delays.append).send_reminders(
+            self.reminders, 'Maintenance Reminder', 'One job:', 'You have {count} jobs:'
+        )
+
+        self.assertEqual(result['failed'], [])
+        self.assertEqual(len(mail.outbox), 4)
+        # Two chunks of two digests, then one retry connection
+        self.assertEqual(result['connections'], 3)
+        self.assertEqual(CountingBackend.opened, 3)
+        self.assertEqual(delays, [3])
+
+    def test_gives_up_after_max_retries(self):
+        """Recipients that keep failing are reported, not retried forever."""
+        reset_backend(refuse={'solo@example.com': 10})
+        result = ReminderDigestService({'max_retries': 1}, sleep=lambda seconds: None).send_reminders(
+            self.reminders, 'Maintenance Reminder', 'One job:', 'You have {count} jobs:'
+        )
+        self.assertEqual([m.to for m in result['failed']], [['solo@example.com']])
+        self.assertEqual(result['reminders_sent'], 9)
+
+
+@override_settings(EMAIL_BACKEND=BACKEND)
+class MaintenanceReminderTaskTest(TestCase):
+    """Test that the reminder task sends one digest per technician."""
+
+    def test_digest_per_technician(self):
+        reset_backend()
+        location = Location.objects.create(name='Reminder Site', is_site=True)
+        equipment = Equipment.objects.create(
+            name='TX-1', category=EquipmentCategory.objects.create(name='Transformers'), location=location,
+            manufacturer_serial='SN-TX-1', asset_tag='AT-TX-1',
+        )
+        activity_type = MaintenanceActivityType.objects.create(
+            name='Inspection', category=ActivityTypeCategory.objects.create(name='Preventive'), frequency_days=30,
+        )
+        technicians = [
+            User.objects.create_user(username=f'tech{i}', email=f'tech{i}@example.com') for i in range(2)
+        ]
+        tomorrow = timezone.make_aware(datetime.combine(timezone.now().date() + timedelta(days=1), time(12)))
+        MaintenanceActivity.objects.bulk_create([
+            MaintenanceActivity(
+                equipment=equipment, activity_type=activity_type, title=f'Inspection {i}',
+                assigned_to=technicians[i % 2], status='scheduled',
+                scheduled_start=tomorrow + timedelta(minutes=i), scheduled_end=tomorrow + timedelta(hours=1),
+            )
+            for i in range(5)
+        ])
+
+        self.assertEqual(send_maintenance_reminders(), 5)
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), ['tech0@example.com', 'tech1@example.com'])
+        self.assertEqual(CountingBackend.opened, 1)
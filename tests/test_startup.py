@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for lazily imported URL views and the startup_profile command.
+"""
+
+import json
+from io import StringIO
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+from django.urls import URLPattern, get_resolver
+from core.management.commands.startup_profile import package_breakdown, parse_importtime
+from core.utils import LazyView, LazyViews
+
+
+def iter_patterns(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLPattern):
+            yield pattern
+        else:
+            yield from iter_patterns(pattern.url_patterns)
+
+
+class LazyViewTest(SimpleTestCase):
+    """Test that views are imported on dispatch, not by URL resolution."""
+
+    def test_resolution_does_not_import(self):
+        view = LazyViews('core.health_views').simple_health_check
+        pattern = URLPattern(pattern=None, callback=view)
+        self.assertEqual(pattern.lookup_str, 'core.health_views.simple_health_check')
+        self.assertIsNone(view._view)
+
+    def test_resolves_on_attribute_access(self):
+        from core import health_views
+
+        view = LazyView('core.health_views', 'comprehensive_health_check')
+        self.assertTrue(view.csrf_exempt)
+        self.assertIs(view.resolve(), health_views.comprehensive_health_check)
+
+    def test_every_url_resolves(self):
+        lazy = [pattern for pattern in iter_patterns(get_resolver().url_patterns) if isinstance(pattern.callback, LazyView)]
+        self.assertGreater(len(lazy), 100)
+        for pattern in lazy:
+            self.assertTrue(callable(pattern.callback.resolve()), pattern.lookup_str)
+
+
+class StartupProfileTest(SimpleTestCase):
+    """Test the import-time parsing and the command's report and budget."""
+
+    def test_parse_importtime(self):
+        entries = parse_importtime([
+            'import time: self [us] | cumulative | imported package',
+            'import time:       120 |        120 |     django.utils',
+            'import time:       300 |        420 |   django.urls',
+            'import time:        80 |         80 | redis',
+            'unrelated output',
+        ])
+        self.assertEqual(entries[1], ('django.urls', 300, 420, 1))
+        self.assertEqual(package_breakdown(entries), [('django', 420), ('redis', 80)])
+
+    def test_command(self):
+        output = StringIO()
+        call_command('startup_profile', runs=1, top=5, json=True, stdout=output)
+        report = json.loads(output.getvalue())
+        self.assertGreater(report['median_rss_mb'], 0)
+        self.assertEqual(len(report['slowest_modules']), 5)
+        self.assertIn('django', [entry['package'] for entry in report['packages']])
+
+        with self.assertRaisesMessage(CommandError, 'Start-up budget exceeded'):
+            call_command('startup_profile', runs=1, max_ms=0.01, stdout=StringIO())